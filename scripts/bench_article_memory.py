@@ -0,0 +1,142 @@
+"""記事収集・正規化のメモリベンチマークCLI.
+
+合成記事を大量に生成して Normalizer.normalize に通し、
+tracemalloc のピーク割り当てとプロセスのピークRSSをJSONで出力する.
+--baseline を指定すると、__dict__ を持つ記事をコピーで正規化する従来方式を再現して計測する
+（比較のため、方式ごとに別プロセスで実行すること）.
+
+使用例:
+    python scripts/bench_article_memory.py --count 100000
+    python scripts/bench_article_memory.py --count 100000 --baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.article import Article
+from src.services.normalizer import Normalizer
+from src.shared.logging.logger import configure_logging
+
+
+@dataclasses.dataclass
+class _DictArticle:
+    """従来方式（__dict__ あり）の記事表現（比較用）."""
+
+    url: str
+    title: str
+    published_at: datetime
+    source_name: str
+    description: str
+    normalized_url: str
+    collected_at: datetime
+
+
+def _peak_rss_mb() -> float:
+    """プロセスのピークRSS（MB）を取得する."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linuxはキロバイト、macOSはバイト単位
+    return max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _create_articles(count: int, article_type: type[Any]) -> list[Any]:
+    """収集直後を模した合成記事を生成する."""
+    collected_at = datetime.now(UTC)
+    return [
+        article_type(
+            url=f"https://example.com/posts/{i}?utm_source=rss",
+            title=f"  記事タイトル &amp; サンプル {i}  ",
+            published_at=collected_at - timedelta(minutes=i % 1440),
+            source_name=f"Source {i % 20}",
+            description=f"記事 {i} の概要です。" * 8,
+            normalized_url=f"https://example.com/posts/{i}?utm_source=rss",
+            collected_at=collected_at,
+        )
+        for i in range(count)
+    ]
+
+
+def _normalize_with_copies(normalizer: Normalizer, articles: list[Any]) -> list[Any]:
+    """従来方式（記事ごとに dataclasses.replace でコピー）で正規化する."""
+    normalized = []
+    for article in articles:
+        copied = dataclasses.replace(article)
+        normalizer.normalize([copied])  # type: ignore[list-item]
+        normalized.append(copied)
+    return normalized
+
+
+def run_benchmark(count: int, baseline: bool) -> dict[str, Any]:
+    """記事生成・正規化のメモリ使用量を計測する.
+
+    Args:
+        count: 生成する記事件数
+        baseline: 従来方式（__dict__ あり・コピー正規化）で計測する場合True
+
+    Returns:
+        計測結果の辞書
+    """
+    normalizer = Normalizer()
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    articles = _create_articles(count, _DictArticle if baseline else Article)
+    collected_bytes, _ = tracemalloc.get_traced_memory()
+
+    if baseline:
+        normalized = _normalize_with_copies(normalizer, articles)
+    else:
+        normalized = normalizer.normalize(articles)
+    elapsed = time.perf_counter() - start
+
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "mode": "baseline" if baseline else "slotted_inplace",
+        "article_count": count,
+        "normalized_count": len(normalized),
+        "collected_mb": round(collected_bytes / 1024 / 1024, 2),
+        "peak_traced_mb": round(peak_bytes / 1024 / 1024, 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 2),
+        "elapsed_seconds": round(elapsed, 3),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure peak memory of collecting and normalizing synthetic articles"
+    )
+    parser.add_argument("--count", type=int, default=100_000, help="Number of articles")
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="Use dict-backed articles with per-article copies (previous behavior)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """ベンチマークを実行し、結果JSONを出力する."""
+    args = _parse_args()
+    # 正規化のログ出力を計測対象から外す
+    configure_logging(log_level="ERROR")
+
+    result = run_benchmark(args.count, args.baseline)
+    sys.stdout.write(json.dumps(result, ensure_ascii=False, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
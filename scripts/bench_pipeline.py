@@ -0,0 +1,420 @@
+"""ローカルスタブを使ったパイプライン全体の性能ベンチマークCLI.
+
+実フィード・はてな/Zenn/Qiita・Bedrockにアクセスせず、
+ローカルのスタブHTTPサーバーと疑似Bedrockクライアントで Orchestrator.execute を実行し、
+記事件数ごとのステップ別計測値（ExecutionSummary.stage_metrics）をJSONで出力する.
+
+使用例:
+    python scripts/bench_pipeline.py --sizes 100 1000 10000 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+import yaml
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.orchestrator.orchestrator import Orchestrator
+from src.repositories.interest_master import InterestMaster
+from src.repositories.source_master import SourceMaster
+from src.services.buzz_scorer import BuzzScorer
+from src.services.candidate_selector import CandidateSelector
+from src.services.collector import Collector
+from src.services.deduplicator import Deduplicator
+from src.services.final_selector import FinalSelector
+from src.services.formatter import Formatter
+from src.services.llm_judge import LlmJudge
+from src.services.normalizer import Normalizer
+from src.services.notifier import Notifier
+from src.services.social_proof import (
+    ExternalServicePolicy,
+    HatenaCountFetcher,
+    MultiSourceSocialProofFetcher,
+    QiitaRankFetcher,
+    YamadashySignalFetcher,
+    ZennLikeFetcher,
+)
+from src.shared.logging.logger import configure_logging
+from src.shared.utils.date_utils import now_utc
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_INTERESTS_PATH = "config/interests.yaml"
+
+# 合成記事URLのドメイン（Zenn/Qiita固有のスコア経路も通るよう混在させる）
+_ARTICLE_URL_PATTERNS = [
+    "https://zenn.dev/bench/articles/{id}",
+    "https://qiita.com/bench/items/{id}",
+    "https://example.com/blog/{id}",
+]
+_TITLE_WORDS = ["AWS", "Python", "LLM", "セキュリティ", "アーキテクチャ", "Kotlin", "PostgreSQL"]
+
+
+@dataclass
+class BenchParams:
+    """ベンチマーク条件.
+
+    Attributes:
+        feed_count: 合成フィード数
+        duplicate_rate: フィード間で重複させる記事の割合（0.0-1.0）
+        http_latency_ms: スタブHTTPサーバーの応答遅延（ミリ秒）
+        bedrock_latency_ms: 疑似Bedrockの応答遅延（ミリ秒）
+        bedrock_throttle_rate: 疑似BedrockがThrottlingExceptionを返す確率（0.0-1.0）
+        llm_candidate_max: LLM判定候補の最大件数
+        bedrock_max_parallel: Bedrock並列度
+        seed: 乱数シード
+    """
+
+    feed_count: int = 10
+    duplicate_rate: float = 0.1
+    http_latency_ms: float = 0.0
+    bedrock_latency_ms: float = 50.0
+    bedrock_throttle_rate: float = 0.0
+    llm_candidate_max: int = 150
+    bedrock_max_parallel: int = 5
+    seed: int = 42
+
+
+class SyntheticCorpus:
+    """スタブサーバーが返す合成データ.
+
+    Attributes:
+        feeds: フィードIDごとの記事（URL, タイトル）リスト
+        popular_urls: ソーシャルシグナル（Zenn/Qiita/yamadashy）に掲載する記事URL
+    """
+
+    def __init__(self, article_count: int, params: BenchParams) -> None:
+        """記事件数と条件から合成データを生成する."""
+        rng = random.Random(params.seed)
+        unique_count = max(int(article_count * (1 - params.duplicate_rate)), 1)
+        articles = [
+            (
+                rng.choice(_ARTICLE_URL_PATTERNS).format(id=i),
+                f"{rng.choice(_TITLE_WORDS)} {rng.choice(_TITLE_WORDS)} の実践 #{i}",
+            )
+            for i in range(unique_count)
+        ]
+        # 重複分は既存記事から再掲する
+        entries = articles + [rng.choice(articles) for _ in range(article_count - unique_count)]
+        rng.shuffle(entries)
+
+        self.feeds: dict[int, list[tuple[str, str]]] = {
+            feed_id: entries[feed_id :: params.feed_count] for feed_id in range(params.feed_count)
+        }
+        self.popular_urls = [url for url, _ in articles[: min(100, len(articles))]]
+
+
+def _render_rss(items: list[tuple[str, str]]) -> bytes:
+    """記事リストをRSS 2.0として出力する."""
+    published = format_datetime(now_utc() - timedelta(hours=1))
+    buffer = io.StringIO()
+    buffer.write('<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>')
+    buffer.write(
+        "<title>bench</title><link>http://localhost/</link><description>bench</description>"
+    )
+    for url, title in items:
+        buffer.write(
+            f"<item><title>{escape(title)}</title><link>{escape(url)}</link>"
+            f"<description>{escape(title)} の概要</description>"
+            f"<pubDate>{published}</pubDate></item>"
+        )
+    buffer.write("</channel></rss>")
+    return buffer.getvalue().encode("utf-8")
+
+
+def _create_handler(corpus: SyntheticCorpus, latency_ms: float) -> type[BaseHTTPRequestHandler]:
+    """合成データを返すリクエストハンドラクラスを生成する."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if latency_ms > 0:
+                time.sleep(latency_ms / 1000)
+            parsed = urlparse(self.path)
+            query = parse_qs(parsed.query)
+
+            if parsed.path.startswith("/feeds/"):
+                feed_id = int(Path(parsed.path).stem)
+                self._send(_render_rss(corpus.feeds.get(feed_id, [])), "application/rss+xml")
+            elif parsed.path == "/hatena/count/entries":
+                counts = {url: len(url) % 120 for url in query.get("url", [])}
+                self._send(json.dumps(counts).encode(), "application/json")
+            elif parsed.path == "/zenn/api/articles":
+                zenn_paths = [
+                    {"path": urlparse(url).path}
+                    for url in corpus.popular_urls
+                    if url.startswith("https://zenn.dev/")
+                ]
+                self._send(json.dumps({"articles": zenn_paths, "next_page": None}).encode())
+            elif parsed.path in ("/qiita/feed", "/yamadashy/rss.xml"):
+                popular = [(url, "popular") for url in corpus.popular_urls]
+                self._send(_render_rss(popular), "application/rss+xml")
+            else:
+                self.send_error(404)
+
+        def _send(self, body: bytes, content_type: str = "application/json") -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return StubHandler
+
+
+class StubServer:
+    """合成データを返すローカルHTTPサーバー（バックグラウンドスレッドで動作）."""
+
+    def __init__(self, corpus: SyntheticCorpus, latency_ms: float) -> None:
+        """スタブサーバーを初期化する（ポートは自動割り当て）."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(corpus, latency_ms))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """サーバーのベースURL."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> StubServer:
+        """サーバーを起動する."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """サーバーを停止する."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeBedrockClient:
+    """応答遅延とスロットリング率を設定できる疑似Bedrock Runtimeクライアント."""
+
+    def __init__(self, latency_ms: float, throttle_rate: float, seed: int) -> None:
+        """疑似クライアントを初期化する."""
+        self._latency_ms = latency_ms
+        self._throttle_rate = throttle_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def invoke_model(self, modelId: str, body: str) -> dict[str, Any]:  # noqa: N803
+        """invoke_model を模擬する（LlmJudgeからスレッド経由で呼ばれる）."""
+        time.sleep(self._latency_ms / 1000)
+        with self._lock:
+            throttled = self._rng.random() < self._throttle_rate
+            label = self._rng.choice(["ACT_NOW", "THINK", "FYI", "IGNORE"])
+        if throttled:
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                "InvokeModel",
+            )
+        prompt = json.loads(body)["messages"][0]["content"]
+        text = json.dumps(
+            {"interest_label": label, "confidence": 0.8, "summary": "bench", "tags": ["bench"]}
+        )
+        payload = {
+            "content": [{"text": text}],
+            "usage": {"input_tokens": len(prompt) // 2, "output_tokens": 60},
+        }
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+class FakeSesClient:
+    """送信しない疑似SESクライアント."""
+
+    def send_email(self, **kwargs: Any) -> dict[str, str]:
+        """send_email を模擬する."""
+        return {"MessageId": "bench"}
+
+
+def _write_sources_config(base_url: str, feed_count: int, directory: Path) -> Path:
+    """スタブフィードを指す収集元設定ファイルを作成する."""
+    sources = [
+        {
+            "source_id": f"bench_feed_{feed_id}",
+            "name": f"Bench Feed {feed_id}",
+            "feed_url": f"{base_url}/feeds/{feed_id}.xml",
+            "feed_type": "rss",
+            "priority": "medium",
+            "timeout_seconds": 30,
+            "retry_count": 0,
+            "enabled": True,
+        }
+        for feed_id in range(feed_count)
+    ]
+    path = directory / "sources.yaml"
+    path.write_text(yaml.safe_dump({"sources": sources}), encoding="utf-8")
+    return path
+
+
+def _create_social_proof_fetcher(base_url: str) -> MultiSourceSocialProofFetcher:
+    """スタブサーバーを参照するSocialProof取得を作成する."""
+
+    class StubHatenaCountFetcher(HatenaCountFetcher):
+        HATENA_BATCH_API_URL = f"{base_url}/hatena/count/entries"
+
+    class StubZennLikeFetcher(ZennLikeFetcher):
+        ZENN_API_BASE_URL = f"{base_url}/zenn/api/articles"
+
+    def policy() -> ExternalServicePolicy:
+        # 本番のjitter（3-6秒）はサーバー保護用のため計測対象外とする
+        return ExternalServicePolicy(jitter_range=(0.0, 0.0), timeout=30)
+
+    return MultiSourceSocialProofFetcher(
+        yamadashy_fetcher=YamadashySignalFetcher(
+            policy=policy(), rss_url=f"{base_url}/yamadashy/rss.xml"
+        ),
+        hatena_fetcher=StubHatenaCountFetcher(policy=policy()),
+        zenn_fetcher=StubZennLikeFetcher(policy=policy()),
+        qiita_fetcher=QiitaRankFetcher(policy=policy(), feed_url=f"{base_url}/qiita/feed"),
+    )
+
+
+def _build_orchestrator(sources_path: Path, base_url: str, params: BenchParams) -> Orchestrator:
+    """スタブを注入したOrchestratorを構築する."""
+    source_master = SourceMaster(sources_path)
+    interest_profile = InterestMaster(DEFAULT_INTERESTS_PATH).get_profile()
+    return Orchestrator(
+        source_master=source_master,
+        cache_repository=None,
+        history_repository=None,
+        collector=Collector(source_master),
+        normalizer=Normalizer(),
+        deduplicator=Deduplicator(None),
+        buzz_scorer=BuzzScorer(
+            interest_profile=interest_profile,
+            source_master=source_master,
+            social_proof_fetcher=_create_social_proof_fetcher(base_url),
+        ),
+        candidate_selector=CandidateSelector(max_candidates=params.llm_candidate_max),
+        llm_judge=LlmJudge(
+            bedrock_client=FakeBedrockClient(
+                params.bedrock_latency_ms, params.bedrock_throttle_rate, params.seed
+            ),
+            cache_repository=None,
+            interest_profile=interest_profile,
+            model_id="anthropic.claude-haiku-4-5-20251001-v1:0",
+            concurrency_limit=params.bedrock_max_parallel,
+            retry_base_delay=0.1,
+            max_backoff=1.0,
+        ),
+        final_selector=FinalSelector(),
+        formatter=Formatter(),
+        notifier=Notifier(
+            FakeSesClient(),
+            from_email="bench@example.com",
+            to_email="bench@example.com",
+            dry_run=True,
+        ),
+    )
+
+
+def run_benchmark(article_count: int, params: BenchParams) -> dict[str, Any]:
+    """指定記事件数でパイプラインを1回実行し、計測結果を返す.
+
+    Args:
+        article_count: 合成フィード全体の記事件数
+        params: ベンチマーク条件
+
+    Returns:
+        実行サマリとステップ別計測値の辞書
+    """
+    corpus = SyntheticCorpus(article_count, params)
+    with StubServer(corpus, params.http_latency_ms) as server, tempfile.TemporaryDirectory() as tmp:
+        sources_path = _write_sources_config(server.base_url, params.feed_count, Path(tmp))
+        orchestrator = _build_orchestrator(sources_path, server.base_url, params)
+
+        start = time.perf_counter()
+        result = asyncio.run(
+            orchestrator.execute(f"bench-{article_count}", now_utc(), dry_run=True)
+        )
+        wall_seconds = time.perf_counter() - start
+
+    summary = result.summary
+    return {
+        "article_count": article_count,
+        "wall_seconds": round(wall_seconds, 4),
+        "articles_per_second": round(summary.collected_count / wall_seconds, 2),
+        "collected_count": summary.collected_count,
+        "deduped_count": summary.deduped_count,
+        "llm_judged_count": summary.llm_judged_count,
+        "final_selected_count": summary.final_selected_count,
+        "estimated_cost_usd": summary.estimated_cost_usd,
+        "stages": [asdict(stage) for stage in summary.stage_metrics],
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the pipeline against local stubs and report per-stage timings as JSON"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Article counts to run"
+    )
+    parser.add_argument("--feeds", type=int, default=10, help="Number of synthetic feeds")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument("--http-latency-ms", type=float, default=0.0)
+    parser.add_argument("--bedrock-latency-ms", type=float, default=50.0)
+    parser.add_argument("--bedrock-throttle-rate", type=float, default=0.0)
+    parser.add_argument("--llm-candidate-max", type=int, default=150)
+    parser.add_argument("--bedrock-max-parallel", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="Write JSON here (default: stdout)")
+    parser.add_argument("--log-level", default="ERROR", help="Pipeline log level")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """ベンチマークを実行し、結果JSONを出力する."""
+    args = _parse_args()
+    configure_logging(log_level=args.log_level)
+
+    params = BenchParams(
+        feed_count=args.feeds,
+        duplicate_rate=args.duplicate_rate,
+        http_latency_ms=args.http_latency_ms,
+        bedrock_latency_ms=args.bedrock_latency_ms,
+        bedrock_throttle_rate=args.bedrock_throttle_rate,
+        llm_candidate_max=args.llm_candidate_max,
+        bedrock_max_parallel=args.bedrock_max_parallel,
+        seed=args.seed,
+    )
+    report = {
+        "generated_at": now_utc().isoformat(),
+        "python_version": sys.version.split()[0],
+        "params": asdict(params),
+        "runs": [run_benchmark(size, params) for size in args.sizes],
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        sys.stderr.write(f"written: {args.output}\n")
+    else:
+        sys.stdout.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""URL正規化のマイクロベンチマークCLI.
+
+合成URLを正規化し、1URLあたりの処理時間をJSONで出力する.
+以下の3方式を計測する:
+- legacy: 従来実装（呼び出しごとにトラッキングパラメータ集合を構築し、parse_qsで解析）
+- cold: 現行実装（キャッシュなし、初回正規化）
+- warm: 現行実装（キャッシュ済みURLの再正規化。収集→正規化→ソーシャルプルーフの重複呼び出しに相当）
+
+使用例:
+    python scripts/bench_url_normalizer.py --count 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse, urlunparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.shared.utils.url_normalizer import normalize_url, normalize_urls
+
+
+def _legacy_normalize_url(url: str) -> str:
+    """従来実装のURL正規化（比較用）."""
+    parsed = urlparse(url)
+    query_params = parse_qs(parsed.query)
+    tracking_params = {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "fbclid",
+        "gclid",
+        "msclkid",
+    }
+    filtered_params = {
+        k: v
+        for k, v in query_params.items()
+        if not any(k.startswith(prefix) for prefix in ["utm_"]) and k not in tracking_params
+    }
+    query = "&".join(f"{k}={v[0]}" for k, v in filtered_params.items())
+    path = parsed.path.rstrip("/") if parsed.path != "/" else parsed.path
+    return urlunparse(("https", parsed.netloc, path, parsed.params, query, ""))
+
+
+def _create_urls(count: int) -> list[str]:
+    """フィード記事を模した合成URLを生成する."""
+    return [
+        f"http://example{i % 50}.com/posts/{i}/?id={i}&utm_source=rss&utm_medium=feed#top"
+        for i in range(count)
+    ]
+
+
+def _measure(func: Callable[[], Any]) -> float:
+    """関数の実行時間（秒）を計測する."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_benchmark(count: int) -> dict[str, Any]:
+    """URL正規化の処理時間を計測する.
+
+    Args:
+        count: 正規化するURL件数
+
+    Returns:
+        計測結果の辞書（1URLあたりのマイクロ秒）
+    """
+    urls = _create_urls(count)
+
+    legacy = _measure(lambda: [_legacy_normalize_url(url) for url in urls])
+    normalize_url.cache_clear()
+    cold = _measure(lambda: normalize_urls(urls))
+    warm = _measure(lambda: normalize_urls(urls))
+
+    def per_url_us(seconds: float) -> float:
+        return round(seconds / count * 1_000_000, 3)
+
+    return {
+        "url_count": count,
+        "legacy_us_per_url": per_url_us(legacy),
+        "cold_us_per_url": per_url_us(cold),
+        "warm_us_per_url": per_url_us(warm),
+        "cache_info": normalize_url.cache_info()._asdict(),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure URL normalization throughput")
+    parser.add_argument("--count", type=int, default=10_000, help="Number of URLs")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """ベンチマークを実行し、結果JSONを出力する."""
+    args = _parse_args()
+    result = run_benchmark(args.count)
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
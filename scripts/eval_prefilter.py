@@ -0,0 +1,133 @@
+r"""事前分類モデルの学習・評価CLI.
+
+過去のLLM判定結果（キャッシュテーブルの項目）から事前分類モデルを学習し、
+ホールドアウトデータで以下を評価してJSONで出力する:
+- avoided_ratio: LLM判定を省略できた割合（事前分類でIGNOREとした件数 / 全件）
+- precision: 事前分類でIGNOREとした記事のうち、LLM判定もIGNOREだった割合
+- ignore_recall: LLM判定がIGNOREの記事のうち、事前分類でIGNOREとできた割合
+
+判定結果は JSONL（1行1項目、title・description・interest_label を含む）または
+DynamoDBキャッシュテーブルのスキャンで読み込む.
+
+使用例:
+    python scripts/eval_prefilter.py --input judgments.jsonl --threshold 0.95
+    python scripts/eval_prefilter.py --table ai-curated-newsletter-cache --save-model \
+        config/prefilter_model.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.judgment import InterestLabel
+from src.services.prefilter_classifier import PrefilterModel, article_text
+
+
+def _load_jsonl(path: Path) -> list[dict[str, Any]]:
+    """JSONLファイルから判定結果の項目を読み込む."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _scan_table(table_name: str) -> list[dict[str, Any]]:
+    """DynamoDBキャッシュテーブルから判定結果の項目を読み込む."""
+    import boto3
+
+    table = boto3.resource("dynamodb").Table(table_name)
+    items: list[dict[str, Any]] = []
+    scan_kwargs: dict[str, Any] = {
+        "ProjectionExpression": "title, description, interest_label",
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _to_samples(items: list[dict[str, Any]]) -> list[tuple[str, bool]]:
+    """項目を (記事テキスト, IGNOREかどうか) の組に変換する（判定ラベルがない項目は除外）."""
+    return [
+        (
+            article_text(item.get("title", ""), item.get("description", "")),
+            item["interest_label"] == InterestLabel.IGNORE.value,
+        )
+        for item in items
+        if item.get("interest_label")
+    ]
+
+
+def evaluate(
+    samples: list[tuple[str, bool]], threshold: float, holdout_ratio: float, seed: int
+) -> dict[str, Any]:
+    """ホールドアウトデータで事前分類モデルを評価する.
+
+    Args:
+        samples: (記事テキスト, IGNOREかどうか) の組
+        threshold: IGNOREと判定するIGNORE確率の閾値
+        holdout_ratio: 評価に使う割合
+        seed: 分割の乱数シード
+
+    Returns:
+        評価結果の辞書
+    """
+    shuffled = samples[:]
+    random.Random(seed).shuffle(shuffled)
+    holdout_size = max(1, int(len(shuffled) * holdout_ratio))
+    holdout, train = shuffled[:holdout_size], shuffled[holdout_size:]
+
+    model = PrefilterModel.train(train)
+    predicted = [model.ignore_probability(text) >= threshold for text, _ in holdout]
+
+    ignored = sum(predicted)
+    true_ignored = sum(
+        1 for pred, (_, is_ignore) in zip(predicted, holdout, strict=True) if pred and is_ignore
+    )
+    actual_ignore = sum(1 for _, is_ignore in holdout if is_ignore)
+    return {
+        "train_count": len(train),
+        "holdout_count": len(holdout),
+        "threshold": threshold,
+        "avoided_ratio": round(ignored / len(holdout), 4),
+        "precision": round(true_ignored / ignored, 4) if ignored else None,
+        "ignore_recall": round(true_ignored / actual_ignore, 4) if actual_ignore else None,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Train and evaluate the pre-filter classifier")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", type=Path, help="JSONL export of cached judgments")
+    source.add_argument("--table", help="DynamoDB cache table name to scan")
+    parser.add_argument("--threshold", type=float, default=0.95, help="IGNORE probability cut-off")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Holdout ratio for evaluation")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the holdout split")
+    parser.add_argument("--save-model", type=Path, help="Train on all data and save the model")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """事前分類モデルを評価し、結果JSONを出力する."""
+    args = _parse_args()
+    items = _load_jsonl(args.input) if args.input else _scan_table(args.table)
+    samples = _to_samples(items)
+
+    result = evaluate(samples, args.threshold, args.holdout, args.seed)
+    if args.save_model:
+        PrefilterModel.train(samples).save(args.save_model)
+        result["saved_model"] = str(args.save_model)
+
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,222 @@
+"""実行スナップショットからパイプラインを再実行するCLI.
+
+RUN_SNAPSHOT_PATH を設定した実行で記録したスナップショット（収集記事・SocialProofスコア・
+Bedrock応答）を使い、フィード・はてな/Zenn/Qiita・Bedrock・SESにアクセスせずに
+Orchestrator.execute を再実行し、実行サマリと最終選定結果をJSONで出力する.
+
+同じスナップショット・設定からは同じ結果になるため、選抜ロジックやプロンプト以外の
+変更による結果の差分確認や不具合の再現に使う. スナップショットにないBedrockリクエスト
+（プロンプト・関心プロファイル・モデルを変更した場合等）は判定失敗として扱う.
+
+使用例:
+    python scripts/replay_run.py /tmp/snapshots/<run_id>.json.gz --output replay.json
+    python scripts/replay_run.py snapshot.json.gz --final-select-max 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.buzz_score import BuzzScore
+from src.models.interest_profile import InterestProfile
+from src.models.judgment import JudgmentResult
+from src.orchestrator.orchestrator import Orchestrator
+from src.repositories.interest_master import InterestMaster
+from src.repositories.source_master import SourceMaster
+from src.services.buzz_scorer import BuzzScorer
+from src.services.candidate_selector import CandidateSelector
+from src.services.cascade_llm_judge import CascadeLlmJudge
+from src.services.deduplicator import Deduplicator
+from src.services.final_selector import FinalSelectionResult, FinalSelector
+from src.services.formatter import Formatter
+from src.services.llm_judge import LlmJudge
+from src.services.normalizer import Normalizer
+from src.services.notifier import Notifier
+from src.services.prefilter_classifier import PrefilterClassifier, PrefilterModel
+from src.services.run_snapshot import (
+    ReplayBedrockClient,
+    ReplayCollector,
+    ReplaySocialProofFetcher,
+    RunSnapshot,
+)
+from src.shared.logging.logger import configure_logging
+
+DEFAULT_INTERESTS_PATH = "config/interests.yaml"
+DEFAULT_PREFILTER_MODEL_PATH = "config/prefilter_model.json"
+
+
+class _CapturingFinalSelector(FinalSelector):
+    """最終選定結果を保持する最終選定サービス."""
+
+    def __init__(self, max_articles: int, max_per_domain: int) -> None:
+        super().__init__(max_articles=max_articles, max_per_domain=max_per_domain)
+        self.selected: list[JudgmentResult] = []
+
+    def select(
+        self,
+        judgments: list[JudgmentResult],
+        buzz_scores: dict[str, BuzzScore] | None = None,
+    ) -> FinalSelectionResult:
+        result = super().select(judgments, buzz_scores)
+        self.selected = result.selected_articles
+        return result
+
+
+def _build_llm_judge(
+    snapshot: RunSnapshot, interest_profile: InterestProfile, args: argparse.Namespace
+) -> LlmJudge:
+    """記録されたBedrock応答を返すLLM判定サービスを構築する（待機なし）."""
+    metadata = snapshot.metadata
+    bedrock_client = ReplayBedrockClient(snapshot)
+    options: dict[str, Any] = {
+        "bedrock_client": bedrock_client,
+        "cache_repository": None,
+        "interest_profile": interest_profile,
+        "max_retries": metadata.get("bedrock_max_retries", 2),
+        "retry_base_delay": 0.0,
+        "max_backoff": 0.0,
+        "streaming": metadata.get("bedrock_streaming", False),
+        "tool_use": metadata.get("bedrock_tool_use", False),
+    }
+    judge = LlmJudge(
+        model_id=args.model_id,
+        inference_profile_arn=metadata.get("bedrock_inference_profile_arn", ""),
+        **options,
+    )
+    if not args.cascade_primary_model_id:
+        return judge
+
+    return CascadeLlmJudge(
+        primary_judge=LlmJudge(model_id=args.cascade_primary_model_id, **options),
+        model_id=args.model_id,
+        inference_profile_arn=metadata.get("bedrock_inference_profile_arn", ""),
+        **options,
+    )
+
+
+def _build_orchestrator(
+    snapshot: RunSnapshot, args: argparse.Namespace, final_selector: FinalSelector
+) -> Orchestrator:
+    """スナップショットを再生するサービスを注入したOrchestratorを構築する."""
+    source_master = SourceMaster(args.sources)
+    interest_profile = InterestMaster(args.interests).get_profile()
+    prefilter = None
+    if args.prefilter_model and Path(args.prefilter_model).exists():
+        prefilter = PrefilterClassifier(PrefilterModel.load(args.prefilter_model))
+
+    return Orchestrator(
+        source_master=source_master,
+        cache_repository=None,
+        history_repository=None,
+        collector=ReplayCollector(snapshot, source_master),
+        normalizer=Normalizer(),
+        deduplicator=Deduplicator(None),
+        buzz_scorer=BuzzScorer(
+            interest_profile=interest_profile,
+            source_master=source_master,
+            social_proof_fetcher=ReplaySocialProofFetcher(snapshot),
+        ),
+        candidate_selector=CandidateSelector(max_candidates=args.llm_candidate_max),
+        llm_judge=_build_llm_judge(snapshot, interest_profile, args),
+        final_selector=final_selector,
+        formatter=Formatter(),
+        notifier=Notifier(None, from_email="", to_email="", dry_run=True),
+        prefilter=prefilter,
+    )
+
+
+def replay(snapshot: RunSnapshot, args: argparse.Namespace) -> dict[str, Any]:
+    """スナップショットからパイプラインを再実行し、結果を返す.
+
+    Args:
+        snapshot: 再生するスナップショット
+        args: コマンドライン引数
+
+    Returns:
+        実行サマリと最終選定結果の辞書
+    """
+    final_selector = _CapturingFinalSelector(
+        max_articles=args.final_select_max, max_per_domain=args.final_select_max_per_domain
+    )
+    orchestrator = _build_orchestrator(snapshot, args, final_selector)
+    result = asyncio.run(orchestrator.execute(snapshot.run_id, snapshot.executed_at, dry_run=True))
+
+    summary = result.summary
+    return {
+        "run_id": snapshot.run_id,
+        "executed_at": snapshot.executed_at.isoformat(),
+        "collected_count": summary.collected_count,
+        "deduped_count": summary.deduped_count,
+        "prefilter_ignored_count": summary.prefilter_ignored_count,
+        "llm_judged_count": summary.llm_judged_count,
+        "llm_escalated_count": summary.llm_escalated_count,
+        "final_selected_count": summary.final_selected_count,
+        "selected": [
+            {
+                "url": judgment.url,
+                "title": judgment.title,
+                "interest_label": judgment.interest_label.value,
+                "buzz_label": judgment.buzz_label.value,
+                "confidence": judgment.confidence,
+                "model_id": judgment.model_id,
+            }
+            for judgment in final_selector.selected
+        ],
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded run snapshot without network access and report as JSON"
+    )
+    parser.add_argument("snapshot", help="Snapshot file written via RUN_SNAPSHOT_PATH")
+    parser.add_argument("--interests", default=DEFAULT_INTERESTS_PATH)
+    parser.add_argument("--sources", default=None, help="Default: path recorded in snapshot")
+    parser.add_argument("--prefilter-model", default=DEFAULT_PREFILTER_MODEL_PATH)
+    parser.add_argument("--model-id", default=None, help="Default: model recorded in snapshot")
+    parser.add_argument("--cascade-primary-model-id", default=None)
+    parser.add_argument("--llm-candidate-max", type=int, default=None)
+    parser.add_argument("--final-select-max", type=int, default=None)
+    parser.add_argument("--final-select-max-per-domain", type=int, default=None)
+    parser.add_argument("--output", default=None, help="Write JSON here (default: stdout)")
+    parser.add_argument("--log-level", default="ERROR", help="Pipeline log level")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """スナップショットを再生し、結果JSONを出力する."""
+    args = _parse_args()
+    configure_logging(log_level=args.log_level)
+
+    snapshot = RunSnapshot.load(args.snapshot)
+    # 未指定の設定は記録時の値を使う
+    recorded = {
+        "sources": snapshot.metadata.get("sources_config_path", "config/sources.yaml"),
+        "model_id": snapshot.metadata.get("bedrock_model_id", ""),
+        "cascade_primary_model_id": snapshot.metadata.get("bedrock_cascade_primary_model_id", ""),
+        "llm_candidate_max": snapshot.metadata.get("llm_candidate_max", 120),
+        "final_select_max": snapshot.metadata.get("final_select_max", 15),
+        "final_select_max_per_domain": snapshot.metadata.get("final_select_max_per_domain", 0),
+    }
+    for name, value in recorded.items():
+        if getattr(args, name) is None:
+            setattr(args, name, value)
+
+    output = json.dumps(replay(snapshot, args), ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        sys.stderr.write(f"written: {args.output}\n")
+    else:
+        sys.stdout.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """記事エンティティ.
 
     RSS/Atomフィードから収集された記事を表す.
+    収集件数が多い実行でのメモリ使用量を抑えるため、__slots__ で保持する
+    （インスタンスごとの __dict__ を持たない）.
 
     Attributes:
         url: 正規化されたURL（一意キー）
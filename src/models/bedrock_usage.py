@@ -0,0 +1,127 @@
+"""Bedrock利用量エンティティモジュール."""
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class BedrockCallUsage:
+    """Bedrock呼び出し1回分のトークン利用量.
+
+    Attributes:
+        url: 判定対象記事のURL
+        model_id: 使用したLLMモデルID
+        attempt: 試行番号（0始まり、1以上はリトライ）
+        input_tokens: 入力トークン数（キャッシュ分を除く）
+        output_tokens: 出力トークン数
+        cache_read_input_tokens: プロンプトキャッシュから読み込んだ入力トークン数
+        cache_write_input_tokens: プロンプトキャッシュへ書き込んだ入力トークン数
+        batch_inference: バッチ推論ジョブ経由の呼び出しの場合True（割引単価で課金される）
+        output_tokens_estimated: 出力トークン数が近似値の場合True
+            （ストリーミング応答を途中で閉じ、実際の出力トークン数を受信しなかった場合）
+    """
+
+    url: str
+    model_id: str
+    attempt: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+    batch_inference: bool = False
+    output_tokens_estimated: bool = False
+
+    @classmethod
+    def from_response_usage(
+        cls,
+        url: str,
+        model_id: str,
+        attempt: int,
+        usage: dict[str, Any],
+        batch_inference: bool = False,
+        output_tokens_estimated: bool = False,
+    ) -> Self:
+        """Bedrockレスポンスのusageから生成する.
+
+        Args:
+            url: 判定対象記事のURL
+            model_id: 使用したLLMモデルID
+            attempt: 試行番号（0始まり）
+            usage: レスポンスボディの "usage" 辞書
+            batch_inference: バッチ推論ジョブ経由の呼び出しの場合True（デフォルト: False）
+            output_tokens_estimated: 出力トークン数が近似値の場合True（デフォルト: False）
+
+        Returns:
+            Bedrock呼び出し1回分のトークン利用量
+        """
+        return cls(
+            url=url,
+            model_id=model_id,
+            attempt=attempt,
+            input_tokens=int(usage.get("input_tokens", 0)),
+            output_tokens=int(usage.get("output_tokens", 0)),
+            cache_read_input_tokens=int(usage.get("cache_read_input_tokens", 0)),
+            cache_write_input_tokens=int(usage.get("cache_creation_input_tokens", 0)),
+            batch_inference=batch_inference,
+            output_tokens_estimated=output_tokens_estimated,
+        )
+
+
+@dataclass
+class BedrockUsageLedger:
+    """Bedrock利用量の台帳.
+
+    課金対象となった呼び出し（レスポンスを受信した呼び出し）を記録する.
+    スロットリング等でレスポンスを受信できなかった呼び出しは課金されないため
+    calls には含めず、retry_count にのみ計上する.
+
+    Attributes:
+        calls: 呼び出しごとのトークン利用量
+        retry_count: リトライ回数（JSON解析失敗・スロットリングを含む）
+        json_parse_failure_count: 出力を判定結果として解析できなかった回数（修復不能）
+        json_repair_count: 壊れた出力を修復して解析できた回数
+    """
+
+    calls: list[BedrockCallUsage] = field(default_factory=list)
+    retry_count: int = 0
+    json_parse_failure_count: int = 0
+    json_repair_count: int = 0
+
+    def record(self, call: BedrockCallUsage) -> None:
+        """呼び出し1回分の利用量を記録する.
+
+        Args:
+            call: Bedrock呼び出し1回分のトークン利用量
+        """
+        self.calls.append(call)
+
+    def merge(self, other: Self) -> None:
+        """他の台帳の利用量を取り込む（モデルを切り替えて判定した場合の合算用）.
+
+        Args:
+            other: 取り込む台帳
+        """
+        self.calls.extend(other.calls)
+        self.retry_count += other.retry_count
+        self.json_parse_failure_count += other.json_parse_failure_count
+        self.json_repair_count += other.json_repair_count
+
+    @property
+    def total_input_tokens(self) -> int:
+        """入力トークン数の合計を返す."""
+        return sum(call.input_tokens for call in self.calls)
+
+    @property
+    def total_output_tokens(self) -> int:
+        """出力トークン数の合計を返す."""
+        return sum(call.output_tokens for call in self.calls)
+
+    @property
+    def total_cache_read_input_tokens(self) -> int:
+        """キャッシュ読み込み入力トークン数の合計を返す."""
+        return sum(call.cache_read_input_tokens for call in self.calls)
+
+    @property
+    def total_cache_write_input_tokens(self) -> int:
+        """キャッシュ書き込み入力トークン数の合計を返す."""
+        return sum(call.cache_write_input_tokens for call in self.calls)
@@ -1,8 +1,11 @@
 """実行サマリエンティティモジュール."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from src.models.source_latency import SourceLatency
+from src.models.stage_metrics import StageMetrics
+
 
 @dataclass
 class ExecutionSummary:
@@ -16,11 +19,16 @@ class ExecutionSummary:
         collected_count: 収集件数
         deduped_count: 重複排除後件数
         llm_judged_count: LLM判定件数
+        prefilter_ignored_count: 事前分類でIGNOREと判定しLLM判定を省略した件数
+        llm_escalated_count: カスケード判定で上位モデルに再判定させた件数
         cache_hit_count: キャッシュヒット件数
         final_selected_count: 最終選定件数（0-15）
         notification_sent: 通知送信成功フラグ
         execution_time_seconds: 実行時間（秒）
         estimated_cost_usd: 推定コスト（USD）
+        llm_budget_utilization: LLM判定枠のうち未判定記事で埋めた割合（0.0-1.0）
+        stage_metrics: ステップ単位の計測値（実行順）
+        source_latencies: 収集元ごとの取得レイテンシ統計
     """
 
     run_id: str
@@ -33,3 +41,8 @@ class ExecutionSummary:
     notification_sent: bool
     execution_time_seconds: float
     estimated_cost_usd: float
+    llm_budget_utilization: float = 0.0
+    prefilter_ignored_count: int = 0
+    llm_escalated_count: int = 0
+    stage_metrics: list[StageMetrics] = field(default_factory=list)
+    source_latencies: list[SourceLatency] = field(default_factory=list)
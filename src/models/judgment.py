@@ -53,6 +53,7 @@ class JudgmentResult:
         judged_at: 判定日時（UTC）
         tags: 記事タグ（例: ["Kotlin", "Claude"]）
         published_at: 記事の公開日時（UTC）
+        notified_at: ニュースレターで通知した日時（UTC、未通知の場合None）
     """
 
     url: str
@@ -66,3 +67,4 @@ class JudgmentResult:
     judged_at: datetime
     published_at: datetime
     tags: list[str] = field(default_factory=list)
+    notified_at: datetime | None = None
@@ -62,6 +62,8 @@ class SourceConfig(BaseModel):
         retry_count: リトライ回数（0-5回）
         enabled: 有効フラグ
         authority_level: 公式度レベル（デフォルト: LOW）
+        streaming: ストリーミング解析を使用するか（大規模フィード向け、デフォルト: False）
+        max_entries: 1回の収集で読み込むエントリ数の上限（デフォルト: None=無制限）
     """
 
     source_id: str = Field(min_length=1, max_length=50, pattern="^[a-z0-9_]+$")
@@ -73,3 +75,5 @@ class SourceConfig(BaseModel):
     retry_count: int = Field(ge=0, le=5, default=2)
     enabled: bool = True
     authority_level: AuthorityLevel = AuthorityLevel.LOW
+    streaming: bool = False
+    max_entries: int | None = Field(ge=1, default=None)
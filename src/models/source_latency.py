@@ -0,0 +1,20 @@
+"""収集元レイテンシ統計エンティティモジュール."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SourceLatency:
+    """収集元ごとの取得レイテンシ統計.
+
+    Attributes:
+        source_id: ソースID
+        p50_seconds: 取得時間の中央値（秒）
+        p95_seconds: 取得時間の95パーセンタイル（秒）
+        sample_count: 統計に使用したサンプル数
+    """
+
+    source_id: str
+    p50_seconds: float
+    p95_seconds: float
+    sample_count: int
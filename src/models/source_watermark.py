@@ -0,0 +1,42 @@
+"""収集元ハイウォーターマークエンティティモジュール."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# 保持する直近エントリIDの上限件数
+MAX_RECENT_ENTRY_IDS = 500
+
+
+@dataclass
+class SourceWatermark:
+    """収集元ごとのハイウォーターマーク（前回までに収集済みの位置）.
+
+    差分収集で、前回までに収集済みのエントリをArticle生成前に除外するために使用する.
+
+    Attributes:
+        source_id: ソースID
+        latest_published_at: 収集済みエントリの最新公開日時（UTC）
+        recent_entry_ids: 直近に収集したエントリID（公開日時のないエントリや
+            公開日時が同じエントリの判定に使用）
+    """
+
+    source_id: str
+    latest_published_at: datetime
+    recent_entry_ids: frozenset[str] = field(default_factory=frozenset)
+
+    def is_seen(self, entry_id: str, published_at: datetime | None) -> bool:
+        """エントリが収集済みか判定する.
+
+        公開日時がマークより古いエントリ、またはIDが直近エントリIDに含まれるエントリを
+        収集済みとみなす.
+
+        Args:
+            entry_id: エントリID（id要素、なければリンクURL）
+            published_at: 公開日時（フィードに含まれない場合None）
+
+        Returns:
+            収集済みの場合True
+        """
+        if entry_id in self.recent_entry_ids:
+            return True
+        return published_at is not None and published_at < self.latest_published_at
@@ -0,0 +1,31 @@
+"""ステップ計測エンティティモジュール."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class StageMetrics:
+    """ステップ単位の実行計測値.
+
+    Orchestratorの各ステップ（およびその内部のサブ処理）の性能指標を表す.
+    サブ処理の名前は "step3_buzz_score.social_proof" のように親ステップ名で修飾される.
+
+    Attributes:
+        name: ステップ名
+        wall_seconds: 経過時間（秒）
+        cpu_seconds: プロセスCPU時間（秒、並行タスク・スレッド分を含む）
+        peak_rss_delta_mb: ステップ中のピークRSS増分（MB）
+        http_request_count: HTTPリクエスト数（成功レスポンスのみ）
+        http_bytes: HTTPレスポンスボディの合計バイト数
+        bedrock_input_tokens: Bedrock入力トークン数
+        bedrock_output_tokens: Bedrock出力トークン数
+    """
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_mb: float = 0.0
+    http_request_count: int = 0
+    http_bytes: int = 0
+    bedrock_input_tokens: int = 0
+    bedrock_output_tokens: int = 0
@@ -18,8 +18,11 @@ from src.services.formatter import Formatter
 from src.services.llm_judge import LlmJudge
 from src.services.normalizer import Normalizer
 from src.services.notifier import Notifier
+from src.services.prefilter_classifier import PrefilterClassifier
 from src.shared.logging.logger import get_logger
-from src.shared.utils.bedrock_cost_estimator import estimate_bedrock_cost_usd
+from src.shared.utils.bedrock_cost_estimator import calculate_bedrock_cost_usd
+from src.shared.utils.run_deadline import RunDeadline
+from src.shared.utils.stage_profiler import StageProfiler
 
 logger = get_logger(__name__)
 
@@ -46,12 +49,16 @@ class Orchestrator:
     1. 収集・正規化
     2. 重複排除
     3. Buzzスコア計算
-    4. 候補選定
+    4. 候補選定（事前分類が設定されている場合、確実にIGNOREとなる候補を除外）
     5. LLM判定
     6. 最終選定
     7. フォーマット・通知
     8. 履歴保存
 
+    実行期限（RunDeadline）が渡された場合、収集・Buzzスコア計算・LLM判定の各ステップに
+    時間予算を割り当てる。予算を超えたステップは未完了の処理をキャンセルし、
+    部分的な結果で後続ステップへ進むことで、タイムアウト前に必ず通知まで到達させる。
+
     Attributes:
         _source_master: 収集元マスタ
         _cache_repository: キャッシュリポジトリ
@@ -65,8 +72,15 @@ class Orchestrator:
         _final_selector: 最終選定サービス
         _formatter: フォーマットサービス
         _notifier: 通知サービス
+        _prefilter: LLM判定前の事前分類サービス（Noneの場合は全候補をLLM判定）
     """
 
+    # 各ステップ開始時点の残り時間（通知用の予約時間を除く）に対する割当比率
+    COLLECT_BUDGET_RATIO = 0.25
+    SOCIAL_PROOF_BUDGET_RATIO = 0.25
+    # LLM判定後の最終選定・フォーマット・通知・履歴保存のために残す時間（秒）
+    DELIVERY_RESERVE_SECONDS = 30.0
+
     def __init__(
         self,
         source_master: SourceMaster,
@@ -81,6 +95,7 @@ class Orchestrator:
         final_selector: FinalSelector,
         formatter: Formatter,
         notifier: Notifier,
+        prefilter: PrefilterClassifier | None = None,
     ) -> None:
         """オーケストレーターを初期化する.
 
@@ -97,6 +112,7 @@ class Orchestrator:
             final_selector: 最終選定サービス
             formatter: フォーマットサービス
             notifier: 通知サービス
+            prefilter: LLM判定前の事前分類サービス（デフォルト: None=事前分類なし）
         """
         self._source_master = source_master
         self._cache_repository = cache_repository
@@ -110,9 +126,14 @@ class Orchestrator:
         self._final_selector = final_selector
         self._formatter = formatter
         self._notifier = notifier
+        self._prefilter = prefilter
 
     async def execute(
-        self, run_id: str, executed_at: datetime, dry_run: bool = False
+        self,
+        run_id: str,
+        executed_at: datetime,
+        dry_run: bool = False,
+        deadline: RunDeadline | None = None,
     ) -> OrchestratorOutput:
         """ニュースレター生成フローを実行する.
 
@@ -120,6 +141,7 @@ class Orchestrator:
             run_id: 実行ID（UUID）
             executed_at: 実行日時（UTC）
             dry_run: dry_runモード（通知をスキップ）
+            deadline: 実行期限（デフォルト: None=無期限）
 
         Returns:
             実行結果
@@ -128,32 +150,50 @@ class Orchestrator:
             Exception: 致命的エラーが発生した場合
         """
         start_time = time.time()
+        if deadline is None:
+            deadline = RunDeadline.unlimited()
 
-        logger.info("orchestrator_start", run_id=run_id, dry_run=dry_run)
+        logger.info(
+            "orchestrator_start",
+            run_id=run_id,
+            dry_run=dry_run,
+            remaining_seconds=None if deadline.is_unlimited else deadline.remaining_seconds(),
+        )
 
         # 統計情報の初期化
         collected_count = 0
         deduped_count = 0
         llm_judged_count = 0
+        prefilter_ignored_count = 0
         cache_hit_count = 0
         final_selected_count = 0
         notification_sent = False
 
+        profiler = StageProfiler()
+
         try:
             # Step 1: 収集・正規化
-            collection_result = await self._collector.collect()
-            collected_count = len(collection_result.articles)
-            logger.info(
-                "step1_collect_complete",
-                collected_count=collected_count,
-                error_count=len(collection_result.errors),
-            )
+            with profiler.span("step1_collect"):
+                collect_budget = deadline.budget(
+                    self.COLLECT_BUDGET_RATIO, reserve_seconds=self.DELIVERY_RESERVE_SECONDS
+                )
+                with profiler.span("collect"):
+                    collection_result = await self._collector.collect(budget_seconds=collect_budget)
+                collected_count = len(collection_result.articles)
+                logger.info(
+                    "step1_collect_complete",
+                    collected_count=collected_count,
+                    error_count=len(collection_result.errors),
+                    budget_seconds=collect_budget,
+                )
 
-            normalized_articles = self._normalizer.normalize(collection_result.articles)
-            logger.info("step1_complete", normalized_count=len(normalized_articles))
+                with profiler.span("normalize"):
+                    normalized_articles = self._normalizer.normalize(collection_result.articles)
+                logger.info("step1_complete", normalized_count=len(normalized_articles))
 
             # Step 2: 重複排除
-            dedup_result = self._deduplicator.deduplicate(normalized_articles)
+            with profiler.span("step2_deduplicate"):
+                dedup_result = self._deduplicator.deduplicate(normalized_articles)
             deduped_count = len(dedup_result.unique_articles)
             cache_hit_count = dedup_result.cached_count
             logger.info(
@@ -164,84 +204,134 @@ class Orchestrator:
             )
 
             # Step 3: Buzzスコア計算
-            buzz_scores = await self._buzz_scorer.calculate_scores(dedup_result.unique_articles)
-            logger.info("step3_complete", score_count=len(buzz_scores))
+            # キャッシュ済み記事も最終選定で未判定記事と並べて順位付けするためスコアを計算する
+            scored_articles = dedup_result.unique_articles + dedup_result.cached_articles
+            with profiler.span("step3_buzz_score"):
+                social_proof_budget = deadline.budget(
+                    self.SOCIAL_PROOF_BUDGET_RATIO, reserve_seconds=self.DELIVERY_RESERVE_SECONDS
+                )
+                buzz_scores = await self._buzz_scorer.calculate_scores(
+                    scored_articles, budget_seconds=social_proof_budget
+                )
+            logger.info(
+                "step3_complete", score_count=len(buzz_scores), budget_seconds=social_proof_budget
+            )
 
             # Step 4: 候補選定
-            selection_result = self._candidate_selector.select(
-                dedup_result.unique_articles, buzz_scores
+            with profiler.span("step4_select_candidates"):
+                selection_result = self._candidate_selector.select(
+                    scored_articles, buzz_scores, dedup_result.cached_judgments
+                )
+            logger.info(
+                "step4_complete",
+                candidate_count=len(selection_result.candidates),
+                carried_count=len(selection_result.cached_judgments),
+                budget_utilization=round(selection_result.budget_utilization, 3),
             )
-            logger.info("step4_complete", candidate_count=len(selection_result.candidates))
+
+            # Step 4.5: 事前分類（確実にIGNOREとなる候補はLLM判定を省略）
+            llm_candidates = selection_result.candidates
+            if self._prefilter is not None:
+                with profiler.span("step4_5_prefilter"):
+                    prefilter_result = self._prefilter.filter(llm_candidates, buzz_scores)
+                llm_candidates = prefilter_result.llm_articles
+                prefilter_ignored_count = len(prefilter_result.ignored_judgments)
+                logger.info(
+                    "step4_5_complete",
+                    llm_candidate_count=len(llm_candidates),
+                    ignored_count=prefilter_ignored_count,
+                )
 
             # Step 5: LLM判定
-            judgment_result = await self._llm_judge.judge_batch(selection_result.candidates)
+            with profiler.span("step5_llm_judge"):
+                judge_budget = deadline.budget(reserve_seconds=self.DELIVERY_RESERVE_SECONDS)
+                judgment_result = await self._llm_judge.judge_batch(
+                    llm_candidates, budget_seconds=judge_budget
+                )
             llm_judged_count = len(judgment_result.judgments)
             logger.info(
                 "step5_complete",
                 judged_count=llm_judged_count,
                 failed_count=judgment_result.failed_count,
+                skipped_count=judgment_result.skipped_count,
+                escalated_count=judgment_result.escalated_count,
+                budget_seconds=judge_budget,
             )
 
             # Step 5.5: BuzzScoreからBuzzLabelを設定
-            for judgment in judgment_result.judgments:
+            # 最終選定はLLM判定結果とキャッシュ済み判定結果を合わせて順位付けする
+            ranked_judgments = judgment_result.judgments + selection_result.cached_judgments
+            for judgment in ranked_judgments:
                 buzz_score = buzz_scores.get(judgment.url)
                 if buzz_score is not None:
                     judgment.buzz_label = buzz_score.to_buzz_label()
             logger.debug("step5_5_complete", message="buzz_labels overwritten from buzz_scores")
 
             # Step 6: 最終選定
-            final_result = self._final_selector.select(judgment_result.judgments, buzz_scores)
+            with profiler.span("step6_final_select"):
+                final_result = self._final_selector.select(ranked_judgments, buzz_scores)
             final_selected_count = len(final_result.selected_articles)
             logger.info("step6_complete", selected_count=final_selected_count)
 
             # Step 7: フォーマット・通知
             logger.debug("step7_start", step="format_and_notify")
 
-            if final_selected_count == 0:
-                logger.warning("no_articles_to_notify")
-                # 記事がない場合でも履歴は保存
-            else:
-                # メール本文生成
-                mail_body = self._formatter.format(
-                    selected_articles=final_result.selected_articles,
-                    collected_count=collected_count,
-                    judged_count=llm_judged_count,
-                    executed_at=executed_at,
-                )
-                mail_html_body = self._formatter.format_html(
-                    selected_articles=final_result.selected_articles,
-                    collected_count=collected_count,
-                    judged_count=llm_judged_count,
-                    executed_at=executed_at,
-                )
-
-                if dry_run:
-                    logger.info(
-                        "dry_run_mode",
-                        message="Newsletter formatted (not sent in dry_run mode)",
-                        mail_body_length=len(mail_body),
-                        selected_count=final_selected_count,
-                    )
-                    logger.debug("step7_complete", notification_sent=notification_sent)
+            with profiler.span("step7_notify"):
+                if final_selected_count == 0:
+                    logger.warning("no_articles_to_notify")
+                    # 記事がない場合でも履歴は保存
                 else:
-                    # メール送信
-                    subject = self._build_newsletter_subject(executed_at)
-                    notification_result = self._notifier.send(
-                        subject=subject, body=mail_body, html_body=mail_html_body
-                    )
-                    notification_sent = True
-                    logger.info(
-                        "step7_complete",
-                        message_id=notification_result.message_id,
-                        notification_sent=notification_sent,
-                    )
-
-            # Step 8: 履歴保存
+                    # メール本文生成
+                    with profiler.span("format"):
+                        mail_body = self._formatter.format(
+                            selected_articles=final_result.selected_articles,
+                            collected_count=collected_count,
+                            judged_count=llm_judged_count,
+                            executed_at=executed_at,
+                        )
+                        mail_html_body = self._formatter.format_html(
+                            selected_articles=final_result.selected_articles,
+                            collected_count=collected_count,
+                            judged_count=llm_judged_count,
+                            executed_at=executed_at,
+                        )
+
+                    if dry_run:
+                        logger.info(
+                            "dry_run_mode",
+                            message="Newsletter formatted (not sent in dry_run mode)",
+                            mail_body_length=len(mail_body),
+                            selected_count=final_selected_count,
+                        )
+                        logger.debug("step7_complete", notification_sent=notification_sent)
+                    else:
+                        # メール送信
+                        subject = self._build_newsletter_subject(executed_at)
+                        with profiler.span("send"):
+                            notification_result = self._notifier.send(
+                                subject=subject, body=mail_body, html_body=mail_html_body
+                            )
+                        notification_sent = True
+                        # 通知済みとして記録し、キャッシュ済み判定結果として再通知しないようにする
+                        if self._cache_repository is not None:
+                            self._cache_repository.mark_notified(
+                                final_result.selected_articles, notification_result.sent_at
+                            )
+                        logger.info(
+                            "step7_complete",
+                            message_id=notification_result.message_id,
+                            notification_sent=notification_sent,
+                        )
+
+            # Step 8: 収集位置・履歴保存
             logger.debug("step8_start", step="save_history")
+            with profiler.span("step8_save_watermarks"):
+                # 実行成功後に収集位置を進める（失敗した実行の記事は次回も収集対象とする）
+                self._collector.save_watermarks(collection_result.watermarks)
             execution_time = time.time() - start_time
 
-            # コスト推定（トークン単価ベース）
-            estimated_cost = estimate_bedrock_cost_usd(llm_judged_count)
+            # コスト計算（実トークン数 × モデル別単価）
+            estimated_cost = calculate_bedrock_cost_usd(judgment_result.usage)
 
             summary = ExecutionSummary(
                 run_id=run_id,
@@ -249,16 +339,22 @@ class Orchestrator:
                 collected_count=collected_count,
                 deduped_count=deduped_count,
                 llm_judged_count=llm_judged_count,
+                prefilter_ignored_count=prefilter_ignored_count,
+                llm_escalated_count=judgment_result.escalated_count,
                 cache_hit_count=cache_hit_count,
                 final_selected_count=final_selected_count,
                 notification_sent=notification_sent,
                 execution_time_seconds=execution_time,
                 estimated_cost_usd=estimated_cost,
+                llm_budget_utilization=selection_result.budget_utilization,
+                stage_metrics=profiler.stages,
+                source_latencies=collection_result.source_latencies,
             )
 
-            # TODO(MVP): DynamoDB未セットアップのため一時的にコメントアウト
-            # self._history_repository.save(summary)
-            # MVPフェーズではログ出力のみ（DynamoDB未使用）
+            # 保存する履歴とログのサマリを一致させるため、計測区間を閉じてから履歴を保存する
+            # MVPフェーズではDynamoDB未セットアップのため、リポジトリ未設定時はログ出力のみ
+            if self._history_repository is not None:
+                self._history_repository.save(summary)
             logger.info("execution_summary", **asdict(summary))
             logger.debug("step8_complete", run_id=run_id)
 
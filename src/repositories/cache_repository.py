@@ -1,36 +1,77 @@
 """判定キャッシュリポジトリモジュール."""
 
+import dataclasses
 import hashlib
+import unicodedata
+from datetime import datetime
 from typing import Any
 
 from botocore.exceptions import ClientError
 
-from src.models.judgment import JudgmentResult
+from src.models.article import Article
+from src.models.judgment import BuzzLabel, InterestLabel, JudgmentResult
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def content_fingerprint(title: str, description: str) -> str | None:
+    """記事のタイトル・概要から内容のフィンガープリントを生成する.
+
+    表記揺れ（全角半角・大文字小文字・空白・記号）を正規化してからハッシュ化するため、
+    配信元ごとに整形が異なるだけのほぼ同一の内容は同じフィンガープリントとなる.
+    概要が空の記事はタイトルのみでは別記事と衝突しやすいため対象外とする.
+
+    Args:
+        title: 記事タイトル
+        description: 記事概要
+
+    Returns:
+        フィンガープリント（概要が空の場合None）
+    """
+
+    def normalize(text: str) -> str:
+        return "".join(
+            char for char in unicodedata.normalize("NFKC", text).casefold() if char.isalnum()
+        )
+
+    normalized_description = normalize(description)
+    if not normalized_description:
+        return None
+    content = f"{normalize(title)}\n{normalized_description}"
+    return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+
 class CacheRepository:
     """判定キャッシュリポジトリ.
 
     DynamoDBに判定結果をキャッシュし、再判定を防ぐ.
 
+    判定結果はURLのキーに加え、内容のフィンガープリントのキーにも保存し、
+    同じ内容の記事が別URLで配信された場合も再判定しない. ソートキーには
+    判定バージョン（関心プロファイル・プロンプトのハッシュ）を含めるため、
+    関心プロファイルを変更すると過去の判定結果は自動的に参照されなくなる.
+
     Attributes:
         _table: DynamoDBテーブルリソース
         _table_name: テーブル名
+        _judgment_version: 判定バージョン
     """
 
-    def __init__(self, dynamodb_resource: Any, table_name: str) -> None:
+    def __init__(
+        self, dynamodb_resource: Any, table_name: str, judgment_version: str = "v1"
+    ) -> None:
         """リポジトリを初期化する.
 
         Args:
             dynamodb_resource: DynamoDBリソース（boto3.resource('dynamodb')）
             table_name: テーブル名
+            judgment_version: 判定バージョン（デフォルト: "v1"）
         """
         self._dynamodb = dynamodb_resource
         self._table_name = table_name
         self._table = dynamodb_resource.Table(table_name)
+        self._judgment_version = judgment_version
 
     def _generate_pk(self, url: str) -> str:
         """URLからパーティションキーを生成する.
@@ -44,13 +85,25 @@ class CacheRepository:
         url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
         return f"URL#{url_hash}"
 
+    @staticmethod
+    def _generate_content_pk(fingerprint: str) -> str:
+        """内容のフィンガープリントからパーティションキーを生成する.
+
+        Args:
+            fingerprint: 内容のフィンガープリント
+
+        Returns:
+            パーティションキー（CONTENT#<fingerprint>形式）
+        """
+        return f"CONTENT#{fingerprint}"
+
     def _generate_sk(self) -> str:
         """ソートキーを生成する.
 
         Returns:
-            ソートキー（JUDGMENT#v1固定）
+            ソートキー（JUDGMENT#<判定バージョン>形式）
         """
-        return "JUDGMENT#v1"
+        return f"JUDGMENT#{self._judgment_version}"
 
     def get(self, url: str) -> JudgmentResult | None:
         """キャッシュから判定結果を取得する.
@@ -72,25 +125,7 @@ class CacheRepository:
             if "Item" not in response:
                 return None
 
-            item = response["Item"]
-            # DynamoDBアイテムからJudgmentResultに変換
-            from datetime import datetime
-
-            from src.models.judgment import BuzzLabel, InterestLabel
-
-            return JudgmentResult(
-                url=item["url"],
-                title=item.get("title", "No Title"),  # 欠損値の場合は"No Title"
-                description=item.get("description", ""),  # 欠損値の場合は空文字列
-                interest_label=InterestLabel(item["interest_label"]),
-                buzz_label=BuzzLabel(item["buzz_label"]),
-                confidence=float(item["confidence"]),
-                summary=item["summary"],
-                model_id=item["model_id"],
-                judged_at=datetime.fromisoformat(item["judged_at"]),
-                published_at=datetime.fromisoformat(item["published_at"]),
-                tags=item.get("tags", []),  # 欠損値の場合は空配列
-            )
+            return self._to_judgment(response["Item"])
 
         except ClientError as e:
             logger.error("cache_get_error", url=url, error=str(e))
@@ -99,6 +134,8 @@ class CacheRepository:
     def put(self, judgment: JudgmentResult) -> None:
         """判定結果をキャッシュに保存する.
 
+        URLのキーに加え、内容のフィンガープリントを生成できる場合はそのキーにも保存する.
+
         注: dry_run=true の場合でも、キャッシュは保存されます。
         これにより、テスト実行でも判定結果が永続化され、次回以降の
         テスト実行でキャッシュが活用されます。
@@ -106,30 +143,78 @@ class CacheRepository:
         Args:
             judgment: 判定結果
         """
+        partition_keys = [self._generate_pk(judgment.url)]
+        fingerprint = content_fingerprint(judgment.title, judgment.description)
+        if fingerprint is not None:
+            partition_keys.append(self._generate_content_pk(fingerprint))
+
         try:
-            self._table.put_item(
-                Item={
-                    "PK": self._generate_pk(judgment.url),
-                    "SK": self._generate_sk(),
-                    "url": judgment.url,
-                    "title": judgment.title,
-                    "description": judgment.description,
-                    "interest_label": judgment.interest_label.value,
-                    "buzz_label": judgment.buzz_label.value,
-                    "confidence": judgment.confidence,
-                    "summary": judgment.summary,
-                    "model_id": judgment.model_id,
-                    "judged_at": judgment.judged_at.isoformat(),
-                    "published_at": judgment.published_at.isoformat(),
-                    "tags": judgment.tags,
-                }
-            )
+            for partition_key in partition_keys:
+                self._put_item(partition_key, judgment)
             logger.debug("cache_put_success", url=judgment.url)
 
         except ClientError as e:
             logger.error("cache_put_error", url=judgment.url, error=str(e))
             raise
 
+    def _put_item(self, partition_key: str, judgment: JudgmentResult) -> None:
+        """判定結果を指定したパーティションキーで保存する.
+
+        Args:
+            partition_key: パーティションキー
+            judgment: 判定結果
+        """
+        item: dict[str, Any] = {
+            "PK": partition_key,
+            "SK": self._generate_sk(),
+            "url": judgment.url,
+            "title": judgment.title,
+            "description": judgment.description,
+            "interest_label": judgment.interest_label.value,
+            "buzz_label": judgment.buzz_label.value,
+            "confidence": judgment.confidence,
+            "summary": judgment.summary,
+            "model_id": judgment.model_id,
+            "judged_at": judgment.judged_at.isoformat(),
+            "published_at": judgment.published_at.isoformat(),
+            "tags": judgment.tags,
+        }
+        if judgment.notified_at is not None:
+            item["notified_at"] = judgment.notified_at.isoformat()
+        self._table.put_item(Item=item)
+
+    def mark_notified(self, judgments: list[JudgmentResult], notified_at: datetime) -> None:
+        """判定結果を通知済みとして記録する.
+
+        URL・内容のフィンガープリントの両方のキーに記録し、同じ内容の記事が
+        別URLで再配信された場合も再通知しないようにする. 通知は送信済みのため、
+        記録に失敗してもエラーログのみとし例外は送出しない.
+
+        Args:
+            judgments: 通知した判定結果のリスト
+            notified_at: 通知日時（UTC）
+        """
+        for judgment in judgments:
+            partition_keys = [self._generate_pk(judgment.url)]
+            fingerprint = content_fingerprint(judgment.title, judgment.description)
+            if fingerprint is not None:
+                partition_keys.append(self._generate_content_pk(fingerprint))
+
+            for partition_key in partition_keys:
+                try:
+                    self._table.update_item(
+                        Key={"PK": partition_key, "SK": self._generate_sk()},
+                        UpdateExpression="SET notified_at = :notified_at",
+                        # 判定結果のない不完全な項目を作らないよう、既存項目のみ更新する
+                        ConditionExpression="attribute_exists(PK)",
+                        ExpressionAttributeValues={":notified_at": notified_at.isoformat()},
+                    )
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code", "")
+                    if error_code == "ConditionalCheckFailedException":
+                        continue
+                    logger.error("cache_mark_notified_error", url=judgment.url, error=str(e))
+
     def exists(self, url: str) -> bool:
         """URLが既に判定済みか確認する.
 
@@ -150,18 +235,87 @@ class CacheRepository:
         Returns:
             URLをキーとする判定済みフラグの辞書
         """
-        if not urls:
-            return {}
+        pks = [self._generate_pk(url) for url in urls]
+        existing_urls = {item["url"] for item in self._batch_get_items(pks)}
+        return {url: url in existing_urls for url in urls}
 
-        result: dict[str, bool] = {}
+    def batch_get(self, urls: list[str]) -> dict[str, JudgmentResult]:
+        """複数URLの判定結果を一括取得する.
+
+        Args:
+            urls: URLリスト
+
+        Returns:
+            URLをキーとする判定結果の辞書（未判定のURLは含まない）
+        """
+        pks = [self._generate_pk(url) for url in urls]
+        return {item["url"]: self._to_judgment(item) for item in self._batch_get_items(pks)}
+
+    def batch_get_for_articles(self, articles: list[Article]) -> dict[str, JudgmentResult]:
+        """複数記事の判定結果をURL・内容のフィンガープリントで一括取得する.
+
+        URLで見つからない記事は、同じ内容の記事の判定結果をその記事のURLに置き換えて返す.
+
+        Args:
+            articles: 記事リスト
+
+        Returns:
+            記事URLをキーとする判定結果の辞書（未判定の記事は含まない）
+        """
+        fingerprints = {
+            article.url: content_fingerprint(article.title, article.description)
+            for article in articles
+        }
+        url_pks = {article.url: self._generate_pk(article.url) for article in articles}
+        content_pks = {
+            url: self._generate_content_pk(fingerprint)
+            for url, fingerprint in fingerprints.items()
+            if fingerprint is not None
+        }
+        # 同じ内容の記事のキーは1回だけ取得する
+        pks = list(dict.fromkeys([*url_pks.values(), *content_pks.values()]))
+        items = {item["PK"]: item for item in self._batch_get_items(pks)}
+
+        judgments: dict[str, JudgmentResult] = {}
+        content_hit_count = 0
+        for article in articles:
+            if url_pks[article.url] in items:
+                judgments[article.url] = self._to_judgment(items[url_pks[article.url]])
+                continue
+            content_pk = content_pks.get(article.url)
+            if content_pk is not None and content_pk in items:
+                content_hit_count += 1
+                judgments[article.url] = dataclasses.replace(
+                    self._to_judgment(items[content_pk]),
+                    url=article.url,
+                    title=article.title,
+                    description=article.description,
+                )
+
+        if content_hit_count:
+            logger.debug("cache_content_hit", count=content_hit_count)
+        return judgments
+
+    def _batch_get_items(self, pks: list[str]) -> list[dict[str, Any]]:
+        """複数パーティションキーのキャッシュアイテムを一括取得する.
+
+        取得に失敗したバッチは未判定として扱う（安全側に倒す）.
+
+        Args:
+            pks: パーティションキーのリスト
+
+        Returns:
+            取得できたDynamoDBアイテムのリスト
+        """
+        items: list[dict[str, Any]] = []
 
         # DynamoDB BatchGetItemは最大100件まで
         batch_size = 100
-        for i in range(0, len(urls), batch_size):
-            batch_urls = urls[i : i + batch_size]
+        for i in range(0, len(pks), batch_size):
+            batch_pks = pks[i : i + batch_size]
 
             # リクエストキーを構築
-            keys = [{"PK": self._generate_pk(url), "SK": self._generate_sk()} for url in batch_urls]
+            keys = [{"PK": pk, "SK": self._generate_sk()} for pk in batch_pks]
 
             try:
                 response = self._dynamodb.batch_get_item(
@@ -171,20 +325,37 @@ class CacheRepository:
                         }
                     }
                 )
+            except ClientError as e:
+                logger.error("cache_batch_get_error", batch_size=len(batch_pks), error=str(e))
+                continue
 
-                # 存在するURLを取得
-                existing_urls = {
-                    item["url"] for item in response.get("Responses", {}).get(self._table_name, [])
-                }
+            items.extend(response.get("Responses", {}).get(self._table_name, []))
 
-                # 結果を構築
-                for url in batch_urls:
-                    result[url] = url in existing_urls
+        return items
 
-            except ClientError as e:
-                logger.error("cache_batch_exists_error", batch_size=len(batch_urls), error=str(e))
-                # エラー時は全てFalseとして扱う（安全側に倒す）
-                for url in batch_urls:
-                    result[url] = False
+    @staticmethod
+    def _to_judgment(item: dict[str, Any]) -> JudgmentResult:
+        """DynamoDBアイテムをJudgmentResultに変換する.
 
-        return result
+        Args:
+            item: DynamoDBアイテム
+
+        Returns:
+            判定結果
+        """
+        return JudgmentResult(
+            url=item["url"],
+            title=item.get("title", "No Title"),  # 欠損値の場合は"No Title"
+            description=item.get("description", ""),  # 欠損値の場合は空文字列
+            interest_label=InterestLabel(item["interest_label"]),
+            buzz_label=BuzzLabel(item["buzz_label"]),
+            confidence=float(item["confidence"]),
+            summary=item["summary"],
+            model_id=item["model_id"],
+            judged_at=datetime.fromisoformat(item["judged_at"]),
+            published_at=datetime.fromisoformat(item["published_at"]),
+            tags=item.get("tags", []),  # 欠損値の場合は空配列
+            notified_at=(
+                datetime.fromisoformat(item["notified_at"]) if "notified_at" in item else None
+            ),
+        )
@@ -1,11 +1,14 @@
 """実行履歴リポジトリモジュール."""
 
-from datetime import timedelta
+from dataclasses import asdict
+from datetime import datetime, timedelta
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from src.models.execution_summary import ExecutionSummary
+from src.models.source_latency import SourceLatency
+from src.models.stage_metrics import StageMetrics
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -115,6 +118,11 @@ class HistoryRepository:
                     "notification_sent": summary.notification_sent,
                     "execution_time_seconds": summary.execution_time_seconds,
                     "estimated_cost_usd": summary.estimated_cost_usd,
+                    "llm_budget_utilization": summary.llm_budget_utilization,
+                    "prefilter_ignored_count": summary.prefilter_ignored_count,
+                    "llm_escalated_count": summary.llm_escalated_count,
+                    "stage_metrics": [asdict(stage) for stage in summary.stage_metrics],
+                    "source_latencies": [asdict(latency) for latency in summary.source_latencies],
                     "ttl": ttl,
                 }
             )
@@ -129,6 +137,44 @@ class HistoryRepository:
             logger.error("history_save_error", run_id=summary.run_id, error=str(e))
             raise
 
+    @staticmethod
+    def _to_stage_metrics(stage: dict[str, Any]) -> StageMetrics:
+        """DynamoDBアイテムのステップ計測値をStageMetricsに変換する.
+
+        Args:
+            stage: ステップ計測値の辞書
+
+        Returns:
+            ステップ計測値
+        """
+        return StageMetrics(
+            name=str(stage["name"]),
+            wall_seconds=float(stage.get("wall_seconds", 0.0)),
+            cpu_seconds=float(stage.get("cpu_seconds", 0.0)),
+            peak_rss_delta_mb=float(stage.get("peak_rss_delta_mb", 0.0)),
+            http_request_count=int(stage.get("http_request_count", 0)),
+            http_bytes=int(stage.get("http_bytes", 0)),
+            bedrock_input_tokens=int(stage.get("bedrock_input_tokens", 0)),
+            bedrock_output_tokens=int(stage.get("bedrock_output_tokens", 0)),
+        )
+
+    @staticmethod
+    def _to_source_latency(latency: dict[str, Any]) -> SourceLatency:
+        """DynamoDBアイテムのレイテンシ統計をSourceLatencyに変換する.
+
+        Args:
+            latency: レイテンシ統計の辞書
+
+        Returns:
+            収集元ごとの取得レイテンシ統計
+        """
+        return SourceLatency(
+            source_id=str(latency["source_id"]),
+            p50_seconds=float(latency["p50_seconds"]),
+            p95_seconds=float(latency["p95_seconds"]),
+            sample_count=int(latency["sample_count"]),
+        )
+
     def get_by_week(self, year: int, week: int) -> list[ExecutionSummary]:
         """指定週の実行履歴を取得する.
 
@@ -150,8 +196,6 @@ class HistoryRepository:
             items = response.get("Items", [])
 
             # DynamoDBアイテムからExecutionSummaryに変換
-            from datetime import datetime
-
             summaries: list[ExecutionSummary] = []
             for item in items:
                 summary = ExecutionSummary(
@@ -165,6 +209,16 @@ class HistoryRepository:
                     notification_sent=bool(item["notification_sent"]),
                     execution_time_seconds=float(item["execution_time_seconds"]),
                     estimated_cost_usd=float(item["estimated_cost_usd"]),
+                    llm_budget_utilization=float(item.get("llm_budget_utilization", 0.0)),
+                    prefilter_ignored_count=int(item.get("prefilter_ignored_count", 0)),
+                    llm_escalated_count=int(item.get("llm_escalated_count", 0)),
+                    stage_metrics=[
+                        self._to_stage_metrics(stage) for stage in item.get("stage_metrics", [])
+                    ],
+                    source_latencies=[
+                        self._to_source_latency(latency)
+                        for latency in item.get("source_latencies", [])
+                    ],
                 )
                 summaries.append(summary)
 
@@ -174,3 +228,18 @@ class HistoryRepository:
         except ClientError as e:
             logger.error("history_get_by_week_error", year=year, week=week, error=str(e))
             return []
+
+    def get_latest(self, now: datetime) -> ExecutionSummary | None:
+        """直近の実行履歴を取得する（今週・前週の実行が対象）.
+
+        Args:
+            now: 現在日時
+
+        Returns:
+            直近の実行サマリ（今週・前週に実行履歴がない場合None）
+        """
+        summaries: list[ExecutionSummary] = []
+        for day in (now - timedelta(weeks=1), now):
+            iso_calendar = day.isocalendar()
+            summaries.extend(self.get_by_week(iso_calendar[0], iso_calendar[1]))
+        return max(summaries, key=lambda summary: summary.executed_at, default=None)
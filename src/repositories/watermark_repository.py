@@ -0,0 +1,141 @@
+"""収集元ハイウォーターマークリポジトリモジュール."""
+
+from datetime import datetime
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from src.models.source_watermark import SourceWatermark
+from src.shared.logging.logger import get_logger
+from src.shared.utils.date_utils import now_utc
+
+logger = get_logger(__name__)
+
+
+class WatermarkRepository:
+    """収集元ハイウォーターマークリポジトリ.
+
+    DynamoDBにソースごとのハイウォーターマークを保存する.
+
+    Attributes:
+        _table: DynamoDBテーブルリソース
+        _table_name: テーブル名
+        _dry_run: ドライランモード（true の場合、保存をスキップ）
+    """
+
+    def __init__(self, dynamodb_resource: Any, table_name: str, dry_run: bool = False) -> None:
+        """リポジトリを初期化する.
+
+        Args:
+            dynamodb_resource: DynamoDBリソース（boto3.resource('dynamodb')）
+            table_name: テーブル名
+            dry_run: ドライランモード（デフォルト: False）
+        """
+        self._dynamodb = dynamodb_resource
+        self._table_name = table_name
+        self._table = dynamodb_resource.Table(table_name)
+        self._dry_run = dry_run
+
+    def _generate_pk(self, source_id: str) -> str:
+        """ソースIDからパーティションキーを生成する.
+
+        Args:
+            source_id: ソースID
+
+        Returns:
+            パーティションキー（SOURCE#<source_id>形式）
+        """
+        return f"SOURCE#{source_id}"
+
+    def _generate_sk(self) -> str:
+        """ソートキーを生成する.
+
+        Returns:
+            ソートキー（WATERMARK#v1固定）
+        """
+        return "WATERMARK#v1"
+
+    def get_all(self, source_ids: list[str]) -> dict[str, SourceWatermark]:
+        """複数ソースのハイウォーターマークを一括取得する.
+
+        取得に失敗した場合は空の結果を返す（全件収集に倒す）.
+
+        Args:
+            source_ids: ソースIDリスト
+
+        Returns:
+            ソースIDをキーとするハイウォーターマークの辞書（未保存のソースは含まない）
+        """
+        result: dict[str, SourceWatermark] = {}
+
+        # DynamoDB BatchGetItemは最大100件まで
+        batch_size = 100
+        for i in range(0, len(source_ids), batch_size):
+            batch_ids = source_ids[i : i + batch_size]
+            keys = [{"PK": self._generate_pk(sid), "SK": self._generate_sk()} for sid in batch_ids]
+
+            try:
+                response = self._dynamodb.batch_get_item(
+                    RequestItems={self._table_name: {"Keys": keys}}
+                )
+            except ClientError as e:
+                logger.error("watermark_get_error", batch_size=len(batch_ids), error=str(e))
+                continue
+
+            for item in response.get("Responses", {}).get(self._table_name, []):
+                watermark = self._to_watermark(item)
+                result[watermark.source_id] = watermark
+
+        return result
+
+    def save(self, watermark: SourceWatermark) -> None:
+        """ハイウォーターマークを保存する.
+
+        dry_run=true の場合、保存をスキップします（本番実行の収集対象を減らさないため）。
+
+        Args:
+            watermark: ハイウォーターマーク
+
+        Raises:
+            ClientError: DynamoDB操作に失敗した場合
+        """
+        if self._dry_run:
+            logger.debug(
+                "watermark_save_skipped",
+                source_id=watermark.source_id,
+                reason="dry_run_mode_enabled",
+            )
+            return
+
+        try:
+            self._table.put_item(
+                Item={
+                    "PK": self._generate_pk(watermark.source_id),
+                    "SK": self._generate_sk(),
+                    "source_id": watermark.source_id,
+                    "latest_published_at": watermark.latest_published_at.isoformat(),
+                    "recent_entry_ids": sorted(watermark.recent_entry_ids),
+                    "updated_at": now_utc().isoformat(),
+                }
+            )
+            logger.debug("watermark_save_success", source_id=watermark.source_id)
+
+        except ClientError as e:
+            logger.error("watermark_save_error", source_id=watermark.source_id, error=str(e))
+            raise
+
+    @staticmethod
+    def _to_watermark(item: dict[str, Any]) -> SourceWatermark:
+        """DynamoDBアイテムをSourceWatermarkに変換する.
+
+        Args:
+            item: DynamoDBアイテム
+
+        Returns:
+            ハイウォーターマーク
+        """
+        return SourceWatermark(
+            source_id=item["source_id"],
+            latest_published_at=datetime.fromisoformat(item["latest_published_at"]),
+            recent_entry_ids=frozenset(item.get("recent_entry_ids", [])),
+        )
@@ -0,0 +1,272 @@
+"""バッチ推論ジョブ実行モジュール."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol
+
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 出力を読み出せるジョブ状態（PartiallyCompleted は一部レコードのみ error を持つ）
+BATCH_JOB_SUCCEEDED_STATUSES = frozenset({"Completed", "PartiallyCompleted"})
+
+# 出力を読み出せずに終了したジョブ状態
+BATCH_JOB_FAILED_STATUSES = frozenset({"Failed", "Stopping", "Stopped", "Expired"})
+
+
+class BatchJobRunner(Protocol):
+    """バッチ推論ジョブの実行基盤.
+
+    レコードは Bedrock バッチ推論の JSONL 形式
+    （入力: {"recordId", "modelInput"}、出力: {"recordId", "modelOutput"} または {"recordId", "error"}）.
+    """
+
+    def submit(self, job_name: str, records: list[dict[str, Any]]) -> str:
+        """入力レコードを書き出してジョブを投入し、ジョブIDを返す."""
+        ...
+
+    def get_status(self, job_id: str) -> str:
+        """ジョブ状態（Bedrockのステータス文字列）を返す."""
+        ...
+
+    def read_outputs(self, job_id: str) -> list[dict[str, Any]]:
+        """完了したジョブの出力レコードを返す."""
+        ...
+
+    def stop(self, job_id: str) -> None:
+        """実行中のジョブを停止する."""
+        ...
+
+
+def _to_jsonl(records: list[dict[str, Any]]) -> str:
+    """レコードをJSONL文字列に変換する."""
+    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+
+def _parse_jsonl(text: str) -> list[dict[str, Any]]:
+    """JSONL文字列をレコードのリストに変換する（空行は無視）."""
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class BedrockBatchJobRunner:
+    """Bedrockバッチ推論（CreateModelInvocationJob）によるジョブ実行基盤.
+
+    入力JSONLをS3に書き出してジョブを投入し、ジョブ完了後にS3から出力JSONLを読み込む.
+
+    Attributes:
+        _bedrock_client: Bedrockコントロールプレーンクライアント（boto3.client('bedrock')）
+        _s3_client: S3クライアント
+        _bucket: 入出力を置くS3バケット名
+        _role_arn: Bedrockがバケットにアクセスするためのサービスロール ARN
+        _model_id: 使用するモデルID（またはインファレンスプロファイルARN）
+        _prefix: 入出力を置くS3キーの接頭辞
+    """
+
+    def __init__(
+        self,
+        bedrock_client: Any,
+        s3_client: Any,
+        bucket: str,
+        role_arn: str,
+        model_id: str,
+        prefix: str = "llm-batch",
+    ) -> None:
+        """ジョブ実行基盤を初期化する.
+
+        Args:
+            bedrock_client: Bedrockコントロールプレーンクライアント（boto3.client('bedrock')）
+            s3_client: S3クライアント（boto3.client('s3')）
+            bucket: 入出力を置くS3バケット名
+            role_arn: Bedrockがバケットにアクセスするためのサービスロール ARN
+            model_id: 使用するモデルID（またはインファレンスプロファイルARN）
+            prefix: 入出力を置くS3キーの接頭辞（デフォルト: "llm-batch"）
+        """
+        self._bedrock_client = bedrock_client
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._role_arn = role_arn
+        self._model_id = model_id
+        self._prefix = prefix.strip("/")
+
+    def submit(self, job_name: str, records: list[dict[str, Any]]) -> str:
+        """入力JSONLをS3に書き出してジョブを投入する.
+
+        Args:
+            job_name: ジョブ名
+            records: 入力レコードのリスト
+
+        Returns:
+            ジョブARN
+
+        Raises:
+            ClientError: S3書き込み・ジョブ投入に失敗した場合
+        """
+        input_key = f"{self._prefix}/{job_name}/input.jsonl"
+        self._s3_client.put_object(
+            Bucket=self._bucket, Key=input_key, Body=_to_jsonl(records).encode()
+        )
+        response = self._bedrock_client.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self._role_arn,
+            modelId=self._model_id,
+            inputDataConfig={
+                "s3InputDataConfig": {
+                    "s3Uri": f"s3://{self._bucket}/{input_key}",
+                    "s3InputFormat": "JSONL",
+                }
+            },
+            outputDataConfig={
+                "s3OutputDataConfig": {"s3Uri": f"s3://{self._bucket}/{self._prefix}/{job_name}/"}
+            },
+        )
+        job_arn: str = response["jobArn"]
+        logger.info("batch_job_submitted", job_arn=job_arn, record_count=len(records))
+        return job_arn
+
+    def get_status(self, job_id: str) -> str:
+        """ジョブ状態を返す.
+
+        Args:
+            job_id: ジョブARN
+
+        Returns:
+            ジョブ状態（Submitted, InProgress, Completed など）
+        """
+        response = self._bedrock_client.get_model_invocation_job(jobIdentifier=job_id)
+        status: str = response["status"]
+        return status
+
+    def read_outputs(self, job_id: str) -> list[dict[str, Any]]:
+        """S3から出力JSONLを読み込む.
+
+        Bedrockは出力先URIの配下に <ジョブID>/<入力ファイル名>.out を書き出す.
+
+        Args:
+            job_id: ジョブARN
+
+        Returns:
+            出力レコードのリスト
+        """
+        job = self._bedrock_client.get_model_invocation_job(jobIdentifier=job_id)
+        output_uri: str = job["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"]
+        bucket, _, key_prefix = output_uri.removeprefix("s3://").partition("/")
+        job_prefix = f"{key_prefix.rstrip('/')}/{job_id.rsplit('/', 1)[-1]}/"
+
+        records: list[dict[str, Any]] = []
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=job_prefix):
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith(".jsonl.out"):
+                    continue
+                body = self._s3_client.get_object(Bucket=bucket, Key=obj["Key"])["Body"]
+                records.extend(_parse_jsonl(body.read().decode()))
+        return records
+
+    def stop(self, job_id: str) -> None:
+        """ジョブを停止する.
+
+        Args:
+            job_id: ジョブARN
+        """
+        self._bedrock_client.stop_model_invocation_job(jobIdentifier=job_id)
+        logger.info("batch_job_stopped", job_arn=job_id)
+
+
+class LocalBatchJobRunner:
+    """ローカルファイルによるジョブ実行基盤（オフライン検証用）.
+
+    Bedrockバッチ推論と同じJSONL形式で入出力をディレクトリに書き出す.
+    ジョブは初回の状態確認時に同期的に実行し、各レコードの modelInput を invoke に渡す.
+    invoke が例外を送出したレコードは Bedrock と同様に error を持つ出力レコードになる.
+
+    Attributes:
+        _work_dir: ジョブの入出力を置くディレクトリ
+        _invoke: modelInput を受け取り modelOutput を返す関数
+    """
+
+    def __init__(self, work_dir: Path, invoke: Callable[[dict[str, Any]], dict[str, Any]]) -> None:
+        """ジョブ実行基盤を初期化する.
+
+        Args:
+            work_dir: ジョブの入出力を置くディレクトリ
+            invoke: modelInput を受け取り modelOutput を返す関数
+        """
+        self._work_dir = work_dir
+        self._invoke = invoke
+
+    def submit(self, job_name: str, records: list[dict[str, Any]]) -> str:
+        """入力JSONLを書き出してジョブを投入する.
+
+        Args:
+            job_name: ジョブ名
+            records: 入力レコードのリスト
+
+        Returns:
+            ジョブID（ジョブ名）
+        """
+        job_dir = self._work_dir / job_name
+        job_dir.mkdir(parents=True, exist_ok=True)
+        (job_dir / "input.jsonl").write_text(_to_jsonl(records), encoding="utf-8")
+        (job_dir / "status").write_text("Submitted", encoding="utf-8")
+        return job_name
+
+    def get_status(self, job_id: str) -> str:
+        """ジョブ状態を返す（未実行のジョブはここで実行する）.
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            ジョブ状態
+        """
+        job_dir = self._work_dir / job_id
+        status = (job_dir / "status").read_text(encoding="utf-8")
+        if status != "Submitted":
+            return status
+
+        outputs = [
+            self._run_record(record)
+            for record in _parse_jsonl((job_dir / "input.jsonl").read_text(encoding="utf-8"))
+        ]
+        (job_dir / "input.jsonl.out").write_text(_to_jsonl(outputs), encoding="utf-8")
+        status = (
+            "Completed"
+            if all("error" not in output for output in outputs)
+            else "PartiallyCompleted"
+        )
+        (job_dir / "status").write_text(status, encoding="utf-8")
+        return status
+
+    def read_outputs(self, job_id: str) -> list[dict[str, Any]]:
+        """出力JSONLを読み込む.
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            出力レコードのリスト
+        """
+        output_path = self._work_dir / job_id / "input.jsonl.out"
+        return _parse_jsonl(output_path.read_text(encoding="utf-8"))
+
+    def stop(self, job_id: str) -> None:
+        """ジョブを停止する.
+
+        Args:
+            job_id: ジョブID
+        """
+        (self._work_dir / job_id / "status").write_text("Stopped", encoding="utf-8")
+
+    def _run_record(self, record: dict[str, Any]) -> dict[str, Any]:
+        """入力レコード1件を処理して出力レコードを返す."""
+        output: dict[str, Any] = {
+            "recordId": record["recordId"],
+            "modelInput": record["modelInput"],
+        }
+        try:
+            output["modelOutput"] = self._invoke(record["modelInput"])
+        except Exception as e:
+            output["error"] = {"errorMessage": str(e)}
+        return output
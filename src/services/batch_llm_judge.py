@@ -0,0 +1,218 @@
+"""バッチ推論によるLLM判定サービスモジュール."""
+
+import asyncio
+import time
+from typing import Any
+from uuid import uuid4
+
+from botocore.exceptions import ClientError
+
+from src.models.article import Article
+from src.models.bedrock_usage import BedrockCallUsage, BedrockUsageLedger
+from src.models.interest_profile import InterestProfile
+from src.models.judgment import JudgmentResult
+from src.repositories.cache_repository import CacheRepository
+from src.services.batch_job_runner import (
+    BATCH_JOB_FAILED_STATUSES,
+    BATCH_JOB_SUCCEEDED_STATUSES,
+    BatchJobRunner,
+)
+from src.services.llm_judge import JudgmentBatchResult, LlmJudge
+from src.shared.exceptions.llm_error import LlmBatchRecordError
+from src.shared.logging.logger import get_logger
+from src.shared.utils.date_utils import now_utc
+from src.shared.utils.stage_profiler import record_bedrock_tokens
+
+logger = get_logger(__name__)
+
+
+class BatchLlmJudge(LlmJudge):
+    """バッチ推論によるLLM判定サービス.
+
+    判定プロンプトをJSONLのバッチジョブとして投入し、完了を待って出力を判定結果に変換する.
+    リアルタイム呼び出しのスロットリングを受けず、バッチ推論の割引単価で課金されるため、
+    バックフィルなど件数が多く即時性を求めない判定に使用する.
+
+    プロンプト生成・出力の検証（_parse_response）・判定失敗時のフォールバック・
+    キャッシュ保存はLlmJudgeと共通. 件数が min_batch_size 未満の場合は
+    バッチジョブを投入せずリアルタイム判定に切り替える.
+
+    Attributes:
+        _job_runner: バッチ推論ジョブの実行基盤
+        _poll_interval_seconds: ジョブ状態の確認間隔（秒）
+        _min_batch_size: バッチジョブを投入する最小件数
+    """
+
+    # Bedrockバッチ推論の1ジョブあたり最小レコード数
+    DEFAULT_MIN_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        job_runner: BatchJobRunner,
+        bedrock_client: Any,
+        cache_repository: CacheRepository | None,
+        interest_profile: InterestProfile,
+        model_id: str,
+        inference_profile_arn: str = "",
+        poll_interval_seconds: float = 60.0,
+        min_batch_size: int = DEFAULT_MIN_BATCH_SIZE,
+    ) -> None:
+        """バッチ推論によるLLM判定サービスを初期化する.
+
+        Args:
+            job_runner: バッチ推論ジョブの実行基盤
+            bedrock_client: Bedrock Runtimeクライアント（min_batch_size未満のリアルタイム判定用）
+            cache_repository: キャッシュリポジトリ
+            interest_profile: 関心プロファイル
+            model_id: 使用するLLMモデルID
+            inference_profile_arn: インファレンスプロファイルARN（デフォルト: ""）
+            poll_interval_seconds: ジョブ状態の確認間隔（秒、デフォルト: 60.0）
+            min_batch_size: バッチジョブを投入する最小件数（デフォルト: 100）
+        """
+        super().__init__(
+            bedrock_client=bedrock_client,
+            cache_repository=cache_repository,
+            interest_profile=interest_profile,
+            model_id=model_id,
+            inference_profile_arn=inference_profile_arn,
+        )
+        self._job_runner = job_runner
+        self._poll_interval_seconds = poll_interval_seconds
+        self._min_batch_size = min_batch_size
+
+    async def judge_batch(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> JudgmentBatchResult:
+        """記事リストをバッチ推論ジョブで一括判定する.
+
+        budget_seconds までにジョブが完了しない場合はジョブを停止し、
+        全件を未判定（skipped_count）として返す.
+
+        Args:
+            articles: 判定対象記事のリスト
+            budget_seconds: ジョブ完了を待つ時間予算（秒、デフォルト: None=無制限）
+
+        Returns:
+            一括判定結果
+        """
+        if len(articles) < self._min_batch_size:
+            logger.info(
+                "llm_batch_job_skipped",
+                article_count=len(articles),
+                min_batch_size=self._min_batch_size,
+                reason="below_min_batch_size",
+            )
+            return await super().judge_batch(articles, budget_seconds=budget_seconds)
+
+        start_time = time.time()
+        self._usage_ledger = BedrockUsageLedger()
+
+        records = [
+            {
+                "recordId": self._record_id(index),
+                "modelInput": self._build_request_body(
+                    self._build_prompt(article), tool_use=self._tool_use
+                ),
+            }
+            for index, article in enumerate(articles)
+        ]
+        job_name = f"judge-{now_utc():%Y%m%d-%H%M%S}-{uuid4().hex[:8]}"
+
+        outputs: dict[str, dict[str, Any]] = {}
+        try:
+            job_id = await asyncio.to_thread(self._job_runner.submit, job_name, records)
+            status = await self._wait_for_job(job_id, budget_seconds)
+            if status is None:
+                logger.warning(
+                    "llm_batch_job_budget_exceeded",
+                    job_id=job_id,
+                    budget_seconds=budget_seconds,
+                    skipped_count=len(articles),
+                )
+                await asyncio.to_thread(self._job_runner.stop, job_id)
+                return JudgmentBatchResult(
+                    judgments=[],
+                    failed_count=0,
+                    skipped_count=len(articles),
+                    usage=self._usage_ledger,
+                )
+            if status in BATCH_JOB_SUCCEEDED_STATUSES:
+                raw_outputs = await asyncio.to_thread(self._job_runner.read_outputs, job_id)
+                outputs = {output["recordId"]: output for output in raw_outputs}
+            logger.info(
+                "llm_batch_job_finished",
+                job_id=job_id,
+                status=status,
+                output_count=len(outputs),
+            )
+        except ClientError as e:
+            # 投入・状態確認に失敗した場合は全件を判定失敗として扱う
+            logger.error("llm_batch_job_error", job_name=job_name, error=str(e))
+
+        results: list[JudgmentResult | BaseException | None] = []
+        for index, article in enumerate(articles):
+            try:
+                results.append(self._judge_output(article, outputs.get(self._record_id(index))))
+            except Exception as e:
+                results.append(e)
+
+        return self._aggregate_results(articles, results, time.time() - start_time)
+
+    async def _wait_for_job(self, job_id: str, budget_seconds: float | None) -> str | None:
+        """ジョブが終了するまで状態を確認する.
+
+        Args:
+            job_id: ジョブID
+            budget_seconds: 待機の時間予算（秒、None=無制限）
+
+        Returns:
+            終了時のジョブ状態（時間予算内に終了しなかった場合None）
+        """
+        deadline = None if budget_seconds is None else time.monotonic() + budget_seconds
+        while True:
+            status = await asyncio.to_thread(self._job_runner.get_status, job_id)
+            if status in BATCH_JOB_SUCCEEDED_STATUSES or status in BATCH_JOB_FAILED_STATUSES:
+                return status
+            if deadline is not None and time.monotonic() + self._poll_interval_seconds > deadline:
+                return None
+            logger.debug("llm_batch_job_pending", job_id=job_id, status=status)
+            await asyncio.sleep(self._poll_interval_seconds)
+
+    def _judge_output(self, article: Article, output: dict[str, Any] | None) -> JudgmentResult:
+        """バッチ出力レコードを判定結果に変換する.
+
+        Args:
+            article: 判定対象記事
+            output: 出力レコード（ジョブ失敗・レコード欠落の場合None）
+
+        Returns:
+            判定結果
+
+        Raises:
+            LlmBatchRecordError: 出力レコードがない、またはレコード単位で失敗した場合
+            LlmJsonParseError: LLM出力のJSON解析に失敗した場合
+        """
+        if output is None:
+            raise LlmBatchRecordError("Batch output record not found")
+        if "error" in output:
+            raise LlmBatchRecordError(f"Batch record failed: {output['error']}")
+
+        response_body = output["modelOutput"]
+        # JSON解析に失敗したレコードも課金されるため解析前に記録する
+        call_usage = BedrockCallUsage.from_response_usage(
+            article.url,
+            self._model_id,
+            attempt=0,
+            usage=response_body.get("usage", {}),
+            batch_inference=True,
+        )
+        self._usage_ledger.record(call_usage)
+        record_bedrock_tokens(call_usage.input_tokens, call_usage.output_tokens)
+
+        judgment_data = self._parse_response(self._response_text(response_body))
+        return self._to_judgment(article, judgment_data)
+
+    @staticmethod
+    def _record_id(index: int) -> str:
+        """入力レコードのIDを返す（Bedrockの recordId 形式: 英数字11文字）."""
+        return f"REC{index:08d}"
@@ -0,0 +1,262 @@
+"""Bedrockマルチリージョン振り分けサービスモジュール."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from src.services.llm_judge import RETRYABLE_ERROR_CODES
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# クロスリージョン推論プロファイルIDの地域プレフィックス（例: "apac.anthropic.claude-..."）
+INFERENCE_PROFILE_PREFIXES = frozenset({"us", "us-gov", "eu", "apac", "jp", "au", "ca", "global"})
+
+
+@dataclass
+class BedrockRegion:
+    """振り分け先のBedrockリージョン.
+
+    Attributes:
+        region: AWSリージョン
+        weight: 振り分けの重み（正の整数）
+        profile_prefix: モデルIDに付与する推論プロファイルの地域プレフィックス（空の場合は書き換えない）
+    """
+
+    region: str
+    weight: int = 1
+    profile_prefix: str = ""
+
+    def model_identifier(self, model_id: str) -> str:
+        """このリージョンで呼び出すモデル識別子を返す.
+
+        地域プレフィックス付きのモデルID（推論プロファイルID）はこのリージョンの
+        プレフィックスに置き換える. ARNはリージョン固有のため書き換えない.
+
+        Args:
+            model_id: リクエストに指定されたモデルID
+
+        Returns:
+            モデル識別子
+        """
+        if not self.profile_prefix or model_id.startswith("arn:"):
+            return model_id
+        prefix, _, base_model_id = model_id.partition(".")
+        if prefix not in INFERENCE_PROFILE_PREFIXES:
+            base_model_id = model_id
+        return f"{self.profile_prefix}.{base_model_id}"
+
+
+def parse_region_pool(spec: str) -> list[BedrockRegion]:
+    """リージョンプール設定を解析する.
+
+    形式はカンマ区切りの "リージョン[=地域プレフィックス][:重み]"
+    （例: "ap-northeast-1=apac:2,us-east-1=us"）.
+
+    Args:
+        spec: リージョンプール設定
+
+    Returns:
+        振り分け先リージョンのリスト（設定が空の場合は空リスト）
+
+    Raises:
+        ValueError: 重みが正の整数でない、またはリージョンが重複している場合
+    """
+    regions: list[BedrockRegion] = []
+    for entry in (raw_entry.strip() for raw_entry in spec.split(",")):
+        if not entry:
+            continue
+        target, _, weight = entry.partition(":")
+        region, _, profile_prefix = target.partition("=")
+        parsed_weight = int(weight) if weight else 1
+        if parsed_weight <= 0:
+            raise ValueError(f"Region weight must be positive: {entry}")
+        regions.append(
+            BedrockRegion(
+                region=region.strip(),
+                weight=parsed_weight,
+                profile_prefix=profile_prefix.strip(),
+            )
+        )
+    names = [region.region for region in regions]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate region in region pool: {spec}")
+    return regions
+
+
+@dataclass
+class _RegionState:
+    """リージョンごとの振り分け・健全性の状態.
+
+    Attributes:
+        region: 振り分け先リージョン
+        client: リージョンのBedrock Runtimeクライアント
+        current_weight: 平滑化加重ラウンドロビンの現在の重み
+        throttled_until: スロットリングによる除外期限（monotonic秒）
+        consecutive_throttles: 連続したスロットリングの回数
+    """
+
+    region: BedrockRegion
+    client: Any
+    current_weight: int = 0
+    throttled_until: float = 0.0
+    consecutive_throttles: int = 0
+
+
+class BedrockRegionPool:
+    """複数リージョンのBedrock Runtimeクライアントにリクエストを振り分ける.
+
+    Bedrock Runtimeクライアントと同じ invoke_model / invoke_model_with_response_stream を
+    提供し、LlmJudge にクライアントとしてそのまま渡せる. リクエストは重みに応じて
+    平滑化加重ラウンドロビンで振り分ける.
+
+    ThrottlingException 等のリトライ対象エラーが発生したリージョンは一定時間
+    振り分けから除外し（連続するほど除外時間を延ばす）、同じリクエストを待たずに
+    他の健全なリージョンへ振り替える. 全リージョンで失敗した場合は最後のエラーを送出し、
+    呼び出し側のバックオフ付きリトライに委ねる. 全リージョンが除外中の場合は
+    除外期限が最も早いリージョンを使用する.
+
+    Lambdaのウォーム起動間で健全性を引き継ぐため、モジュールレベルで保持して
+    複数回の実行で共有する想定（asyncio.to_thread から並行に呼ばれるためロックで保護する）.
+
+    Attributes:
+        _states: リージョンごとの状態（設定順）
+        _clock: 現在時刻（monotonic秒）を返す関数
+        _lock: 状態更新のロック
+    """
+
+    BASE_COOLDOWN_SECONDS = 2.0
+    MAX_COOLDOWN_SECONDS = 30.0
+
+    def __init__(
+        self,
+        clients: list[tuple[BedrockRegion, Any]],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """マルチリージョン振り分けを初期化する.
+
+        Args:
+            clients: 振り分け先リージョンとそのBedrock Runtimeクライアントのリスト
+            clock: 現在時刻（monotonic秒）を返す関数（デフォルト: time.monotonic）
+
+        Raises:
+            ValueError: 振り分け先リージョンが空の場合
+        """
+        if not clients:
+            raise ValueError("Region pool requires at least one region")
+        self._states = [_RegionState(region=region, client=client) for region, client in clients]
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """振り分け先リージョン数を返す."""
+        return len(self._states)
+
+    def invoke_model(self, **kwargs: Any) -> dict[str, Any]:
+        """いずれかのリージョンでモデルを呼び出す.
+
+        Args:
+            **kwargs: invoke_model の引数（modelId はリージョンに応じて書き換える）
+
+        Returns:
+            invoke_model の応答
+
+        Raises:
+            ClientError: リトライ対象外のエラー、または全リージョンで失敗した場合
+        """
+        return self._call("invoke_model", kwargs)
+
+    def invoke_model_with_response_stream(self, **kwargs: Any) -> dict[str, Any]:
+        """いずれかのリージョンでモデルをストリーミング呼び出しする.
+
+        ストリーム読み取り中のエラーは振り替えない（呼び出し側でリトライする）.
+
+        Args:
+            **kwargs: invoke_model_with_response_stream の引数
+
+        Returns:
+            invoke_model_with_response_stream の応答
+
+        Raises:
+            ClientError: リトライ対象外のエラー、または全リージョンで失敗した場合
+        """
+        return self._call("invoke_model_with_response_stream", kwargs)
+
+    def _call(self, operation: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """健全なリージョンを順に選んで呼び出し、スロットリング時は他リージョンへ振り替える."""
+        tried: set[str] = set()
+        last_error: ClientError | None = None
+        while (state := self._select(tried)) is not None:
+            tried.add(state.region.region)
+            call_kwargs = dict(kwargs)
+            if "modelId" in call_kwargs:
+                call_kwargs["modelId"] = state.region.model_identifier(call_kwargs["modelId"])
+            try:
+                response: dict[str, Any] = getattr(state.client, operation)(**call_kwargs)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                if error_code not in RETRYABLE_ERROR_CODES:
+                    raise
+                cooldown = self._mark_throttled(state)
+                logger.warning(
+                    "bedrock_region_throttled",
+                    region=state.region.region,
+                    error_code=error_code,
+                    cooldown_seconds=cooldown,
+                )
+                last_error = e
+                continue
+            self._mark_healthy(state)
+            if len(tried) > 1:
+                logger.info("bedrock_region_spillover", region=state.region.region)
+            return response
+
+        if last_error is not None:
+            raise last_error
+        # ここには到達しないはずだが、型チェックのため（_select は初回に必ずリージョンを返す）
+        raise RuntimeError("No Bedrock region available")
+
+    def _select(self, tried: set[str]) -> _RegionState | None:
+        """次に呼び出すリージョンを選ぶ（未試行かつ健全なリージョンがない場合None）.
+
+        初回の選択で全リージョンが除外中の場合は、除外期限が最も早いリージョンを返す.
+        """
+        with self._lock:
+            now = self._clock()
+            candidates = [
+                state
+                for state in self._states
+                if state.region.region not in tried and state.throttled_until <= now
+            ]
+            if not candidates:
+                if tried:
+                    return None
+                return min(self._states, key=lambda state: state.throttled_until)
+
+            # 平滑化加重ラウンドロビン（重みに比例しつつ同じリージョンへの連続を避ける）
+            for state in candidates:
+                state.current_weight += state.region.weight
+            selected = max(candidates, key=lambda state: state.current_weight)
+            selected.current_weight -= sum(state.region.weight for state in candidates)
+            return selected
+
+    def _mark_throttled(self, state: _RegionState) -> float:
+        """リージョンを一定時間振り分けから除外し、除外時間（秒）を返す."""
+        with self._lock:
+            state.consecutive_throttles += 1
+            cooldown = min(
+                self.BASE_COOLDOWN_SECONDS * 2.0 ** (state.consecutive_throttles - 1),
+                self.MAX_COOLDOWN_SECONDS,
+            )
+            state.throttled_until = self._clock() + cooldown
+            return cooldown
+
+    def _mark_healthy(self, state: _RegionState) -> None:
+        """リージョンの連続スロットリング回数をリセットする."""
+        with self._lock:
+            state.consecutive_throttles = 0
+            state.throttled_until = 0.0
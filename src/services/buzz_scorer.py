@@ -5,10 +5,12 @@ from src.models.buzz_score import BuzzScore
 from src.models.interest_profile import InterestProfile
 from src.models.source_config import AuthorityLevel
 from src.repositories.source_master import SourceMaster
+from src.services.interest_relevance import InterestRelevanceScorer
 from src.services.social_proof.multi_source_social_proof_fetcher import (
     MultiSourceSocialProofFetcher,
 )
 from src.shared.logging.logger import get_logger
+from src.shared.utils.stage_profiler import stage_span
 
 logger = get_logger(__name__)
 
@@ -18,7 +20,7 @@ class BuzzScorer:
 
     スコア計算式:
     - social_proof_score = 4指標統合スコア（yamadashy, Hatena, Zenn, Qiita）（0-100）
-    - interest_score = InterestProfileとのマッチング度（0-100）
+    - interest_score = InterestProfileとの関連度（0-100、InterestRelevanceScorer で計算）
     - authority_score = authority_levelに応じたスコア（0, 50, 80, 100）
     - total_score = (social_proof × 0.55) + (interest × 0.35) + (authority × 0.10)
     """
@@ -41,15 +43,19 @@ class BuzzScorer:
             source_master: 収集元マスタ
             social_proof_fetcher: MultiSourceSocialProof取得サービス（4指標統合）
         """
-        self._interest_profile = interest_profile
+        # トピックの特徴量ベクトルは初期化時に1度だけ構築する
+        self._relevance_scorer = InterestRelevanceScorer(interest_profile)
         self._source_master = source_master
         self._social_proof_fetcher = social_proof_fetcher
 
-    async def calculate_scores(self, articles: list[Article]) -> dict[str, BuzzScore]:
+    async def calculate_scores(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> dict[str, BuzzScore]:
         """全記事のBuzzスコアを計算する（非同期版）.
 
         Args:
             articles: 重複排除済み記事のリスト
+            budget_seconds: SocialProof取得の時間予算（秒、デフォルト: None=無制限）
 
         Returns:
             スコア辞書（normalized_url -> BuzzScore）
@@ -57,14 +63,19 @@ class BuzzScorer:
         logger.debug("buzz_scoring_start", article_count=len(articles))
 
         # SocialProof（4指標統合スコア）を一括取得
-        social_proof_scores = await self._social_proof_fetcher.fetch_batch(articles)
+        with stage_span("social_proof"):
+            social_proof_scores = await self._social_proof_fetcher.fetch_batch(
+                articles, budget_seconds=budget_seconds
+            )
+
+        # Interestスコアは全記事を一括計算する
+        interest_scores = self._relevance_scorer.score_batch(articles)
 
         # 各記事のスコアを計算
         scores: dict[str, BuzzScore] = {}
 
-        for article in articles:
+        for article, interest_score in zip(articles, interest_scores, strict=True):
             social_proof_score = social_proof_scores.get(article.url, 20.0)  # デフォルト20.0
-            interest_score = self._calculate_interest_score(article)
             authority_score = self._calculate_authority_score(article.source_name)
 
             total_score = self._calculate_total_score(
@@ -97,60 +108,6 @@ class BuzzScorer:
 
         return scores
 
-    def _calculate_interest_score(self, article: Article) -> float:
-        """Interest（興味との一致度）スコアを計算する（5段階版）.
-
-        Args:
-            article: 記事
-
-        Returns:
-            スコア（0-100）
-        """
-        text = f"{article.title} {article.description}".lower()
-
-        # トピックレベルとスコアのマッピング（下位厳格型）
-        topic_levels = [
-            (self._interest_profile.max_interest, 100.0),
-            (self._interest_profile.high_interest, 80.0),
-            (self._interest_profile.medium_interest, 55.0),
-            (self._interest_profile.low_interest, 30.0),
-            (self._interest_profile.ignore_interest, 0.0),
-        ]
-
-        for topics, score in topic_levels:
-            for topic in topics:
-                if self._match_topic(topic, text):
-                    return score
-
-        # いずれにも一致しない場合はデフォルト（ignore寄りの低スコア）
-        return 15.0
-
-    def _match_topic(self, topic: str, text: str) -> bool:
-        """トピックとテキストのマッチング判定.
-
-        Args:
-            topic: トピック文字列（例: "AI/ML（大規模言語モデル、機械学習基盤）"）
-            text: 記事タイトル+概要の結合テキスト
-
-        Returns:
-            マッチングした場合True
-        """
-        # トピックからキーワードを抽出（括弧内・カンマ区切り）
-        keywords = []
-
-        # 括弧外のメインキーワード
-        main = topic.split("（")[0].split("(")[0].strip()
-        keywords.append(main.lower())
-
-        # 括弧内のサブキーワード
-        if "（" in topic or "(" in topic:
-            sub = topic.split("（")[-1].split("(")[-1].split("）")[0].split(")")[0]
-            keywords.extend([k.strip().lower() for k in sub.split("、") if k.strip()])
-            keywords.extend([k.strip().lower() for k in sub.split(",") if k.strip()])
-
-        # いずれかのキーワードが含まれればマッチ
-        return any(keyword in text for keyword in keywords if keyword)
-
     def _calculate_authority_score(self, source_name: str) -> float:
         """Authority（公式補正）スコアを計算する.
 
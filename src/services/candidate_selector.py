@@ -1,9 +1,10 @@
 """候補選定サービスモジュール."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.models.article import Article
 from src.models.buzz_score import BuzzScore
+from src.models.judgment import JudgmentResult
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,18 +15,24 @@ class SelectionResult:
     """候補選定結果.
 
     Attributes:
-        candidates: 選定された候補記事のリスト
+        candidates: 選定された候補記事のリスト（LLM判定対象. キャッシュ済み記事は含まない）
         total_score_dict: Buzzスコア辞書（normalized_url -> total_score）
+        cached_judgments: 最終選定に引き継ぐキャッシュ済み判定結果のリスト（Buzzスコア順）
+        budget_utilization: LLM判定枠（max_candidates）のうち未判定記事で埋めた割合（0.0-1.0）
     """
 
     candidates: list[Article]
     total_score_dict: dict[str, float]
+    cached_judgments: list[JudgmentResult] = field(default_factory=list)
+    budget_utilization: float = 0.0
 
 
 class CandidateSelector:
     """候補選定サービス.
 
     Buzzスコアと鮮度に基づいて、LLM判定候補を選定する.
+    キャッシュ済み判定結果がある記事はLLM判定枠を消費せず、判定結果をそのまま最終選定に引き継ぐ
+    （通知済みの判定結果は再通知しないよう引き継がない）.
 
     Attributes:
         _max_candidates: 最大候補数
@@ -39,23 +46,36 @@ class CandidateSelector:
         """
         self._max_candidates = max_candidates
 
-    def select(self, articles: list[Article], scores: dict[str, BuzzScore]) -> SelectionResult:
+    def select(
+        self,
+        articles: list[Article],
+        scores: dict[str, BuzzScore],
+        cached_judgments: dict[str, JudgmentResult] | None = None,
+    ) -> SelectionResult:
         """Buzzスコアに基づいて候補記事を選定する.
 
         ソート順:
         1. Buzzスコア降順
         2. 鮮度降順（公開日時の新しい順）
 
+        キャッシュ済み判定結果がある記事は候補に含めず、上位max_candidates件の枠を
+        未判定記事のみで埋める（LLM判定コストを新規記事だけに使うため）.
+        過去の実行で通知済みの判定結果は最終選定に引き継がない.
+
         Args:
-            articles: 重複排除済み記事のリスト
+            articles: 重複排除済み記事のリスト（キャッシュ済み記事を含んでもよい）
             scores: Buzzスコア辞書（normalized_url -> BuzzScore）
+            cached_judgments: キャッシュ済み判定結果の辞書（url -> JudgmentResult、
+                デフォルト: None=キャッシュなし）
 
         Returns:
-            選定結果（上位max_candidates件）
+            選定結果（未判定記事の上位max_candidates件とキャッシュ済み判定結果）
         """
+        cached_judgments = cached_judgments or {}
         logger.debug(
             "candidate_selection_start",
             article_count=len(articles),
+            cached_count=len(cached_judgments),
             max_candidates=self._max_candidates,
         )
 
@@ -71,8 +91,19 @@ class CandidateSelector:
             ),
         )
 
-        # 上位max_candidates件を選定
-        candidates = sorted_articles[: self._max_candidates]
+        # キャッシュ済み記事は判定結果を引き継ぎ、未判定記事で上位max_candidates件の枠を埋める
+        candidates: list[Article] = []
+        carried_judgments: list[JudgmentResult] = []
+        notified_count = 0
+        for article in sorted_articles:
+            cached = cached_judgments.get(article.url)
+            if cached is not None:
+                if cached.notified_at is None:
+                    carried_judgments.append(cached)
+                else:
+                    notified_count += 1
+            elif len(candidates) < self._max_candidates:
+                candidates.append(article)
 
         # total_score辞書を作成（後続処理で使用）
         total_score_dict: dict[str, float] = {
@@ -80,13 +111,22 @@ class CandidateSelector:
             for article in candidates
         }
 
+        budget_utilization = (
+            len(candidates) / self._max_candidates if self._max_candidates > 0 else 0.0
+        )
+
         logger.info(
             "candidate_selection_complete",
             input_count=len(articles),
             output_count=len(candidates),
+            carried_count=len(carried_judgments),
+            notified_count=notified_count,
+            budget_utilization=round(budget_utilization, 3),
         )
 
         return SelectionResult(
             candidates=candidates,
             total_score_dict=total_score_dict,
+            cached_judgments=carried_judgments,
+            budget_utilization=budget_utilization,
         )
@@ -0,0 +1,207 @@
+"""モデルカスケードによるLLM判定サービスモジュール."""
+
+import time
+from typing import Any
+
+from src.models.article import Article
+from src.models.bedrock_usage import BedrockUsageLedger
+from src.models.interest_profile import InterestProfile
+from src.models.judgment import InterestLabel, JudgmentResult
+from src.repositories.cache_repository import CacheRepository
+from src.services.llm_judge import JudgmentBatchResult, LlmJudge
+from src.services.output_token_budget import OutputTokenBudget
+from src.shared.exceptions.llm_error import LlmFatalError
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CascadeLlmJudge(LlmJudge):
+    """モデルカスケードによるLLM判定サービス.
+
+    安価・高速な一次判定モデル（primary_judge）で全件を判定し、判定が不確かな記事のみ
+    このクラスのモデル（上位モデル）で再判定する. 再判定の対象は以下のいずれか:
+    - 一次判定に失敗した記事
+    - confidence が min_confidence 未満の記事
+    - THINK/FYI の境界にある記事（confidence が borderline_confidence 未満）
+
+    一次判定・再判定はそれぞれのLlmJudgeの並列度で実行し、利用量は呼び出しごとの
+    モデルIDを保持したまま1つの台帳に合算する（コストはモデル別単価で計算される）.
+    再判定に失敗した・時間予算内に完了しなかった記事は一次判定の結果を採用する.
+    一次判定モデルで致命的エラーが発生した場合は全件を上位モデルで判定し、
+    上位モデルで致命的エラーが発生した場合は一次判定の結果をすべて採用する.
+
+    Attributes:
+        _primary_judge: 一次判定サービス
+        _min_confidence: 再判定しない confidence の下限
+        _borderline_confidence: THINK/FYI の判定を再判定しない confidence の下限
+    """
+
+    # 再判定の対象とする境界ラベル（メール掲載の可否が分かれるラベル）
+    BORDERLINE_LABELS = frozenset({InterestLabel.THINK, InterestLabel.FYI})
+
+    # 時間予算のうち一次判定に割り当てる比率（残りを再判定に使う）
+    PRIMARY_BUDGET_RATIO = 0.6
+
+    def __init__(
+        self,
+        primary_judge: LlmJudge,
+        bedrock_client: Any,
+        cache_repository: CacheRepository | None,
+        interest_profile: InterestProfile,
+        model_id: str,
+        inference_profile_arn: str = "",
+        max_retries: int = 2,
+        concurrency_limit: int = 5,
+        request_interval: float = 0.0,
+        retry_base_delay: float = 2.0,
+        max_backoff: float = 20.0,
+        streaming: bool = False,
+        output_token_budget: OutputTokenBudget | None = None,
+        tool_use: bool = False,
+        fallback_judge: LlmJudge | None = None,
+        min_confidence: float = 0.6,
+        borderline_confidence: float = 0.8,
+    ) -> None:
+        """モデルカスケードによるLLM判定サービスを初期化する.
+
+        Args:
+            primary_judge: 一次判定サービス（安価・高速なモデル）
+            bedrock_client: Bedrock Runtimeクライアント（boto3.client('bedrock-runtime')）
+            cache_repository: キャッシュリポジトリ
+            interest_profile: 関心プロファイル
+            model_id: 再判定に使用する上位モデルID
+            inference_profile_arn: インファレンスプロファイルARN（デフォルト: ""）
+            max_retries: 最大リトライ回数（デフォルト: 2）
+            concurrency_limit: 再判定の並列度制限（デフォルト: 5）
+            request_interval: 並列リクエスト間隔（秒、デフォルト: 0.0）
+            retry_base_delay: リトライの基本遅延時間（秒、デフォルト: 2.0）
+            max_backoff: 最大バックオフ時間（秒、デフォルト: 20.0）
+            streaming: ストリーミング応答で判定するかどうか（デフォルト: False）
+            output_token_budget: 出力トークン上限の推定（デフォルト: None=固定の上限）
+            tool_use: 判定結果をtool useの引数で受け取るかどうか（デフォルト: False）
+            fallback_judge: 上位モデルの致命的エラー時に残りの記事を判定させる代替の判定サービス
+                （デフォルト: None）
+            min_confidence: 再判定しない confidence の下限（デフォルト: 0.6）
+            borderline_confidence: THINK/FYI の判定を再判定しない confidence の下限
+                （デフォルト: 0.8）
+        """
+        super().__init__(
+            bedrock_client=bedrock_client,
+            cache_repository=cache_repository,
+            interest_profile=interest_profile,
+            model_id=model_id,
+            inference_profile_arn=inference_profile_arn,
+            max_retries=max_retries,
+            concurrency_limit=concurrency_limit,
+            request_interval=request_interval,
+            retry_base_delay=retry_base_delay,
+            max_backoff=max_backoff,
+            streaming=streaming,
+            output_token_budget=output_token_budget,
+            tool_use=tool_use,
+            fallback_judge=fallback_judge,
+        )
+        self._primary_judge = primary_judge
+        self._min_confidence = min_confidence
+        self._borderline_confidence = borderline_confidence
+
+    async def judge_batch(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> JudgmentBatchResult:
+        """記事リストを一次判定し、不確かな記事のみ上位モデルで再判定する.
+
+        Args:
+            articles: 判定対象記事のリスト
+            budget_seconds: 判定全体の時間予算（秒、デフォルト: None=無制限）
+
+        Returns:
+            一括判定結果（一次判定結果を再判定結果で置き換えたもの）
+        """
+        start_time = time.monotonic()
+        primary_budget = (
+            None if budget_seconds is None else budget_seconds * self.PRIMARY_BUDGET_RATIO
+        )
+        try:
+            primary_result = await self._primary_judge.judge_batch(
+                articles, budget_seconds=primary_budget
+            )
+        except LlmFatalError as e:
+            logger.warning("llm_cascade_primary_unavailable", error=str(e))
+            return await super().judge_batch(articles, budget_seconds=budget_seconds)
+
+        escalation_urls = {
+            judgment.url
+            for judgment in primary_result.judgments
+            if self._needs_escalation(judgment, primary_result.failed_urls)
+        }
+        escalation_articles = [article for article in articles if article.url in escalation_urls]
+
+        escalation_result = JudgmentBatchResult(judgments=[], failed_count=0)
+        if escalation_articles:
+            escalation_budget = (
+                None
+                if budget_seconds is None
+                else max(budget_seconds - (time.monotonic() - start_time), 0.0)
+            )
+            try:
+                escalation_result = await super().judge_batch(
+                    escalation_articles, budget_seconds=escalation_budget
+                )
+            except LlmFatalError as e:
+                logger.warning("llm_cascade_escalation_unavailable", error=str(e))
+                # 致命的エラーの発生前に課金された呼び出しは台帳に残す
+                escalation_result = JudgmentBatchResult(
+                    judgments=[], failed_count=0, usage=self._usage_ledger
+                )
+
+        # 再判定に成功した記事のみ一次判定結果を置き換える
+        escalated = {
+            judgment.url: judgment
+            for judgment in escalation_result.judgments
+            if judgment.url not in escalation_result.failed_urls
+        }
+        judgments = [escalated.get(judgment.url, judgment) for judgment in primary_result.judgments]
+        failed_urls = primary_result.failed_urls - escalated.keys()
+
+        usage = BedrockUsageLedger()
+        usage.merge(primary_result.usage)
+        usage.merge(escalation_result.usage)
+
+        logger.info(
+            "llm_cascade_complete",
+            primary_count=len(primary_result.judgments),
+            escalated_count=len(escalation_articles),
+            escalation_succeeded_count=len(escalated),
+            primary_input_tokens=primary_result.usage.total_input_tokens,
+            primary_output_tokens=primary_result.usage.total_output_tokens,
+            escalation_input_tokens=escalation_result.usage.total_input_tokens,
+            escalation_output_tokens=escalation_result.usage.total_output_tokens,
+            elapsed_seconds=round(time.monotonic() - start_time, 2),
+        )
+
+        return JudgmentBatchResult(
+            judgments=judgments,
+            failed_count=len(failed_urls),
+            skipped_count=primary_result.skipped_count,
+            usage=usage,
+            failed_urls=failed_urls,
+            escalated_count=len(escalation_articles),
+        )
+
+    def _needs_escalation(self, judgment: JudgmentResult, failed_urls: set[str]) -> bool:
+        """一次判定結果を上位モデルで再判定すべきか判定する.
+
+        Args:
+            judgment: 一次判定結果
+            failed_urls: 一次判定に失敗した記事のURL
+
+        Returns:
+            再判定すべき場合True
+        """
+        if judgment.url in failed_urls or judgment.confidence < self._min_confidence:
+            return True
+        return (
+            judgment.interest_label in self.BORDERLINE_LABELS
+            and judgment.confidence < self._borderline_confidence
+        )
@@ -1,23 +1,51 @@
 """記事収集サービスモジュール."""
 
+from __future__ import annotations
+
 import asyncio
+import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import feedparser  # type: ignore[import-untyped]
 import httpx
 
 from src.models.article import Article
-from src.models.source_config import SourceConfig
+from src.models.source_config import Priority, SourceConfig
+from src.models.source_latency import SourceLatency
+from src.models.source_watermark import MAX_RECENT_ENTRY_IDS, SourceWatermark
 from src.repositories.source_master import SourceMaster
-from src.shared.exceptions.collection_error import SourceCollectionError
+from src.services.feed_stream_parser import FeedEntry, read_feed_entries
+from src.services.latency_tracker import LatencyTracker
+from src.shared.exceptions.collection_error import FeedStreamParseError, SourceCollectionError
 from src.shared.logging.logger import get_logger
 from src.shared.utils.date_utils import now_utc, struct_time_to_datetime
+from src.shared.utils.run_deadline import gather_within_budget
+from src.shared.utils.stage_profiler import record_http_response
 from src.shared.utils.url_normalizer import normalize_url
 
+if TYPE_CHECKING:
+    from src.repositories.watermark_repository import WatermarkRepository
+
 logger = get_logger(__name__)
 
+# ストリーミング受信のチャンクサイズ（バイト）
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# リトライ待機時間の基準値（秒、試行ごとに倍増）
+RETRY_BASE_DELAY_SECONDS = 0.5
+
+# 概要の最大文字数
+DESCRIPTION_MAX_LENGTH = 500
+
+# 概要からHTMLタグを除去する正規表現（簡易版、モジュール読み込み時に1度だけコンパイル）
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# 収集の実行順（優先度の高いソースから取得する）
+PRIORITY_ORDER = (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+
 
 @dataclass
 class CollectionResult:
@@ -26,48 +54,118 @@ class CollectionResult:
     Attributes:
         articles: 収集された記事のリスト
         errors: 収集エラー（source_id -> エラーメッセージ）
+        watermarks: 収集に成功したソースの更新後ハイウォーターマーク（source_id -> マーク）
+        skipped_count: 差分収集で収集済みとして除外したエントリ数
+        source_latencies: 収集元ごとの取得レイテンシ統計
     """
 
     articles: list[Article]
     errors: dict[str, str]
+    watermarks: dict[str, SourceWatermark] = field(default_factory=dict)
+    skipped_count: int = 0
+    source_latencies: list[SourceLatency] = field(default_factory=list)
+
+
+@dataclass
+class _SourceCollection:
+    """単一ソースの収集結果.
+
+    Attributes:
+        articles: 収集された記事のリスト
+        watermark: 更新後のハイウォーターマーク（公開日時を持つエントリがない場合None）
+        skipped_count: 収集済みとして除外したエントリ数
+    """
+
+    articles: list[Article]
+    watermark: SourceWatermark | None
+    skipped_count: int = 0
 
 
 class Collector:
     """記事収集サービス.
 
     複数のRSS/Atomフィードから記事を並列収集する.
+    ハイウォーターマークリポジトリを指定した場合は差分収集モードとなり、
+    前回までに収集済みのエントリをArticle生成（HTML除去を含む）の前に除外する.
+    リクエストタイムアウトはソースごとの取得レイテンシ統計から導出し、
+    高優先度ソースは応答がp95を超えた時点で2本目のリクエスト（ヘッジ）を送る.
+    同時実行数は max_concurrency に制限し、優先度の高いソースから順に取得を開始するため、
+    時間予算を超えた場合は低優先度のソースから打ち切られる.
 
     Attributes:
         _source_master: 収集元マスタ
+        _watermark_repository: ハイウォーターマークリポジトリ（Noneの場合は全件収集）
+        _latency_tracker: 収集元レイテンシ追跡
+        _max_concurrency: 同時に取得するソース数の上限
     """
 
-    def __init__(self, source_master: SourceMaster) -> None:
+    def __init__(
+        self,
+        source_master: SourceMaster,
+        watermark_repository: WatermarkRepository | None = None,
+        latency_tracker: LatencyTracker | None = None,
+        max_concurrency: int = 8,
+    ) -> None:
         """収集サービスを初期化する.
 
         Args:
             source_master: 収集元マスタ
+            watermark_repository: ハイウォーターマークリポジトリ（デフォルト: None=全件収集）
+            latency_tracker: 収集元レイテンシ追跡（デフォルト: None=新規作成し、設定値の
+                タイムアウトから開始）
+            max_concurrency: 同時に取得するソース数の上限（デフォルト: 8）
         """
         self._source_master = source_master
+        self._watermark_repository = watermark_repository
+        self._latency_tracker = latency_tracker or LatencyTracker()
+        self._max_concurrency = max_concurrency
 
-    async def collect(self) -> CollectionResult:
+    async def collect(self, budget_seconds: float | None = None) -> CollectionResult:
         """全有効ソースから記事を収集する.
 
         複数ソースから並列収集を行い、ソース単位のエラーは継続する.
+        ソースは優先度順に取得を開始し、同時実行数を max_concurrency に制限する.
+        budget_seconds を超えた場合は未完了ソース（取得待ちを含む）をキャンセルし、
+        完了分のみで結果を返す.
+
+        Args:
+            budget_seconds: 収集全体の時間予算（秒、デフォルト: None=無制限）
 
         Returns:
             収集結果（記事リストとエラー情報）
         """
         start_time = time.time()
-        sources = self._source_master.get_enabled_sources()
-        logger.debug("collection_start", source_count=len(sources))
+        sources = sorted(
+            self._source_master.get_enabled_sources(),
+            key=lambda source: PRIORITY_ORDER.index(source.priority),
+        )
+        logger.debug(
+            "collection_start",
+            source_count=len(sources),
+            budget_seconds=budget_seconds,
+            max_concurrency=self._max_concurrency,
+            incremental=self._watermark_repository is not None,
+        )
 
-        # 並列収集
-        tasks = [self._collect_from_source(source) for source in sources]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        watermarks: dict[str, SourceWatermark] = {}
+        if self._watermark_repository is not None:
+            watermarks = self._watermark_repository.get_all([s.source_id for s in sources])
+
+        # 並列収集（Semaphoreの待機はFIFOのため、タスク生成順=優先度順に取得を開始する）
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks = [
+            asyncio.create_task(
+                self._collect_with_limit(semaphore, source, watermarks.get(source.source_id))
+            )
+            for source in sources
+        ]
+        results = await self._gather_within(tasks, budget_seconds)
 
         # 結果を集約
         all_articles: list[Article] = []
         errors: dict[str, str] = {}
+        new_watermarks: dict[str, SourceWatermark] = {}
+        skipped_count = 0
 
         for source, result in zip(sources, results, strict=True):
             if isinstance(result, Exception):
@@ -78,12 +176,16 @@ class Collector:
                     source_id=source.source_id,
                     error=error_msg,
                 )
-            elif isinstance(result, list):
-                all_articles.extend(result)
+            elif isinstance(result, _SourceCollection):
+                all_articles.extend(result.articles)
+                skipped_count += result.skipped_count
+                if result.watermark is not None:
+                    new_watermarks[source.source_id] = result.watermark
                 logger.debug(
                     "source_collection_success",
                     source_id=source.source_id,
-                    article_count=len(result),
+                    article_count=len(result.articles),
+                    skipped_count=result.skipped_count,
                 )
 
         elapsed = time.time() - start_time
@@ -91,131 +193,425 @@ class Collector:
             "collection_complete",
             total_articles=len(all_articles),
             failed_sources=len(errors),
+            skipped_count=skipped_count,
+            priority_completion=self._priority_completion(sources, results),
             elapsed_seconds=round(elapsed, 2),
         )
 
-        return CollectionResult(articles=all_articles, errors=errors)
+        return CollectionResult(
+            articles=all_articles,
+            errors=errors,
+            watermarks=new_watermarks,
+            skipped_count=skipped_count,
+            source_latencies=self._latency_tracker.snapshot(),
+        )
+
+    async def _collect_with_limit(
+        self,
+        semaphore: asyncio.Semaphore,
+        source: SourceConfig,
+        watermark: SourceWatermark | None,
+    ) -> _SourceCollection:
+        """同時実行数の上限内で単一ソースから記事を収集する.
+
+        Args:
+            semaphore: 同時実行数を制限するセマフォ
+            source: 収集元設定
+            watermark: 前回までのハイウォーターマーク
+
+        Returns:
+            ソースの収集結果
+        """
+        async with semaphore:
+            return await self._collect_from_source(source, watermark)
+
+    @staticmethod
+    def _priority_completion(
+        sources: list[SourceConfig], results: list[_SourceCollection | BaseException]
+    ) -> dict[str, str]:
+        """優先度ごとの収集完了数を集計する.
 
-    async def _collect_from_source(self, source: SourceConfig) -> list[Article]:
+        Args:
+            sources: 収集元設定のリスト
+            results: ソース順の収集結果
+
+        Returns:
+            優先度をキーとする "完了数/ソース数" の辞書
+        """
+        completion: dict[str, str] = {}
+        for priority in PRIORITY_ORDER:
+            outcomes = [
+                isinstance(result, _SourceCollection)
+                for source, result in zip(sources, results, strict=True)
+                if source.priority == priority
+            ]
+            if outcomes:
+                completion[priority.value] = f"{sum(outcomes)}/{len(outcomes)}"
+        return completion
+
+    def save_watermarks(self, watermarks: dict[str, SourceWatermark]) -> None:
+        """収集結果のハイウォーターマークを保存する.
+
+        実行全体の成功後に呼び出す（途中で失敗した実行の記事を次回も収集するため）.
+        差分収集モードでない場合は何もしない. 保存失敗は次回の収集量が増えるだけのため、
+        ログ出力のみで継続する.
+
+        Args:
+            watermarks: ソースIDをキーとするハイウォーターマーク
+        """
+        if self._watermark_repository is None:
+            return
+
+        for watermark in watermarks.values():
+            try:
+                self._watermark_repository.save(watermark)
+            except Exception as e:
+                logger.warning("watermark_save_failed", source_id=watermark.source_id, error=str(e))
+
+    async def _gather_within(
+        self, tasks: list[asyncio.Task[_SourceCollection]], budget_seconds: float | None
+    ) -> list[_SourceCollection | BaseException]:
+        """時間予算内で完了したタスクの結果を集める.
+
+        予算切れで未完了のタスクはキャンセルし、SourceCollectionErrorとして扱う.
+
+        Args:
+            tasks: ソースごとの収集タスク
+            budget_seconds: 時間予算（秒、Noneの場合は全タスク完了まで待機）
+
+        Returns:
+            タスク順の結果リスト（成功時はソースの収集結果、失敗時は例外）
+        """
+        gathered = await gather_within_budget(tasks, budget_seconds)
+        if gathered.cancelled_count:
+            logger.warning(
+                "collection_budget_exceeded",
+                budget_seconds=budget_seconds,
+                cancelled_count=gathered.cancelled_count,
+            )
+        return [
+            SourceCollectionError("Cancelled: collection time budget exceeded")
+            if isinstance(outcome, asyncio.CancelledError)
+            else outcome
+            for outcome in gathered.outcomes
+        ]
+
+    async def _collect_from_source(
+        self, source: SourceConfig, watermark: SourceWatermark | None = None
+    ) -> _SourceCollection:
         """単一ソースから記事を収集する.
 
         Args:
             source: 収集元設定
+            watermark: 前回までのハイウォーターマーク（Noneの場合は全件収集）
 
         Returns:
-            記事のリスト
+            ソースの収集結果
 
         Raises:
             SourceCollectionError: 収集に失敗した場合
         """
         logger.debug("source_collection_start", source_id=source.source_id)
 
+        timeout = self._latency_tracker.timeout_for(source)
+
         try:
-            # HTTP リクエスト（リトライ付き）
-            async with httpx.AsyncClient(timeout=source.timeout_seconds) as client:
-                for attempt in range(source.retry_count + 1):
-                    try:
-                        response = await client.get(str(source.feed_url))
-                        response.raise_for_status()
-                        feed_content = response.text
-                        break
-                    except (httpx.HTTPError, httpx.TimeoutException) as e:
-                        if attempt == source.retry_count:
-                            raise SourceCollectionError(
-                                f"HTTP request failed after {source.retry_count + 1} attempts: {e}"
-                            ) from e
-                        logger.debug(
-                            "source_collection_retry",
-                            source_id=source.source_id,
-                            attempt=attempt + 1,
-                            error=str(e),
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                entries: list[Any] | None = None
+                if source.streaming:
+                    stream_started = time.perf_counter()
+                    entries = await self._stream_entries(client, source, watermark)
+                    if entries is not None:
+                        self._latency_tracker.record(
+                            source.source_id, time.perf_counter() - stream_started
                         )
-                        await asyncio.sleep(1.0 * (attempt + 1))  # 指数バックオフ
+                if entries is None:
+                    entries = await self._fetch_entries(client, source, timeout)
 
-            # フィード解析
-            feed = feedparser.parse(feed_content)
+            # 記事エントリを Article に変換
+            collection = self._to_articles(entries[: source.max_entries], source, watermark)
 
-            if feed.bozo:
-                raise SourceCollectionError(f"Feed parsing error: {feed.bozo_exception}")
+            logger.debug(
+                "source_collection_complete",
+                source_id=source.source_id,
+                article_count=len(collection.articles),
+                skipped_count=collection.skipped_count,
+            )
 
-            # 記事エントリを Article に変換
-            articles: list[Article] = []
-            collected_at = now_utc()
-
-            for entry in feed.entries:
-                try:
-                    # 必須フィールドのチェック
-                    if not hasattr(entry, "link") or not entry.link:
-                        logger.debug(
-                            "entry_missing_link",
-                            source_id=source.source_id,
-                            title=getattr(entry, "title", "N/A"),
-                        )
-                        continue
+            return collection
 
-                    # URL正規化
-                    url = entry.link
-                    normalized_url = normalize_url(url)
+        except SourceCollectionError:
+            raise
+        except Exception as e:
+            raise SourceCollectionError(f"Unexpected error: {e}") from e
 
-                    # タイトル取得
-                    title = getattr(entry, "title", "No Title")
+    async def _fetch_entries(
+        self, client: httpx.AsyncClient, source: SourceConfig, timeout_seconds: float
+    ) -> list[Any]:
+        """フィード全体を取得し、feedparserで解析する.
 
-                    # 公開日時取得
-                    published_at = self._parse_published_date(entry)
+        Args:
+            client: HTTPクライアント
+            source: 収集元設定
+            timeout_seconds: リクエストタイムアウト（秒）
 
-                    # 概要取得
-                    description = self._extract_description(entry)
+        Returns:
+            フィードエントリのリスト
 
-                    article = Article(
-                        url=url,
-                        title=title,
-                        published_at=published_at,
-                        source_name=source.name,
-                        description=description,
-                        normalized_url=normalized_url,
-                        collected_at=collected_at,
-                    )
+        Raises:
+            SourceCollectionError: HTTPリクエスト・フィード解析に失敗した場合
+        """
+        # HTTP リクエスト（リトライ付き）
+        hedge_delay = self._latency_tracker.hedge_delay_for(source)
+        for attempt in range(source.retry_count + 1):
+            try:
+                request_started = time.perf_counter()
+                response = await self._hedged_get(client, str(source.feed_url), hedge_delay)
+                response.raise_for_status()
+                # リトライのバックオフ待機を含めない、成功した1リクエスト分のレイテンシを記録する
+                self._latency_tracker.record(
+                    source.source_id, time.perf_counter() - request_started
+                )
+                record_http_response(response)
+                feed_content = response.text
+                break
+            except (httpx.HTTPError, httpx.TimeoutException) as e:
+                if isinstance(e, httpx.TimeoutException):
+                    # タイムアウトもサンプルとして記録し、遅くなったソースのタイムアウトを延ばす
+                    self._latency_tracker.record(source.source_id, timeout_seconds)
+                if attempt == source.retry_count:
+                    raise SourceCollectionError(
+                        f"HTTP request failed after {source.retry_count + 1} attempts: {e}"
+                    ) from e
+                logger.debug(
+                    "source_collection_retry",
+                    source_id=source.source_id,
+                    attempt=attempt + 1,
+                    error=str(e),
+                )
+                await asyncio.sleep(RETRY_BASE_DELAY_SECONDS * 2**attempt)  # 指数バックオフ
+
+        # フィード解析
+        feed = feedparser.parse(feed_content)
+
+        if feed.bozo:
+            raise SourceCollectionError(f"Feed parsing error: {feed.bozo_exception}")
+
+        return list(feed.entries)
+
+    async def _hedged_get(
+        self, client: httpx.AsyncClient, url: str, hedge_delay: float | None
+    ) -> httpx.Response:
+        """GETリクエストを送信し、応答が遅い場合は2本目のリクエストを並行して送る.
+
+        先に完了したリクエストの応答を返し、残りはキャンセルする（呼び出し元が
+        キャンセルされた場合も送信中のリクエストをすべてキャンセルする）.
+        両方とも失敗した場合は1本目の例外を送出する.
+
+        Args:
+            client: HTTPクライアント
+            url: リクエストURL
+            hedge_delay: 2本目を送るまでの待機時間（秒、Noneの場合はヘッジしない）
+
+        Returns:
+            HTTPレスポンス
 
-                    articles.append(article)
+        Raises:
+            httpx.HTTPError: リクエストに失敗した場合
+        """
+        if hedge_delay is None:
+            return await client.get(url)
+
+        primary = asyncio.create_task(client.get(url))
+        tasks: set[asyncio.Task[httpx.Response]] = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            logger.debug("source_request_hedged", url=url, hedge_delay=hedge_delay)
+            tasks.add(asyncio.create_task(client.get(url)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _stream_entries(
+        self,
+        client: httpx.AsyncClient,
+        source: SourceConfig,
+        watermark: SourceWatermark | None,
+    ) -> list[Any] | None:
+        """レスポンスをストリーミング受信しながらエントリを解析する.
+
+        max_entries件に達した時点、またはハイウォーターマーク以前の収集済みエントリに
+        達した時点で受信を打ち切る（フィードが新しい順に並ぶことを前提とする）.
+        不正なXML・HTTPエラーの場合は None を返し、呼び出し元でfeedparserによる
+        全件取得にフォールバックする.
+
+        Args:
+            client: HTTPクライアント
+            source: 収集元設定
+            watermark: 前回までのハイウォーターマーク（Noneの場合は打ち切り判定なし）
+
+        Returns:
+            フィードエントリのリスト（フォールバックが必要な場合None）
+        """
+        should_stop = None
+        if watermark is not None:
+
+            def should_stop(entry: FeedEntry) -> bool:
+                published_at = self._parse_entry_date(entry)
+                return (
+                    self._entry_id(entry) in watermark.recent_entry_ids
+                    and published_at is not None
+                    and published_at < watermark.latest_published_at
+                )
+
+        try:
+            async with client.stream("GET", str(source.feed_url)) as response:
+                response.raise_for_status()
+                result = await read_feed_entries(
+                    response.aiter_bytes(STREAM_CHUNK_SIZE),
+                    max_entries=source.max_entries,
+                    should_stop=should_stop,
+                )
+        except (FeedStreamParseError, httpx.HTTPError) as e:
+            logger.info("feed_stream_fallback", source_id=source.source_id, error=str(e))
+            return None
+
+        record_http_response(response, num_bytes=result.bytes_read)
+        logger.debug(
+            "feed_stream_parsed",
+            source_id=source.source_id,
+            entry_count=len(result.entries),
+            bytes_read=result.bytes_read,
+            stopped_early=result.stopped_early,
+        )
+        return list(result.entries)
 
-                except Exception as e:
+    def _to_articles(
+        self,
+        entries: list[Any],
+        source: SourceConfig,
+        watermark: SourceWatermark | None,
+    ) -> _SourceCollection:
+        """フィードエントリを Article に変換し、更新後のハイウォーターマークを求める.
+
+        ハイウォーターマークが指定された場合、収集済みのエントリは
+        URL正規化・概要抽出（HTML除去）の前に除外する.
+
+        Args:
+            entries: フィードエントリのリスト
+            source: 収集元設定
+            watermark: 前回までのハイウォーターマーク（Noneの場合は全件変換）
+
+        Returns:
+            ソースの収集結果
+        """
+        articles: list[Article] = []
+        collected_at = now_utc()
+        entry_ids: list[str] = []
+        latest_published_at = watermark.latest_published_at if watermark else None
+        skipped_count = 0
+
+        for entry in entries:
+            try:
+                # 必須フィールドのチェック
+                if not hasattr(entry, "link") or not entry.link:
                     logger.debug(
-                        "entry_parse_error",
+                        "entry_missing_link",
                         source_id=source.source_id,
-                        entry_link=getattr(entry, "link", "N/A"),
-                        error=str(e),
+                        title=getattr(entry, "title", "N/A"),
                     )
                     continue
 
-            logger.debug(
-                "source_collection_complete",
+                url = entry.link
+                entry_id = self._entry_id(entry)
+                entry_published_at = self._parse_entry_date(entry)
+                entry_ids.append(entry_id)
+
+                # 未来日時のエントリでマークが先行しないよう、収集時刻で頭打ちにする
+                if entry_published_at is not None:
+                    capped = min(entry_published_at, collected_at)
+                    if latest_published_at is None or capped > latest_published_at:
+                        latest_published_at = capped
+
+                # 収集済みエントリの除外（Article生成前）
+                if watermark is not None and watermark.is_seen(entry_id, entry_published_at):
+                    skipped_count += 1
+                    continue
+
+                article = Article(
+                    url=url,
+                    title=getattr(entry, "title", "No Title"),
+                    published_at=entry_published_at or now_utc(),
+                    source_name=source.name,
+                    description=self._extract_description(entry),
+                    normalized_url=normalize_url(url),
+                    collected_at=collected_at,
+                )
+
+                articles.append(article)
+
+            except Exception as e:
+                logger.debug(
+                    "entry_parse_error",
+                    source_id=source.source_id,
+                    entry_link=getattr(entry, "link", "N/A"),
+                    error=str(e),
+                )
+                continue
+
+        new_watermark = None
+        if latest_published_at is not None:
+            # 今回のエントリIDを優先し、前回のIDで上限まで補う（打ち切り収集でも判定を継続するため）
+            recent_ids = list(dict.fromkeys(entry_ids))
+            if watermark is not None:
+                recent_ids.extend(watermark.recent_entry_ids.difference(recent_ids))
+            new_watermark = SourceWatermark(
                 source_id=source.source_id,
-                article_count=len(articles),
+                latest_published_at=latest_published_at,
+                recent_entry_ids=frozenset(recent_ids[:MAX_RECENT_ENTRY_IDS]),
             )
+        return _SourceCollection(
+            articles=articles, watermark=new_watermark, skipped_count=skipped_count
+        )
 
-            return articles
+    @staticmethod
+    def _entry_id(entry: Any) -> str:
+        """フィードエントリのIDを返す（id要素がない場合はリンクURL）.
 
-        except SourceCollectionError:
-            raise
-        except Exception as e:
-            raise SourceCollectionError(f"Unexpected error: {e}") from e
+        Args:
+            entry: フィードエントリ
 
-    def _parse_published_date(self, entry: feedparser.FeedParserDict) -> datetime:
-        """フィードエントリから公開日時を解析する.
+        Returns:
+            エントリID
+        """
+        return str(getattr(entry, "id", None) or entry.link)
+
+    def _parse_entry_date(self, entry: feedparser.FeedParserDict) -> datetime | None:
+        """フィードエントリに記載された公開日時を解析する.
 
         Args:
             entry: フィードエントリ
 
         Returns:
-            公開日時（UTC）
+            公開日時（UTC、日時情報がない場合None）
         """
         # published または updated を試行
         if hasattr(entry, "published_parsed") and entry.published_parsed:
             return struct_time_to_datetime(entry.published_parsed)
         if hasattr(entry, "updated_parsed") and entry.updated_parsed:
             return struct_time_to_datetime(entry.updated_parsed)
-        # 日時情報がない場合は現在時刻を使用
-        return now_utc()
+        return None
 
     def _extract_description(self, entry: feedparser.FeedParserDict) -> str:
         """フィードエントリから概要を抽出する.
@@ -238,11 +634,9 @@ class Collector:
             description = entry.content[0].get("value", "")
 
         # HTML タグを除去（簡易版）
-        import re
-
-        description = re.sub(r"<[^>]+>", "", description)
+        description = _HTML_TAG_PATTERN.sub("", description)
 
         # 前後空白除去と長さ制限
-        description = description.strip()[:500]
+        description = description.strip()[:DESCRIPTION_MAX_LENGTH]
 
         return description or "No description"
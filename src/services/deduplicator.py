@@ -1,8 +1,9 @@
 """重複排除サービスモジュール."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.models.article import Article
+from src.models.judgment import JudgmentResult
 from src.repositories.cache_repository import CacheRepository
 from src.shared.logging.logger import get_logger
 
@@ -17,17 +18,21 @@ class DeduplicationResult:
         unique_articles: 重複排除後の記事リスト
         duplicate_count: 重複件数（同一URL）
         cached_count: キャッシュヒット件数（既に判定済み）
+        cached_articles: キャッシュヒットした記事のリスト（unique_articlesには含まない）
+        cached_judgments: キャッシュ済み判定結果の辞書（url -> JudgmentResult）
     """
 
     unique_articles: list[Article]
     duplicate_count: int
     cached_count: int
+    cached_articles: list[Article] = field(default_factory=list)
+    cached_judgments: dict[str, JudgmentResult] = field(default_factory=dict)
 
 
 class Deduplicator:
     """重複排除サービス.
 
-    URL完全一致による重複排除と、キャッシュ済み記事の除外を行う.
+    URL完全一致による重複排除と、キャッシュ済み記事（URLまたは内容が一致）の除外を行う.
 
     Attributes:
         _cache_repository: キャッシュリポジトリ
@@ -45,7 +50,7 @@ class Deduplicator:
         """記事リストから重複を排除する.
 
         1. normalized_url で重複チェック（先に出現した記事を優先）
-        2. キャッシュ済み記事を除外（既にLLM判定済み）
+        2. キャッシュ済み記事を除外（既にLLM判定済み）. 判定結果は最終選定に引き継ぐため保持する
 
         Args:
             articles: 正規化済み記事のリスト
@@ -80,22 +85,23 @@ class Deduplicator:
         )
 
         # ステップ2: キャッシュ済み記事の除外
-        # 一括でキャッシュ存在チェック
-        urls_to_check = [article.url for article in url_unique_articles]
+        # 一括でキャッシュ済み判定結果を取得
         if self._cache_repository is not None:
-            cache_results = self._cache_repository.batch_exists(urls_to_check)
+            cached_judgments = self._cache_repository.batch_get_for_articles(url_unique_articles)
         else:
             logger.debug(
                 "cache_check_skipped", message="CacheRepository is None, skipping cache check"
             )
-            cache_results = {}  # 空辞書: 全記事がキャッシュヒットしていないとみなす
+            cached_judgments = {}  # 空辞書: 全記事がキャッシュヒットしていないとみなす
 
         final_articles: list[Article] = []
+        cached_articles: list[Article] = []
         cached_count = 0
 
         for article in url_unique_articles:
-            if cache_results.get(article.url, False):
+            if article.url in cached_judgments:
                 cached_count += 1
+                cached_articles.append(article)
                 logger.debug(
                     "cached_article_found",
                     url=article.url,
@@ -116,4 +122,6 @@ class Deduplicator:
             unique_articles=final_articles,
             duplicate_count=duplicate_count,
             cached_count=cached_count,
+            cached_articles=cached_articles,
+            cached_judgments=cached_judgments,
         )
@@ -0,0 +1,237 @@
+"""フィードストリーミング解析モジュール."""
+
+import time
+from collections.abc import AsyncIterable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from src.shared.exceptions.collection_error import FeedStreamParseError
+from src.shared.utils.date_utils import parse_rfc2822, to_utc
+
+# フィードのルート要素名（名前空間を除いたローカル名）
+FEED_ROOT_TAGS = frozenset({"rss", "feed", "RDF"})
+
+# エントリ要素名（RSS: item, Atom: entry）
+ENTRY_TAGS = frozenset({"item", "entry"})
+
+# テキストをそのまま設定する子要素名 -> FeedEntryの属性名
+_TEXT_FIELDS = {"guid": "id", "id": "id", "title": "title"}
+
+# 日時として解析する子要素名 -> FeedEntryの属性名
+_DATE_FIELDS = {
+    "pubDate": "published_parsed",
+    "published": "published_parsed",
+    "date": "published_parsed",
+    "issued": "published_parsed",
+    "updated": "updated_parsed",
+    "modified": "updated_parsed",
+}
+
+
+@dataclass(slots=True)
+class FeedEntry:
+    """ストリーミング解析したフィードエントリ.
+
+    feedparserのエントリと同じ属性名を持ち、Collectorで同様に扱える.
+
+    Attributes:
+        link: 記事URL
+        id: エントリID（RSS: guid, Atom: id）
+        title: タイトル
+        summary: 概要（RSS: description, Atom: summary）
+        content: 本文（RSS: content:encoded, Atom: content）. feedparser同様 {"value": ...} のリスト
+        published_parsed: 公開日時（UTCのstruct_time）
+        updated_parsed: 更新日時（UTCのstruct_time）
+    """
+
+    link: str = ""
+    id: str = ""
+    title: str = ""
+    summary: str = ""
+    content: list[dict[str, str]] = field(default_factory=list)
+    published_parsed: time.struct_time | None = None
+    updated_parsed: time.struct_time | None = None
+
+
+@dataclass
+class FeedStreamResult:
+    """ストリーミング解析結果.
+
+    Attributes:
+        entries: 解析したエントリのリスト
+        bytes_read: 受信したバイト数
+        stopped_early: 打ち切り条件によりフィード末尾まで読まずに終了した場合True
+    """
+
+    entries: list[FeedEntry]
+    bytes_read: int
+    stopped_early: bool = False
+
+
+class FeedStreamParser:
+    """RSS/Atomフィードのインクリメンタル解析器.
+
+    XMLPullParserにバイト列を逐次投入し、エントリの終了タグごとにFeedEntryを生成する.
+    生成済みのエントリ要素はツリーから取り除くため、保持する要素は1エントリ分に限られる.
+
+    Attributes:
+        _parser: XMLプル解析器
+        _stack: 開始済み・未終了の要素スタック
+    """
+
+    def __init__(self) -> None:
+        """解析器を初期化する."""
+        self._parser: XMLPullParser[Element] = XMLPullParser(events=("start", "end"))
+        self._stack: list[Element] = []
+
+    def feed(self, chunk: bytes) -> list[FeedEntry]:
+        """バイト列を投入し、解析が完了したエントリを返す.
+
+        Args:
+            chunk: レスポンスボディの断片
+
+        Returns:
+            この断片で終了タグまで解析できたエントリのリスト
+
+        Raises:
+            FeedStreamParseError: XMLが不正、またはRSS/Atom以外の文書の場合
+        """
+        try:
+            self._parser.feed(chunk)
+            # 解析エラーはイベント読み出し時に送出される
+            return self._drain()
+        except ParseError as e:
+            raise FeedStreamParseError(f"Malformed feed XML: {e}") from e
+
+    def close(self) -> list[FeedEntry]:
+        """入力の終端を通知し、残りのエントリを返す.
+
+        Returns:
+            残りのエントリのリスト
+
+        Raises:
+            FeedStreamParseError: XMLが不正、または途中で終わっている場合
+        """
+        try:
+            self._parser.close()
+            # 解析エラーはイベント読み出し時に送出される
+            return self._drain()
+        except ParseError as e:
+            raise FeedStreamParseError(f"Malformed feed XML: {e}") from e
+
+    def _drain(self) -> list[FeedEntry]:
+        """解析イベントを処理し、終了したエントリを取り出す."""
+        entries: list[FeedEntry] = []
+        for item in self._parser.read_events():
+            # start/endイベントのみ購読しているため、常に (イベント名, Element) の組
+            event, elem = item[0], item[-1]
+            if not isinstance(elem, Element):
+                continue
+            if event == "start":
+                if not self._stack and _local_name(elem.tag) not in FEED_ROOT_TAGS:
+                    raise FeedStreamParseError(f"Not an RSS/Atom feed: <{elem.tag}>")
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            if _local_name(elem.tag) in ENTRY_TAGS:
+                entries.append(_to_feed_entry(elem))
+                # 解析済みエントリを破棄してメモリを解放
+                elem.clear()
+                if self._stack:
+                    self._stack[-1].remove(elem)
+        return entries
+
+
+async def read_feed_entries(
+    chunks: AsyncIterable[bytes],
+    max_entries: int | None = None,
+    should_stop: Callable[[FeedEntry], bool] | None = None,
+) -> FeedStreamResult:
+    """バイトストリームを逐次解析してエントリを読み込む.
+
+    max_entries件に達した場合、または should_stop が True を返すエントリに達した場合は
+    残りのストリームを読まずに終了する（打ち切ったエントリは結果に含めない）.
+
+    Args:
+        chunks: レスポンスボディのバイトストリーム
+        max_entries: 読み込むエントリ数の上限（None=無制限）
+        should_stop: 読み込みを打ち切るエントリを判定する関数（None=打ち切らない）
+
+    Returns:
+        ストリーミング解析結果
+
+    Raises:
+        FeedStreamParseError: XMLが不正、またはRSS/Atom以外の文書の場合
+    """
+    parser = FeedStreamParser()
+    entries: list[FeedEntry] = []
+    bytes_read = 0
+
+    def accept(parsed: list[FeedEntry]) -> bool:
+        for entry in parsed:
+            if should_stop is not None and should_stop(entry):
+                return False
+            entries.append(entry)
+            if max_entries is not None and len(entries) >= max_entries:
+                return False
+        return True
+
+    async for chunk in chunks:
+        bytes_read += len(chunk)
+        if not accept(parser.feed(chunk)):
+            return FeedStreamResult(entries=entries, bytes_read=bytes_read, stopped_early=True)
+
+    stopped_early = not accept(parser.close())
+    return FeedStreamResult(entries=entries, bytes_read=bytes_read, stopped_early=stopped_early)
+
+
+def _local_name(tag: str) -> str:
+    """名前空間を除いた要素名を返す."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _to_feed_entry(elem: Element) -> FeedEntry:
+    """RSS item / Atom entry 要素をFeedEntryに変換する."""
+    entry = FeedEntry()
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "link":
+            _set_link(entry, child)
+        elif name in _TEXT_FIELDS:
+            setattr(entry, _TEXT_FIELDS[name], (child.text or "").strip())
+        elif name in _DATE_FIELDS:
+            setattr(entry, _DATE_FIELDS[name], _parse_date((child.text or "").strip()))
+        elif name in ("description", "summary"):
+            # Atomの type="xhtml" は子要素として本文を持つため、子孫のテキストを連結する
+            entry.summary = "".join(child.itertext()).strip()
+        elif name in ("encoded", "content"):
+            entry.content.append({"value": "".join(child.itertext()).strip()})
+    return entry
+
+
+def _set_link(entry: FeedEntry, link: Element) -> None:
+    """link要素からエントリのURLを設定する.
+
+    Atomは href 属性（rel="alternate" または rel 省略を優先）、RSSはテキストを使用する.
+    """
+    href = link.get("href")
+    if href is None:
+        entry.link = entry.link or (link.text or "").strip()
+    elif link.get("rel", "alternate") == "alternate" or not entry.link:
+        entry.link = href
+
+
+def _parse_date(text: str) -> time.struct_time | None:
+    """RFC 2822 / ISO 8601 形式の日時をUTCのstruct_timeに変換する."""
+    if not text:
+        return None
+    try:
+        dt = parse_rfc2822(text)
+    except ValueError:
+        try:
+            dt = to_utc(datetime.fromisoformat(text))
+        except ValueError:
+            return None
+    return dt.astimezone(UTC).utctimetuple()
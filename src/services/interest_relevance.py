@@ -0,0 +1,183 @@
+"""関心プロファイルとの関連度スコア計算サービスモジュール."""
+
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+
+from src.models.article import Article
+from src.models.interest_profile import InterestProfile
+
+# 英数字の単語、または英数字以外の文字（日本語等）の連続
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[^\W\d_a-z]+")
+
+# 特徴量のハッシュ空間の次元数
+FEATURE_DIMENSION = 1 << 20
+
+
+def extract_topic_keywords(topic: str) -> list[str]:
+    """トピック文字列からキーワードを抽出する.
+
+    Args:
+        topic: トピック文字列（例: "AI/ML（大規模言語モデル、機械学習基盤）"）
+
+    Returns:
+        キーワードのリスト（括弧外のメインキーワードと括弧内の区切られたサブキーワード）
+    """
+    keywords = [re.split(r"[（(]", topic, maxsplit=1)[0].strip()]
+    match = re.search(r"[（(]([^）)]*)[）)]?", topic)
+    if match:
+        keywords.extend(part.strip() for part in re.split(r"[、,，]", match.group(1)))
+    return [keyword for keyword in keywords if keyword]
+
+
+def hashed_features(text: str) -> set[int]:
+    """テキストをハッシュ化した特徴量の集合に変換する.
+
+    英数字は単語単位（末尾の複数形の "s" は除去）、日本語等は文字bigram
+    （1文字の場合はunigram）を特徴量とする. 全角半角・大文字小文字は正規化する.
+
+    Args:
+        text: テキスト
+
+    Returns:
+        特徴量ID（0 以上 FEATURE_DIMENSION 未満）の集合
+    """
+    features: set[int] = set()
+    for token in _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold()):
+        if token.isascii():
+            grams = [token[:-1] if len(token) > 3 and token.endswith("s") else token]
+        elif len(token) == 1:
+            grams = [token]
+        else:
+            grams = [token[index : index + 2] for index in range(len(token) - 1)]
+        features.update(zlib.crc32(gram.encode()) % FEATURE_DIMENSION for gram in grams)
+    return features
+
+
+@dataclass
+class _Topic:
+    """スコア計算用のトピック.
+
+    Attributes:
+        tier_score: トピックの関心レベルのスコア
+        keyword_indexes: トピックのキーワードのインデックス
+    """
+
+    tier_score: float
+    keyword_indexes: list[int]
+
+
+class InterestRelevanceScorer:
+    """関心プロファイルとの関連度からInterestスコアを計算する.
+
+    関心プロファイルの各トピックのキーワードを、ハッシュ化した特徴量の重みベクトル
+    （L1正規化）として初期化時に1度だけ計算し、特徴量IDから (キーワード, 重み) への
+    転置インデックス（疎行列）として保持する. 記事は特徴量の集合に変換し、疎行列との
+    積で全キーワードの被覆率（キーワードの特徴量のうち記事に含まれる割合）を求める.
+
+    スコアは被覆率が最も高いトピック（同率の場合は関心レベルが高いトピック）の被覆率で
+    DEFAULT_SCORE と関心レベルのスコアの間を補間した値とする（被覆率1.0で関心レベルの
+    スコアと一致）. 被覆率が MIN_COVERAGE 未満のトピックは一致しないものとみなす.
+    他にキーワードをすべて含む関心トピックがあれば、1件あたり MULTI_MATCH_BONUS を
+    MAX_MULTI_MATCH_BONUS まで加算する（部分一致は偶然の重なりが多いため加算しない）.
+
+    Attributes:
+        _topics: トピックのリスト（関心レベルの高い順）
+        _keyword_count: キーワード数
+        _index: 特徴量IDをキーとする (キーワードのインデックス, 重み) のリスト
+    """
+
+    # 関心レベルとスコアのマッピング（InterestProfile の属性名, スコア）
+    TIER_SCORES = (
+        ("max_interest", 100.0),
+        ("high_interest", 80.0),
+        ("medium_interest", 55.0),
+        ("low_interest", 30.0),
+        ("ignore_interest", 0.0),
+    )
+    DEFAULT_SCORE = 15.0
+    MIN_COVERAGE = 0.6
+    FULL_COVERAGE = 0.999
+    MULTI_MATCH_BONUS = 5.0
+    MAX_MULTI_MATCH_BONUS = 15.0
+
+    def __init__(self, interest_profile: InterestProfile) -> None:
+        """関心プロファイルからトピックの特徴量ベクトルを構築する.
+
+        Args:
+            interest_profile: 関心プロファイル
+        """
+        self._topics: list[_Topic] = []
+        self._index: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        keyword_count = 0
+        for attribute, tier_score in self.TIER_SCORES:
+            for topic in getattr(interest_profile, attribute):
+                keyword_indexes = []
+                for keyword in extract_topic_keywords(topic):
+                    features = hashed_features(keyword)
+                    if not features:
+                        continue
+                    weight = 1.0 / len(features)
+                    for feature in features:
+                        self._index[feature].append((keyword_count, weight))
+                    keyword_indexes.append(keyword_count)
+                    keyword_count += 1
+                if keyword_indexes:
+                    self._topics.append(_Topic(tier_score, keyword_indexes))
+        self._keyword_count = keyword_count
+
+    def score(self, article: Article) -> float:
+        """記事のInterestスコアを計算する.
+
+        Args:
+            article: 記事
+
+        Returns:
+            スコア（0-100）
+        """
+        return self.score_batch([article])[0]
+
+    def score_batch(self, articles: list[Article]) -> list[float]:
+        """複数記事のInterestスコアを一括計算する.
+
+        Args:
+            articles: 記事リスト
+
+        Returns:
+            記事と同じ順序のスコア（0-100）のリスト
+        """
+        return [self._score_coverages(self._coverages(article)) for article in articles]
+
+    def _coverages(self, article: Article) -> list[float]:
+        """記事に対する全キーワードの被覆率を計算する（疎行列と特徴量ベクトルの積）."""
+        coverages = [0.0] * self._keyword_count
+        for feature in hashed_features(f"{article.title} {article.description}"):
+            for keyword_index, weight in self._index.get(feature, ()):
+                coverages[keyword_index] += weight
+        return coverages
+
+    def _score_coverages(self, coverages: list[float]) -> float:
+        """キーワードの被覆率からスコアを計算する."""
+        matches = []
+        for topic in self._topics:
+            coverage = min(max(coverages[index] for index in topic.keyword_indexes), 1.0)
+            if coverage >= self.MIN_COVERAGE:
+                matches.append((coverage, topic.tier_score))
+        if not matches:
+            return self.DEFAULT_SCORE
+
+        best = max(matches)
+        coverage, tier_score = best
+        score = self.DEFAULT_SCORE + (tier_score - self.DEFAULT_SCORE) * coverage
+        if tier_score > self.DEFAULT_SCORE:
+            others = list(matches)
+            others.remove(best)
+            bonus = self.MULTI_MATCH_BONUS * sum(
+                1
+                for other_coverage, other_score in others
+                if other_coverage >= self.FULL_COVERAGE and other_score > self.DEFAULT_SCORE
+            )
+            score += min(bonus, self.MAX_MULTI_MATCH_BONUS)
+        return round(min(max(score, 0.0), 100.0), 2)
@@ -0,0 +1,146 @@
+"""収集元レイテンシ追跡サービスモジュール."""
+
+import math
+from collections import deque
+
+from src.models.source_config import Priority, SourceConfig
+from src.models.source_latency import SourceLatency
+
+
+def _percentile(sorted_samples: list[float], ratio: float) -> float:
+    """ソート済みサンプルのパーセンタイルを返す（nearest-rank法）."""
+    index = max(math.ceil(ratio * len(sorted_samples)) - 1, 0)
+    return sorted_samples[index]
+
+
+class LatencyTracker:
+    """収集元ごとの取得レイテンシを追跡し、タイムアウト・ヘッジ遅延を導出する.
+
+    直近のサンプルを保持する. Lambdaのウォーム起動間で統計を引き継ぐため、
+    モジュールレベルで保持して複数回の実行で共有する想定. コールドスタートをまたいで
+    引き継ぐため、前回実行の統計（実行履歴の source_latencies）から初期化できる.
+
+    タイムアウトは p95 × TIMEOUT_P95_MULTIPLIER を MIN_TIMEOUT_SECONDS と
+    設定値（SourceConfig.timeout_seconds）の間に収めた値とする.
+    サンプルが MIN_SAMPLES 件未満のソースは設定値をそのまま使用する.
+
+    Attributes:
+        _window_size: ソースごとに保持するサンプル数
+        _samples: ソースIDをキーとする直近の取得時間（秒）
+    """
+
+    MIN_SAMPLES = 3
+    TIMEOUT_P95_MULTIPLIER = 3.0
+    MIN_TIMEOUT_SECONDS = 3.0
+    MIN_HEDGE_DELAY_SECONDS = 0.5
+
+    def __init__(self, window_size: int = 50) -> None:
+        """レイテンシ追跡を初期化する.
+
+        Args:
+            window_size: ソースごとに保持するサンプル数（デフォルト: 50）
+        """
+        self._window_size = window_size
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, source_id: str, elapsed_seconds: float) -> None:
+        """取得時間を記録する.
+
+        Args:
+            source_id: ソースID
+            elapsed_seconds: 取得開始から完了までの時間（秒）
+        """
+        samples = self._samples.setdefault(source_id, deque(maxlen=self._window_size))
+        samples.append(elapsed_seconds)
+
+    def seed(self, latencies: list[SourceLatency]) -> None:
+        """前回実行までのレイテンシ統計からサンプルを復元する.
+
+        サンプルのないソースのみ、統計と同じ p50/p95 となるサンプルを
+        sample_count 件（ウィンドウサイズまで）追加する（半数を p50、残りを p95 とする）.
+
+        Args:
+            latencies: レイテンシ統計のリスト（snapshot の戻り値）
+        """
+        for latency in latencies:
+            if self._samples.get(latency.source_id):
+                continue
+            count = min(latency.sample_count, self._window_size)
+            median_count = math.ceil(count / 2)
+            for index in range(count):
+                self.record(
+                    latency.source_id,
+                    latency.p50_seconds if index < median_count else latency.p95_seconds,
+                )
+
+    def get_latency(self, source_id: str) -> SourceLatency | None:
+        """ソースのレイテンシ統計を返す.
+
+        Args:
+            source_id: ソースID
+
+        Returns:
+            レイテンシ統計（サンプルが MIN_SAMPLES 件未満の場合None）
+        """
+        samples = self._samples.get(source_id)
+        if samples is None or len(samples) < self.MIN_SAMPLES:
+            return None
+        return self._summarize(source_id)
+
+    def _summarize(self, source_id: str) -> SourceLatency:
+        """サンプル数によらずソースのレイテンシ統計を返す."""
+        sorted_samples = sorted(self._samples[source_id])
+        return SourceLatency(
+            source_id=source_id,
+            p50_seconds=round(_percentile(sorted_samples, 0.5), 3),
+            p95_seconds=round(_percentile(sorted_samples, 0.95), 3),
+            sample_count=len(sorted_samples),
+        )
+
+    def timeout_for(self, source: SourceConfig) -> float:
+        """ソースのリクエストタイムアウトを返す.
+
+        Args:
+            source: 収集元設定
+
+        Returns:
+            タイムアウト（秒）
+        """
+        latency = self.get_latency(source.source_id)
+        if latency is None:
+            return float(source.timeout_seconds)
+        timeout = latency.p95_seconds * self.TIMEOUT_P95_MULTIPLIER
+        return min(max(timeout, self.MIN_TIMEOUT_SECONDS), float(source.timeout_seconds))
+
+    def hedge_delay_for(self, source: SourceConfig) -> float | None:
+        """ヘッジリクエストを送るまでの待機時間を返す.
+
+        高優先度ソースのみ、p95を経過しても応答がない場合に2本目のリクエストを送る.
+
+        Args:
+            source: 収集元設定
+
+        Returns:
+            待機時間（秒、ヘッジしない場合None）
+        """
+        if source.priority != Priority.HIGH:
+            return None
+        latency = self.get_latency(source.source_id)
+        if latency is None:
+            return None
+        return max(latency.p95_seconds, self.MIN_HEDGE_DELAY_SECONDS)
+
+    def snapshot(self) -> list[SourceLatency]:
+        """全ソースのレイテンシ統計を返す（実行履歴の記録・次回実行の seed 用）.
+
+        1日1回の実行では1回あたりのサンプルが少ないため、実行をまたいでサンプルを
+        蓄積できるよう MIN_SAMPLES 件未満のソースも含める.
+
+        Returns:
+            レイテンシ統計のリスト（サンプルのあるソースのみ）
+        """
+        return [
+            self._summarize(source_id)
+            for source_id in sorted(self._samples)
+            if self._samples[source_id]
+        ]
@@ -1,24 +1,160 @@
 """LLM判定サービスモジュール."""
 
+from __future__ import annotations
+
 import asyncio
+import hashlib
 import json
 import random
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from botocore.exceptions import ClientError
 
 from src.models.article import Article
+from src.models.bedrock_usage import BedrockCallUsage, BedrockUsageLedger
 from src.models.interest_profile import InterestProfile
 from src.models.judgment import BuzzLabel, InterestLabel, JudgmentResult
 from src.repositories.cache_repository import CacheRepository
-from src.shared.exceptions.llm_error import LlmJsonParseError
+from src.services.output_token_budget import OutputTokenBudget
+from src.shared.exceptions.llm_error import LlmFatalError, LlmJsonParseError
 from src.shared.logging.logger import get_logger
 from src.shared.utils.date_utils import now_utc
+from src.shared.utils.json_repair import repair_json_object
+from src.shared.utils.json_stream import JsonObjectScanner
+from src.shared.utils.run_deadline import gather_within_budget
+from src.shared.utils.stage_profiler import record_bedrock_tokens
 
 logger = get_logger(__name__)
 
+# リトライ対象のBedrockエラーコード
+# ThrottlingException: レート制限超過（429相当）
+# ServiceUnavailableException: サービス利用不可（5xx相当）
+RETRYABLE_ERROR_CODES = frozenset({"ThrottlingException", "ServiceUnavailableException"})
+
+# 一括判定全体を中断するBedrockエラーコード（記事によらず同じく失敗する設定起因のエラー）
+# AccessDeniedException: モデルへのアクセス権限なし
+# ValidationException: モデルID・インファレンスプロファイルARN・リクエスト形式の誤り
+# ResourceNotFoundException: モデル・インファレンスプロファイルが存在しない
+# UnrecognizedClientException: 認証情報が無効
+FATAL_ERROR_CODES = frozenset(
+    {
+        "AccessDeniedException",
+        "ValidationException",
+        "ResourceNotFoundException",
+        "UnrecognizedClientException",
+    }
+)
+
+# 判定結果の必須フィールド
+JUDGMENT_REQUIRED_FIELDS = ("interest_label", "confidence", "summary")
+
+INTEREST_LABEL_VALUES = frozenset(label.value for label in InterestLabel)
+
+# tool use モードで判定結果を受け取るツール（input_schema に一致する引数で呼び出させる）
+JUDGMENT_TOOL_NAME = "record_judgment"
+JUDGMENT_TOOL: dict[str, Any] = {
+    "name": JUDGMENT_TOOL_NAME,
+    "description": "記事の判定結果を記録する",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "interest_label": {"type": "string", "enum": sorted(INTEREST_LABEL_VALUES)},
+            "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+            "summary": {"type": "string", "maxLength": 300},
+            "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 5},
+        },
+        "required": list(JUDGMENT_REQUIRED_FIELDS),
+    },
+}
+
+# 判定プロンプト・出力形式のバージョン（判定結果が変わりうる変更をした場合に上げる）
+JUDGMENT_PROMPT_VERSION = 2
+
+
+def judgment_cache_version(interest_profile: InterestProfile) -> str:
+    """判定キャッシュのバージョンを返す.
+
+    関心プロファイルのプロンプト表現と JUDGMENT_PROMPT_VERSION のハッシュのため、
+    interests.yaml やプロンプトを変更すると過去の判定結果は参照されなくなる.
+
+    Args:
+        interest_profile: 関心プロファイル
+
+    Returns:
+        判定キャッシュのバージョン（CacheRepository の judgment_version に指定する）
+    """
+    source = "\n".join(
+        [
+            str(JUDGMENT_PROMPT_VERSION),
+            interest_profile.format_for_prompt(),
+            interest_profile.format_criteria_for_prompt(),
+        ]
+    )
+    return f"p{JUDGMENT_PROMPT_VERSION}-{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+
+
+@dataclass
+class ModelResponse:
+    """Bedrock呼び出し1回分の応答.
+
+    Attributes:
+        text: 出力テキスト
+        usage: トークン利用量（Anthropic Messages API の "usage" 形式）
+        stop_reason: 停止理由（"end_turn", "max_tokens" など、ストリームを途中で閉じた場合None）
+        output_tokens_estimated: usage の出力トークン数が近似値の場合True（ストリームを途中で閉じた場合）
+    """
+
+    text: str
+    usage: dict[str, Any]
+    stop_reason: str | None = None
+    output_tokens_estimated: bool = False
+
+
+def read_response_stream(stream: Any) -> ModelResponse:
+    """Bedrockのストリーミング応答を読み込む.
+
+    出力テキストからJSONオブジェクトが閉じた時点でストリームを閉じ、以降の出力を待たない.
+    途中で閉じた場合は出力トークン数を受信したテキスト断片の数で近似する
+    （message_delta の利用量を受信しないため）.
+
+    Args:
+        stream: invoke_model_with_response_stream の応答ボディ（EventStream）
+
+    Returns:
+        応答（途中で閉じた場合、text はJSONオブジェクト部分のみ）
+    """
+    scanner = JsonObjectScanner()
+    text_parts: list[str] = []
+    usage: dict[str, Any] = {}
+    stop_reason: str | None = None
+    delta_count = 0
+    try:
+        for event in stream:
+            if "chunk" not in event:
+                continue
+            payload = json.loads(event["chunk"]["bytes"])
+            event_type = payload.get("type")
+            if event_type == "message_start":
+                usage.update(payload["message"].get("usage", {}))
+            elif event_type == "message_delta":
+                usage.update(payload.get("usage", {}))
+                stop_reason = payload.get("delta", {}).get("stop_reason")
+            elif event_type == "content_block_delta":
+                delta_count += 1
+                # テキスト出力は text、tool use の引数は partial_json で届く
+                delta = payload.get("delta", {})
+                text = delta.get("text", delta.get("partial_json", ""))
+                text_parts.append(text)
+                completed = scanner.feed(text)
+                if completed is not None:
+                    usage["output_tokens"] = max(int(usage.get("output_tokens", 0)), delta_count)
+                    return ModelResponse(text=completed, usage=usage, output_tokens_estimated=True)
+    finally:
+        stream.close()
+    return ModelResponse(text="".join(text_parts), usage=usage, stop_reason=stop_reason)
+
 
 @dataclass
 class JudgmentBatchResult:
@@ -27,10 +163,18 @@ class JudgmentBatchResult:
     Attributes:
         judgments: 判定結果のリスト
         failed_count: 判定失敗件数
+        skipped_count: 時間予算切れで判定しなかった件数
+        usage: Bedrock利用量の台帳
+        failed_urls: 判定に失敗しフォールバック判定結果となった記事のURL
+        escalated_count: 上位モデルで再判定した件数（カスケード判定の場合）
     """
 
     judgments: list[JudgmentResult]
     failed_count: int
+    skipped_count: int = 0
+    usage: BedrockUsageLedger = field(default_factory=BedrockUsageLedger)
+    failed_urls: set[str] = field(default_factory=set)
+    escalated_count: int = 0
 
 
 class LlmJudge:
@@ -49,6 +193,12 @@ class LlmJudge:
         _request_interval: 並列リクエスト間隔（秒）
         _retry_base_delay: リトライの基本遅延時間（秒）
         _max_backoff: 最大バックオフ時間（秒）
+        _streaming: ストリーミング応答で判定するかどうか
+        _output_token_budget: 出力トークン上限の推定（Noneの場合は固定の上限）
+        _tool_use: 判定結果をtool useの引数（JSONスキーマ準拠）で受け取るかどうか
+        _fallback_judge: 致命的エラー時に残りの記事を判定させる代替の判定サービス
+        _usage_ledger: 実行中バッチのBedrock利用量の台帳
+        _prompt_profile_texts: プロンプトに埋め込む関心プロファイル・判定基準（初回生成時にメモ化）
     """
 
     def __init__(
@@ -63,6 +213,10 @@ class LlmJudge:
         request_interval: float = 0.0,
         retry_base_delay: float = 2.0,
         max_backoff: float = 20.0,
+        streaming: bool = False,
+        output_token_budget: OutputTokenBudget | None = None,
+        tool_use: bool = False,
+        fallback_judge: LlmJudge | None = None,
     ) -> None:
         """LLM判定サービスを初期化する.
 
@@ -77,6 +231,13 @@ class LlmJudge:
             request_interval: 並列リクエスト間隔（秒、デフォルト: 0.0、Phase4で使用）
             retry_base_delay: リトライの基本遅延時間（秒、デフォルト: 2.0）
             max_backoff: 最大バックオフ時間（秒、デフォルト: 20.0）
+            streaming: ストリーミング応答で判定し、JSONが閉じた時点で受信を打ち切るかどうか
+                （デフォルト: False）
+            output_token_budget: 出力トークン上限の推定（デフォルト: None=固定の上限）
+            tool_use: 判定結果をtool useの引数（JSONスキーマ準拠）で受け取るかどうか
+                （デフォルト: False）
+            fallback_judge: 致命的エラー時に残りの記事を判定させる代替の判定サービス
+                （別リージョン・別モデル、デフォルト: None=一括判定を失敗させる）
         """
         self._bedrock_client = bedrock_client
         self._cache_repository = cache_repository
@@ -88,26 +249,40 @@ class LlmJudge:
         self._request_interval = request_interval
         self._retry_base_delay = retry_base_delay
         self._max_backoff = max_backoff
-        self._batch_input_tokens = 0
-        self._batch_output_tokens = 0
-
-    async def judge_batch(self, articles: list[Article]) -> JudgmentBatchResult:
+        self._streaming = streaming
+        self._output_token_budget = output_token_budget
+        self._tool_use = tool_use
+        self._fallback_judge = fallback_judge
+        self._usage_ledger = BedrockUsageLedger()
+        self._prompt_profile_texts: tuple[str, str] | None = None
+
+    async def judge_batch(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> JudgmentBatchResult:
         """記事リストを一括判定する.
 
         並列度を制限しながら、複数記事を同時に判定する.
+        budget_seconds を超えた場合は未完了の判定をキャンセルし、
+        完了済みの判定結果のみを返す（キャンセル分は判定結果に含めない）.
+
+        致命的エラー（FATAL_ERROR_CODES）が発生した場合は未完了の判定をすべてキャンセルし、
+        未判定の記事を fallback_judge に判定させる（未設定の場合は LlmFatalError を送出する）.
 
         Args:
             articles: 判定対象記事のリスト
+            budget_seconds: 判定全体の時間予算（秒、デフォルト: None=無制限）
 
         Returns:
             一括判定結果
+
+        Raises:
+            LlmFatalError: 致命的エラーが発生し、fallback_judge が未設定の場合
         """
         start_time = time.time()
         logger.debug("llm_judgment_start", article_count=len(articles))
 
-        # バッチごとのトークン集計をリセット
-        self._batch_input_tokens = 0
-        self._batch_output_tokens = 0
+        # バッチごとの利用量台帳をリセット
+        self._usage_ledger = BedrockUsageLedger()
 
         # 並列度制限（Semaphore）
         semaphore = asyncio.Semaphore(self._concurrency_limit)
@@ -124,11 +299,116 @@ class LlmJudge:
                 return await self._judge_single(article)
 
         # 並列実行
-        tasks = [judge_with_semaphore(i, article) for i, article in enumerate(articles)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
+        tasks = [
+            asyncio.create_task(judge_with_semaphore(i, article))
+            for i, article in enumerate(articles)
+        ]
+        if not tasks:
+            return self._aggregate_results([], [], time.time() - start_time)
+
+        gathered = await gather_within_budget(tasks, budget_seconds, stop_on=LlmFatalError)
+        fatal_error = (
+            gathered.stop_error if isinstance(gathered.stop_error, LlmFatalError) else None
+        )
+        if gathered.cancelled_count and fatal_error is None:
+            logger.warning(
+                "llm_judgment_budget_exceeded",
+                budget_seconds=budget_seconds,
+                skipped_count=gathered.cancelled_count,
+            )
+
+        # 予算内に完了した判定のみ集約する
+        judged_articles, results, unjudged_articles = self._partition_results(
+            articles, gathered.outcomes
+        )
         elapsed = time.time() - start_time
-        return self._aggregate_results(articles, results, elapsed)
+        batch_result = self._aggregate_results(judged_articles, results, elapsed)
+        if fatal_error is None:
+            batch_result.skipped_count = gathered.cancelled_count
+            return batch_result
+
+        remaining_budget = None if budget_seconds is None else max(budget_seconds - elapsed, 0.0)
+        return await self._reroute(batch_result, unjudged_articles, fatal_error, remaining_budget)
+
+    @staticmethod
+    def _partition_results(
+        articles: list[Article],
+        outcomes: list[JudgmentResult | BaseException | None],
+    ) -> tuple[list[Article], list[JudgmentResult | BaseException | None], list[Article]]:
+        """判定タスクの結果を完了済み・未判定に振り分ける.
+
+        致命的エラーで失敗した記事・キャンセルした記事は未判定とする.
+
+        Args:
+            articles: 判定対象記事のリスト
+            outcomes: 記事ごとの判定タスクの結果
+
+        Returns:
+            (完了済みの記事, 完了済みの記事の判定結果または例外, 未判定の記事)
+        """
+        judged_articles: list[Article] = []
+        results: list[JudgmentResult | BaseException | None] = []
+        unjudged_articles: list[Article] = []
+        for article, outcome in zip(articles, outcomes, strict=True):
+            if isinstance(outcome, asyncio.CancelledError | LlmFatalError):
+                unjudged_articles.append(article)
+                continue
+            judged_articles.append(article)
+            results.append(outcome)
+        return judged_articles, results, unjudged_articles
+
+    async def _reroute(
+        self,
+        partial_result: JudgmentBatchResult,
+        articles: list[Article],
+        fatal_error: LlmFatalError,
+        budget_seconds: float | None,
+    ) -> JudgmentBatchResult:
+        """致命的エラーで判定できなかった記事を fallback_judge に判定させる.
+
+        Args:
+            partial_result: 致命的エラーの発生前に完了した判定の結果
+            articles: 未判定の記事リスト
+            fatal_error: 発生した致命的エラー
+            budget_seconds: 残りの時間予算（秒、None=無制限）
+
+        Returns:
+            完了済みの判定結果と fallback_judge の判定結果を合わせた一括判定結果
+
+        Raises:
+            LlmFatalError: fallback_judge が未設定の場合
+        """
+        if self._fallback_judge is None:
+            logger.error(
+                "llm_judgment_aborted",
+                model_id=self._model_id,
+                unjudged_count=len(articles),
+                error=str(fatal_error),
+            )
+            raise fatal_error
+
+        logger.warning(
+            "llm_judgment_rerouted",
+            model_id=self._model_id,
+            fallback_model_id=self._fallback_judge._model_id,
+            rerouted_count=len(articles),
+            error=str(fatal_error),
+        )
+        fallback_result = await self._fallback_judge.judge_batch(
+            articles, budget_seconds=budget_seconds
+        )
+
+        usage = BedrockUsageLedger()
+        usage.merge(partial_result.usage)
+        usage.merge(fallback_result.usage)
+        return JudgmentBatchResult(
+            judgments=partial_result.judgments + fallback_result.judgments,
+            failed_count=partial_result.failed_count + fallback_result.failed_count,
+            skipped_count=fallback_result.skipped_count,
+            usage=usage,
+            failed_urls=partial_result.failed_urls | fallback_result.failed_urls,
+            escalated_count=fallback_result.escalated_count,
+        )
 
     def _aggregate_results(
         self,
@@ -148,6 +428,7 @@ class LlmJudge:
         """
         judgments: list[JudgmentResult] = []
         failed_count = 0
+        failed_urls: set[str] = set()
 
         for article, result in zip(articles, results, strict=True):
             if isinstance(result, Exception):
@@ -157,11 +438,13 @@ class LlmJudge:
                     error=str(result),
                 )
                 failed_count += 1
+                failed_urls.add(article.url)
                 fallback_judgment = self._create_fallback_judgment(article)
                 judgments.append(fallback_judgment)
             elif result is None:
                 logger.warning("llm_judgment_none", url=article.url)
                 failed_count += 1
+                failed_urls.add(article.url)
                 fallback_judgment = self._create_fallback_judgment(article)
                 judgments.append(fallback_judgment)
             elif isinstance(result, JudgmentResult):
@@ -185,12 +468,29 @@ class LlmJudge:
             total_count=len(articles),
             success_count=len(judgments) - failed_count,
             failed_count=failed_count,
-            total_input_tokens=self._batch_input_tokens,
-            total_output_tokens=self._batch_output_tokens,
+            total_input_tokens=self._usage_ledger.total_input_tokens,
+            total_output_tokens=self._usage_ledger.total_output_tokens,
+            total_cache_read_input_tokens=self._usage_ledger.total_cache_read_input_tokens,
+            bedrock_call_count=len(self._usage_ledger.calls),
+            retry_count=self._usage_ledger.retry_count,
+            json_parse_failure_count=self._usage_ledger.json_parse_failure_count,
+            json_repair_count=self._usage_ledger.json_repair_count,
+            json_parse_failure_rate=self._rate(self._usage_ledger.json_parse_failure_count),
+            json_repair_rate=self._rate(self._usage_ledger.json_repair_count),
             elapsed_seconds=round(elapsed, 2),
         )
 
-        return JudgmentBatchResult(judgments=judgments, failed_count=failed_count)
+        return JudgmentBatchResult(
+            judgments=judgments,
+            failed_count=failed_count,
+            usage=self._usage_ledger,
+            failed_urls=failed_urls,
+        )
+
+    def _rate(self, count: int) -> float:
+        """課金対象の呼び出し回数（応答を受信した回数）に対する割合を返す."""
+        call_count = len(self._usage_ledger.calls)
+        return round(count / call_count, 3) if call_count > 0 else 0.0
 
     async def _judge_single(self, article: Article) -> JudgmentResult:
         """単一記事を判定する（リトライ付き）.
@@ -206,64 +506,47 @@ class LlmJudge:
 
         Raises:
             LlmJsonParseError: JSON解析に失敗した場合（リトライ後）
+            LlmFatalError: 致命的なBedrock API エラー（FATAL_ERROR_CODES）の場合
             ClientError: Bedrock API エラー（リトライ対象外 or 最大リトライ到達）
         """
         for attempt in range(self._max_retries + 1):
             try:
-                # プロンプト生成
-                prompt = self._build_prompt(article)
-
-                # Bedrock呼び出し
-                # ARNが設定されていればそれを使用、未設定ならmodel_idを使用
-                model_identifier = (
-                    self._inference_profile_arn if self._inference_profile_arn else self._model_id
-                )
-                response = await asyncio.to_thread(
-                    self._bedrock_client.invoke_model,
-                    modelId=model_identifier,
-                    body=json.dumps(
-                        {
-                            "anthropic_version": "bedrock-2023-05-31",
-                            "max_tokens": 1000,
-                            "messages": [{"role": "user", "content": prompt}],
-                        }
-                    ),
+                # プロンプト生成・Bedrock呼び出し
+                response = await self._invoke(self._build_prompt(article), attempt)
+
+                # トークン数を抽出しDEBUGログ出力・利用量台帳に記録
+                # （JSON解析に失敗した呼び出しも課金されるため解析前に記録する）
+                call_usage = BedrockCallUsage.from_response_usage(
+                    article.url,
+                    self._model_id,
+                    attempt,
+                    response.usage,
+                    output_tokens_estimated=response.output_tokens_estimated,
                 )
-
-                # レスポンス解析
-                response_body = json.loads(response["body"].read())
-                content = response_body["content"][0]["text"]
-
-                # トークン数を抽出しDEBUGログ出力・バッチ集計用に蓄積
-                usage = response_body.get("usage", {})
-                input_tokens = usage.get("input_tokens", 0)
-                output_tokens = usage.get("output_tokens", 0)
-                self._batch_input_tokens += input_tokens
-                self._batch_output_tokens += output_tokens
+                self._usage_ledger.record(call_usage)
+                # 打ち切られた出力は上限の推定に使わない
+                # （ストリームを途中で閉じた場合は受信したJSONの長さから見積もる）
+                if self._output_token_budget is not None and response.stop_reason != "max_tokens":
+                    budget_sample = call_usage.output_tokens
+                    if response.output_tokens_estimated:
+                        budget_sample = max(
+                            budget_sample,
+                            self._output_token_budget.estimate_output_tokens(response.text),
+                        )
+                    self._output_token_budget.record(budget_sample)
+                record_bedrock_tokens(call_usage.input_tokens, call_usage.output_tokens)
                 logger.debug(
                     "llm_judgment_token_usage",
                     url=article.url,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
+                    input_tokens=call_usage.input_tokens,
+                    output_tokens=call_usage.output_tokens,
                 )
 
                 # JSON解析
-                judgment_data = self._parse_response(content)
+                judgment_data = self._parse_response(response.text)
 
                 # JudgmentResult作成
-                judgment = JudgmentResult(
-                    url=article.url,
-                    title=article.title,
-                    description=article.description,
-                    interest_label=InterestLabel(judgment_data["interest_label"]),
-                    buzz_label=BuzzLabel.LOW,  # BuzzScoreから後で上書きされる
-                    confidence=float(judgment_data["confidence"]),
-                    summary=judgment_data["summary"][:300],  # 最大300文字
-                    model_id=self._model_id,
-                    judged_at=now_utc(),
-                    published_at=article.published_at,
-                    tags=self._extract_tags(judgment_data),
-                )
+                judgment = self._to_judgment(article, judgment_data)
 
                 logger.debug(
                     "llm_judgment_success",
@@ -281,6 +564,7 @@ class LlmJudge:
                         attempt=attempt + 1,
                         error=str(e),
                     )
+                    self._usage_ledger.retry_count += 1
                     await asyncio.sleep(1.0 * (attempt + 1))  # 指数バックオフ
                     continue
                 logger.error(
@@ -294,10 +578,18 @@ class LlmJudge:
                 # Bedrock API エラー（ThrottlingException, ServiceUnavailableException など）
                 error_code = e.response.get("Error", {}).get("Code", "")
 
-                # リトライ対象のエラーか判定
-                # ThrottlingException: レート制限超過（429相当）
-                # ServiceUnavailableException: サービス利用不可（5xx相当）
-                is_retryable = error_code in ["ThrottlingException", "ServiceUnavailableException"]
+                # リトライ対象・致命的なエラーか判定
+                # （ストリーミング応答のエラーは "throttlingException" のように先頭が小文字）
+                normalized_code = error_code[:1].upper() + error_code[1:]
+                if normalized_code in FATAL_ERROR_CODES:
+                    logger.error(
+                        "llm_judgment_fatal_error",
+                        url=article.url,
+                        error_code=error_code,
+                        error=str(e),
+                    )
+                    raise LlmFatalError(f"{error_code}: {e}") from e
+                is_retryable = normalized_code in RETRYABLE_ERROR_CODES
 
                 if is_retryable and attempt < self._max_retries:
                     # 指数バックオフ + ジッター計算
@@ -314,6 +606,7 @@ class LlmJudge:
                         backoff_delay=backoff_delay,
                         error=str(e),
                     )
+                    self._usage_ledger.retry_count += 1
                     await asyncio.sleep(backoff_delay)
                     continue
                 # リトライ対象外（ValidationException, AccessDeniedException など）
@@ -337,6 +630,51 @@ class LlmJudge:
         # ここには到達しないはずだが、型チェックのため
         raise LlmJsonParseError("Max retries exceeded")
 
+    async def _invoke(self, prompt: str, attempt: int) -> ModelResponse:
+        """Bedrockを呼び出して応答を返す.
+
+        max_tokens は output_token_budget の推定値とし、リトライ時は出力の打ち切りで
+        JSON解析に失敗した可能性があるため固定の上限に戻す.
+
+        Args:
+            prompt: 判定プロンプト
+            attempt: 試行番号（0始まり）
+
+        Returns:
+            応答
+
+        Raises:
+            ClientError: Bedrock API エラー
+        """
+        max_tokens = (
+            self._output_token_budget.max_tokens()
+            if self._output_token_budget is not None and attempt == 0
+            else OutputTokenBudget.DEFAULT_MAX_TOKENS
+        )
+        # ARNが設定されていればそれを使用、未設定ならmodel_idを使用
+        model_identifier = (
+            self._inference_profile_arn if self._inference_profile_arn else self._model_id
+        )
+        body = json.dumps(self._build_request_body(prompt, max_tokens, self._tool_use))
+
+        if self._streaming:
+            stream_response = await asyncio.to_thread(
+                self._bedrock_client.invoke_model_with_response_stream,
+                modelId=model_identifier,
+                body=body,
+            )
+            return await asyncio.to_thread(read_response_stream, stream_response["body"])
+
+        response = await asyncio.to_thread(
+            self._bedrock_client.invoke_model, modelId=model_identifier, body=body
+        )
+        response_body = json.loads(response["body"].read())
+        return ModelResponse(
+            text=self._response_text(response_body),
+            usage=response_body.get("usage", {}),
+            stop_reason=response_body.get("stop_reason"),
+        )
+
     @staticmethod
     def _calculate_backoff(attempt: int, base_delay: float, max_backoff: float) -> float:
         """指数バックオフ + ジッターを計算する.
@@ -353,6 +691,75 @@ class LlmJudge:
         jitter: float = random.uniform(0, delay * 0.5)  # 最大50%のジッター
         return delay + jitter
 
+    @staticmethod
+    def _build_request_body(
+        prompt: str,
+        max_tokens: int = OutputTokenBudget.DEFAULT_MAX_TOKENS,
+        tool_use: bool = False,
+    ) -> dict[str, Any]:
+        """Bedrock（Anthropic Messages API）のリクエストボディを生成する.
+
+        Args:
+            prompt: 判定プロンプト
+            max_tokens: 出力トークン上限（デフォルト: 1000）
+            tool_use: 判定結果ツールの呼び出しを強制するかどうか（デフォルト: False）
+
+        Returns:
+            リクエストボディの辞書
+        """
+        body: dict[str, Any] = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if tool_use:
+            body["tools"] = [JUDGMENT_TOOL]
+            body["tool_choice"] = {"type": "tool", "name": JUDGMENT_TOOL_NAME}
+        return body
+
+    @staticmethod
+    def _response_text(response_body: dict[str, Any]) -> str:
+        """レスポンスボディから判定結果のJSON文字列を取り出す.
+
+        tool use の応答は引数（解析済みのオブジェクト）をJSON文字列に戻し、
+        テキスト出力と同じ検証（_parse_response）を通す.
+
+        Args:
+            response_body: Anthropic Messages API のレスポンスボディ
+
+        Returns:
+            判定結果のJSON文字列（またはLLMの出力テキスト）
+        """
+        content: list[dict[str, Any]] = response_body["content"]
+        for block in content:
+            if block.get("type") == "tool_use":
+                return json.dumps(block.get("input", {}), ensure_ascii=False)
+        return str(content[0]["text"])
+
+    def _to_judgment(self, article: Article, judgment_data: dict[str, Any]) -> JudgmentResult:
+        """解析済みのLLM出力から判定結果を作成する.
+
+        Args:
+            article: 判定対象記事
+            judgment_data: _parse_response で検証済みの判定結果の辞書
+
+        Returns:
+            判定結果
+        """
+        return JudgmentResult(
+            url=article.url,
+            title=article.title,
+            description=article.description,
+            interest_label=InterestLabel(judgment_data["interest_label"]),
+            buzz_label=BuzzLabel.LOW,  # BuzzScoreから後で上書きされる
+            confidence=float(judgment_data["confidence"]),
+            summary=judgment_data["summary"][:300],  # 最大300文字
+            model_id=self._model_id,
+            judged_at=now_utc(),
+            published_at=article.published_at,
+            tags=self._extract_tags(judgment_data),
+        )
+
     def _build_prompt(self, article: Article) -> str:
         """判定プロンプトを生成する.
 
@@ -362,9 +769,13 @@ class LlmJudge:
         Returns:
             プロンプト文字列
         """
-        # InterestProfileから動的に生成
-        profile_text = self._interest_profile.format_for_prompt()
-        criteria_text = self._interest_profile.format_criteria_for_prompt()
+        # InterestProfileから生成（記事ごとに同一のため初回のみ整形する）
+        if self._prompt_profile_texts is None:
+            self._prompt_profile_texts = (
+                self._interest_profile.format_for_prompt(),
+                self._interest_profile.format_criteria_for_prompt(),
+            )
+        profile_text, criteria_text = self._prompt_profile_texts
 
         return f"""以下の記事について、関心度を判定してください。
 
@@ -399,43 +810,98 @@ JSON以外は出力しないでください。"""
     def _parse_response(self, response_text: str) -> dict[str, Any]:
         """LLMレスポンスからJSON判定結果を解析する.
 
+        JSONとして解析できない場合は repair_json_object で修復を試み、
+        修復できない場合のみ LlmJsonParseError を送出する（呼び出し側で再呼び出しする）.
+        解析失敗・修復の回数は利用量台帳に記録する.
+
         Args:
             response_text: LLMの出力テキスト
 
         Returns:
-            判定結果の辞書
+            判定結果の辞書（interest_label は正規化済み、confidence は0.0-1.0に丸め済み）
 
         Raises:
-            LlmJsonParseError: JSON解析に失敗した場合
+            LlmJsonParseError: JSON解析・修復に失敗した場合、または判定結果の形式が不正な場合
         """
         try:
-            # JSON部分を抽出（マークダウンコードブロックを除去）
-            json_text = response_text.strip()
-            if json_text.startswith("```json"):
-                json_text = json_text[7:]  # "```json\n" を除去
-            if json_text.startswith("```"):
-                json_text = json_text[3:]  # "```" を除去
-            if json_text.endswith("```"):
-                json_text = json_text[:-3]  # "```" を除去
-            json_text = json_text.strip()
-
-            # JSON解析
-            data: dict[str, Any] = json.loads(json_text)
-
-            # 必須フィールドの検証
-            required_fields = ["interest_label", "confidence", "summary"]
-            for field in required_fields:
-                if field not in data:
-                    raise LlmJsonParseError(f"Missing required field: {field}")
-
-            data["tags"] = self._extract_tags(data)
-            return data
-
-        except json.JSONDecodeError as e:
-            raise LlmJsonParseError(f"JSON decode error: {e}") from e
+            data, repaired = self._decode_json(response_text)
+            self._validate_judgment_data(data)
+        except LlmJsonParseError:
+            self._usage_ledger.json_parse_failure_count += 1
+            raise
         except Exception as e:
+            self._usage_ledger.json_parse_failure_count += 1
             raise LlmJsonParseError(f"Unexpected parse error: {e}") from e
 
+        if repaired:
+            self._usage_ledger.json_repair_count += 1
+            logger.debug("llm_json_repaired", response_length=len(response_text))
+        data["tags"] = self._extract_tags(data)
+        return data
+
+    @staticmethod
+    def _decode_json(response_text: str) -> tuple[dict[str, Any], bool]:
+        """LLM出力をJSONオブジェクトとして解析する（失敗した場合は修復を試みる）.
+
+        Args:
+            response_text: LLMの出力テキスト
+
+        Returns:
+            (解析したオブジェクト, 修復したかどうか)
+
+        Raises:
+            LlmJsonParseError: 解析・修復のいずれにも失敗した場合
+        """
+        # JSON部分を抽出（マークダウンコードブロックを除去）
+        json_text = response_text.strip()
+        if json_text.startswith("```json"):
+            json_text = json_text[7:]  # "```json\n" を除去
+        if json_text.startswith("```"):
+            json_text = json_text[3:]  # "```" を除去
+        if json_text.endswith("```"):
+            json_text = json_text[:-3]  # "```" を除去
+        json_text = json_text.strip()
+
+        try:
+            data = json.loads(json_text)
+        except json.JSONDecodeError as e:
+            repaired = repair_json_object(response_text)
+            if repaired is None:
+                raise LlmJsonParseError(f"JSON decode error: {e}") from e
+            return repaired, True
+
+        if not isinstance(data, dict):
+            raise LlmJsonParseError(f"JSON is not an object: {type(data).__name__}")
+        return data, False
+
+    @staticmethod
+    def _validate_judgment_data(data: dict[str, Any]) -> None:
+        """判定結果の必須フィールドを検証し、値を正規化する.
+
+        Args:
+            data: 判定結果の辞書（interest_label・confidence を正規化した値で上書きする）
+
+        Raises:
+            LlmJsonParseError: 必須フィールドがない、または値が不正な場合
+        """
+        for field_name in JUDGMENT_REQUIRED_FIELDS:
+            if field_name not in data:
+                raise LlmJsonParseError(f"Missing required field: {field_name}")
+
+        label = str(data["interest_label"]).strip().upper()
+        if label not in INTEREST_LABEL_VALUES:
+            raise LlmJsonParseError(f"Invalid interest_label: {data['interest_label']}")
+        data["interest_label"] = label
+
+        try:
+            confidence = float(data["confidence"])
+        except (TypeError, ValueError) as e:
+            raise LlmJsonParseError(f"Invalid confidence: {data['confidence']}") from e
+        data["confidence"] = min(max(confidence, 0.0), 1.0)
+
+        if not isinstance(data["summary"], str):
+            raise LlmJsonParseError("summary must be a string")
+
     def _create_fallback_judgment(self, article: Article) -> JudgmentResult:
         """判定失敗時のフォールバック判定結果を作成する.
 
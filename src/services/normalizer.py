@@ -1,7 +1,6 @@
 """記事正規化サービスモジュール."""
 
 import html
-from dataclasses import replace
 
 from src.models.article import Article
 from src.shared.logging.logger import get_logger
@@ -16,11 +15,15 @@ class Normalizer:
 
     収集した記事を統一フォーマットに正規化する.
     URL、日時、タイトル、概要を整形する.
+    記事ごとのコピーでピークメモリが倍増しないよう、記事はインプレースで更新する.
     """
 
     def normalize(self, articles: list[Article]) -> list[Article]:
         """記事リストを正規化する.
 
+        入力の記事オブジェクトをインプレースで更新して返す（コピーは作成しない）.
+        正規化に失敗した記事は更新せず、結果から除外する.
+
         Args:
             articles: 収集した記事のリスト
 
@@ -46,17 +49,14 @@ class Normalizer:
                 normalized_published_at = to_utc(article.published_at)
                 normalized_collected_at = to_utc(article.collected_at)
 
-                # 正規化された記事を作成
-                normalized_article = replace(
-                    article,
-                    normalized_url=normalized_url,
-                    title=normalized_title,
-                    description=normalized_description,
-                    published_at=normalized_published_at,
-                    collected_at=normalized_collected_at,
-                )
+                # 全項目の正規化に成功した場合のみインプレースで更新する
+                article.normalized_url = normalized_url
+                article.title = normalized_title
+                article.description = normalized_description
+                article.published_at = normalized_published_at
+                article.collected_at = normalized_collected_at
 
-                normalized_articles.append(normalized_article)
+                normalized_articles.append(article)
 
             except Exception as e:
                 logger.warning(
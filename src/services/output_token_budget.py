@@ -0,0 +1,76 @@
+"""LLM出力トークン上限の推定サービスモジュール."""
+
+import math
+from collections import deque
+
+
+class OutputTokenBudget:
+    """観測した出力トークン数からリクエストの max_tokens を導出する.
+
+    判定のJSON出力は概ね一定の長さのため、直近の出力トークン数の p99 に余裕を持たせた値を
+    max_tokens とし、暴走した出力を早めに打ち切る. Lambdaのウォーム起動間で統計を
+    引き継ぐため、モジュールレベルで保持して複数回の実行で共有する想定.
+
+    max_tokens は p99 × P99_MULTIPLIER を MIN_MAX_TOKENS と DEFAULT_MAX_TOKENS の間に
+    収めた値とする. サンプルが MIN_SAMPLES 件未満の間は DEFAULT_MAX_TOKENS を使用する.
+
+    ストリームを途中で閉じた応答は出力トークン数を受信しないため、受信したJSONの長さから
+    estimate_output_tokens で見積もった値をサンプルとする.
+
+    Attributes:
+        _samples: 直近の出力トークン数
+    """
+
+    DEFAULT_MAX_TOKENS = 1000
+    MIN_MAX_TOKENS = 256
+    MIN_SAMPLES = 20
+    P99_MULTIPLIER = 1.5
+    # 見積もりに使う1トークンあたりのUTF-8バイト数（英数字は約4文字、日本語は約1文字で1トークン）
+    UTF8_BYTES_PER_TOKEN = 3
+
+    def __init__(self, window_size: int = 200) -> None:
+        """出力トークン上限の推定を初期化する.
+
+        Args:
+            window_size: 保持するサンプル数（デフォルト: 200）
+        """
+        self._samples: deque[int] = deque(maxlen=window_size)
+
+    def record(self, output_tokens: int) -> None:
+        """出力トークン数を記録する（max_tokens で打ち切られた出力は記録しないこと）.
+
+        Args:
+            output_tokens: 出力トークン数
+        """
+        if output_tokens > 0:
+            self._samples.append(output_tokens)
+
+    @classmethod
+    def estimate_output_tokens(cls, text: str) -> int:
+        """出力テキストの長さから出力トークン数を見積もる.
+
+        max_tokens の不足で出力が打ち切られないよう、多めに見積もる.
+
+        Args:
+            text: 出力テキスト
+
+        Returns:
+            出力トークン数の見積もり
+        """
+        return math.ceil(len(text.encode()) / cls.UTF8_BYTES_PER_TOKEN)
+
+    def max_tokens(self) -> int:
+        """リクエストに指定する max_tokens を返す.
+
+        Returns:
+            max_tokens
+        """
+        if len(self._samples) < self.MIN_SAMPLES:
+            return self.DEFAULT_MAX_TOKENS
+        sorted_samples = sorted(self._samples)
+        # nearest-rank法の p99
+        p99 = sorted_samples[max(math.ceil(0.99 * len(sorted_samples)) - 1, 0)]
+        return min(
+            max(math.ceil(p99 * self.P99_MULTIPLIER), self.MIN_MAX_TOKENS),
+            self.DEFAULT_MAX_TOKENS,
+        )
@@ -0,0 +1,291 @@
+"""LLM判定前の事前分類サービスモジュール."""
+
+import json
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+from src.models.article import Article
+from src.models.buzz_score import BuzzScore
+from src.models.judgment import BuzzLabel, InterestLabel, JudgmentResult
+from src.shared.logging.logger import get_logger
+from src.shared.utils.date_utils import now_utc
+
+logger = get_logger(__name__)
+
+# 英数字の単語（"c++" "c#" "node.js" 等を1語として扱う）
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# 日本語（ひらがな・カタカナ・漢字）の連続部分
+_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u9fff]+")
+
+
+def tokenize(text: str) -> set[str]:
+    """分類用の特徴トークンを抽出する.
+
+    英数字は単語単位、日本語は分かち書きせず文字bigramで扱う.
+    出現回数ではなく出現有無を特徴とする（短い概要での過学習を抑えるため）.
+
+    Args:
+        text: 記事タイトル+概要
+
+    Returns:
+        特徴トークンの集合
+    """
+    lowered = text.lower()
+    tokens = set(_WORD_PATTERN.findall(lowered))
+    for run in _CJK_PATTERN.findall(lowered):
+        if len(run) == 1:
+            tokens.add(run)
+        tokens.update(run[i : i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def article_text(title: str, description: str) -> str:
+    """分類に使う記事テキストを返す（学習・推論で同じ入力にするため共通化）."""
+    return f"{title} {description}"
+
+
+@dataclass
+class PrefilterModel:
+    """IGNORE判定の二値ナイーブベイズモデル.
+
+    過去のLLM判定結果（JudgmentResult）から学習し、JSONで保存・読み込みする.
+
+    Attributes:
+        ignore_log_prior: IGNOREの事前対数確率
+        keep_log_prior: IGNORE以外の事前対数確率
+        ignore_log_probs: トークンをキーとするIGNORE文書での出現対数確率
+        keep_log_probs: トークンをキーとするIGNORE以外の文書での出現対数確率
+        sample_count: 学習に使用した判定結果の件数
+    """
+
+    ignore_log_prior: float
+    keep_log_prior: float
+    ignore_log_probs: dict[str, float] = field(default_factory=dict)
+    keep_log_probs: dict[str, float] = field(default_factory=dict)
+    sample_count: int = 0
+
+    @classmethod
+    def train(
+        cls, samples: Iterable[tuple[str, bool]], min_count: int = 2, alpha: float = 1.0
+    ) -> Self:
+        """判定結果から学習する.
+
+        Args:
+            samples: (記事テキスト, IGNOREかどうか) の組
+            min_count: 語彙に含めるトークンの最小出現文書数（デフォルト: 2）
+            alpha: ラプラススムージング係数（デフォルト: 1.0）
+
+        Returns:
+            学習済みモデル
+
+        Raises:
+            ValueError: IGNORE・IGNORE以外のいずれかの判定結果がない場合
+        """
+        ignore_counts: Counter[str] = Counter()
+        keep_counts: Counter[str] = Counter()
+        ignore_docs = keep_docs = 0
+        for text, is_ignore in samples:
+            tokens = tokenize(text)
+            if is_ignore:
+                ignore_counts.update(tokens)
+                ignore_docs += 1
+            else:
+                keep_counts.update(tokens)
+                keep_docs += 1
+        if ignore_docs == 0 or keep_docs == 0:
+            raise ValueError("Training data must contain both IGNORE and non-IGNORE judgments")
+
+        vocabulary = [
+            token for token, count in (ignore_counts + keep_counts).items() if count >= min_count
+        ]
+        total_docs = ignore_docs + keep_docs
+        return cls(
+            ignore_log_prior=math.log(ignore_docs / total_docs),
+            keep_log_prior=math.log(keep_docs / total_docs),
+            ignore_log_probs={
+                token: math.log((ignore_counts[token] + alpha) / (ignore_docs + 2 * alpha))
+                for token in vocabulary
+            },
+            keep_log_probs={
+                token: math.log((keep_counts[token] + alpha) / (keep_docs + 2 * alpha))
+                for token in vocabulary
+            },
+            sample_count=total_docs,
+        )
+
+    def ignore_probability(self, text: str) -> float:
+        """記事がIGNOREと判定される確率を返す.
+
+        Args:
+            text: 記事テキスト（article_text で生成）
+
+        Returns:
+            IGNORE確率（0.0-1.0）
+        """
+        log_odds = self.ignore_log_prior - self.keep_log_prior
+        for token in tokenize(text):
+            ignore_log_prob = self.ignore_log_probs.get(token)
+            if ignore_log_prob is not None:
+                log_odds += ignore_log_prob - self.keep_log_probs[token]
+        # オーバーフロー回避のため対数オッズを制限してからシグモイド変換
+        return 1.0 / (1.0 + math.exp(-max(min(log_odds, 50.0), -50.0)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON保存用の辞書に変換する."""
+        return {
+            "ignore_log_prior": self.ignore_log_prior,
+            "keep_log_prior": self.keep_log_prior,
+            "ignore_log_probs": self.ignore_log_probs,
+            "keep_log_probs": self.keep_log_probs,
+            "sample_count": self.sample_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """JSONから読み込んだ辞書から生成する."""
+        return cls(
+            ignore_log_prior=float(data["ignore_log_prior"]),
+            keep_log_prior=float(data["keep_log_prior"]),
+            ignore_log_probs={k: float(v) for k, v in data["ignore_log_probs"].items()},
+            keep_log_probs={k: float(v) for k, v in data["keep_log_probs"].items()},
+            sample_count=int(data.get("sample_count", 0)),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """JSONファイルから読み込む.
+
+        Args:
+            path: モデルファイルパス
+
+        Returns:
+            学習済みモデル
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def save(self, path: str | Path) -> None:
+        """JSONファイルに保存する.
+
+        Args:
+            path: モデルファイルパス
+        """
+        Path(path).write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, sort_keys=True), encoding="utf-8"
+        )
+
+
+@dataclass
+class PrefilterResult:
+    """事前分類結果.
+
+    Attributes:
+        llm_articles: LLM判定に回す記事のリスト
+        ignored_judgments: 事前分類でIGNOREと判定した記事の判定結果
+    """
+
+    llm_articles: list[Article]
+    ignored_judgments: list[JudgmentResult]
+
+    @property
+    def avoided_ratio(self) -> float:
+        """LLM判定を省略した割合を返す."""
+        total = len(self.llm_articles) + len(self.ignored_judgments)
+        return len(self.ignored_judgments) / total if total > 0 else 0.0
+
+
+class PrefilterClassifier:
+    """LLM判定前の事前分類サービス.
+
+    IGNORE確率が閾値以上の記事をLLMに送らずIGNOREと判定し、判定が不確かな記事のみ
+    LLM判定に回す. 関心プロファイルの中程度以上のトピックに一致する記事
+    （Interestスコアが PROTECTED_INTEREST_SCORE 以上）は常にLLM判定に回す.
+
+    事前分類の判定結果はキャッシュに保存しない（モデル改善後に再判定できるようにするため）.
+
+    Attributes:
+        _model: IGNORE判定モデル
+        _threshold: IGNOREと判定するIGNORE確率の閾値
+    """
+
+    MODEL_ID = "prefilter-naive-bayes"
+    DEFAULT_THRESHOLD = 0.95
+
+    # BuzzScorerの中程度関心（medium_interest）のInterestスコア
+    PROTECTED_INTEREST_SCORE = 55.0
+
+    def __init__(self, model: PrefilterModel, threshold: float = DEFAULT_THRESHOLD) -> None:
+        """事前分類サービスを初期化する.
+
+        Args:
+            model: IGNORE判定モデル
+            threshold: IGNOREと判定するIGNORE確率の閾値（デフォルト: 0.95）
+        """
+        self._model = model
+        self._threshold = threshold
+
+    def filter(self, articles: list[Article], scores: dict[str, BuzzScore]) -> PrefilterResult:
+        """LLM判定対象の記事を事前分類する.
+
+        Args:
+            articles: LLM判定候補の記事リスト
+            scores: Buzzスコア辞書（normalized_url -> BuzzScore）
+
+        Returns:
+            事前分類結果
+        """
+        llm_articles: list[Article] = []
+        ignored_judgments: list[JudgmentResult] = []
+
+        for article in articles:
+            score = scores.get(article.normalized_url)
+            if score is not None and score.interest_score >= self.PROTECTED_INTEREST_SCORE:
+                llm_articles.append(article)
+                continue
+
+            probability = self._model.ignore_probability(
+                article_text(article.title, article.description)
+            )
+            if probability >= self._threshold:
+                ignored_judgments.append(self._create_ignore_judgment(article, probability))
+            else:
+                llm_articles.append(article)
+
+        result = PrefilterResult(llm_articles=llm_articles, ignored_judgments=ignored_judgments)
+        logger.info(
+            "prefilter_complete",
+            input_count=len(articles),
+            ignored_count=len(ignored_judgments),
+            avoided_ratio=round(result.avoided_ratio, 3),
+            threshold=self._threshold,
+        )
+        return result
+
+    def _create_ignore_judgment(self, article: Article, probability: float) -> JudgmentResult:
+        """事前分類によるIGNORE判定結果を作成する.
+
+        Args:
+            article: 記事
+            probability: IGNORE確率
+
+        Returns:
+            IGNOREの判定結果
+        """
+        return JudgmentResult(
+            url=article.url,
+            title=article.title,
+            description=article.description,
+            interest_label=InterestLabel.IGNORE,
+            buzz_label=BuzzLabel.LOW,
+            confidence=round(probability, 3),
+            summary="Pre-filtered as IGNORE",
+            model_id=self.MODEL_ID,
+            judged_at=now_utc(),
+            published_at=article.published_at,
+            tags=[],
+        )
@@ -0,0 +1,419 @@
+"""実行スナップショットの記録・再生サービスモジュール.
+
+実行中の外部I/O（フィード収集・SocialProof取得・Bedrock呼び出し）の結果をスナップショットに
+記録し、ネットワークにアクセスせずに同じ入力からパイプラインを再実行できるようにする.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import hashlib
+import io
+import json
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Self
+
+from botocore.exceptions import ClientError
+
+from src.models.article import Article
+from src.repositories.source_master import SourceMaster
+from src.services.collector import CollectionResult, Collector
+from src.services.social_proof.circuit_breaker import CircuitBreakerRegistry
+from src.services.social_proof.multi_source_social_proof_fetcher import (
+    MultiSourceSocialProofFetcher,
+)
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# スナップショットファイルの形式バージョン（互換性のない変更をした場合に上げる）
+SNAPSHOT_FORMAT_VERSION = 1
+
+# 記録されていないBedrockリクエストを再生した場合のエラーコード（リトライ対象外）
+SNAPSHOT_MISS_ERROR_CODE = "SnapshotMissException"
+
+# 応答に影響するリクエストボディのキー（max_tokens 等の出力上限は応答の同一性に含めない）
+_REQUEST_KEY_FIELDS = ("system", "messages", "tools", "tool_choice")
+
+
+def llm_request_key(model_id: str, body: str) -> str:
+    """Bedrockリクエストの記録キーを生成する.
+
+    Args:
+        model_id: モデルID（リージョンプールによる書き換え前）
+        body: リクエストボディ（JSON文字列）
+
+    Returns:
+        記録キー（<モデルID>#<プロンプトのハッシュ>形式）
+    """
+    request = json.loads(body)
+    payload = json.dumps(
+        {key: request[key] for key in _REQUEST_KEY_FIELDS if key in request},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return f"{model_id}#{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+
+def _article_to_dict(article: Article) -> dict[str, Any]:
+    """記事をJSONに変換可能な辞書に変換する."""
+    data = dataclasses.asdict(article)
+    data["published_at"] = article.published_at.isoformat()
+    data["collected_at"] = article.collected_at.isoformat()
+    return data
+
+
+def _article_from_dict(data: dict[str, Any]) -> Article:
+    """辞書から記事を復元する."""
+    return Article(
+        **{
+            **data,
+            "published_at": datetime.fromisoformat(data["published_at"]),
+            "collected_at": datetime.fromisoformat(data["collected_at"]),
+        }
+    )
+
+
+def _error_entry(error: ClientError) -> dict[str, Any]:
+    """Bedrock API エラーの記録を生成する."""
+    error_info = error.response.get("Error", {})
+    return {
+        "kind": "error",
+        "code": error_info.get("Code", ""),
+        "message": error_info.get("Message", ""),
+        "operation": error.operation_name,
+    }
+
+
+@dataclass
+class RunSnapshot:
+    """実行スナップショット.
+
+    Attributes:
+        run_id: 記録した実行の実行ID
+        executed_at: 記録した実行の実行日時（UTC）
+        metadata: 再生時の既定値とする実行設定（モデルID・候補数等）
+        articles: 収集された記事（正規化前）
+        social_proof_scores: URLをキーとするSocialProofスコア
+        llm_responses: 記録キーをキーとするBedrock応答のリスト（呼び出し順）
+    """
+
+    run_id: str
+    executed_at: datetime
+    metadata: dict[str, Any] = field(default_factory=dict)
+    articles: list[Article] = field(default_factory=list)
+    social_proof_scores: dict[str, float] = field(default_factory=dict)
+    llm_responses: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+    def save(self, path: str | Path) -> None:
+        """スナップショットをgzip圧縮したJSONファイルに保存する.
+
+        Args:
+            path: 保存先のパス
+        """
+        data = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "run_id": self.run_id,
+            "executed_at": self.executed_at.isoformat(),
+            "metadata": self.metadata,
+            "articles": [_article_to_dict(article) for article in self.articles],
+            "social_proof_scores": self.social_proof_scores,
+            "llm_responses": self.llm_responses,
+        }
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(output_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """gzip圧縮したJSONファイルからスナップショットを読み込む.
+
+        Args:
+            path: スナップショットファイルのパス
+
+        Returns:
+            スナップショット
+
+        Raises:
+            ValueError: 形式バージョンが一致しない場合
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version: {data.get('format_version')}")
+        return cls(
+            run_id=data["run_id"],
+            executed_at=datetime.fromisoformat(data["executed_at"]),
+            metadata=data.get("metadata", {}),
+            articles=[_article_from_dict(article) for article in data["articles"]],
+            social_proof_scores=data.get("social_proof_scores", {}),
+            llm_responses=data.get("llm_responses", {}),
+        )
+
+
+class RecordingCollector(Collector):
+    """収集した記事をスナップショットに記録する収集サービス."""
+
+    def __init__(self, snapshot: RunSnapshot, source_master: SourceMaster, **kwargs: Any) -> None:
+        """記録付きの収集サービスを初期化する.
+
+        Args:
+            snapshot: 記録先のスナップショット
+            source_master: 収集元マスタ
+            **kwargs: Collector の引数
+        """
+        super().__init__(source_master, **kwargs)
+        self._snapshot = snapshot
+
+    async def collect(self, budget_seconds: float | None = None) -> CollectionResult:
+        """全ソースから記事を収集し、収集した記事を記録する.
+
+        後続の正規化は記事をインプレースで更新するため、収集時点の記事のコピーを記録する.
+        """
+        result = await super().collect(budget_seconds=budget_seconds)
+        self._snapshot.articles.extend(dataclasses.replace(article) for article in result.articles)
+        return result
+
+
+class ReplayCollector(Collector):
+    """スナップショットに記録された記事を返す収集サービス（フィードにアクセスしない）."""
+
+    def __init__(self, snapshot: RunSnapshot, source_master: SourceMaster) -> None:
+        """再生用の収集サービスを初期化する.
+
+        Args:
+            snapshot: 再生するスナップショット
+            source_master: 収集元マスタ
+        """
+        super().__init__(source_master)
+        self._snapshot = snapshot
+
+    async def collect(self, budget_seconds: float | None = None) -> CollectionResult:
+        """記録された記事を返す（正規化で変更されないよう複製する）."""
+        return CollectionResult(
+            articles=[dataclasses.replace(article) for article in self._snapshot.articles],
+            errors={},
+        )
+
+
+class RecordingSocialProofFetcher(MultiSourceSocialProofFetcher):
+    """取得したSocialProofスコアをスナップショットに記録する取得サービス."""
+
+    def __init__(
+        self, snapshot: RunSnapshot, circuit_breakers: CircuitBreakerRegistry | None = None
+    ) -> None:
+        """記録付きのSocialProof取得サービスを初期化する.
+
+        Args:
+            snapshot: 記録先のスナップショット
+            circuit_breakers: サーキットブレーカーのレジストリ（デフォルト: None=無効）
+        """
+        super().__init__(circuit_breakers=circuit_breakers)
+        self._snapshot = snapshot
+
+    async def fetch_batch(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> dict[str, float]:
+        """複数記事のSocialProofスコアを一括取得し、取得結果を記録する."""
+        scores = await super().fetch_batch(articles, budget_seconds=budget_seconds)
+        self._snapshot.social_proof_scores.update(scores)
+        return scores
+
+
+class ReplaySocialProofFetcher(MultiSourceSocialProofFetcher):
+    """スナップショットに記録されたSocialProofスコアを返す取得サービス."""
+
+    def __init__(self, snapshot: RunSnapshot) -> None:
+        """再生用のSocialProof取得サービスを初期化する.
+
+        Args:
+            snapshot: 再生するスナップショット
+        """
+        super().__init__()
+        self._snapshot = snapshot
+
+    async def fetch_batch(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> dict[str, float]:
+        """記録されたスコアを返す（記録のない記事は含めない=欠損扱い）."""
+        scores = self._snapshot.social_proof_scores
+        return {article.url: scores[article.url] for article in articles if article.url in scores}
+
+
+class _RecordingEventStream:
+    """ストリーミング応答のイベントを記録しながら読み出すストリーム.
+
+    ストリームの終端・エラー・close のいずれかの時点で1度だけ記録を確定する.
+
+    Attributes:
+        _stream: 元のストリーム
+        _on_complete: 記録を確定するコールバック
+        _events: 読み出したイベントの記録
+        _completed: 記録を確定済みかどうか
+    """
+
+    def __init__(self, stream: Any, on_complete: Callable[[dict[str, Any]], None]) -> None:
+        self._stream = stream
+        self._on_complete = on_complete
+        self._events: list[dict[str, Any]] = []
+        self._completed = False
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for event in self._stream:
+                chunk = event.get("chunk")
+                if chunk is not None:
+                    self._events.append({"chunk": chunk["bytes"].decode()})
+                yield event
+        except ClientError as e:
+            self._events.append(_error_entry(e))
+            raise
+        finally:
+            self._complete()
+
+    def close(self) -> None:
+        self._complete()
+        self._stream.close()
+
+    def _complete(self) -> None:
+        if not self._completed:
+            self._completed = True
+            self._on_complete({"kind": "stream", "events": self._events})
+
+
+class RecordingBedrockClient:
+    """Bedrock応答をスナップショットに記録するBedrock Runtimeクライアント.
+
+    invoke_model / invoke_model_with_response_stream を元のクライアントに委譲し、
+    応答（エラーを含む）をリクエストの記録キーごとに呼び出し順で記録する.
+    asyncio.to_thread から並行に呼ばれるため記録はロックで保護する.
+
+    Attributes:
+        _client: 元のBedrock Runtimeクライアント
+        _snapshot: 記録先のスナップショット
+        _lock: 記録のロック
+    """
+
+    def __init__(self, client: Any, snapshot: RunSnapshot) -> None:
+        """記録付きのBedrock Runtimeクライアントを初期化する.
+
+        Args:
+            client: 元のBedrock Runtimeクライアント（リージョンプールも可）
+            snapshot: 記録先のスナップショット
+        """
+        self._client = client
+        self._snapshot = snapshot
+        self._lock = threading.Lock()
+
+    def invoke_model(self, **kwargs: Any) -> dict[str, Any]:
+        """モデルを呼び出し、応答ボディを記録する."""
+        key = llm_request_key(kwargs["modelId"], kwargs["body"])
+        try:
+            response: dict[str, Any] = self._client.invoke_model(**kwargs)
+        except ClientError as e:
+            self._record(key, _error_entry(e))
+            raise
+        body = response["body"].read()
+        self._record(key, {"kind": "invoke", "body": body.decode()})
+        return {**response, "body": io.BytesIO(body)}
+
+    def invoke_model_with_response_stream(self, **kwargs: Any) -> dict[str, Any]:
+        """モデルをストリーミング呼び出しし、読み出したイベントを記録する."""
+        key = llm_request_key(kwargs["modelId"], kwargs["body"])
+        try:
+            response: dict[str, Any] = self._client.invoke_model_with_response_stream(**kwargs)
+        except ClientError as e:
+            self._record(key, _error_entry(e))
+            raise
+        stream = _RecordingEventStream(response["body"], lambda entry: self._record(key, entry))
+        return {**response, "body": stream}
+
+    def _record(self, key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._snapshot.llm_responses.setdefault(key, []).append(entry)
+
+
+class _ReplayEventStream:
+    """記録されたイベントを返すストリーム."""
+
+    def __init__(self, events: list[dict[str, Any]]) -> None:
+        self._events = events
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for event in self._events:
+            if event.get("kind") == "error":
+                raise ClientError(
+                    {"Error": {"Code": event["code"], "Message": event["message"]}},
+                    event["operation"],
+                )
+            yield {"chunk": {"bytes": event["chunk"].encode()}}
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayBedrockClient:
+    """スナップショットに記録されたBedrock応答を返すBedrock Runtimeクライアント.
+
+    記録キーごとに記録された応答を呼び出し順に返し、記録より多く呼び出された場合は
+    最後の応答を繰り返す. 記録のないリクエストはリトライ対象外のエラー
+    （SNAPSHOT_MISS_ERROR_CODE）とし、その記事は判定失敗として扱われる.
+
+    Attributes:
+        _responses: 記録キーをキーとする未再生の応答
+        _last: 記録キーをキーとする最後に再生した応答
+        _lock: 再生位置のロック
+    """
+
+    def __init__(self, snapshot: RunSnapshot) -> None:
+        """再生用のBedrock Runtimeクライアントを初期化する.
+
+        Args:
+            snapshot: 再生するスナップショット
+        """
+        self._responses = {key: deque(entries) for key, entries in snapshot.llm_responses.items()}
+        self._last: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def invoke_model(self, **kwargs: Any) -> dict[str, Any]:
+        """記録された応答ボディを返す."""
+        entry = self._next(kwargs, "InvokeModel", "invoke")
+        return {"body": io.BytesIO(entry["body"].encode())}
+
+    def invoke_model_with_response_stream(self, **kwargs: Any) -> dict[str, Any]:
+        """記録されたイベントのストリームを返す."""
+        entry = self._next(kwargs, "InvokeModelWithResponseStream", "stream")
+        return {"body": _ReplayEventStream(entry["events"])}
+
+    def _next(self, kwargs: dict[str, Any], operation: str, kind: str) -> dict[str, Any]:
+        """次に再生する応答を返す（エラーの記録・記録がない場合はClientErrorを送出する）."""
+        key = llm_request_key(kwargs["modelId"], kwargs["body"])
+        with self._lock:
+            pending = self._responses.get(key)
+            entry = pending.popleft() if pending else self._last.get(key)
+            if entry is not None:
+                self._last[key] = entry
+
+        if entry is not None and entry["kind"] == "error":
+            raise ClientError(
+                {"Error": {"Code": entry["code"], "Message": entry["message"]}},
+                entry["operation"],
+            )
+        if entry is None or entry["kind"] != kind:
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": SNAPSHOT_MISS_ERROR_CODE,
+                        "Message": f"No recorded {kind} response for {key}",
+                    }
+                },
+                operation,
+            )
+        return entry
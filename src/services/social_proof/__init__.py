@@ -1,5 +1,10 @@
 """ソーシャルプルーフ取得パッケージ."""
 
+from src.services.social_proof.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
 from src.services.social_proof.external_service_policy import ExternalServicePolicy
 from src.services.social_proof.hatena_count_fetcher import HatenaCountFetcher
 from src.services.social_proof.multi_source_social_proof_fetcher import (
@@ -11,6 +16,9 @@ from src.services.social_proof.yamadashy_signal_fetcher import YamadashySignalFe
 from src.services.social_proof.zenn_like_fetcher import ZennLikeFetcher
 
 __all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
     "ExternalServicePolicy",
     "HatenaCountFetcher",
     "MultiSourceSocialProofFetcher",
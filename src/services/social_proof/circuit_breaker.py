@@ -0,0 +1,244 @@
+"""サーキットブレーカーモジュール."""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitState(StrEnum):
+    """サーキットブレーカーの状態.
+
+    Attributes:
+        CLOSED: 通常状態（リクエストを通す）
+        OPEN: 遮断状態（リクエストを即座に失敗させる）
+        HALF_OPEN: 試行状態（クールダウン後に1件だけ試行リクエストを通す）
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """ドメイン単位のサーキットブレーカー.
+
+    直近 window_size 件のリクエスト結果から失敗率を計算し、
+    閾値を超えた場合にOPENへ遷移する。OPEN状態ではクールダウン経過まで
+    リクエストを遮断し、経過後はHALF_OPENで1件だけ試行する。
+
+    Attributes:
+        _domain: 対象ドメイン
+        _window_size: 失敗率計算に使う直近リクエスト数
+        _min_requests: 失敗率判定を開始する最小リクエスト数
+        _failure_rate_threshold: OPENへ遷移する失敗率（0.0-1.0）
+        _cooldown_seconds: OPEN状態を維持する時間（秒）
+        _clock: 単調増加時刻を返す関数
+        _state: 現在の状態
+        _outcomes: 直近のリクエスト結果（True=成功）
+        _opened_at: OPENへ遷移した時刻
+        _half_open_in_flight: HALF_OPEN中の試行リクエスト実行中フラグ
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        window_size: int = 10,
+        min_requests: int = 4,
+        failure_rate_threshold: float = 0.5,
+        cooldown_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """サーキットブレーカーを初期化する.
+
+        Args:
+            domain: 対象ドメイン
+            window_size: 失敗率計算に使う直近リクエスト数（デフォルト: 10）
+            min_requests: 失敗率判定を開始する最小リクエスト数（デフォルト: 4）
+            failure_rate_threshold: OPENへ遷移する失敗率（デフォルト: 0.5）
+            cooldown_seconds: OPEN状態を維持する時間（秒、デフォルト: 300.0）
+            clock: 単調増加時刻を返す関数（デフォルト: time.monotonic）
+        """
+        self._domain = domain
+        self._window_size = window_size
+        self._min_requests = min_requests
+        self._failure_rate_threshold = failure_rate_threshold
+        self._cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._opened_at: float | None = None
+        self._half_open_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """現在の状態を返す（クールダウン経過時はHALF_OPENとして評価）."""
+        if self._state == CircuitState.OPEN and self._cooldown_elapsed():
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """直近ウィンドウの失敗率を返す."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def allow_request(self) -> bool:
+        """リクエストを送信してよいか判定する.
+
+        Returns:
+            送信可能な場合True（OPEN中、またはHALF_OPENで試行中の場合False）
+        """
+        if self._state == CircuitState.CLOSED:
+            return True
+
+        if self._state == CircuitState.OPEN:
+            if not self._cooldown_elapsed():
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+
+        # HALF_OPEN: 試行リクエストは同時に1件のみ
+        if self._half_open_in_flight:
+            return False
+        self._half_open_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """リクエスト成功を記録する."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = False
+            self._outcomes.clear()
+            self._transition(CircuitState.CLOSED)
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """リクエスト失敗を記録する."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = False
+            self._open()
+            return
+
+        self._outcomes.append(False)
+        if (
+            self._state == CircuitState.CLOSED
+            and len(self._outcomes) >= self._min_requests
+            and self.failure_rate >= self._failure_rate_threshold
+        ):
+            self._open()
+
+    def release_probe(self) -> None:
+        """結果を記録せずに終了したHALF_OPENの試行リクエストを解放する.
+
+        試行リクエストがキャンセル・想定外の例外で終了した場合に呼び出し、
+        次のリクエストで再び試行できるようにする（状態・失敗率は変更しない）.
+        """
+        self._half_open_in_flight = False
+
+    def _open(self) -> None:
+        """OPEN状態へ遷移する."""
+        self._opened_at = self._clock()
+        self._transition(CircuitState.OPEN)
+
+    def _cooldown_elapsed(self) -> bool:
+        """OPEN遷移からクールダウン時間が経過したか判定する."""
+        if self._opened_at is None:
+            return True
+        return self._clock() - self._opened_at >= self._cooldown_seconds
+
+    def _transition(self, new_state: CircuitState) -> None:
+        """状態を遷移し、遷移をログ出力する."""
+        if new_state == self._state:
+            return
+        logger.warning(
+            "circuit_breaker_state_changed",
+            domain=self._domain,
+            from_state=self._state.value,
+            to_state=new_state.value,
+            failure_rate=round(self.failure_rate, 2),
+        )
+        self._state = new_state
+
+
+class CircuitBreakerRegistry:
+    """ドメインごとのサーキットブレーカーを保持するレジストリ.
+
+    Lambdaのウォーム起動間で状態を引き継ぐため、モジュールレベルで保持して
+    ExternalServicePolicy間で共有する想定.
+
+    Attributes:
+        _window_size: 失敗率計算に使う直近リクエスト数
+        _min_requests: 失敗率判定を開始する最小リクエスト数
+        _failure_rate_threshold: OPENへ遷移する失敗率
+        _cooldown_seconds: OPEN状態を維持する時間（秒）
+        _clock: 単調増加時刻を返す関数
+        _breakers: ドメインをキーとするサーキットブレーカー
+    """
+
+    def __init__(
+        self,
+        window_size: int = 10,
+        min_requests: int = 4,
+        failure_rate_threshold: float = 0.5,
+        cooldown_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """レジストリを初期化する.
+
+        Args:
+            window_size: 失敗率計算に使う直近リクエスト数（デフォルト: 10）
+            min_requests: 失敗率判定を開始する最小リクエスト数（デフォルト: 4）
+            failure_rate_threshold: OPENへ遷移する失敗率（デフォルト: 0.5）
+            cooldown_seconds: OPEN状態を維持する時間（秒、デフォルト: 300.0）
+            clock: 単調増加時刻を返す関数（デフォルト: time.monotonic）
+        """
+        self._window_size = window_size
+        self._min_requests = min_requests
+        self._failure_rate_threshold = failure_rate_threshold
+        self._cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, domain: str) -> CircuitBreaker:
+        """ドメインに対応するサーキットブレーカーを取得する（未登録なら作成）.
+
+        Args:
+            domain: 対象ドメイン
+
+        Returns:
+            サーキットブレーカー
+        """
+        if domain not in self._breakers:
+            self._breakers[domain] = CircuitBreaker(
+                domain,
+                window_size=self._window_size,
+                min_requests=self._min_requests,
+                failure_rate_threshold=self._failure_rate_threshold,
+                cooldown_seconds=self._cooldown_seconds,
+                clock=self._clock,
+            )
+        return self._breakers[domain]
+
+    def is_open(self, domain: str) -> bool:
+        """ドメインのサーキットがOPEN（クールダウン中）か判定する.
+
+        Args:
+            domain: 対象ドメイン
+
+        Returns:
+            OPENの場合True（未登録・HALF_OPENの場合False）
+        """
+        breaker = self._breakers.get(domain)
+        return breaker is not None and breaker.state == CircuitState.OPEN
+
+    def snapshot(self) -> dict[str, str]:
+        """全ドメインの状態をログ出力用に返す.
+
+        Returns:
+            ドメインをキーとする状態文字列の辞書
+        """
+        return {domain: breaker.state.value for domain, breaker in self._breakers.items()}
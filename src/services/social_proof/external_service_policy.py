@@ -7,7 +7,14 @@ from urllib.parse import urlparse
 
 import httpx
 
+from src.services.social_proof.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from src.shared.exceptions.external_service_error import CircuitOpenError
 from src.shared.logging.logger import get_logger
+from src.shared.utils.stage_profiler import record_http_response
 
 logger = get_logger(__name__)
 
@@ -21,6 +28,7 @@ class ExternalServicePolicy:
     - リクエスト間隔（jitter）
     - タイムアウト
     - リトライ戦略（429 / 5xx のみ）
+    - サーキットブレーカー（ドメイン単位、レジストリ指定時のみ）
 
     Attributes:
         _domain_concurrency: 同一ドメイン同時接続数
@@ -31,6 +39,7 @@ class ExternalServicePolicy:
         _total_semaphore: 全体同時接続制限用のセマフォ
         _domain_semaphores: ドメインごとの同時接続制限用セマフォ
         _last_request_time: 最後のリクエスト時刻
+        _circuit_breakers: ドメインごとのサーキットブレーカー（Noneの場合は無効）
     """
 
     def __init__(
@@ -40,6 +49,7 @@ class ExternalServicePolicy:
         jitter_range: tuple[float, float] = (3.0, 6.0),
         timeout: int = 5,
         retry_delays: list[float] | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
     ) -> None:
         """外部サービス利用ポリシーを初期化する.
 
@@ -49,12 +59,14 @@ class ExternalServicePolicy:
             jitter_range: リクエスト間隔のjitter範囲（秒、デフォルト: 3.0〜6.0）
             timeout: タイムアウト（秒、デフォルト: 5）
             retry_delays: リトライ間隔リスト（秒、デフォルト: [2.0, 4.0, 8.0]）
+            circuit_breakers: サーキットブレーカーのレジストリ（デフォルト: None=無効）
         """
         self._domain_concurrency = domain_concurrency
         self._total_concurrency = total_concurrency
         self._jitter_range = jitter_range
         self._timeout = timeout
         self._retry_delays = retry_delays if retry_delays is not None else [2.0, 4.0, 8.0]
+        self._circuit_breakers = circuit_breakers
 
         # 同時接続制限用のセマフォ
         self._total_semaphore = asyncio.Semaphore(total_concurrency)
@@ -80,6 +92,65 @@ class ExternalServicePolicy:
 
         return self._domain_semaphores[domain]
 
+    def is_circuit_open(self, url: str) -> bool:
+        """URLのドメインのサーキットがOPENか判定する.
+
+        Args:
+            url: リクエストURL
+
+        Returns:
+            OPENの場合True（サーキットブレーカー無効時は常にFalse）
+        """
+        if self._circuit_breakers is None:
+            return False
+        return self._circuit_breakers.is_open(urlparse(url).netloc)
+
+    def _raise_if_circuit_open(self, url: str) -> None:
+        """サーキットがOPENなら試行枠を消費せずに例外を送出する.
+
+        Args:
+            url: リクエストURL
+
+        Raises:
+            CircuitOpenError: サーキットがOPENの場合
+        """
+        if self.is_circuit_open(url):
+            domain = urlparse(url).netloc
+            logger.info("circuit_open_short_circuit", url=url, domain=domain)
+            raise CircuitOpenError(f"Circuit is open for domain: {domain}")
+
+    def _check_circuit(self, url: str) -> CircuitBreaker | None:
+        """サーキットブレーカーを確認し、遮断中なら例外を送出する.
+
+        Args:
+            url: リクエストURL
+
+        Returns:
+            ドメインのサーキットブレーカー（無効時None）
+
+        Raises:
+            CircuitOpenError: サーキットがOPENの場合
+        """
+        if self._circuit_breakers is None:
+            return None
+
+        domain = urlparse(url).netloc
+        breaker = self._circuit_breakers.get(domain)
+        if not breaker.allow_request():
+            logger.info("circuit_open_short_circuit", url=url, domain=domain)
+            raise CircuitOpenError(f"Circuit is open for domain: {domain}")
+        return breaker
+
+    @staticmethod
+    def _record_outcome(breaker: CircuitBreaker | None, success: bool) -> None:
+        """サーキットブレーカーにリクエスト結果を記録する（無効時は何もしない）."""
+        if breaker is None:
+            return
+        if success:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
     async def _apply_jitter(self) -> None:
         """リクエスト間隔のjitterを適用する.
 
@@ -109,59 +180,91 @@ class ExternalServicePolicy:
 
         Raises:
             httpx.HTTPError: リトライ後も失敗した場合
+            CircuitOpenError: サーキットがOPENのためリクエストを遮断した場合
         """
+        # OPEN中はセマフォ・jitter待ちをせず即座に失敗させる
+        self._raise_if_circuit_open(url)
+
         domain_semaphore = self._get_domain_semaphore(url)
 
         # 同時接続制限とjitterを適用
         async with self._total_semaphore, domain_semaphore:
-            await self._apply_jitter()
-
-            # リトライロジック（初回 + retry_delays回数分リトライ）
-            max_attempts = len(self._retry_delays) + 1
-            for attempt in range(max_attempts):
-                # リトライ時は待機
-                if attempt > 0:
-                    delay = self._retry_delays[attempt - 1]
-                    logger.debug("retrying_request", url=url, attempt=attempt, delay=delay)
-                    await asyncio.sleep(delay)
-
-                try:
-                    response = await client.get(url, timeout=self._timeout)
-                    response.raise_for_status()
-                    return response
-
-                except httpx.HTTPStatusError as e:
-                    status_code = e.response.status_code
-                    is_last_attempt = attempt >= len(self._retry_delays)
-
-                    # 429 / 5xx のみリトライ対象
-                    if status_code == 429 or 500 <= status_code < 600:
-                        logger.warning(
-                            "http_error_retryable",
-                            url=url,
-                            status_code=status_code,
-                            attempt=attempt,
-                        )
-
-                        # 最後のリトライでもエラーの場合は例外を再送出
-                        if is_last_attempt:
-                            raise
-                    else:
-                        # 429 / 5xx 以外はリトライしない
-                        logger.warning(
-                            "http_error_not_retryable",
-                            url=url,
-                            status_code=status_code,
-                        )
-                        raise
-
-                except httpx.TimeoutException:
-                    is_last_attempt = attempt >= len(self._retry_delays)
-                    logger.warning("request_timeout", url=url, attempt=attempt)
-
-                    # タイムアウトもリトライ対象
+            # セマフォ待機中にOPENへ遷移している可能性があるため取得後にも確認
+            breaker = self._check_circuit(url)
+            # HALF_OPENで通過したリクエストは試行リクエスト（同時に1件のみ）
+            is_probe = breaker is not None and breaker.state == CircuitState.HALF_OPEN
+            try:
+                await self._apply_jitter()
+                return await self._fetch_with_retries(url, client, breaker)
+            finally:
+                # キャンセル等で結果を記録できなかった試行リクエストを解放する
+                # （解放しないとHALF_OPENのまま全リクエストが遮断され続ける）
+                if is_probe and breaker is not None:
+                    breaker.release_probe()
+
+    async def _fetch_with_retries(
+        self, url: str, client: httpx.AsyncClient, breaker: CircuitBreaker | None
+    ) -> httpx.Response:
+        """リトライ付きでHTTPリクエストを実行し、結果をサーキットブレーカーに記録する."""
+        # リトライロジック（初回 + retry_delays回数分リトライ）
+        max_attempts = len(self._retry_delays) + 1
+        for attempt in range(max_attempts):
+            # リトライ時は待機
+            if attempt > 0:
+                # 失敗の蓄積でOPENになった場合はリトライを打ち切る
+                if breaker is not None and breaker.state == CircuitState.OPEN:
+                    raise CircuitOpenError(f"Circuit opened while retrying: {url}")
+                delay = self._retry_delays[attempt - 1]
+                logger.debug("retrying_request", url=url, attempt=attempt, delay=delay)
+                await asyncio.sleep(delay)
+
+            try:
+                response = await client.get(url, timeout=self._timeout)
+                response.raise_for_status()
+                record_http_response(response)
+                self._record_outcome(breaker, success=True)
+                return response
+
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                is_last_attempt = attempt >= len(self._retry_delays)
+
+                # 429 / 5xx のみリトライ対象
+                if status_code == 429 or 500 <= status_code < 600:
+                    logger.warning(
+                        "http_error_retryable",
+                        url=url,
+                        status_code=status_code,
+                        attempt=attempt,
+                    )
+                    self._record_outcome(breaker, success=False)
+
+                    # 最後のリトライでもエラーの場合は例外を再送出
                     if is_last_attempt:
                         raise
-
-            # ここには到達しないが、型チェッカーのために必要
-            raise RuntimeError("Unexpected code path")
+                else:
+                    # 429 / 5xx 以外はリトライしない（サービス自体は稼働中とみなす）
+                    self._record_outcome(breaker, success=True)
+                    logger.warning(
+                        "http_error_not_retryable",
+                        url=url,
+                        status_code=status_code,
+                    )
+                    raise
+
+            except httpx.TimeoutException:
+                is_last_attempt = attempt >= len(self._retry_delays)
+                logger.warning("request_timeout", url=url, attempt=attempt)
+                self._record_outcome(breaker, success=False)
+
+                # タイムアウトもリトライ対象
+                if is_last_attempt:
+                    raise
+
+            except httpx.TransportError:
+                # 接続エラー等はリトライせず、失敗として記録する
+                self._record_outcome(breaker, success=False)
+                raise
+
+        # ここには到達しないが、型チェッカーのために必要
+        raise RuntimeError("Unexpected code path")
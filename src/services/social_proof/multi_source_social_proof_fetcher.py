@@ -1,14 +1,19 @@
 """MultiSourceSocialProofFetcherモジュール."""
 
 import asyncio
+from collections.abc import Coroutine
+from typing import Any
 from urllib.parse import urlparse
 
 from src.models.article import Article
+from src.services.social_proof.circuit_breaker import CircuitBreakerRegistry
+from src.services.social_proof.external_service_policy import ExternalServicePolicy
 from src.services.social_proof.hatena_count_fetcher import HatenaCountFetcher
 from src.services.social_proof.qiita_rank_fetcher import QiitaRankFetcher
 from src.services.social_proof.yamadashy_signal_fetcher import YamadashySignalFetcher
 from src.services.social_proof.zenn_like_fetcher import ZennLikeFetcher
 from src.shared.logging.logger import get_logger
+from src.shared.utils.run_deadline import gather_within_budget
 
 logger = get_logger(__name__)
 
@@ -26,11 +31,15 @@ class MultiSourceSocialProofFetcher:
 
     統合計算式: S = 適用指標の加重合計 / 適用重み合計
 
+    サーキットブレーカー指定時、OPEN中の情報源は呼び出さずに欠損扱いとし、
+    全情報源がOPENの場合はHTTPリクエストを一切行わずDEFAULT_SCOREを返す。
+
     Attributes:
         _yamadashy_fetcher: yamadashy掲載シグナル取得
         _hatena_fetcher: Hatenaブックマーク数取得
         _zenn_fetcher: Zenn like数取得
         _qiita_fetcher: Qiita順位取得
+        _circuit_breakers: サーキットブレーカーのレジストリ（Noneの場合は無効）
     """
 
     # 各指標の重み
@@ -42,12 +51,19 @@ class MultiSourceSocialProofFetcher:
     # デフォルトスコア（全欠損時）
     DEFAULT_SCORE = 20.0
 
+    # 各情報源のAPIドメイン（サーキットブレーカーの判定に使用）
+    YAMADASHY_DOMAIN = urlparse(YamadashySignalFetcher.DEFAULT_RSS_URL).netloc
+    HATENA_DOMAIN = urlparse(HatenaCountFetcher.HATENA_BATCH_API_URL).netloc
+    ZENN_DOMAIN = urlparse(ZennLikeFetcher.ZENN_API_BASE_URL).netloc
+    QIITA_DOMAIN = urlparse(QiitaRankFetcher.DEFAULT_FEED_URL).netloc
+
     def __init__(
         self,
         yamadashy_fetcher: YamadashySignalFetcher | None = None,
         hatena_fetcher: HatenaCountFetcher | None = None,
         zenn_fetcher: ZennLikeFetcher | None = None,
         qiita_fetcher: QiitaRankFetcher | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
     ) -> None:
         """MultiSourceSocialProofFetcherを初期化する.
 
@@ -56,21 +72,49 @@ class MultiSourceSocialProofFetcher:
             hatena_fetcher: Hatenaブックマーク数取得（デフォルト: 新規作成）
             zenn_fetcher: Zenn like数取得（デフォルト: 新規作成）
             qiita_fetcher: Qiita順位取得（デフォルト: 新規作成）
+            circuit_breakers: サーキットブレーカーのレジストリ
+                （デフォルト: None=無効。新規作成するFetcherのポリシーにも共有される）
         """
+        self._circuit_breakers = circuit_breakers
         self._yamadashy_fetcher = (
-            yamadashy_fetcher if yamadashy_fetcher is not None else YamadashySignalFetcher()
+            yamadashy_fetcher
+            if yamadashy_fetcher is not None
+            else YamadashySignalFetcher(policy=self._create_policy())
         )
         self._hatena_fetcher = (
-            hatena_fetcher if hatena_fetcher is not None else HatenaCountFetcher()
+            hatena_fetcher
+            if hatena_fetcher is not None
+            else HatenaCountFetcher(policy=self._create_policy())
+        )
+        self._zenn_fetcher = (
+            zenn_fetcher
+            if zenn_fetcher is not None
+            else ZennLikeFetcher(policy=self._create_policy())
         )
-        self._zenn_fetcher = zenn_fetcher if zenn_fetcher is not None else ZennLikeFetcher()
-        self._qiita_fetcher = qiita_fetcher if qiita_fetcher is not None else QiitaRankFetcher()
+        self._qiita_fetcher = (
+            qiita_fetcher
+            if qiita_fetcher is not None
+            else QiitaRankFetcher(policy=self._create_policy())
+        )
+
+    def _create_policy(self) -> ExternalServicePolicy:
+        """レジストリを共有する外部サービス利用ポリシーを生成する."""
+        return ExternalServicePolicy(circuit_breakers=self._circuit_breakers)
+
+    def _is_circuit_open(self, domain: str) -> bool:
+        """情報源ドメインのサーキットがOPENか判定する."""
+        return self._circuit_breakers is not None and self._circuit_breakers.is_open(domain)
 
-    async def fetch_batch(self, articles: list[Article]) -> dict[str, float]:
+    async def fetch_batch(
+        self, articles: list[Article], budget_seconds: float | None = None
+    ) -> dict[str, float]:
         """複数記事のSocialProofスコアを一括取得する.
 
+        budget_seconds を超えた情報源はキャンセルし、欠損扱いとして統合する.
+
         Args:
             articles: 記事リスト
+            budget_seconds: 取得全体の時間予算（秒、デフォルト: None=無制限）
 
         Returns:
             URLをキーとするSocialProofスコア（0-100）の辞書
@@ -82,18 +126,49 @@ class MultiSourceSocialProofFetcher:
 
         urls = [article.url for article in articles]
 
+        # サーキットがOPENの情報源は呼び出さない
+        open_sources = [
+            name
+            for name, domain in [
+                ("yamadashy", self.YAMADASHY_DOMAIN),
+                ("hatena", self.HATENA_DOMAIN),
+                ("zenn", self.ZENN_DOMAIN),
+                ("qiita", self.QIITA_DOMAIN),
+            ]
+            if self._is_circuit_open(domain)
+        ]
+        if open_sources:
+            logger.warning(
+                "social_proof_sources_circuit_open",
+                open_sources=open_sources,
+                circuit_states=self._circuit_breakers.snapshot() if self._circuit_breakers else {},
+            )
+        if len(open_sources) == 4:
+            # 全情報源が遮断中: リトライを待たずにデフォルトスコアへフォールバック
+            logger.info(
+                "multi_source_social_proof_default_fallback",
+                article_count=len(articles),
+                default_score=self.DEFAULT_SCORE,
+            )
+            return dict.fromkeys(urls, self.DEFAULT_SCORE)
+
+        async def skipped() -> dict[str, Any]:
+            return {}
+
         # 4つの情報源を並列で取得
-        yamadashy_task = self._yamadashy_fetcher.fetch_signals(urls)
-        hatena_task = self._hatena_fetcher.fetch_batch(urls)
-        zenn_task = self._zenn_fetcher.fetch_batch(urls)
-        qiita_task = self._qiita_fetcher.fetch_batch(urls)
-
-        results = await asyncio.gather(
-            yamadashy_task,
-            hatena_task,
-            zenn_task,
-            qiita_task,
-            return_exceptions=True,
+        yamadashy_task = (
+            skipped()
+            if "yamadashy" in open_sources
+            else self._yamadashy_fetcher.fetch_signals(urls)
+        )
+        hatena_task = (
+            skipped() if "hatena" in open_sources else self._hatena_fetcher.fetch_batch(urls)
+        )
+        zenn_task = skipped() if "zenn" in open_sources else self._zenn_fetcher.fetch_batch(urls)
+        qiita_task = skipped() if "qiita" in open_sources else self._qiita_fetcher.fetch_batch(urls)
+
+        results = await self._gather_within(
+            [yamadashy_task, hatena_task, zenn_task, qiita_task], budget_seconds
         )
 
         # 結果を展開
@@ -115,10 +190,40 @@ class MultiSourceSocialProofFetcher:
             "multi_source_social_proof_fetch_complete",
             article_count=len(articles),
             success_count=len(integrated_scores),
+            circuit_states=self._circuit_breakers.snapshot() if self._circuit_breakers else {},
         )
 
         return integrated_scores
 
+    async def _gather_within(
+        self, coroutines: list[Coroutine[Any, Any, dict[str, Any]]], budget_seconds: float | None
+    ) -> list[dict[str, Any] | BaseException]:
+        """時間予算内で情報源ごとの取得を実行する.
+
+        予算切れで未完了の情報源はキャンセルし、TimeoutErrorとして扱う.
+
+        Args:
+            coroutines: 情報源ごとの取得コルーチン
+            budget_seconds: 時間予算（秒、Noneの場合は全完了まで待機）
+
+        Returns:
+            コルーチン順の結果リスト（成功時はスコア辞書、失敗時は例外）
+        """
+        tasks = [asyncio.create_task(coroutine) for coroutine in coroutines]
+        gathered = await gather_within_budget(tasks, budget_seconds)
+        if gathered.cancelled_count:
+            logger.warning(
+                "social_proof_budget_exceeded",
+                budget_seconds=budget_seconds,
+                cancelled_count=gathered.cancelled_count,
+            )
+        return [
+            TimeoutError("Social proof time budget exceeded")
+            if isinstance(outcome, asyncio.CancelledError)
+            else outcome
+            for outcome in gathered.outcomes
+        ]
+
     def _calculate_integrated_scores(
         self,
         urls: list[str],
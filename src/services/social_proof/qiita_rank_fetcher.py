@@ -7,7 +7,7 @@ import httpx
 
 from src.services.social_proof.external_service_policy import ExternalServicePolicy
 from src.shared.logging.logger import get_logger
-from src.shared.utils.url_normalizer import normalize_url
+from src.shared.utils.url_normalizer import normalize_url, normalize_urls
 
 logger = get_logger(__name__)
 
@@ -81,8 +81,7 @@ class QiitaRankFetcher:
         # 各URLの順位を取得
         ranks: dict[str, int | None] = {}
 
-        for url in qiita_urls:
-            normalized_url = normalize_url(url)
+        for url, normalized_url in zip(qiita_urls, normalize_urls(qiita_urls), strict=True):
             rank = feed_ranks.get(normalized_url)
             ranks[url] = rank
 
@@ -5,7 +5,7 @@ import httpx
 
 from src.services.social_proof.external_service_policy import ExternalServicePolicy
 from src.shared.logging.logger import get_logger
-from src.shared.utils.url_normalizer import normalize_url
+from src.shared.utils.url_normalizer import normalize_urls
 
 logger = get_logger(__name__)
 
@@ -60,7 +60,7 @@ class YamadashySignalFetcher:
             return dict.fromkeys(urls, 0)
 
         # 正規化されたRSS URLのセットを作成
-        normalized_feed_urls = {normalize_url(url) for url in feed_urls}
+        normalized_feed_urls = set(normalize_urls(feed_urls))
 
         logger.debug(
             "yamadashy_feed_urls_fetched",
@@ -69,8 +69,7 @@ class YamadashySignalFetcher:
 
         # 各URLについて掲載判定
         signals = {}
-        for url in urls:
-            normalized_url = normalize_url(url)
+        for url, normalized_url in zip(urls, normalize_urls(urls), strict=True):
             signal = 100 if normalized_url in normalized_feed_urls else 0
             signals[url] = signal
 
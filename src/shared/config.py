@@ -1,6 +1,8 @@
 """アプリケーション設定管理モジュール."""
 
 import os
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from io import StringIO
 
@@ -29,7 +31,7 @@ class AppConfig:
         bedrock_model_id: Bedrock モデルID
         bedrock_inference_profile_arn: Bedrock インファレンスプロファイルARN (オプション)
         bedrock_region: Bedrock リージョン
-        bedrock_max_parallel: Bedrock 並列実行数
+        bedrock_max_parallel: Bedrock 並列実行数（リージョンプール使用時はリージョンあたり）
         bedrock_request_interval: 並列リクエスト間隔（秒）
         bedrock_retry_base_delay: リトライ基本遅延時間（秒）
         bedrock_max_backoff: 最大バックオフ時間（秒）
@@ -40,6 +42,16 @@ class AppConfig:
         sources_config_path: RSS/Atom ソース設定ファイルパス
         from_email: 送信元メールアドレス
         to_email: 送信先メールアドレス
+        collect_max_concurrency: フィード収集の同時実行数上限
+        bedrock_cascade_primary_model_id: 一次判定に使う安価なモデルID（空の場合はカスケード判定なし）
+        bedrock_cascade_primary_max_parallel: 一次判定の並列実行数
+        bedrock_streaming: ストリーミング応答で判定するかどうか
+        bedrock_tool_use: 判定結果をtool useの引数（JSONスキーマ準拠）で受け取るかどうか
+        bedrock_fallback_region: 致命的エラー時の代替リージョン（空の場合は bedrock_region）
+        bedrock_fallback_model_id: 致命的エラー時の代替モデルID（空の場合は bedrock_model_id）
+        bedrock_region_pool: 判定リクエストを振り分けるリージョンプール
+            （"リージョン[=地域プレフィックス][:重み]" のカンマ区切り、空の場合は bedrock_region のみ）
+        run_snapshot_path: 実行スナップショットの保存先（"{run_id}" は実行IDに置換、空の場合は記録しない）
     """
 
     environment: str
@@ -61,6 +73,28 @@ class AppConfig:
     sources_config_path: str
     from_email: str
     to_email: str
+    collect_max_concurrency: int = 8
+    bedrock_cascade_primary_model_id: str = ""
+    bedrock_cascade_primary_max_parallel: int = 10
+    bedrock_streaming: bool = False
+    bedrock_tool_use: bool = False
+    bedrock_fallback_region: str = ""
+    bedrock_fallback_model_id: str = ""
+    bedrock_region_pool: str = ""
+    run_snapshot_path: str = ""
+
+    def __post_init__(self) -> None:
+        """設定の組み合わせを検証する.
+
+        Raises:
+            ValueError: リージョンプールとインファレンスプロファイルARNを併用した場合
+                （ARNはリージョン固有のため、他リージョンへ振り分けると呼び出しに失敗する）
+        """
+        if self.bedrock_region_pool.strip() and self.bedrock_inference_profile_arn:
+            raise ValueError(
+                "BEDROCK_INFERENCE_PROFILE_ARN cannot be used with BEDROCK_REGION_POOL; "
+                "use a cross-region inference profile ID as BEDROCK_MODEL_ID instead"
+            )
 
 
 def load_config() -> AppConfig:
@@ -77,16 +111,111 @@ def load_config() -> AppConfig:
         ValueError: 必須設定が見つからない場合
         ClientError: SSM Parameter Store 読み込み失敗時（Lambda環境）
     """
+    environment = _load_dotenv_files()
+
+    if environment == "local":
+        return _load_config_local()
+    return _load_config_from_ssm()
+
+
+class CachedConfigLoader:
+    """ウォーム起動間で設定を再利用する設定ローダー.
+
+    Lambda環境（environment=production）では check_interval_seconds ごとに
+    SSMパラメータのバージョンを確認し、バージョンが変わった場合のみ設定を再構築する.
+    確認間隔内はSSMを呼び出さずに前回の設定を返す.
+    ローカル環境では毎回読み込み、内容が前回と同じ場合は前回のインスタンスを返す.
+    いずれも設定が変わらない限り同一インスタンスを返すため、呼び出し側は
+    インスタンスの同一性で依存オブジェクトの再構築要否を判断できる.
+
+    Attributes:
+        _check_interval_seconds: SSMパラメータバージョンの確認間隔（秒）
+        _clock: 単調増加時刻を返す関数
+        _config: キャッシュ済みの設定
+        _environment: キャッシュ済み設定の実行環境
+        _ssm_version: キャッシュ済み設定のSSMパラメータバージョン
+        _checked_at: SSMパラメータバージョンを最後に確認した時刻
+    """
+
+    DEFAULT_CHECK_INTERVAL_SECONDS = 300.0
+
+    def __init__(
+        self,
+        check_interval_seconds: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """設定ローダーを初期化する.
+
+        Args:
+            check_interval_seconds: SSMパラメータバージョンの確認間隔（秒、デフォルト: 300.0）
+            clock: 単調増加時刻を返す関数（デフォルト: time.monotonic）
+        """
+        self._check_interval_seconds = check_interval_seconds
+        self._clock = clock
+        self._config: AppConfig | None = None
+        self._environment: str | None = None
+        self._ssm_version: str | None = None
+        self._checked_at: float | None = None
+
+    def load(self) -> AppConfig:
+        """設定を読み込む（変更がなければキャッシュ済みの設定を返す）.
+
+        Returns:
+            AppConfig: アプリケーション設定
+
+        Raises:
+            ValueError: 必須設定が見つからない場合
+            ClientError: SSM Parameter Store 読み込み失敗時（Lambda環境）
+        """
+        environment = _load_dotenv_files()
+        if environment != self._environment:
+            self._config = None
+            self._ssm_version = None
+            self._checked_at = None
+            self._environment = environment
+
+        if environment == "local":
+            config = _load_config_local()
+            if config != self._config:
+                self._config = config
+            return self._config
+        return self._load_from_ssm()
+
+    def _load_from_ssm(self) -> AppConfig:
+        """SSMパラメータのバージョンを確認し、変更時のみ設定を再構築する."""
+        now = self._clock()
+        if (
+            self._config is not None
+            and self._checked_at is not None
+            and now - self._checked_at < self._check_interval_seconds
+        ):
+            logger.debug("config_cache_hit", reason="within_check_interval")
+            return self._config
+
+        dotenv_content, version = _fetch_ssm_dotenv()
+        self._checked_at = now
+        if self._config is not None and version == self._ssm_version:
+            logger.debug("config_cache_hit", reason="ssm_version_unchanged", version=version)
+            return self._config
+
+        self._config = _parse_ssm_dotenv(dotenv_content)
+        self._ssm_version = version
+        logger.info("config_cache_rebuilt", ssm_version=version)
+        return self._config
+
+
+def _load_dotenv_files() -> str:
+    """.env ファイルを読み込み、実行環境を返す.
+
+    Returns:
+        実行環境（ENVIRONMENT、未設定の場合 "local"）
+    """
     # .env ファイル読み込み（ローカル開発時のみ効果があります）
     load_dotenv(".env")
     # .env.local があればローカル固有設定で上書き（ファイルが存在しなくても安全）
     load_dotenv(".env.local", override=True)
 
-    environment = os.getenv("ENVIRONMENT", "local")
-
-    if environment == "local":
-        return _load_config_local()
-    return _load_config_from_ssm()
+    return os.getenv("ENVIRONMENT", "local")
 
 
 def _load_config_local() -> AppConfig:
@@ -128,6 +257,17 @@ def _load_config_local() -> AppConfig:
             sources_config_path=os.getenv("SOURCES_CONFIG_PATH", "config/sources.yaml"),
             from_email=os.getenv("FROM_EMAIL", "noreply@example.com"),
             to_email=os.getenv("TO_EMAIL", "recipient@example.com"),
+            collect_max_concurrency=int(os.getenv("COLLECT_MAX_CONCURRENCY", "8")),
+            bedrock_cascade_primary_model_id=os.getenv("BEDROCK_CASCADE_PRIMARY_MODEL_ID", ""),
+            bedrock_cascade_primary_max_parallel=int(
+                os.getenv("BEDROCK_CASCADE_PRIMARY_MAX_PARALLEL", "10")
+            ),
+            bedrock_streaming=os.getenv("BEDROCK_STREAMING", "false").lower() == "true",
+            bedrock_tool_use=os.getenv("BEDROCK_TOOL_USE", "false").lower() == "true",
+            bedrock_fallback_region=os.getenv("BEDROCK_FALLBACK_REGION", ""),
+            bedrock_fallback_model_id=os.getenv("BEDROCK_FALLBACK_MODEL_ID", ""),
+            bedrock_region_pool=os.getenv("BEDROCK_REGION_POOL", ""),
+            run_snapshot_path=os.getenv("RUN_SNAPSHOT_PATH", ""),
         )
         logger.info("config_loaded_successfully", environment="local")
         return config
@@ -151,6 +291,19 @@ def _load_config_from_ssm() -> AppConfig:
         ClientError: SSM Parameter Store へのアクセス失敗時
         ValueError: 必須パラメータが見つからない場合
     """
+    dotenv_content, _ = _fetch_ssm_dotenv()
+    return _parse_ssm_dotenv(dotenv_content)
+
+
+def _fetch_ssm_dotenv() -> tuple[str, str]:
+    """SSM Parameter Store から dotenv 形式の設定を取得する.
+
+    Returns:
+        (dotenv形式の設定内容, パラメータバージョン)
+
+    Raises:
+        ClientError: SSM Parameter Store へのアクセス失敗時
+    """
     logger.debug("loading_config_from_ssm_parameter_store")
 
     try:
@@ -162,7 +315,29 @@ def _load_config_from_ssm() -> AppConfig:
             Name=parameter_name,
             WithDecryption=True,
         )
-        dotenv_content = response["Parameter"]["Value"]
+    except (ClientError, BotoCoreError) as e:
+        logger.error("ssm_parameter_store_error", error=str(e))
+        raise ClientError({"Error": {"Code": "SSMError", "Message": str(e)}}, "GetParameter") from e
+
+    parameter = response["Parameter"]
+    return parameter["Value"], str(parameter.get("Version", ""))
+
+
+def _parse_ssm_dotenv(dotenv_content: str) -> AppConfig:
+    """SSMのdotenv形式の設定内容から本番環境の設定を復元する.
+
+    Args:
+        dotenv_content: SSM Parameter Store から取得した dotenv 形式の設定内容
+
+    Returns:
+        AppConfig: 本番環境の設定
+
+    Raises:
+        ValueError: 必須パラメータが見つからない場合
+    """
+    try:
+        aws_region = os.getenv("AWS_REGION", "ap-northeast-1")
+        parameter_name = os.getenv("SSM_DOTENV_PARAMETER", "/ai-curated-newsletter/dotenv")
 
         dotenv_values_dict = {
             key: value
@@ -222,14 +397,25 @@ def _load_config_from_ssm() -> AppConfig:
             sources_config_path=dotenv_values_dict["SOURCES_CONFIG_PATH"],
             from_email=dotenv_values_dict["FROM_EMAIL"],
             to_email=dotenv_values_dict["TO_EMAIL"],
+            collect_max_concurrency=int(dotenv_values_dict.get("COLLECT_MAX_CONCURRENCY", "8")),
+            bedrock_cascade_primary_model_id=dotenv_values_dict.get(
+                "BEDROCK_CASCADE_PRIMARY_MODEL_ID", ""
+            ),
+            bedrock_cascade_primary_max_parallel=int(
+                dotenv_values_dict.get("BEDROCK_CASCADE_PRIMARY_MAX_PARALLEL", "10")
+            ),
+            bedrock_streaming=dotenv_values_dict.get("BEDROCK_STREAMING", "false").lower()
+            == "true",
+            bedrock_tool_use=dotenv_values_dict.get("BEDROCK_TOOL_USE", "false").lower() == "true",
+            bedrock_fallback_region=dotenv_values_dict.get("BEDROCK_FALLBACK_REGION", ""),
+            bedrock_fallback_model_id=dotenv_values_dict.get("BEDROCK_FALLBACK_MODEL_ID", ""),
+            bedrock_region_pool=dotenv_values_dict.get("BEDROCK_REGION_POOL", ""),
+            run_snapshot_path=dotenv_values_dict.get("RUN_SNAPSHOT_PATH", ""),
         )
 
         logger.info("config_loaded_successfully", environment="production")
         return config
 
-    except (ClientError, BotoCoreError) as e:
-        logger.error("ssm_parameter_store_error", error=str(e))
-        raise ClientError({"Error": {"Code": "SSMError", "Message": str(e)}}, "GetParameter") from e
     except (ValueError, TypeError) as e:
         logger.error("config_parse_error", error=str(e))
         raise ValueError(f"Failed to parse configuration from SSM: {e}") from e
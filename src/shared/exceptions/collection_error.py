@@ -14,3 +14,11 @@ class SourceCollectionError(CollectionError):
     特定の収集元からの記事取得に失敗した場合に発生する.
     このエラーは個別にハンドリングされ、他のソースの収集は継続される.
     """
+
+
+class FeedStreamParseError(SourceCollectionError):
+    """フィードストリーミング解析エラー.
+
+    ストリーミング解析できないフィード（不正なXML、RSS/Atom以外の文書）の場合に発生する.
+    Collectorはこのエラーを受けてfeedparserによる解析にフォールバックする.
+    """
@@ -0,0 +1,16 @@
+"""外部サービスエラー例外モジュール."""
+
+
+class ExternalServiceError(Exception):
+    """外部サービスエラー.
+
+    SocialProof取得などの外部API呼び出しで発生するエラーの基底クラス.
+    """
+
+
+class CircuitOpenError(ExternalServiceError):
+    """サーキットブレーカー遮断エラー.
+
+    対象ドメインのサーキットブレーカーがOPEN状態のため、
+    HTTPリクエストを送信せずに即座に失敗した場合に発生する.
+    """
@@ -21,3 +21,19 @@ class LlmTimeoutError(LlmError):
 
     LLMのレスポンスがタイムアウト時間内に返ってこない場合に発生する.
     """
+
+
+class LlmBatchRecordError(LlmError):
+    """バッチ推論のレコード単位エラー.
+
+    バッチ推論ジョブの出力にレコードがない、またはレコードが error を持つ場合に発生する.
+    """
+
+
+class LlmFatalError(LlmError):
+    """LLM呼び出しの致命的エラー.
+
+    権限不足・モデルIDやインファレンスプロファイルARNの誤りなど、
+    記事を変えても同じく失敗する設定起因のBedrockエラーで発生する.
+    一括判定全体を中断する（フォールバック先がない場合は実行を失敗させる）.
+    """
@@ -1,5 +1,104 @@
 """Bedrockコスト推定ユーティリティ."""
 
+import re
+from dataclasses import dataclass
+
+from src.models.bedrock_usage import BedrockUsageLedger
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """モデルごとのトークン単価（USD/1M tokens）.
+
+    Attributes:
+        input_cost_per_million: 入力トークン単価
+        output_cost_per_million: 出力トークン単価
+        cache_read_cost_per_million: キャッシュ読み込み入力トークン単価
+        cache_write_cost_per_million: キャッシュ書き込み入力トークン単価
+    """
+
+    input_cost_per_million: float
+    output_cost_per_million: float
+    cache_read_cost_per_million: float
+    cache_write_cost_per_million: float
+
+
+# モデル名をキーとする単価表（2026年2月時点）
+# モデルIDからリージョン接頭辞（"jp." "apac." など）・日付とバージョンの接尾辞を除いたモデル名で引く
+BEDROCK_MODEL_PRICING: dict[str, ModelPricing] = {
+    "claude-haiku-4-5": ModelPricing(1.0, 5.0, 0.1, 1.25),
+    "claude-sonnet-4-5": ModelPricing(3.0, 15.0, 0.3, 3.75),
+    "claude-sonnet-4": ModelPricing(3.0, 15.0, 0.3, 3.75),
+    "claude-3-5-haiku": ModelPricing(0.8, 4.0, 0.08, 1.0),
+    "claude-3-haiku": ModelPricing(0.25, 1.25, 0.03, 0.3),
+}
+
+# 単価表にないモデルはClaude Haiku 4.5の単価で推定し、警告ログを出す
+DEFAULT_MODEL_PRICING = BEDROCK_MODEL_PRICING["claude-haiku-4-5"]
+
+# バッチ推論の単価（オンデマンド単価に対する比率）
+BATCH_INFERENCE_PRICE_RATIO = 0.5
+
+# モデルIDの日付・バージョン接尾辞（例: "-20251001-v1:0"）
+_MODEL_ID_SUFFIX_PATTERN = re.compile(r"(-\d{8})?(-v\d+(:\d+)?)?$")
+
+
+def get_model_pricing(model_id: str) -> ModelPricing | None:
+    """モデルIDに対応するトークン単価を取得する.
+
+    推論プロファイルのARN・リージョン接頭辞・日付とバージョンの接尾辞を除いたモデル名が
+    単価表のキーと一致する場合のみ単価を返す（"claude-sonnet-4" が "claude-sonnet-4-6" に
+    一致するような部分一致はしない）.
+
+    Args:
+        model_id: BedrockモデルID（例: "anthropic.claude-haiku-4-5-20251001-v1:0"）
+
+    Returns:
+        トークン単価（単価表にない場合None）
+    """
+    model_name = model_id.rsplit("/", 1)[-1].rsplit(".", 1)[-1]
+    return BEDROCK_MODEL_PRICING.get(_MODEL_ID_SUFFIX_PATTERN.sub("", model_name, count=1))
+
+
+def calculate_bedrock_cost_usd(ledger: BedrockUsageLedger) -> float:
+    """利用量台帳の実トークン数からBedrockコスト（USD）を計算する.
+
+    呼び出しごとにモデルIDから単価を引き、キャッシュ読み書きトークンも含めて合算する.
+    バッチ推論ジョブ経由の呼び出しは BATCH_INFERENCE_PRICE_RATIO を乗じる.
+    単価表にないモデルは DEFAULT_MODEL_PRICING で推定し、警告ログを出す.
+
+    Args:
+        ledger: Bedrock利用量の台帳
+
+    Returns:
+        コスト（USD）
+    """
+    total = 0.0
+    unknown_model_ids: set[str] = set()
+    for call in ledger.calls:
+        pricing = get_model_pricing(call.model_id)
+        if pricing is None:
+            unknown_model_ids.add(call.model_id)
+            pricing = DEFAULT_MODEL_PRICING
+        cost = (
+            call.input_tokens * pricing.input_cost_per_million
+            + call.output_tokens * pricing.output_cost_per_million
+            + call.cache_read_input_tokens * pricing.cache_read_cost_per_million
+            + call.cache_write_input_tokens * pricing.cache_write_cost_per_million
+        ) / 1_000_000
+        if call.batch_inference:
+            cost *= BATCH_INFERENCE_PRICE_RATIO
+        total += cost
+    if unknown_model_ids:
+        logger.warning(
+            "bedrock_model_pricing_unknown",
+            model_ids=sorted(unknown_model_ids),
+        )
+    return total
+
 
 def estimate_bedrock_cost_usd(
     article_count: int,
@@ -11,6 +110,8 @@ def estimate_bedrock_cost_usd(
 ) -> float:
     """記事判定件数からBedrockコスト（USD）を推定する.
 
+    実行前の見積もり用。実行後のコストは calculate_bedrock_cost_usd で実トークン数から計算する.
+
     デフォルト単価はClaude Haiku 4.5の価格（2026年2月時点）:
     - Input: $1.00 / 1M tokens
     - Output: $5.00 / 1M tokens
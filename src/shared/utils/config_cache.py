@@ -0,0 +1,86 @@
+"""設定キャッシュユーティリティモジュール."""
+
+import hashlib
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# ファイルパスごとの (mtime_ns, size, 内容のSHA-256)
+_file_digests: dict[str, tuple[int, int, str]] = {}
+
+
+def file_version(path: str | Path) -> str:
+    """設定ファイルのバージョン（内容のSHA-256）を返す.
+
+    mtime・サイズが前回と同じ場合はファイルを読まずに前回のハッシュを返す.
+    touchのみでmtimeが変わった場合は内容を再ハッシュし、同じハッシュを返す.
+
+    Args:
+        path: 設定ファイルパス
+
+    Returns:
+        内容のSHA-256（16進文字列）
+
+    Raises:
+        FileNotFoundError: ファイルが存在しない場合
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    cached = _file_digests.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    digest = hashlib.sha256(Path(key).read_bytes()).hexdigest()
+    _file_digests[key] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+class ConfigCache:
+    """設定から構築したオブジェクトのプロセス内キャッシュ.
+
+    キーごとに構築時の設定バージョンを保持し、バージョンが変わった場合のみ再構築する.
+    Lambdaのウォーム起動間で再利用するため、モジュールレベルで保持する想定.
+
+    Attributes:
+        _entries: キーをキーとする (バージョン, 構築済みオブジェクト)
+    """
+
+    def __init__(self) -> None:
+        """設定キャッシュを初期化する."""
+        self._entries: dict[str, tuple[str, Any]] = {}
+
+    def get_or_build(self, key: str, version: str, builder: Callable[[], T]) -> T:
+        """キャッシュ済みオブジェクトを返す（バージョン不一致・未構築の場合は構築する）.
+
+        Args:
+            key: キャッシュキー
+            version: 設定バージョン（ファイルハッシュ、SSMパラメータバージョン等）
+            builder: オブジェクトを構築する関数
+
+        Returns:
+            構築済みオブジェクト
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            logger.debug("config_cache_hit", key=key)
+            return cast("T", entry[1])
+
+        value = builder()
+        self._entries[key] = (version, value)
+        logger.info(
+            "config_cache_rebuilt",
+            key=key,
+            reason="initial" if entry is None else "changed",
+        )
+        return value
+
+    def clear(self) -> None:
+        """キャッシュを全て破棄する."""
+        self._entries.clear()
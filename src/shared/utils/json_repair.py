@@ -0,0 +1,138 @@
+"""JSON修復ユーティリティモジュール."""
+
+import json
+from typing import Any
+
+
+def _loads_object(text: str) -> dict[str, Any] | None:
+    """JSONオブジェクトとして解析する（解析できない・オブジェクトでない場合None）."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _close(chars: list[str], closers: list[str]) -> str:
+    """途中で切れたJSONの末尾を整え、開いている括弧を閉じる."""
+    text = "".join(chars).rstrip().rstrip(",").rstrip()
+    if text.endswith(":"):
+        text += "null"
+    return text + "".join(reversed(closers))
+
+
+def _strip_trailing_comma(chars: list[str]) -> None:
+    """末尾の空白を除いた最後の文字がカンマの場合、カンマを除去する."""
+    index = len(chars) - 1
+    while index >= 0 and chars[index].isspace():
+        index -= 1
+    if index >= 0 and chars[index] == ",":
+        del chars[index]
+
+
+class _JsonRepairer:
+    """JSONオブジェクトを1文字ずつ走査して修復する.
+
+    Attributes:
+        chars: 修復後の文字列（走査済み部分）
+        closers: 開いている括弧に対応する閉じ括弧のスタック
+        in_string: 文字列リテラル内かどうか
+        escaped: 直前の文字がエスケープ文字かどうか
+        cut: 最後に出現したカンマの位置と、その時点の閉じ括弧のスタック
+    """
+
+    def __init__(self) -> None:
+        """走査状態を初期化する."""
+        self.chars: list[str] = []
+        self.closers: list[str] = []
+        self.in_string = False
+        self.escaped = False
+        self.cut: tuple[int, list[str]] | None = None
+
+    def feed(self, char: str) -> bool | None:
+        """1文字走査する.
+
+        Returns:
+            トップレベルのオブジェクトが閉じた場合True、対応しない閉じ括弧の場合None、
+            それ以外False
+        """
+        if self.in_string:
+            self._feed_string(char)
+            return False
+
+        if char in "}]":
+            # 閉じ括弧直前の余分なカンマを除去する
+            _strip_trailing_comma(self.chars)
+            if not self.closers or self.closers[-1] != char:
+                return None
+            self.closers.pop()
+            self.chars.append(char)
+            return not self.closers
+
+        if char == '"':
+            self.in_string = True
+        elif char == "{":
+            self.closers.append("}")
+        elif char == "[":
+            self.closers.append("]")
+        elif char == ",":
+            self.cut = (len(self.chars), self.closers.copy())
+        self.chars.append(char)
+        return False
+
+    def _feed_string(self, char: str) -> None:
+        """文字列リテラル内の1文字を走査する."""
+        self.chars.append(char)
+        if self.escaped:
+            self.escaped = False
+        elif char == "\\":
+            self.escaped = True
+        elif char == '"':
+            self.in_string = False
+
+    def candidates(self) -> list[str]:
+        """途中で切れたJSONを閉じた修復候補を返す（優先度順）."""
+        chars = self.chars.copy()
+        if self.in_string:
+            if self.escaped:
+                chars.pop()
+            chars.append('"')
+        candidates = [_close(chars, self.closers)]
+        if self.cut is not None:
+            # 最後の要素が不完全な場合（キーの途中で切れた等）は直前のカンマまでを採用する
+            position, closers = self.cut
+            candidates.append(_close(self.chars[:position], closers))
+        return candidates
+
+
+def repair_json_object(text: str) -> dict[str, Any] | None:
+    """壊れたJSONオブジェクトを修復して解析する.
+
+    LLM出力で起こりやすい以下の崩れを修復する:
+    - オブジェクト前後の余分なテキスト（マークダウンのコードブロック・説明文）
+    - 閉じ括弧直前の余分なカンマ
+    - 出力上限による途中での打ち切り（文字列・括弧を閉じ、不完全な最後の要素は除去）
+
+    Args:
+        text: LLMの出力テキスト
+
+    Returns:
+        修復したオブジェクト（修復できない場合None）
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    repairer = _JsonRepairer()
+    for char in text[start:]:
+        closed = repairer.feed(char)
+        if closed is None:
+            return None
+        if closed:
+            return _loads_object("".join(repairer.chars))
+
+    for candidate in repairer.candidates():
+        data = _loads_object(candidate)
+        if data is not None:
+            return data
+    return None
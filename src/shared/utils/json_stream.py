@@ -0,0 +1,72 @@
+"""JSONストリーム走査ユーティリティモジュール."""
+
+
+class JsonObjectScanner:
+    """ストリーミング出力からトップレベルのJSONオブジェクトの終端を検出する.
+
+    テキスト断片を順に受け取り、最初の "{" から対応する "}" までが揃った時点で
+    オブジェクト部分の文字列を返す. 文字列リテラル内の括弧・エスケープは無視する.
+    オブジェクト前後のテキスト（マークダウンのコードブロック等）は含めない.
+    構文の妥当性は検証しない（呼び出し側で json.loads する）.
+
+    Attributes:
+        _buffer: 最初の "{" 以降に受け取ったテキスト
+        _depth: 現在の括弧の深さ
+        _in_string: 文字列リテラル内かどうか
+        _escaped: 直前の文字がエスケープ文字かどうか
+        _completed: 検出済みのオブジェクト文字列
+    """
+
+    def __init__(self) -> None:
+        """走査状態を初期化する."""
+        self._buffer: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._completed: str | None = None
+
+    def feed(self, text: str) -> str | None:
+        """テキスト断片を走査する.
+
+        Args:
+            text: ストリーミング出力のテキスト断片
+
+        Returns:
+            オブジェクトが閉じた場合はオブジェクト部分の文字列、未完了の場合None
+        """
+        if self._completed is not None:
+            return self._completed
+
+        start = 0
+        if self._depth == 0:
+            start = text.find("{")
+            if start < 0:
+                return None
+
+        for index in range(start, len(text)):
+            if self._advance(text[index]):
+                self._buffer.append(text[start : index + 1])
+                self._completed = "".join(self._buffer)
+                return self._completed
+        self._buffer.append(text[start:])
+        return None
+
+    def _advance(self, char: str) -> bool:
+        """1文字分走査状態を進め、トップレベルのオブジェクトが閉じた場合Trueを返す."""
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+            return False
+
+        if char == '"':
+            self._in_string = True
+        elif char == "{":
+            self._depth += 1
+        elif char == "}":
+            self._depth -= 1
+            return self._depth == 0
+        return False
@@ -0,0 +1,180 @@
+"""実行期限（デッドライン）ユーティリティモジュール."""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+class RunDeadline:
+    """実行全体の期限を表す.
+
+    Lambdaの残り実行時間から生成し、各ステップに時間予算を割り当てるために使う.
+    期限は単調増加時計（time.monotonic）基準で保持する.
+
+    Attributes:
+        _deadline_at: 期限時刻（clock基準、無期限の場合はinf）
+        _clock: 単調増加時刻を返す関数
+    """
+
+    # Lambdaタイムアウト直前の強制終了を避けるための安全マージン（秒）
+    DEFAULT_SAFETY_MARGIN_SECONDS = 20.0
+
+    def __init__(self, deadline_at: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """実行期限を初期化する.
+
+        Args:
+            deadline_at: 期限時刻（clock基準）
+            clock: 単調増加時刻を返す関数（デフォルト: time.monotonic）
+        """
+        self._deadline_at = deadline_at
+        self._clock = clock
+
+    @classmethod
+    def from_remaining_millis(
+        cls,
+        remaining_millis: int,
+        safety_margin_seconds: float = DEFAULT_SAFETY_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> Self:
+        """残り実行時間（ミリ秒）から実行期限を生成する.
+
+        Args:
+            remaining_millis: 残り実行時間（context.get_remaining_time_in_millis()の値）
+            safety_margin_seconds: 安全マージン（秒、デフォルト: 20.0）
+            clock: 単調増加時刻を返す関数（デフォルト: time.monotonic）
+
+        Returns:
+            実行期限
+        """
+        usable_seconds = max(remaining_millis / 1000 - safety_margin_seconds, 0.0)
+        return cls(clock() + usable_seconds, clock=clock)
+
+    @classmethod
+    def unlimited(cls) -> Self:
+        """期限なしの実行期限を生成する（ローカル実行・テスト用）.
+
+        Returns:
+            無期限の実行期限
+        """
+        return cls(math.inf)
+
+    @property
+    def is_unlimited(self) -> bool:
+        """期限なしの場合True."""
+        return math.isinf(self._deadline_at)
+
+    def remaining_seconds(self) -> float:
+        """期限までの残り時間（秒）を返す.
+
+        Returns:
+            残り時間（秒、期限切れの場合0.0、無期限の場合inf）
+        """
+        return max(self._deadline_at - self._clock(), 0.0)
+
+    def is_expired(self) -> bool:
+        """期限切れの場合True."""
+        return self.remaining_seconds() <= 0.0
+
+    def budget(self, ratio: float = 1.0, reserve_seconds: float = 0.0) -> float | None:
+        """ステップに割り当てる時間予算（秒）を計算する.
+
+        後続ステップ用の予約時間を差し引いた残り時間に ratio を掛けた値を返す.
+
+        Args:
+            ratio: 残り時間のうち割り当てる比率（0.0-1.0、デフォルト: 1.0）
+            reserve_seconds: 後続ステップのために残しておく時間（秒、デフォルト: 0.0）
+
+        Returns:
+            時間予算（秒、0.0以上）。無期限の場合None
+        """
+        if self.is_unlimited:
+            return None
+        return max((self.remaining_seconds() - reserve_seconds) * ratio, 0.0)
+
+
+@dataclass
+class BudgetedGatherResult:
+    """時間予算内で待機したタスク群の結果.
+
+    Attributes:
+        outcomes: タスク順の結果（完了時は戻り値または例外、キャンセル時は asyncio.CancelledError）
+        cancelled_count: 予算切れ・待機の打ち切りでキャンセルしたタスク数
+        stop_error: 待機を打ち切る原因となった例外（打ち切らなかった場合None）
+    """
+
+    outcomes: list[Any]
+    cancelled_count: int = 0
+    stop_error: BaseException | None = None
+
+
+async def gather_within_budget(
+    tasks: Sequence[asyncio.Task[Any]],
+    budget_seconds: float | None,
+    stop_on: type[BaseException] | None = None,
+) -> BudgetedGatherResult:
+    """時間予算内に完了したタスクの結果を集める.
+
+    予算切れ、または stop_on の例外でタスクが失敗した時点で未完了のタスクをキャンセルし、
+    キャンセルの完了を待ってから結果を返す.
+
+    Args:
+        tasks: 待機するタスク
+        budget_seconds: 時間予算（秒、Noneの場合は全タスク完了まで待機）
+        stop_on: 発生した時点で待機を打ち切る例外の型（Noneの場合は打ち切らない）
+
+    Returns:
+        タスク順の結果
+    """
+    if not tasks:
+        return BudgetedGatherResult(outcomes=[])
+
+    loop = asyncio.get_running_loop()
+    deadline = None if budget_seconds is None else loop.time() + budget_seconds
+    return_when = asyncio.ALL_COMPLETED if stop_on is None else asyncio.FIRST_EXCEPTION
+    pending: set[asyncio.Task[Any]] = set(tasks)
+    stop_error: BaseException | None = None
+    while pending and stop_error is None:
+        timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+        done, pending = await asyncio.wait(pending, timeout=timeout, return_when=return_when)
+        if not done:
+            break
+        if stop_on is not None:
+            stop_error = _find_exception(done, stop_on)
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    outcomes: list[Any] = []
+    for task in tasks:
+        if task in pending:
+            outcomes.append(asyncio.CancelledError())
+        else:
+            exception = task.exception()
+            outcomes.append(exception if exception is not None else task.result())
+    return BudgetedGatherResult(
+        outcomes=outcomes, cancelled_count=len(pending), stop_error=stop_error
+    )
+
+
+def _find_exception(
+    tasks: set[asyncio.Task[Any]], exception_type: type[BaseException]
+) -> BaseException | None:
+    """完了したタスクから指定した型の例外を探す.
+
+    Args:
+        tasks: 完了したタスク
+        exception_type: 探す例外の型
+
+    Returns:
+        見つかった例外（見つからない場合None）
+    """
+    for task in tasks:
+        exception = task.exception()
+        if isinstance(exception, exception_type):
+            return exception
+    return None
@@ -0,0 +1,125 @@
+"""ステップ計測（プロファイリング）ユーティリティモジュール."""
+
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from src.models.stage_metrics import StageMetrics
+
+
+def _peak_rss_mb() -> float:
+    """プロセスのピークRSS（MB）を取得する."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linuxはキロバイト、macOSはバイト単位
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max_rss / divisor
+
+
+class StageProfiler:
+    """ステップ計測サービス.
+
+    span() で囲んだ区間の経過時間・CPU時間・ピークRSS増分を計測し、
+    区間内で記録されたHTTPリクエスト数・バイト数・Bedrockトークン数を集計する.
+    span() はネスト可能で、内側のスパンで記録した値は外側のスパンにも加算される.
+
+    Attributes:
+        _stages: 計測結果のリスト（開始順）
+    """
+
+    def __init__(self) -> None:
+        """ステップ計測サービスを初期化する."""
+        self._stages: list[StageMetrics] = []
+
+    @property
+    def stages(self) -> list[StageMetrics]:
+        """計測結果のリスト（開始順）を返す."""
+        return self._stages.copy()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[StageMetrics]:
+        """区間を計測する.
+
+        Args:
+            name: ステップ名（ネスト時は親ステップ名で修飾される）
+
+        Yields:
+            計測中のStageMetrics（区間終了時に値が確定する）
+        """
+        parents = _active_spans.get()
+        full_name = f"{parents[-1].name}.{name}" if parents else name
+        metrics = StageMetrics(name=full_name)
+        self._stages.append(metrics)
+
+        profiler_token = _current_profiler.set(self)
+        spans_token = _active_spans.set((*parents, metrics))
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        start_rss = _peak_rss_mb()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_seconds = round(time.perf_counter() - start_wall, 4)
+            metrics.cpu_seconds = round(time.process_time() - start_cpu, 4)
+            metrics.peak_rss_delta_mb = round(_peak_rss_mb() - start_rss, 2)
+            _active_spans.reset(spans_token)
+            _current_profiler.reset(profiler_token)
+
+
+# 現在実行中のプロファイラと計測中スパンのスタック
+# contextvarsで保持するため、asyncioタスクにも生成時点のスタックが引き継がれる
+_current_profiler: ContextVar[StageProfiler | None] = ContextVar("_current_profiler", default=None)
+_active_spans: ContextVar[tuple[StageMetrics, ...]] = ContextVar("_active_spans", default=())
+
+
+@contextmanager
+def stage_span(name: str) -> Iterator[StageMetrics | None]:
+    """実行中のプロファイラがあればサブ区間を計測する.
+
+    サービス内部のサブ処理から使用する。プロファイラが無い場合は何もしない.
+
+    Args:
+        name: サブ処理名
+
+    Yields:
+        計測中のStageMetrics（プロファイラが無い場合None）
+    """
+    profiler = _current_profiler.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.span(name) as metrics:
+        yield metrics
+
+
+def record_http_response(response: Any, num_bytes: int | None = None) -> None:
+    """計測中の全スパンにHTTPレスポンスを記録する.
+
+    Args:
+        response: httpx.Response（ボディがbytesでない場合はバイト数0として扱う）
+        num_bytes: 受信バイト数（ストリーミング受信でボディを保持しない場合に指定）
+    """
+    spans = _active_spans.get()
+    if not spans:
+        return
+    if num_bytes is None:
+        content = getattr(response, "content", b"")
+        num_bytes = len(content) if isinstance(content, bytes | bytearray) else 0
+    for span in spans:
+        span.http_request_count += 1
+        span.http_bytes += num_bytes
+
+
+def record_bedrock_tokens(input_tokens: int, output_tokens: int) -> None:
+    """計測中の全スパンにBedrockトークン数を記録する.
+
+    Args:
+        input_tokens: 入力トークン数
+        output_tokens: 出力トークン数
+    """
+    for span in _active_spans.get():
+        span.bedrock_input_tokens += input_tokens
+        span.bedrock_output_tokens += output_tokens
@@ -1,8 +1,20 @@
 """URL正規化ユーティリティモジュール."""
 
-from urllib.parse import parse_qs, urlparse, urlunparse
+from collections.abc import Iterable
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
 
+# 除去するトラッキングパラメータ
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "msclkid"})
 
+# 除去するトラッキングパラメータの接頭辞
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+# 正規化結果のキャッシュ件数上限（1回の実行で扱うURL数より十分大きい値）
+NORMALIZE_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_url(url: str) -> str:
     """URLを正規化する.
 
@@ -12,6 +24,11 @@ def normalize_url(url: str) -> str:
     - トレーリングスラッシュの除去
     - フラグメント（#以降）の除去
 
+    トラッキング以外のクエリパラメータは、重複キー・空値を含めて
+    元の順序・エンコードのまま保持する.
+    正規化結果は元URLをキーにメモ化される（収集・正規化・ソーシャルプルーフ取得で
+    同じURLを繰り返し正規化するため）.
+
     Args:
         url: 正規化前URL
 
@@ -31,42 +48,52 @@ def normalize_url(url: str) -> str:
         raise ValueError("URLが空です")
 
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
     except Exception as e:
         raise ValueError(f"URLの解析に失敗しました: {url}") from e
 
-    # スキームをhttpsに統一
-    scheme = "https"
-
-    # クエリパラメータからトラッキングパラメータを除去
-    query_params = parse_qs(parsed.query)
-    # utm_*, fbclid, gclid等のトラッキングパラメータを除去
-    tracking_params = {
-        "utm_source",
-        "utm_medium",
-        "utm_campaign",
-        "utm_term",
-        "utm_content",
-        "fbclid",
-        "gclid",
-        "msclkid",
-    }
-    filtered_params = {
-        k: v
-        for k, v in query_params.items()
-        if not any(k.startswith(prefix) for prefix in ["utm_"]) and k not in tracking_params
-    }
-
-    # クエリ文字列を再構築（空の場合は除去）
-    query = ""
-    if filtered_params:
-        query = "&".join(f"{k}={v[0]}" for k, v in filtered_params.items())
-
     # パスからトレーリングスラッシュを除去
     path = parsed.path.rstrip("/") if parsed.path != "/" else parsed.path
 
-    # フラグメントを除去
-    fragment = ""
+    # スキームをhttpsに統一し、フラグメントを除去
+    return urlunsplit(("https", parsed.netloc, path, _strip_tracking_params(parsed.query), ""))
+
+
+def normalize_urls(urls: Iterable[str]) -> list[str]:
+    """複数のURLをまとめて正規化する.
+
+    Args:
+        urls: 正規化前URLのリスト
+
+    Returns:
+        正規化されたURLのリスト（入力と同じ順序）
+
+    Raises:
+        ValueError: 不正な形式のURLが含まれる場合
+    """
+    return [normalize_url(url) for url in urls]
+
+
+def _strip_tracking_params(query: str) -> str:
+    """クエリ文字列からトラッキングパラメータを除去する.
+
+    デコード・再エンコードは行わず、各パラメータを元の文字列のまま扱う.
+
+    Args:
+        query: クエリ文字列（?を含まない）
+
+    Returns:
+        トラッキングパラメータを除去したクエリ文字列
+    """
+    if not query:
+        return ""
 
-    # 正規化されたURLを構築
-    return urlunparse((scheme, parsed.netloc, path, parsed.params, query, fragment))
+    kept = []
+    for pair in query.split("&"):
+        if not pair:
+            continue
+        key = pair.split("=", 1)[0]
+        if key in TRACKING_PARAMS or key.startswith(TRACKING_PARAM_PREFIXES):
+            continue
+        kept.append(pair)
+    return "&".join(kept)
@@ -9,9 +9,9 @@ def test_lambda_handler_error() -> None:
     """Lambda handlerがエラーを適切にハンドリングすることを確認."""
     # すべてのAWSクライアントとサービスをモック
     with (
-        patch("src.handler.boto3.client") as mock_boto3_client,
-        patch("src.handler.boto3.resource") as mock_boto3_resource,
-        patch("src.handler.Orchestrator") as mock_orchestrator_class,
+        patch("boto3.client") as mock_boto3_client,
+        patch("boto3.resource") as mock_boto3_resource,
+        patch("src.orchestrator.orchestrator.Orchestrator") as mock_orchestrator_class,
         patch("src.handler.asyncio.run") as mock_asyncio_run,
     ):
         # boto3クライアントのモック
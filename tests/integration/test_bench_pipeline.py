@@ -0,0 +1,19 @@
+"""パイプラインベンチマーク（scripts/bench_pipeline.py）のスモークテスト."""
+
+from scripts.bench_pipeline import BenchParams, run_benchmark
+
+
+def test_run_benchmark_reports_stage_metrics() -> None:
+    """スタブ環境でパイプラインを実行し、ステップ別計測値を返すことを確認."""
+    params = BenchParams(feed_count=3, duplicate_rate=0.2, bedrock_latency_ms=0.0)
+
+    report = run_benchmark(30, params)
+
+    assert report["collected_count"] == 30
+    assert report["deduped_count"] == 24
+    assert report["llm_judged_count"] == 24
+    stages = {stage["name"]: stage for stage in report["stages"]}
+    assert stages["step1_collect"]["http_request_count"] == 3
+    assert stages["step3_buzz_score.social_proof"]["http_request_count"] > 0
+    assert stages["step5_llm_judge"]["bedrock_input_tokens"] > 0
+    assert report["estimated_cost_usd"] > 0
@@ -1,5 +1,6 @@
 """収集フローの統合テスト."""
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -8,8 +9,11 @@ import httpx
 import pytest
 
 from src.models.source_config import FeedType, Priority, SourceConfig
+from src.models.source_watermark import SourceWatermark
 from src.repositories.source_master import SourceMaster
+from src.repositories.watermark_repository import WatermarkRepository
 from src.services.collector import CollectionResult, Collector
+from src.services.latency_tracker import LatencyTracker
 
 
 @pytest.fixture
@@ -163,3 +167,355 @@ async def test_collection_flow_all_failure(mock_source_master: SourceMaster) ->
     assert isinstance(result, CollectionResult)
     assert len(result.articles) == 0
     assert len(result.errors) == 2
+
+
+@pytest.mark.asyncio
+async def test_collection_flow_budget_exceeded_returns_partial_result(
+    mock_source_master: SourceMaster,
+    sample_rss_response: str,
+) -> None:
+    """時間予算を超えたソースはキャンセルされ、完了分のみで結果を返すことを確認."""
+    collector = Collector(mock_source_master)
+
+    mock_response_rss = Mock(spec=httpx.Response)
+    mock_response_rss.status_code = 200
+    mock_response_rss.text = sample_rss_response
+
+    async def mock_get(url: str, *args, **kwargs) -> httpx.Response:
+        if "rss" in url:
+            return mock_response_rss
+        # Atomは応答が返らない
+        await asyncio.sleep(10)
+        raise AssertionError("unreachable")
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        result = await collector.collect(budget_seconds=0.2)
+
+    assert len(result.articles) == 2  # RSS 2件のみ
+    assert "test_atom" in result.errors
+    assert "budget" in result.errors["test_atom"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_collection_skips_seen_entries(
+    mock_source_master: SourceMaster,
+    sample_rss_response: str,
+    sample_atom_response: str,
+) -> None:
+    """差分収集モードでは、ハイウォーターマークより古いエントリを除外することを確認."""
+    watermark_repository = Mock(spec=WatermarkRepository)
+    watermark_repository.get_all.return_value = {
+        "test_rss": SourceWatermark(
+            source_id="test_rss",
+            latest_published_at=datetime(2025, 2, 10, 10, 30, 0, tzinfo=timezone.utc),
+        ),
+        "test_atom": SourceWatermark(
+            source_id="test_atom",
+            latest_published_at=datetime(2025, 2, 10, 10, 0, 0, tzinfo=timezone.utc),
+            recent_entry_ids=frozenset({"https://example.com/atom1"}),
+        ),
+    }
+    collector = Collector(mock_source_master, watermark_repository=watermark_repository)
+
+    async def mock_get(url: str, *args, **kwargs) -> httpx.Response:
+        response = Mock(spec=httpx.Response)
+        response.text = sample_rss_response if "rss" in url else sample_atom_response
+        return response
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        result = await collector.collect()
+
+    assert [article.title for article in result.articles] == ["Test Article 2"]
+    assert result.skipped_count == 2
+    assert result.watermarks["test_rss"].latest_published_at == datetime(
+        2025, 2, 10, 11, 0, 0, tzinfo=timezone.utc
+    )
+    assert result.watermarks["test_rss"].recent_entry_ids == {
+        "https://example.com/article1",
+        "https://example.com/article2",
+    }
+
+
+@pytest.mark.asyncio
+async def test_collection_without_repository_collects_all_and_skips_save(
+    mock_source_master: SourceMaster,
+    sample_rss_response: str,
+    sample_atom_response: str,
+) -> None:
+    """リポジトリ未指定時は全件収集し、マーク保存は何もしないことを確認."""
+    collector = Collector(mock_source_master)
+
+    async def mock_get(url: str, *args, **kwargs) -> httpx.Response:
+        response = Mock(spec=httpx.Response)
+        response.text = sample_rss_response if "rss" in url else sample_atom_response
+        return response
+
+    with patch("httpx.AsyncClient.get", side_effect=mock_get):
+        result = await collector.collect()
+
+    assert len(result.articles) == 3
+    assert result.skipped_count == 0
+    collector.save_watermarks(result.watermarks)  # 例外にならない
+
+
+def test_save_watermarks_continues_on_error(mock_source_master: SourceMaster) -> None:
+    """マーク保存に失敗しても残りのソースの保存を継続することを確認."""
+    watermark_repository = Mock(spec=WatermarkRepository)
+    watermark_repository.save.side_effect = [RuntimeError("throttled"), None]
+    collector = Collector(mock_source_master, watermark_repository=watermark_repository)
+    marked_at = datetime(2025, 2, 10, tzinfo=timezone.utc)
+
+    collector.save_watermarks(
+        {
+            "a": SourceWatermark(source_id="a", latest_published_at=marked_at),
+            "b": SourceWatermark(source_id="b", latest_published_at=marked_at),
+        }
+    )
+
+    assert watermark_repository.save.call_count == 2
+
+
+def test_extract_description_keeps_unclosed_less_than(mock_source_master: SourceMaster) -> None:
+    """閉じ括弧のない "<" はタグとみなさず、以降の概要が保持されることを確認."""
+    collector = Collector(mock_source_master)
+    entry = feedparser.FeedParserDict(
+        summary="Compare a<b then return the rest of the summary text"
+    )
+
+    description = collector._extract_description(entry)
+
+    assert description == "Compare a<b then return the rest of the summary text"
+
+
+def _streaming_source(**overrides: object) -> SourceConfig:
+    """ストリーミング解析を有効にした収集元設定を返す."""
+    return SourceConfig(
+        source_id="test_stream",
+        name="Test Stream",
+        feed_url="https://example.com/rss",
+        feed_type=FeedType.RSS,
+        priority=Priority.HIGH,
+        retry_count=0,
+        streaming=True,
+        **overrides,
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_collection_respects_max_entries(sample_rss_response: str) -> None:
+    """ストリーミング解析で max_entries 件のみ収集することを確認."""
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = [_streaming_source(max_entries=1)]
+    collector = Collector(source_master)
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        return httpx.Response(200, content=sample_rss_response.encode(), request=request)
+
+    with patch("httpx.AsyncClient.send", side_effect=mock_send) as send:
+        result = await collector.collect()
+
+    assert [article.title for article in result.articles] == ["Test Article 1"]
+    assert send.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_collection_falls_back_to_feedparser(sample_rss_response: str) -> None:
+    """ストリーミング受信に失敗した場合、feedparserによる全件取得にフォールバックすることを確認."""
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = [_streaming_source()]
+    collector = Collector(source_master)
+    responses = [503, 200]
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        return httpx.Response(
+            responses.pop(0), content=sample_rss_response.encode(), request=request
+        )
+
+    with patch("httpx.AsyncClient.send", side_effect=mock_send):
+        result = await collector.collect()
+
+    assert result.errors == {}
+    assert len(result.articles) == 2
+
+
+@pytest.mark.asyncio
+async def test_streaming_collection_reports_malformed_feed() -> None:
+    """XMLとして不正なフィードはフォールバック後も従来どおり収集エラーになることを確認."""
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = [_streaming_source()]
+    collector = Collector(source_master)
+    malformed_rss = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>A&nbsp;B</title><link>https://example.com/a</link></item>
+</channel></rss>"""
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        return httpx.Response(200, content=malformed_rss, request=request)
+
+    with patch("httpx.AsyncClient.send", side_effect=mock_send) as send:
+        result = await collector.collect()
+
+    assert send.call_count == 2
+    assert "Feed parsing error" in result.errors["test_stream"]
+
+
+@pytest.mark.asyncio
+async def test_high_priority_source_sends_hedged_request(sample_rss_response: str) -> None:
+    """高優先度ソースの応答がp95を超えた場合、ヘッジリクエストの応答を使うことを確認."""
+    source = SourceConfig(
+        source_id="test_rss",
+        name="Test RSS",
+        feed_url="https://example.com/rss",
+        feed_type=FeedType.RSS,
+        priority=Priority.HIGH,
+        retry_count=0,
+    )
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = [source]
+    latency_tracker = LatencyTracker()
+    for _ in range(3):
+        latency_tracker.record("test_rss", 0.1)
+    collector = Collector(source_master, latency_tracker=latency_tracker)
+    call_count = 0
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            # 1本目は応答が返らない
+            await asyncio.sleep(10)
+        return httpx.Response(200, content=sample_rss_response.encode(), request=request)
+
+    with patch("httpx.AsyncClient.send", side_effect=mock_send):
+        result = await collector.collect(budget_seconds=5)
+
+    assert call_count == 2
+    assert len(result.articles) == 2
+    assert result.source_latencies[0].source_id == "test_rss"
+    assert result.source_latencies[0].sample_count == 4
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_cancelled_with_caller() -> None:
+    """呼び出し元がキャンセルされた場合、送信中のリクエストもキャンセルすることを確認."""
+    collector = Collector(Mock(spec=SourceMaster))
+    started = asyncio.Event()
+    request_tasks = []
+
+    async def slow_get(url: str) -> httpx.Response:
+        request_tasks.append(asyncio.current_task())
+        started.set()
+        await asyncio.sleep(10)
+        raise AssertionError("request should have been cancelled")
+
+    client = Mock(spec=httpx.AsyncClient)
+    client.get = slow_get
+    caller = asyncio.create_task(
+        collector._hedged_get(client, "https://example.com/rss", hedge_delay=5.0)
+    )
+    await started.wait()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.sleep(0)
+
+    assert len(request_tasks) == 1
+    assert request_tasks[0].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_latency_sample_excludes_retry_backoff(sample_rss_response: str) -> None:
+    """リトライ時のレイテンシのサンプルに、バックオフ待機時間を含めないことを確認."""
+    source = SourceConfig(
+        source_id="test_rss",
+        name="Test RSS",
+        feed_url="https://example.com/rss",
+        feed_type=FeedType.RSS,
+        priority=Priority.MEDIUM,
+        retry_count=1,
+    )
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = [source]
+    latency_tracker = LatencyTracker()
+    collector = Collector(source_master, latency_tracker=latency_tracker)
+    call_count = 0
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, content=sample_rss_response.encode(), request=request)
+
+    with (
+        patch("src.services.collector.RETRY_BASE_DELAY_SECONDS", 0.3),
+        patch("httpx.AsyncClient.send", side_effect=mock_send),
+    ):
+        result = await collector.collect()
+
+    assert len(result.articles) == 2
+    samples = list(latency_tracker._samples["test_rss"])
+    assert len(samples) == 1
+    assert samples[0] < 0.3
+
+
+def _prioritized_sources() -> list[SourceConfig]:
+    """優先度の異なる収集元設定を返す（設定ファイル上は低優先度から並ぶ）."""
+    return [
+        SourceConfig(
+            source_id=f"source_{priority.value}",
+            name=f"Source {priority.value}",
+            feed_url=f"https://example.com/{priority.value}/rss",
+            feed_type=FeedType.RSS,
+            priority=priority,
+            retry_count=0,
+        )
+        for priority in (Priority.LOW, Priority.HIGH, Priority.MEDIUM)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_collection_dispatches_high_priority_first(sample_rss_response: str) -> None:
+    """同時実行数の上限内で、高優先度のソースから順に取得することを確認."""
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = _prioritized_sources()
+    collector = Collector(source_master, max_concurrency=1)
+    requested: list[str] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        requested.append(request.url.path.split("/")[1])
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=sample_rss_response.encode(), request=request)
+
+    with patch("httpx.AsyncClient.send", side_effect=mock_send):
+        result = await collector.collect()
+
+    assert requested == ["high", "medium", "low"]
+    assert max_in_flight == 1
+    assert len(result.articles) == 6
+
+
+@pytest.mark.asyncio
+async def test_collection_budget_cuts_low_priority_sources_first(
+    sample_rss_response: str,
+) -> None:
+    """時間予算を超えた場合、低優先度のソースから打ち切られることを確認."""
+    source_master = Mock(spec=SourceMaster)
+    source_master.get_enabled_sources.return_value = _prioritized_sources()
+    collector = Collector(source_master, max_concurrency=1)
+
+    async def mock_send(request: httpx.Request, *args, **kwargs) -> httpx.Response:
+        await asyncio.sleep(0.3)
+        return httpx.Response(200, content=sample_rss_response.encode(), request=request)
+
+    with patch("httpx.AsyncClient.send", side_effect=mock_send):
+        result = await collector.collect(budget_seconds=0.45)
+
+    assert {article.source_name for article in result.articles} == {"Source high"}
+    assert set(result.errors) == {"source_medium", "source_low"}
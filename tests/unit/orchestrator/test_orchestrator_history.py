@@ -0,0 +1,78 @@
+"""Orchestrator履歴保存のユニットテスト."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.interest_profile import InterestProfile, JudgmentCriterion
+from src.orchestrator.orchestrator import Orchestrator
+from src.services.buzz_scorer import BuzzScorer
+from src.services.candidate_selector import CandidateSelector
+from src.services.collector import CollectionResult
+from src.services.deduplicator import Deduplicator
+from src.services.final_selector import FinalSelector
+from src.services.formatter import Formatter
+from src.services.llm_judge import LlmJudge
+from src.services.normalizer import Normalizer
+from src.services.notifier import Notifier
+
+
+def _interest_profile() -> InterestProfile:
+    criteria = {
+        label.lower(): JudgmentCriterion(label=label, description=label, examples=[])
+        for label in ("ACT_NOW", "THINK", "FYI", "IGNORE")
+    }
+    return InterestProfile(
+        summary="テスト用プロファイル",
+        max_interest=[],
+        high_interest=["AI/ML"],
+        medium_interest=[],
+        low_interest=[],
+        ignore_interest=[],
+        criteria=criteria,
+    )
+
+
+@pytest.mark.asyncio
+async def test_saved_history_includes_watermark_stage() -> None:
+    """保存する履歴に収集位置保存の計測値を含め、ログ出力と同じサマリを保存することを確認."""
+    interest_profile = _interest_profile()
+    source_master = MagicMock()
+    collector = MagicMock()
+    collector.collect = AsyncMock(return_value=CollectionResult(articles=[], errors={}))
+    social_proof_fetcher = MagicMock()
+    social_proof_fetcher.fetch_batch = AsyncMock(return_value={})
+    history_repository = MagicMock()
+    orchestrator = Orchestrator(
+        source_master=source_master,
+        cache_repository=None,
+        history_repository=history_repository,
+        collector=collector,
+        normalizer=Normalizer(),
+        deduplicator=Deduplicator(None),
+        buzz_scorer=BuzzScorer(
+            interest_profile=interest_profile,
+            source_master=source_master,
+            social_proof_fetcher=social_proof_fetcher,
+        ),
+        candidate_selector=CandidateSelector(),
+        llm_judge=LlmJudge(
+            bedrock_client=MagicMock(),
+            cache_repository=None,
+            interest_profile=interest_profile,
+            model_id="claude-haiku-4-5",
+        ),
+        final_selector=FinalSelector(),
+        formatter=Formatter(),
+        notifier=Notifier(None, from_email="", to_email="", dry_run=True),
+    )
+
+    result = await orchestrator.execute(
+        "run-1", datetime(2026, 2, 14, tzinfo=timezone.utc), dry_run=True
+    )
+
+    collector.save_watermarks.assert_called_once()
+    history_repository.save.assert_called_once_with(result.summary)
+    stage_names = [stage.name for stage in result.summary.stage_metrics]
+    assert stage_names[-1] == "step8_save_watermarks"
@@ -3,8 +3,9 @@
 from datetime import datetime, timezone
 from unittest.mock import Mock
 
+from src.models.article import Article
 from src.models.judgment import BuzzLabel, InterestLabel, JudgmentResult
-from src.repositories.cache_repository import CacheRepository
+from src.repositories.cache_repository import CacheRepository, content_fingerprint
 
 
 def _create_repository() -> tuple[CacheRepository, Mock]:
@@ -308,3 +309,200 @@ def test_batch_exists_handles_client_error() -> None:
         "https://example.com/url1": False,
         "https://example.com/url2": False,
     }
+
+
+def test_batch_get_returns_judgments() -> None:
+    """batch_getで判定済みURLの判定結果を取得できる."""
+    repository, _ = _create_repository()
+    dynamodb_resource = repository._dynamodb
+    dynamodb_resource.batch_get_item.return_value = {
+        "Responses": {
+            "cache-table": [
+                {
+                    "url": "https://example.com/exists",
+                    "title": "Title",
+                    "description": "Description",
+                    "interest_label": "THINK",
+                    "buzz_label": "MID",
+                    "confidence": "0.8",
+                    "summary": "Summary",
+                    "model_id": "model",
+                    "judged_at": "2026-02-14T00:00:00+00:00",
+                    "published_at": "2026-02-13T12:00:00+00:00",
+                }
+            ]
+        }
+    }
+
+    result = repository.batch_get(["https://example.com/exists", "https://example.com/new"])
+
+    assert list(result) == ["https://example.com/exists"]
+    judgment = result["https://example.com/exists"]
+    assert judgment.interest_label == InterestLabel.THINK
+    assert judgment.confidence == 0.8
+    assert judgment.tags == []
+
+
+def test_batch_get_handles_client_error() -> None:
+    """batch_getでClientErrorが発生した場合、空の辞書を返す."""
+    from botocore.exceptions import ClientError
+
+    repository, _ = _create_repository()
+    repository._dynamodb.batch_get_item.side_effect = ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "Table not found"}},
+        "BatchGetItem",
+    )
+
+    assert repository.batch_get(["https://example.com/url1"]) == {}
+
+
+def _cached_item(pk: str, url: str) -> dict[str, str]:
+    return {
+        "PK": pk,
+        "SK": "JUDGMENT#p2-abc",
+        "url": url,
+        "title": "Cached Title",
+        "description": "Cached description",
+        "interest_label": "ACT_NOW",
+        "buzz_label": "HIGH",
+        "confidence": "0.9",
+        "summary": "Summary",
+        "model_id": "model",
+        "judged_at": "2026-02-14T00:00:00+00:00",
+        "published_at": "2026-02-13T12:00:00+00:00",
+    }
+
+
+def _article(url: str, title: str, description: str) -> Article:
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    return Article(
+        url=url,
+        title=title,
+        description=description,
+        source_name="Example",
+        published_at=now,
+        normalized_url=url,
+        collected_at=now,
+    )
+
+
+def test_content_fingerprint_ignores_formatting_differences() -> None:
+    """全角半角・大文字小文字・空白・記号の違いは同じフィンガープリントになる."""
+    base = content_fingerprint("Claude 4 Released!", "Anthropic announced Claude 4.")
+
+    assert content_fingerprint("claude　４ released", "Anthropic  announced\nClaude 4") == base
+    assert content_fingerprint("Claude 4 Released!", "Another description") != base
+    assert content_fingerprint("Claude 4 Released!", "") is None
+
+
+def test_put_stores_url_and_content_items_with_versioned_sort_key() -> None:
+    """判定結果をURL・内容のキーに判定バージョン付きのソートキーで保存する."""
+    dynamodb_resource = Mock()
+    table = Mock()
+    dynamodb_resource.Table.return_value = table
+    repository = CacheRepository(dynamodb_resource, "cache-table", judgment_version="p2-abc")
+    judgment = JudgmentResult(
+        url="https://example.com/a",
+        title="Title",
+        description="Description",
+        interest_label=InterestLabel.FYI,
+        buzz_label=BuzzLabel.LOW,
+        confidence=0.7,
+        summary="Summary",
+        model_id="model",
+        judged_at=datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc),
+        published_at=datetime(2026, 2, 13, 12, 0, 0, tzinfo=timezone.utc),
+    )
+
+    repository.put(judgment)
+
+    items = [call.kwargs["Item"] for call in table.put_item.call_args_list]
+    assert [item["PK"].split("#")[0] for item in items] == ["URL", "CONTENT"]
+    assert {item["SK"] for item in items} == {"JUDGMENT#p2-abc"}
+    assert {item["url"] for item in items} == {"https://example.com/a"}
+
+
+def test_batch_get_for_articles_reuses_judgment_of_same_content() -> None:
+    """URLで見つからない記事は同じ内容の判定結果を記事のURLに置き換えて返す."""
+    dynamodb_resource = Mock()
+    dynamodb_resource.Table.return_value = Mock()
+    repository = CacheRepository(dynamodb_resource, "cache-table", judgment_version="p2-abc")
+    cached = _article("https://example.com/cached", "Cached Title", "Cached description")
+    mirrored = _article("https://mirror.example.net/post", "Cached title", "Cached description")
+    new = _article("https://example.com/new", "New Title", "New description")
+    fingerprint = content_fingerprint(cached.title, cached.description)
+    dynamodb_resource.batch_get_item.return_value = {
+        "Responses": {
+            "cache-table": [
+                _cached_item(repository._generate_pk(cached.url), cached.url),
+                _cached_item(f"CONTENT#{fingerprint}", cached.url),
+            ]
+        }
+    }
+
+    result = repository.batch_get_for_articles([cached, mirrored, new])
+
+    assert set(result) == {cached.url, mirrored.url}
+    assert result[mirrored.url].url == mirrored.url
+    assert result[mirrored.url].title == "Cached title"
+    assert result[mirrored.url].interest_label == InterestLabel.ACT_NOW
+    keys = dynamodb_resource.batch_get_item.call_args.kwargs["RequestItems"]["cache-table"]["Keys"]
+    # URL3件 + 内容2件（cached と mirrored は同じ内容のため1件）
+    assert len(keys) == 5
+    assert {key["SK"] for key in keys} == {"JUDGMENT#p2-abc"}
+
+
+def test_mark_notified_updates_url_and_content_items() -> None:
+    """通知済みの記録をURL・内容の両方のキーの既存項目に保存し、未保存の項目は無視する."""
+    from botocore.exceptions import ClientError
+
+    repository, table = _create_repository()
+    table.update_item.side_effect = [
+        None,
+        ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}},
+            "UpdateItem",
+        ),
+    ]
+    judgment = JudgmentResult(
+        url="https://example.com/a",
+        title="Title",
+        description="Description",
+        interest_label=InterestLabel.ACT_NOW,
+        buzz_label=BuzzLabel.HIGH,
+        confidence=0.95,
+        summary="Summary",
+        model_id="model",
+        judged_at=datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc),
+        published_at=datetime(2026, 2, 13, 12, 0, 0, tzinfo=timezone.utc),
+    )
+    notified_at = datetime(2026, 2, 14, 1, 0, 0, tzinfo=timezone.utc)
+
+    repository.mark_notified([judgment], notified_at)
+
+    calls = [call.kwargs for call in table.update_item.call_args_list]
+    assert [call["Key"]["PK"].split("#")[0] for call in calls] == ["URL", "CONTENT"]
+    assert all(call["ConditionExpression"] == "attribute_exists(PK)" for call in calls)
+    assert calls[0]["ExpressionAttributeValues"] == {":notified_at": notified_at.isoformat()}
+
+
+def test_get_restores_notified_at() -> None:
+    """通知済みの記録がある項目は通知日時を復元し、ない項目はNoneとする."""
+    repository, table = _create_repository()
+    item = {
+        "url": "https://example.com/a",
+        "interest_label": "ACT_NOW",
+        "buzz_label": "HIGH",
+        "confidence": 0.9,
+        "summary": "Summary",
+        "model_id": "model",
+        "judged_at": "2026-02-14T00:00:00+00:00",
+        "published_at": "2026-02-13T12:00:00+00:00",
+    }
+    table.get_item.return_value = {"Item": item}
+    assert repository.get("https://example.com/a").notified_at is None
+
+    table.get_item.return_value = {"Item": {**item, "notified_at": "2026-02-14T01:00:00+00:00"}}
+    assert repository.get("https://example.com/a").notified_at == datetime(
+        2026, 2, 14, 1, 0, 0, tzinfo=timezone.utc
+    )
@@ -0,0 +1,131 @@
+"""HistoryRepositoryのユニットテスト."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.models.execution_summary import ExecutionSummary
+from src.models.source_latency import SourceLatency
+from src.models.stage_metrics import StageMetrics
+from src.repositories.history_repository import HistoryRepository
+
+
+def test_stage_metrics_round_trip() -> None:
+    """ステップ計測値・レイテンシ統計が保存・取得で復元されることを確認."""
+    mock_dynamodb = Mock()
+    mock_table = mock_dynamodb.Table.return_value
+    repository = HistoryRepository(dynamodb_resource=mock_dynamodb, table_name="test-history")
+    stage = StageMetrics(
+        name="step3_buzz_score.social_proof",
+        wall_seconds=1.5,
+        cpu_seconds=0.2,
+        peak_rss_delta_mb=3.0,
+        http_request_count=4,
+        http_bytes=2048,
+    )
+    summary = ExecutionSummary(
+        run_id="test-run-id",
+        executed_at=datetime(2026, 1, 7, 9, 0, 0),
+        collected_count=10,
+        deduped_count=8,
+        llm_judged_count=6,
+        cache_hit_count=2,
+        final_selected_count=4,
+        notification_sent=True,
+        execution_time_seconds=5.0,
+        estimated_cost_usd=0.06,
+        llm_budget_utilization=0.75,
+        prefilter_ignored_count=12,
+        llm_escalated_count=7,
+        stage_metrics=[stage],
+        source_latencies=[
+            SourceLatency(source_id="zenn", p50_seconds=0.4, p95_seconds=1.2, sample_count=12)
+        ],
+    )
+
+    repository.save(summary)
+    item = mock_table.put_item.call_args.kwargs["Item"]
+    mock_table.query.return_value = {"Items": [item]}
+    restored = repository.get_by_week(2026, 2)
+
+    assert restored[0].stage_metrics == [stage]
+    assert restored[0].source_latencies == summary.source_latencies
+    assert restored[0].llm_budget_utilization == 0.75
+    assert restored[0].prefilter_ignored_count == 12
+    assert restored[0].llm_escalated_count == 7
+
+
+def test_missing_stage_metrics_defaults_to_empty() -> None:
+    """stage_metrics属性のない既存アイテムは空リストとして取得されることを確認."""
+    mock_dynamodb = Mock()
+    mock_table = mock_dynamodb.Table.return_value
+    mock_table.query.return_value = {
+        "Items": [
+            {
+                "run_id": "old-run",
+                "executed_at": "2025-12-31T09:00:00",
+                "collected_count": 1,
+                "deduped_count": 1,
+                "llm_judged_count": 1,
+                "cache_hit_count": 0,
+                "final_selected_count": 1,
+                "notification_sent": True,
+                "execution_time_seconds": 1.0,
+                "estimated_cost_usd": 0.01,
+            }
+        ]
+    }
+    repository = HistoryRepository(dynamodb_resource=mock_dynamodb, table_name="test-history")
+
+    restored = repository.get_by_week(2026, 1)
+
+    assert restored[0].stage_metrics == []
+    assert restored[0].source_latencies == []
+    assert restored[0].llm_budget_utilization == 0.0
+    assert restored[0].prefilter_ignored_count == 0
+    assert restored[0].llm_escalated_count == 0
+
+
+def test_get_latest_returns_most_recent_run_of_this_and_previous_week() -> None:
+    """今週・前週の実行履歴のうち最新の実行サマリを返すことを確認."""
+    mock_dynamodb = Mock()
+    mock_table = mock_dynamodb.Table.return_value
+    repository = HistoryRepository(dynamodb_resource=mock_dynamodb, table_name="test-history")
+    items = {}
+    for executed_at in (datetime(2026, 1, 3, 9, 0, 0), datetime(2026, 1, 4, 9, 0, 0)):
+        summary = ExecutionSummary(
+            run_id=executed_at.isoformat(),
+            executed_at=executed_at,
+            collected_count=1,
+            deduped_count=1,
+            llm_judged_count=1,
+            cache_hit_count=0,
+            final_selected_count=1,
+            notification_sent=True,
+            execution_time_seconds=1.0,
+            estimated_cost_usd=0.01,
+        )
+        repository.save(summary)
+        items[executed_at] = mock_table.put_item.call_args.kwargs["Item"]
+    # 2026-01-03・04 は2026年第1週、2026-01-05 は第2週
+    mock_table.query.side_effect = lambda **kwargs: {
+        "Items": [
+            item
+            for item in items.values()
+            if item["PK"] == kwargs["ExpressionAttributeValues"][":pk"]
+        ]
+    }
+
+    latest = repository.get_latest(datetime(2026, 1, 5, 9, 0, 0))
+
+    assert latest is not None
+    assert latest.run_id == "2026-01-04T09:00:00"
+    assert mock_table.query.call_count == 2
+
+
+def test_get_latest_returns_none_without_history() -> None:
+    """今週・前週の実行履歴がない場合Noneを返すことを確認."""
+    mock_dynamodb = Mock()
+    mock_dynamodb.Table.return_value.query.return_value = {"Items": []}
+    repository = HistoryRepository(dynamodb_resource=mock_dynamodb, table_name="test-history")
+
+    assert repository.get_latest(datetime(2026, 1, 5, 9, 0, 0)) is None
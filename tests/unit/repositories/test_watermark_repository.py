@@ -0,0 +1,60 @@
+"""WatermarkRepositoryのユニットテスト."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from src.models.source_watermark import SourceWatermark
+from src.repositories.watermark_repository import WatermarkRepository
+
+
+def test_watermark_round_trip() -> None:
+    """ハイウォーターマークが保存・取得で復元されることを確認."""
+    mock_dynamodb = Mock()
+    mock_table = mock_dynamodb.Table.return_value
+    repository = WatermarkRepository(dynamodb_resource=mock_dynamodb, table_name="test-table")
+    watermark = SourceWatermark(
+        source_id="zenn",
+        latest_published_at=datetime(2026, 1, 7, 9, 0, 0, tzinfo=timezone.utc),
+        recent_entry_ids=frozenset({"https://zenn.dev/a", "https://zenn.dev/b"}),
+    )
+
+    repository.save(watermark)
+    item = mock_table.put_item.call_args.kwargs["Item"]
+    mock_dynamodb.batch_get_item.return_value = {"Responses": {"test-table": [item]}}
+    restored = repository.get_all(["zenn", "qiita"])
+
+    assert item["PK"] == "SOURCE#zenn"
+    assert restored == {"zenn": watermark}
+
+
+def test_save_skipped_in_dry_run() -> None:
+    """dry_runモードでは保存しないことを確認."""
+    mock_dynamodb = Mock()
+    mock_table = mock_dynamodb.Table.return_value
+    repository = WatermarkRepository(
+        dynamodb_resource=mock_dynamodb, table_name="test-table", dry_run=True
+    )
+
+    repository.save(
+        SourceWatermark(
+            source_id="zenn",
+            latest_published_at=datetime(2026, 1, 7, tzinfo=timezone.utc),
+        )
+    )
+
+    mock_table.put_item.assert_not_called()
+
+
+def test_is_seen_uses_published_at_and_entry_ids() -> None:
+    """公開日時がマークより古いか、IDが既知のエントリを収集済みと判定することを確認."""
+    marked_at = datetime(2026, 1, 7, tzinfo=timezone.utc)
+    watermark = SourceWatermark(
+        source_id="zenn",
+        latest_published_at=marked_at,
+        recent_entry_ids=frozenset({"seen"}),
+    )
+
+    assert watermark.is_seen("seen", None)
+    assert watermark.is_seen("old", datetime(2026, 1, 6, tzinfo=timezone.utc))
+    assert not watermark.is_seen("same_time", marked_at)
+    assert not watermark.is_seen("undated", None)
@@ -0,0 +1,137 @@
+"""バッチ推論ジョブ実行基盤のユニットテスト."""
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.services.batch_job_runner import BedrockBatchJobRunner, LocalBatchJobRunner
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    return [
+        {"recordId": f"REC{i:08d}", "modelInput": {"messages": [{"content": f"prompt {i}"}]}}
+        for i in range(count)
+    ]
+
+
+class TestLocalBatchJobRunner:
+    """LocalBatchJobRunnerのテスト."""
+
+    def test_runs_job_and_writes_jsonl_output(self, tmp_path: Path) -> None:
+        """ジョブが実行され、Bedrockと同じ形式の出力JSONLが書き出されることを確認."""
+        runner = LocalBatchJobRunner(tmp_path, invoke=lambda model_input: {"echo": model_input})
+
+        job_id = runner.submit("job-1", _records(2))
+
+        assert (tmp_path / "job-1" / "input.jsonl").exists()
+        assert runner.get_status(job_id) == "Completed"
+        outputs = runner.read_outputs(job_id)
+        assert [output["recordId"] for output in outputs] == ["REC00000000", "REC00000001"]
+        assert outputs[0]["modelOutput"] == {"echo": _records(2)[0]["modelInput"]}
+
+    def test_failed_record_has_error(self, tmp_path: Path) -> None:
+        """invokeが失敗したレコードはerrorを持ち、ジョブは一部完了になることを確認."""
+
+        def invoke(model_input: dict[str, Any]) -> dict[str, Any]:
+            if model_input["messages"][0]["content"] == "prompt 1":
+                raise ValueError("boom")
+            return {}
+
+        runner = LocalBatchJobRunner(tmp_path, invoke=invoke)
+        job_id = runner.submit("job-2", _records(2))
+
+        assert runner.get_status(job_id) == "PartiallyCompleted"
+        outputs = runner.read_outputs(job_id)
+        assert "error" not in outputs[0]
+        assert outputs[1]["error"] == {"errorMessage": "boom"}
+
+    def test_job_runs_only_once(self, tmp_path: Path) -> None:
+        """状態確認を繰り返してもジョブは1度だけ実行されることを確認."""
+        invoke = MagicMock(return_value={})
+        runner = LocalBatchJobRunner(tmp_path, invoke=invoke)
+        job_id = runner.submit("job-3", _records(3))
+
+        runner.get_status(job_id)
+        runner.get_status(job_id)
+
+        assert invoke.call_count == 3
+
+    def test_stop_marks_job_stopped(self, tmp_path: Path) -> None:
+        """停止したジョブは実行されないことを確認."""
+        invoke = MagicMock(return_value={})
+        runner = LocalBatchJobRunner(tmp_path, invoke=invoke)
+        job_id = runner.submit("job-4", _records(1))
+
+        runner.stop(job_id)
+
+        assert runner.get_status(job_id) == "Stopped"
+        invoke.assert_not_called()
+
+
+class TestBedrockBatchJobRunner:
+    """BedrockBatchJobRunnerのテスト."""
+
+    JOB_ARN = "arn:aws:bedrock:ap-northeast-1:123456789012:model-invocation-job/abc123"
+
+    def _runner(self) -> tuple[BedrockBatchJobRunner, MagicMock, MagicMock]:
+        bedrock = MagicMock()
+        s3 = MagicMock()
+        runner = BedrockBatchJobRunner(
+            bedrock, s3, bucket="batch-bucket", role_arn="arn:role", model_id="model"
+        )
+        return runner, bedrock, s3
+
+    def test_submit_writes_input_and_creates_job(self) -> None:
+        """入力JSONLをS3に書き出し、ジョブを投入することを確認."""
+        runner, bedrock, s3 = self._runner()
+        bedrock.create_model_invocation_job.return_value = {"jobArn": self.JOB_ARN}
+
+        job_id = runner.submit("judge-1", _records(2))
+
+        assert job_id == self.JOB_ARN
+        put_kwargs = s3.put_object.call_args.kwargs
+        assert put_kwargs["Bucket"] == "batch-bucket"
+        assert put_kwargs["Key"] == "llm-batch/judge-1/input.jsonl"
+        assert len(put_kwargs["Body"].decode().splitlines()) == 2
+        job_kwargs = bedrock.create_model_invocation_job.call_args.kwargs
+        assert job_kwargs["modelId"] == "model"
+        assert job_kwargs["inputDataConfig"]["s3InputDataConfig"]["s3Uri"] == (
+            "s3://batch-bucket/llm-batch/judge-1/input.jsonl"
+        )
+        assert job_kwargs["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"] == (
+            "s3://batch-bucket/llm-batch/judge-1/"
+        )
+
+    def test_read_outputs_reads_out_files_under_job_prefix(self) -> None:
+        """ジョブID配下の .jsonl.out のみを読み込むことを確認."""
+        runner, bedrock, s3 = self._runner()
+        bedrock.get_model_invocation_job.return_value = {
+            "status": "Completed",
+            "outputDataConfig": {
+                "s3OutputDataConfig": {"s3Uri": "s3://batch-bucket/llm-batch/judge-1/"}
+            },
+        }
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "llm-batch/judge-1/abc123/input.jsonl.out"},
+                    {"Key": "llm-batch/judge-1/abc123/manifest.json.out"},
+                ]
+            }
+        ]
+        s3.get_paginator.return_value = paginator
+        output_line = json.dumps({"recordId": "REC00000000", "modelOutput": {}})
+        s3.get_object.return_value = {"Body": io.BytesIO(f"{output_line}\n".encode())}
+
+        outputs = runner.read_outputs(self.JOB_ARN)
+
+        assert outputs == [{"recordId": "REC00000000", "modelOutput": {}}]
+        paginator.paginate.assert_called_once_with(
+            Bucket="batch-bucket", Prefix="llm-batch/judge-1/abc123/"
+        )
+        s3.get_object.assert_called_once_with(
+            Bucket="batch-bucket", Key="llm-batch/judge-1/abc123/input.jsonl.out"
+        )
@@ -0,0 +1,200 @@
+"""BatchLlmJudgeサービスのユニットテスト."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.article import Article
+from src.models.interest_profile import InterestProfile, JudgmentCriterion
+from src.models.judgment import InterestLabel
+from src.services.batch_job_runner import LocalBatchJobRunner
+from src.services.batch_llm_judge import BatchLlmJudge
+from src.services.llm_judge import JudgmentBatchResult
+
+
+@pytest.fixture
+def interest_profile() -> InterestProfile:
+    """テスト用のInterestProfile."""
+    criteria = {
+        label.lower(): JudgmentCriterion(label=label, description=label, examples=[])
+        for label in ("ACT_NOW", "THINK", "FYI", "IGNORE")
+    }
+    return InterestProfile(
+        summary="テスト用プロファイル",
+        max_interest=[],
+        high_interest=["AI/ML"],
+        medium_interest=[],
+        low_interest=[],
+        ignore_interest=[],
+        criteria=criteria,
+    )
+
+
+@pytest.fixture
+def articles() -> list[Article]:
+    """テスト用の記事リスト."""
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    return [
+        Article(
+            url=f"https://example.com/{i}",
+            title=f"記事{i}",
+            description=f"概要{i}",
+            source_name="テストソース",
+            published_at=now,
+            normalized_url=f"https://example.com/{i}",
+            collected_at=now,
+        )
+        for i in range(3)
+    ]
+
+
+def _model_output(text: str) -> dict[str, Any]:
+    """Anthropic Messages API形式のmodelOutputを返す."""
+    return {
+        "content": [{"type": "text", "text": text}],
+        "usage": {"input_tokens": 900, "output_tokens": 100},
+    }
+
+
+def _invoke(model_input: dict[str, Any]) -> dict[str, Any]:
+    """プロンプト中の記事タイトルに応じた判定を返す（記事2はJSON解析失敗）."""
+    prompt = model_input["messages"][0]["content"]
+    if "記事2" in prompt:
+        return _model_output("not json")
+    label = "ACT_NOW" if "記事0" in prompt else "FYI"
+    return _model_output(json.dumps({"interest_label": label, "confidence": 0.9, "summary": "要約"}))
+
+
+def _judge(
+    runner: Any, interest_profile: InterestProfile, min_batch_size: int = 1
+) -> BatchLlmJudge:
+    return BatchLlmJudge(
+        job_runner=runner,
+        bedrock_client=MagicMock(),
+        cache_repository=None,
+        interest_profile=interest_profile,
+        model_id="claude-haiku-4-5",
+        poll_interval_seconds=0.0,
+        min_batch_size=min_batch_size,
+    )
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_maps_outputs_to_judgments(
+    tmp_path: Path, interest_profile: InterestProfile, articles: list[Article]
+) -> None:
+    """バッチ出力が共通の検証を経て判定結果に変換されることを確認."""
+    judge = _judge(LocalBatchJobRunner(tmp_path, invoke=_invoke), interest_profile)
+
+    result = await judge.judge_batch(articles)
+
+    assert [j.url for j in result.judgments] == [a.url for a in articles]
+    assert result.judgments[0].interest_label == InterestLabel.ACT_NOW
+    assert result.judgments[1].interest_label == InterestLabel.FYI
+    # JSON解析に失敗したレコードはフォールバック判定（IGNORE）になる
+    assert result.judgments[2].interest_label == InterestLabel.IGNORE
+    assert result.failed_count == 1
+    # 課金対象の3レコードがバッチ推論として台帳に記録される
+    assert len(result.usage.calls) == 3
+    assert all(call.batch_inference for call in result.usage.calls)
+
+
+def _read_batch_input(work_dir: Path) -> list[dict[str, Any]]:
+    """書き出されたバッチ入力ファイルのレコードを読み込む."""
+    (input_path,) = work_dir.glob("*/input.jsonl")
+    return [json.loads(line) for line in input_path.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_writes_prompts_as_jsonl(
+    tmp_path: Path, interest_profile: InterestProfile, articles: list[Article]
+) -> None:
+    """判定プロンプトがBedrockのバッチ入力形式で書き出されることを確認."""
+    judge = _judge(LocalBatchJobRunner(tmp_path, invoke=_invoke), interest_profile)
+
+    await judge.judge_batch(articles)
+
+    records = _read_batch_input(tmp_path)
+    assert [r["recordId"] for r in records] == ["REC00000000", "REC00000001", "REC00000002"]
+    assert records[0]["modelInput"]["anthropic_version"] == "bedrock-2023-05-31"
+    assert "記事0" in records[0]["modelInput"]["messages"][0]["content"]
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_falls_back_when_job_fails(
+    interest_profile: InterestProfile, articles: list[Article]
+) -> None:
+    """ジョブが失敗した場合、全件がフォールバック判定になることを確認."""
+    runner = MagicMock()
+    runner.submit.return_value = "job"
+    runner.get_status.return_value = "Failed"
+    judge = _judge(runner, interest_profile)
+
+    result = await judge.judge_batch(articles)
+
+    assert result.failed_count == 3
+    assert all(j.interest_label == InterestLabel.IGNORE for j in result.judgments)
+    runner.read_outputs.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_stops_job_when_budget_exceeded(
+    interest_profile: InterestProfile, articles: list[Article]
+) -> None:
+    """時間予算内にジョブが完了しない場合、ジョブを停止して全件を未判定とすることを確認."""
+    runner = MagicMock()
+    runner.submit.return_value = "job"
+    runner.get_status.return_value = "InProgress"
+    judge = _judge(runner, interest_profile)
+    judge._poll_interval_seconds = 60.0
+
+    result = await judge.judge_batch(articles, budget_seconds=1.0)
+
+    assert result.judgments == []
+    assert result.skipped_count == 3
+    runner.stop.assert_called_once_with("job")
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_polls_until_completed(
+    tmp_path: Path, interest_profile: InterestProfile, articles: list[Article]
+) -> None:
+    """ジョブ完了まで状態確認を繰り返すことを確認."""
+    local_runner = LocalBatchJobRunner(tmp_path, invoke=_invoke)
+    runner = MagicMock(wraps=local_runner)
+    statuses = iter(["Submitted", "InProgress"])
+    runner.get_status.side_effect = lambda job_id: next(statuses, None) or (
+        local_runner.get_status(job_id)
+    )
+    judge = _judge(runner, interest_profile)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await judge.judge_batch(articles)
+
+    assert mock_sleep.await_count == 2
+    assert len(result.judgments) == 3
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_uses_realtime_below_min_batch_size(
+    interest_profile: InterestProfile, articles: list[Article]
+) -> None:
+    """件数がmin_batch_size未満の場合、ジョブを投入せずリアルタイム判定を使うことを確認."""
+    runner = MagicMock()
+    judge = _judge(runner, interest_profile, min_batch_size=100)
+    realtime_result = JudgmentBatchResult(judgments=[], failed_count=0)
+
+    with patch(
+        "src.services.llm_judge.LlmJudge.judge_batch",
+        new_callable=AsyncMock,
+        return_value=realtime_result,
+    ) as mock_realtime:
+        result = await judge.judge_batch(articles)
+
+    assert result is realtime_result
+    mock_realtime.assert_awaited_once()
+    runner.submit.assert_not_called()
@@ -0,0 +1,171 @@
+"""BedrockRegionPoolサービスのユニットテスト."""
+
+from collections import Counter
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.services.bedrock_region_pool import BedrockRegion, BedrockRegionPool, parse_region_pool
+
+
+class _Clock:
+    """テスト用の時計."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(region: str) -> MagicMock:
+    """呼び出されたリージョンとモデルIDを返すクライアントを生成する."""
+    client = MagicMock()
+    client.invoke_model.side_effect = lambda **kwargs: {"region": region, **kwargs}
+    return client
+
+
+def _throttling() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "InvokeModel"
+    )
+
+
+def _pool(
+    regions: list[BedrockRegion], clients: dict[str, MagicMock], clock: _Clock
+) -> BedrockRegionPool:
+    return BedrockRegionPool([(region, clients[region.region]) for region in regions], clock=clock)
+
+
+def test_parse_region_pool() -> None:
+    """リージョン・地域プレフィックス・重みを解析できることを確認."""
+    regions = parse_region_pool("ap-northeast-1=apac:2, us-east-1=us,eu-west-1")
+
+    assert regions == [
+        BedrockRegion(region="ap-northeast-1", weight=2, profile_prefix="apac"),
+        BedrockRegion(region="us-east-1", weight=1, profile_prefix="us"),
+        BedrockRegion(region="eu-west-1", weight=1, profile_prefix=""),
+    ]
+    assert parse_region_pool("") == []
+
+
+@pytest.mark.parametrize(
+    ("spec", "message"),
+    [
+        ("ap-northeast-1:0", "Region weight must be positive"),
+        ("ap-northeast-1:x", "invalid literal for int"),
+        ("us-east-1,us-east-1", "Duplicate region"),
+    ],
+)
+def test_parse_region_pool_rejects_invalid_spec(spec: str, message: str) -> None:
+    """不正な重み・重複したリージョンはValueErrorとなることを確認."""
+    with pytest.raises(ValueError, match=message):
+        parse_region_pool(spec)
+
+
+@pytest.mark.parametrize(
+    ("model_id", "expected"),
+    [
+        ("anthropic.claude-haiku-4-5-20251001-v1:0", "us.anthropic.claude-haiku-4-5-20251001-v1:0"),
+        ("apac.anthropic.claude-haiku-4-5-20251001-v1:0", "us.anthropic.claude-haiku-4-5-20251001-v1:0"),
+        ("arn:aws:bedrock:ap-northeast-1:123:inference-profile/x", "arn:aws:bedrock:ap-northeast-1:123:inference-profile/x"),
+    ],
+)
+def test_model_identifier_rewrites_profile_prefix(model_id: str, expected: str) -> None:
+    """モデルIDの地域プレフィックスをリージョンのものに置き換えることを確認."""
+    assert BedrockRegion(region="us-east-1", profile_prefix="us").model_identifier(model_id) == expected
+
+
+def test_distributes_requests_by_weight() -> None:
+    """重みに比例してリクエストを振り分けることを確認."""
+    regions = [BedrockRegion("ap-northeast-1", weight=3), BedrockRegion("us-east-1", weight=1)]
+    clients = {region.region: _client(region.region) for region in regions}
+    pool = _pool(regions, clients, _Clock())
+
+    counts = Counter(pool.invoke_model(modelId="m", body="{}")["region"] for _ in range(8))
+
+    assert counts == {"ap-northeast-1": 6, "us-east-1": 2}
+
+
+def test_rewrites_model_id_per_region() -> None:
+    """振り分け先リージョンの推論プロファイルIDで呼び出すことを確認."""
+    regions = [BedrockRegion("us-east-1", profile_prefix="us")]
+    clients = {"us-east-1": _client("us-east-1")}
+    pool = _pool(regions, clients, _Clock())
+
+    response = pool.invoke_model(modelId="apac.anthropic.claude-3-haiku", body="{}")
+
+    assert response["modelId"] == "us.anthropic.claude-3-haiku"
+
+
+def test_spills_over_to_other_region_on_throttling() -> None:
+    """スロットリングされたリージョンを除外し、同じリクエストを他リージョンへ振り替えることを確認."""
+    clock = _Clock()
+    regions = [BedrockRegion("ap-northeast-1", weight=2), BedrockRegion("us-east-1")]
+    clients = {region.region: _client(region.region) for region in regions}
+    clients["ap-northeast-1"].invoke_model.side_effect = _throttling()
+    pool = _pool(regions, clients, clock)
+
+    responses = [pool.invoke_model(modelId="m", body="{}") for _ in range(3)]
+
+    assert [response["region"] for response in responses] == ["us-east-1"] * 3
+    # 除外期間中は呼び出さない
+    assert clients["ap-northeast-1"].invoke_model.call_count == 1
+
+    # 除外期間の経過後は再び振り分ける
+    clients["ap-northeast-1"].invoke_model.side_effect = lambda **kwargs: {"region": "ap-northeast-1"}
+    clock.now = BedrockRegionPool.BASE_COOLDOWN_SECONDS
+    regions_after = {pool.invoke_model(modelId="m", body="{}")["region"] for _ in range(3)}
+    assert "ap-northeast-1" in regions_after
+
+
+def test_raises_when_all_regions_throttled() -> None:
+    """全リージョンでスロットリングされた場合は呼び出し側のリトライに委ねることを確認."""
+    clock = _Clock()
+    regions = [BedrockRegion("ap-northeast-1"), BedrockRegion("us-east-1")]
+    clients = {region.region: MagicMock() for region in regions}
+    for client in clients.values():
+        client.invoke_model.side_effect = _throttling()
+    pool = _pool(regions, clients, clock)
+
+    with pytest.raises(ClientError):
+        pool.invoke_model(modelId="m", body="{}")
+    assert all(client.invoke_model.call_count == 1 for client in clients.values())
+
+    # 全リージョンが除外中でも、除外期限が最も早いリージョンで呼び出す
+    with pytest.raises(ClientError):
+        pool.invoke_model(modelId="m", body="{}")
+    assert sum(client.invoke_model.call_count for client in clients.values()) == 3
+
+
+def test_cooldown_grows_with_consecutive_throttling() -> None:
+    """連続したスロットリングほど除外時間が延びることを確認."""
+    clock = _Clock()
+    regions = [BedrockRegion("ap-northeast-1")]
+    throttled: list[Any] = []
+    client = MagicMock()
+    client.invoke_model.side_effect = _throttling()
+    pool = _pool(regions, {"ap-northeast-1": client}, clock)
+
+    for _ in range(3):
+        with pytest.raises(ClientError):
+            pool.invoke_model(modelId="m", body="{}")
+        throttled.append(pool._states[0].throttled_until - clock.now)
+
+    assert throttled == [2.0, 4.0, 8.0]
+
+
+def test_does_not_spill_over_non_retryable_error() -> None:
+    """リトライ対象外のエラーは他リージョンへ振り替えずに送出することを確認."""
+    regions = [BedrockRegion("ap-northeast-1"), BedrockRegion("us-east-1")]
+    clients = {region.region: _client(region.region) for region in regions}
+    clients["ap-northeast-1"].invoke_model.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "InvokeModel"
+    )
+    pool = _pool(regions, clients, _Clock())
+
+    with pytest.raises(ClientError):
+        pool.invoke_model(modelId="m", body="{}")
+    clients["us-east-1"].invoke_model.assert_not_called()
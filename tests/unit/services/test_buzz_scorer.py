@@ -120,7 +120,7 @@ class TestBuzzScorer:
             collected_at=datetime.now(timezone.utc),
         )
 
-        score = buzz_scorer._calculate_interest_score(article)
+        score = buzz_scorer._relevance_scorer.score(article)
 
         assert score == 100.0
 
@@ -136,7 +136,7 @@ class TestBuzzScorer:
             collected_at=datetime.now(timezone.utc),
         )
 
-        score = buzz_scorer._calculate_interest_score(article)
+        score = buzz_scorer._relevance_scorer.score(article)
 
         assert score == 80.0
 
@@ -152,7 +152,7 @@ class TestBuzzScorer:
             collected_at=datetime.now(timezone.utc),
         )
 
-        score = buzz_scorer._calculate_interest_score(article)
+        score = buzz_scorer._relevance_scorer.score(article)
 
         assert score == 55.0
 
@@ -168,7 +168,7 @@ class TestBuzzScorer:
             collected_at=datetime.now(timezone.utc),
         )
 
-        score = buzz_scorer._calculate_interest_score(article)
+        score = buzz_scorer._relevance_scorer.score(article)
 
         assert score == 30.0
 
@@ -184,7 +184,7 @@ class TestBuzzScorer:
             collected_at=datetime.now(timezone.utc),
         )
 
-        score = buzz_scorer._calculate_interest_score(article)
+        score = buzz_scorer._relevance_scorer.score(article)
 
         assert score == 0.0
 
@@ -200,31 +200,10 @@ class TestBuzzScorer:
             collected_at=datetime.now(timezone.utc),
         )
 
-        score = buzz_scorer._calculate_interest_score(article)
+        score = buzz_scorer._relevance_scorer.score(article)
 
         assert score == 15.0
 
-    def test_match_topic_main_keyword(self, buzz_scorer: BuzzScorer) -> None:
-        """_match_topic: メインキーワードが一致する場合."""
-        topic = "Kubernetes（コンテナ、オーケストレーション）"
-        text = "kubernetesでデプロイする"
-
-        assert buzz_scorer._match_topic(topic, text) is True
-
-    def test_match_topic_sub_keyword(self, buzz_scorer: BuzzScorer) -> None:
-        """_match_topic: サブキーワードが一致する場合."""
-        topic = "AI/ML（大規模言語モデル、機械学習基盤）"
-        text = "大規模言語モデルの最新動向"
-
-        assert buzz_scorer._match_topic(topic, text) is True
-
-    def test_match_topic_no_match(self, buzz_scorer: BuzzScorer) -> None:
-        """_match_topic: 一致しない場合."""
-        topic = "Kubernetes（コンテナ、オーケストレーション）"
-        text = "全く無関係な内容"
-
-        assert buzz_scorer._match_topic(topic, text) is False
-
     def test_calculate_authority_score_official(self, buzz_scorer: BuzzScorer) -> None:
         """Authorityスコア: OFFICIALの場合は100点."""
         score = buzz_scorer._calculate_authority_score("Test Official")
@@ -4,9 +4,54 @@ from datetime import datetime, timezone
 
 from src.models.article import Article
 from src.models.buzz_score import BuzzScore
+from src.models.judgment import BuzzLabel, InterestLabel, JudgmentResult
 from src.services.candidate_selector import CandidateSelector
 
 
+def _article(index: int) -> Article:
+    """テスト用の記事を生成する."""
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    url = f"https://example.com/{index}"
+    return Article(
+        url=url,
+        title=f"Article {index}",
+        published_at=now,
+        source_name="Example",
+        description="",
+        normalized_url=url,
+        collected_at=now,
+    )
+
+
+def _score(url: str, total_score: float) -> BuzzScore:
+    """テスト用のBuzzスコアを生成する."""
+    return BuzzScore(
+        url=url,
+        social_proof_score=0.0,
+        interest_score=0.0,
+        authority_score=0.0,
+        social_proof_count=0,
+        total_score=total_score,
+    )
+
+
+def _judgment(url: str) -> JudgmentResult:
+    """テスト用のキャッシュ済み判定結果を生成する."""
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    return JudgmentResult(
+        url=url,
+        title="Cached",
+        description="",
+        interest_label=InterestLabel.THINK,
+        buzz_label=BuzzLabel.MID,
+        confidence=0.8,
+        summary="Cached summary",
+        model_id="model",
+        judged_at=now,
+        published_at=now,
+    )
+
+
 class TestCandidateSelector:
     """CandidateSelectorクラスのテスト."""
 
@@ -14,3 +59,58 @@ class TestCandidateSelector:
         """デフォルトのmax_candidatesが100であることを確認."""
         selector = CandidateSelector()
         assert selector._max_candidates == 100
+
+    def test_selects_top_candidates_by_score(self) -> None:
+        """Buzzスコア上位max_candidates件が選定されることを確認."""
+        articles = [_article(i) for i in range(5)]
+        scores = {
+            a.normalized_url: _score(a.normalized_url, float(i)) for i, a in enumerate(articles)
+        }
+
+        result = CandidateSelector(max_candidates=2).select(articles, scores)
+
+        assert [a.url for a in result.candidates] == [articles[4].url, articles[3].url]
+        assert result.cached_judgments == []
+        assert result.budget_utilization == 1.0
+
+    def test_cached_articles_do_not_consume_budget(self) -> None:
+        """キャッシュ済み記事がLLM判定枠を消費せず、判定結果が引き継がれることを確認."""
+        articles = [_article(i) for i in range(5)]
+        scores = {
+            a.normalized_url: _score(a.normalized_url, float(i)) for i, a in enumerate(articles)
+        }
+        cached = {articles[4].url: _judgment(articles[4].url)}
+
+        result = CandidateSelector(max_candidates=2).select(articles, scores, cached)
+
+        # 最上位の記事はキャッシュ済みのため、次点の未判定記事2件で枠を埋める
+        assert [a.url for a in result.candidates] == [articles[3].url, articles[2].url]
+        assert result.cached_judgments == [cached[articles[4].url]]
+        assert result.budget_utilization == 1.0
+
+    def test_notified_cached_judgment_is_not_selected_again(self) -> None:
+        """通知済みのキャッシュ済み判定結果は最終選定に引き継がず、LLM判定候補にもしないことを確認."""
+        articles = [_article(i) for i in range(3)]
+        scores = {
+            a.normalized_url: _score(a.normalized_url, float(i)) for i, a in enumerate(articles)
+        }
+        notified = _judgment(articles[2].url)
+        notified.notified_at = datetime(2026, 2, 13, 0, 0, 0, tzinfo=timezone.utc)
+        cached = {articles[2].url: notified, articles[1].url: _judgment(articles[1].url)}
+
+        result = CandidateSelector(max_candidates=2).select(articles, scores, cached)
+
+        assert [a.url for a in result.candidates] == [articles[0].url]
+        assert result.cached_judgments == [cached[articles[1].url]]
+
+    def test_budget_utilization_when_few_unjudged(self) -> None:
+        """未判定記事が枠より少ない場合の利用率を確認."""
+        articles = [_article(i) for i in range(3)]
+        scores = {a.normalized_url: _score(a.normalized_url, 1.0) for a in articles}
+        cached = {articles[0].url: _judgment(articles[0].url)}
+
+        result = CandidateSelector(max_candidates=4).select(articles, scores, cached)
+
+        assert len(result.candidates) == 2
+        assert len(result.cached_judgments) == 1
+        assert result.budget_utilization == 0.5
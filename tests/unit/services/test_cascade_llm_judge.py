@@ -0,0 +1,231 @@
+"""CascadeLlmJudgeサービスのユニットテスト."""
+
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.models.article import Article
+from src.models.interest_profile import InterestProfile, JudgmentCriterion
+from src.models.judgment import InterestLabel
+from src.services.cascade_llm_judge import CascadeLlmJudge
+from src.services.llm_judge import LlmJudge
+
+PRIMARY_MODEL_ID = "claude-3-haiku"
+ESCALATION_MODEL_ID = "claude-haiku-4-5"
+
+
+@pytest.fixture
+def interest_profile() -> InterestProfile:
+    """テスト用のInterestProfile."""
+    criteria = {
+        label.lower(): JudgmentCriterion(label=label, description=label, examples=[])
+        for label in ("ACT_NOW", "THINK", "FYI", "IGNORE")
+    }
+    return InterestProfile(
+        summary="テスト用プロファイル",
+        max_interest=[],
+        high_interest=["AI/ML"],
+        medium_interest=[],
+        low_interest=[],
+        ignore_interest=[],
+        criteria=criteria,
+    )
+
+
+def _article(index: int) -> Article:
+    """テスト用の記事を生成する."""
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    return Article(
+        url=f"https://example.com/{index}",
+        title=f"記事{index}",
+        description=f"概要{index}",
+        source_name="テストソース",
+        published_at=now,
+        normalized_url=f"https://example.com/{index}",
+        collected_at=now,
+    )
+
+
+def _bedrock_client(outputs: dict[str, tuple[str, float] | None]) -> MagicMock:
+    """記事タイトルごとの (ラベル, confidence) を返すBedrockクライアントを生成する.
+
+    値がNoneの記事はJSON以外を返す（判定失敗）.
+    """
+
+    def invoke_model(**kwargs: Any) -> dict[str, Any]:
+        prompt = json.loads(kwargs["body"])["messages"][0]["content"]
+        title = next(title for title in outputs if f"タイトル: {title}\n" in prompt)
+        output = outputs[title]
+        text = (
+            "not json"
+            if output is None
+            else json.dumps({"interest_label": output[0], "confidence": output[1], "summary": "要約"})
+        )
+        response_body = {
+            "content": [{"type": "text", "text": text}],
+            "usage": {"input_tokens": 900, "output_tokens": 100},
+        }
+        return {"body": io.BytesIO(json.dumps(response_body).encode())}
+
+    client = MagicMock()
+    client.invoke_model.side_effect = invoke_model
+    return client
+
+
+def _cascade(
+    interest_profile: InterestProfile, primary_client: MagicMock, escalation_client: MagicMock
+) -> CascadeLlmJudge:
+    primary_judge = LlmJudge(
+        bedrock_client=primary_client,
+        cache_repository=None,
+        interest_profile=interest_profile,
+        model_id=PRIMARY_MODEL_ID,
+        max_retries=0,
+    )
+    return CascadeLlmJudge(
+        primary_judge=primary_judge,
+        bedrock_client=escalation_client,
+        cache_repository=None,
+        interest_profile=interest_profile,
+        model_id=ESCALATION_MODEL_ID,
+        max_retries=0,
+        min_confidence=0.6,
+        borderline_confidence=0.8,
+    )
+
+
+@pytest.mark.asyncio
+async def test_escalates_only_uncertain_judgments(interest_profile: InterestProfile) -> None:
+    """低confidence・境界ラベルの記事のみ上位モデルで再判定することを確認."""
+    primary_client = _bedrock_client(
+        {
+            "記事0": ("ACT_NOW", 0.95),  # 確信度が高い → 採用
+            "記事1": ("IGNORE", 0.4),  # 確信度が低い → 再判定
+            "記事2": ("THINK", 0.7),  # 境界ラベル → 再判定
+            "記事3": ("FYI", 0.9),  # 境界ラベルだが確信度が高い → 採用
+        }
+    )
+    escalation_client = _bedrock_client({"記事1": ("FYI", 0.8), "記事2": ("ACT_NOW", 0.9)})
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(i) for i in range(4)])
+
+    labels = {j.url: (j.interest_label, j.model_id) for j in result.judgments}
+    assert labels == {
+        "https://example.com/0": (InterestLabel.ACT_NOW, PRIMARY_MODEL_ID),
+        "https://example.com/1": (InterestLabel.FYI, ESCALATION_MODEL_ID),
+        "https://example.com/2": (InterestLabel.ACT_NOW, ESCALATION_MODEL_ID),
+        "https://example.com/3": (InterestLabel.FYI, PRIMARY_MODEL_ID),
+    }
+    assert primary_client.invoke_model.call_count == 4
+    assert escalation_client.invoke_model.call_count == 2
+    assert result.escalated_count == 2
+    assert result.failed_count == 0
+
+
+@pytest.mark.asyncio
+async def test_merges_usage_per_model(interest_profile: InterestProfile) -> None:
+    """一次判定・再判定の利用量がモデルIDごとに1つの台帳へ合算されることを確認."""
+    primary_client = _bedrock_client({"記事0": ("ACT_NOW", 0.95), "記事1": ("THINK", 0.5)})
+    escalation_client = _bedrock_client({"記事1": ("THINK", 0.9)})
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(0), _article(1)])
+
+    assert [call.model_id for call in result.usage.calls].count(PRIMARY_MODEL_ID) == 2
+    assert [call.model_id for call in result.usage.calls].count(ESCALATION_MODEL_ID) == 1
+    assert result.usage.total_input_tokens == 2700
+
+
+@pytest.mark.asyncio
+async def test_primary_failure_is_recovered_by_escalation(
+    interest_profile: InterestProfile,
+) -> None:
+    """一次判定に失敗した記事は上位モデルの判定結果で置き換えられることを確認."""
+    primary_client = _bedrock_client({"記事0": None})
+    escalation_client = _bedrock_client({"記事0": ("THINK", 0.85)})
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(0)])
+
+    assert result.judgments[0].interest_label == InterestLabel.THINK
+    assert result.failed_count == 0
+    assert result.failed_urls == set()
+
+
+@pytest.mark.asyncio
+async def test_escalation_failure_keeps_primary_judgment(
+    interest_profile: InterestProfile,
+) -> None:
+    """再判定に失敗した記事は一次判定の結果を採用することを確認."""
+    primary_client = _bedrock_client({"記事0": ("THINK", 0.7)})
+    escalation_client = _bedrock_client({"記事0": None})
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(0)])
+
+    judgment = result.judgments[0]
+    assert judgment.interest_label == InterestLabel.THINK
+    assert judgment.model_id == PRIMARY_MODEL_ID
+    assert result.failed_count == 0
+    assert result.escalated_count == 1
+
+
+@pytest.mark.asyncio
+async def test_no_escalation_when_all_confident(interest_profile: InterestProfile) -> None:
+    """全件の確信度が高い場合は上位モデルを呼び出さないことを確認."""
+    primary_client = _bedrock_client({"記事0": ("IGNORE", 0.9), "記事1": ("ACT_NOW", 0.9)})
+    escalation_client = _bedrock_client({})
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(0), _article(1)])
+
+    escalation_client.invoke_model.assert_not_called()
+    assert result.escalated_count == 0
+    assert len(result.judgments) == 2
+
+
+@pytest.mark.asyncio
+async def test_primary_fatal_error_judges_all_with_escalation_model(
+    interest_profile: InterestProfile,
+) -> None:
+    """一次判定モデルで致命的エラーが発生した場合は全件を上位モデルで判定することを確認."""
+    primary_client = MagicMock()
+    primary_client.invoke_model.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "InvokeModel"
+    )
+    escalation_client = _bedrock_client({"記事0": ("IGNORE", 0.9), "記事1": ("THINK", 0.5)})
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(0), _article(1)])
+
+    assert {j.model_id for j in result.judgments} == {ESCALATION_MODEL_ID}
+    assert escalation_client.invoke_model.call_count == 2
+    assert result.failed_count == 0
+
+
+@pytest.mark.asyncio
+async def test_escalation_fatal_error_keeps_primary_judgments(
+    interest_profile: InterestProfile,
+) -> None:
+    """上位モデルで致命的エラーが発生した場合は一次判定の結果をすべて採用することを確認."""
+    primary_client = _bedrock_client({"記事0": ("ACT_NOW", 0.95), "記事1": ("THINK", 0.5)})
+    escalation_client = MagicMock()
+    escalation_client.invoke_model.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "InvokeModel"
+    )
+    judge = _cascade(interest_profile, primary_client, escalation_client)
+
+    result = await judge.judge_batch([_article(0), _article(1)])
+
+    assert [(j.interest_label, j.model_id) for j in result.judgments] == [
+        (InterestLabel.ACT_NOW, PRIMARY_MODEL_ID),
+        (InterestLabel.THINK, PRIMARY_MODEL_ID),
+    ]
+    assert result.failed_count == 0
+    assert result.escalated_count == 1
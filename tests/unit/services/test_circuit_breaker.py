@@ -0,0 +1,136 @@
+"""CircuitBreakerのユニットテスト."""
+
+from src.services.social_proof.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+
+
+class FakeClock:
+    """テスト用の手動時計."""
+
+    def __init__(self) -> None:
+        """時計を0秒で初期化する."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+def create_breaker(clock: FakeClock) -> CircuitBreaker:
+    """テスト用のサーキットブレーカーを作成する."""
+    return CircuitBreaker(
+        "example.com",
+        window_size=4,
+        min_requests=4,
+        failure_rate_threshold=0.5,
+        cooldown_seconds=60.0,
+        clock=clock,
+    )
+
+
+class TestCircuitBreaker:
+    """CircuitBreakerクラスのテスト."""
+
+    def test_stays_closed_below_min_requests(self) -> None:
+        """最小リクエスト数に満たない間はOPENにならない."""
+        breaker = create_breaker(FakeClock())
+
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_opens_when_failure_rate_exceeds_threshold(self) -> None:
+        """失敗率が閾値以上になるとOPENへ遷移しリクエストを遮断する."""
+        breaker = create_breaker(FakeClock())
+
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_half_open_after_cooldown_allows_single_probe(self) -> None:
+        """クールダウン経過後はHALF_OPENとなり試行リクエストを1件だけ通す."""
+        clock = FakeClock()
+        breaker = create_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+
+        clock.now = 61.0
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+    def test_half_open_success_closes_circuit(self) -> None:
+        """HALF_OPENの試行が成功するとCLOSEDへ戻る."""
+        clock = FakeClock()
+        breaker = create_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 61.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.failure_rate == 0.0
+
+    def test_half_open_failure_reopens_circuit(self) -> None:
+        """HALF_OPENの試行が失敗すると再びOPENとなりクールダウンが再開する."""
+        clock = FakeClock()
+        breaker = create_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 61.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 100.0
+        assert breaker.allow_request() is False
+
+    def test_release_probe_allows_next_probe(self) -> None:
+        """結果を記録せずに解放した試行の後は、次の試行リクエストを通す."""
+        clock = FakeClock()
+        breaker = create_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 61.0
+        assert breaker.allow_request() is True
+
+        breaker.release_probe()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+
+class TestCircuitBreakerRegistry:
+    """CircuitBreakerRegistryクラスのテスト."""
+
+    def test_get_returns_same_breaker_per_domain(self) -> None:
+        """同一ドメインには同じブレーカーを返す."""
+        registry = CircuitBreakerRegistry()
+
+        assert registry.get("zenn.dev") is registry.get("zenn.dev")
+        assert registry.get("zenn.dev") is not registry.get("qiita.com")
+
+    def test_is_open_and_snapshot(self) -> None:
+        """OPEN判定と状態スナップショットを返す."""
+        registry = CircuitBreakerRegistry(min_requests=1, clock=FakeClock())
+        registry.get("qiita.com").record_success()
+        registry.get("zenn.dev").record_failure()
+
+        assert registry.is_open("zenn.dev") is True
+        assert registry.is_open("qiita.com") is False
+        assert registry.is_open("unknown.example.com") is False
+        assert registry.snapshot() == {"qiita.com": "closed", "zenn.dev": "open"}
@@ -6,6 +6,7 @@ from unittest.mock import Mock
 import pytest
 
 from src.models.article import Article
+from src.models.judgment import BuzzLabel, InterestLabel, JudgmentResult
 from src.repositories.cache_repository import CacheRepository
 from src.services.deduplicator import Deduplicator, DeduplicationResult
 
@@ -45,6 +46,23 @@ def sample_articles() -> list[Article]:
     ]
 
 
+def _judgment(url: str) -> JudgmentResult:
+    """テスト用のキャッシュ済み判定結果を生成する."""
+    now = datetime.now(timezone.utc)
+    return JudgmentResult(
+        url=url,
+        title="Cached",
+        description="Cached description",
+        interest_label=InterestLabel.THINK,
+        buzz_label=BuzzLabel.MID,
+        confidence=0.8,
+        summary="Cached summary",
+        model_id="model",
+        judged_at=now,
+        published_at=now,
+    )
+
+
 @pytest.fixture
 def mock_cache_repository() -> Mock:
     """モックのキャッシュリポジトリを生成する."""
@@ -59,7 +77,7 @@ class TestDeduplicator:
     ) -> None:
         """URL重複排除が正しく動作する."""
         # キャッシュはすべてヒットしない
-        mock_cache_repository.batch_exists.return_value = {}
+        mock_cache_repository.batch_get_for_articles.return_value = {}
 
         deduplicator = Deduplicator(mock_cache_repository)
         result = deduplicator.deduplicate(sample_articles)
@@ -78,9 +96,8 @@ class TestDeduplicator:
     ) -> None:
         """キャッシュ済み記事が除外される."""
         # article1がキャッシュヒット
-        mock_cache_repository.batch_exists.return_value = {
-            "https://example.com/article1": True,
-            "https://example.com/article2": False,
+        mock_cache_repository.batch_get_for_articles.return_value = {
+            "https://example.com/article1": _judgment("https://example.com/article1"),
         }
 
         deduplicator = Deduplicator(mock_cache_repository)
@@ -92,6 +109,10 @@ class TestDeduplicator:
         assert result.cached_count == 1  # キャッシュヒット
         assert result.unique_articles[0].url == "https://example.com/article2"
 
+        # キャッシュ済み記事と判定結果は最終選定への引き継ぎ用に保持される
+        assert [a.url for a in result.cached_articles] == ["https://example.com/article1"]
+        assert list(result.cached_judgments) == ["https://example.com/article1"]
+
     def test_deduplicate_with_no_cache_repository(
         self, sample_articles: list[Article]
     ) -> None:
@@ -106,7 +127,7 @@ class TestDeduplicator:
 
     def test_deduplicate_empty_list(self, mock_cache_repository: Mock) -> None:
         """空のリストを渡した場合、空の結果を返す."""
-        mock_cache_repository.batch_exists.return_value = {}
+        mock_cache_repository.batch_get_for_articles.return_value = {}
 
         deduplicator = Deduplicator(mock_cache_repository)
         result = deduplicator.deduplicate([])
@@ -120,9 +141,9 @@ class TestDeduplicator:
     ) -> None:
         """すべての記事がキャッシュ済みの場合、空のリストを返す."""
         # すべてキャッシュヒット
-        mock_cache_repository.batch_exists.return_value = {
-            "https://example.com/article1": True,
-            "https://example.com/article2": True,
+        mock_cache_repository.batch_get_for_articles.return_value = {
+            "https://example.com/article1": _judgment("https://example.com/article1"),
+            "https://example.com/article2": _judgment("https://example.com/article2"),
         }
 
         deduplicator = Deduplicator(mock_cache_repository)
@@ -132,19 +153,19 @@ class TestDeduplicator:
         assert result.duplicate_count == 1  # URL重複
         assert result.cached_count == 2  # すべてキャッシュヒット
 
-    def test_deduplicate_calls_batch_exists(
+    def test_deduplicate_calls_batch_get_for_articles(
         self, sample_articles: list[Article], mock_cache_repository: Mock
     ) -> None:
-        """batch_existsが正しいURLリストで呼ばれる."""
-        mock_cache_repository.batch_exists.return_value = {}
+        """batch_get_for_articlesが重複排除後の記事リストで呼ばれる."""
+        mock_cache_repository.batch_get_for_articles.return_value = {}
 
         deduplicator = Deduplicator(mock_cache_repository)
         deduplicator.deduplicate(sample_articles)
 
-        # URL重複排除後の2件のURLでbatch_existsが呼ばれる
-        mock_cache_repository.batch_exists.assert_called_once()
-        called_urls = mock_cache_repository.batch_exists.call_args[0][0]
-        assert set(called_urls) == {
+        # URL重複排除後の2件の記事でbatch_get_for_articlesが呼ばれる
+        mock_cache_repository.batch_get_for_articles.assert_called_once()
+        called_articles = mock_cache_repository.batch_get_for_articles.call_args[0][0]
+        assert {article.url for article in called_articles} == {
             "https://example.com/article1",
             "https://example.com/article2",
         }
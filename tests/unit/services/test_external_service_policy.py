@@ -6,7 +6,9 @@ import time
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
+from src.services.social_proof.circuit_breaker import CircuitBreakerRegistry
 from src.services.social_proof.external_service_policy import ExternalServicePolicy
+from src.shared.exceptions.external_service_error import CircuitOpenError
 
 
 class TestExternalServicePolicy:
@@ -31,7 +33,7 @@ class TestExternalServicePolicy:
         # リクエストの開始時刻を記録
         start_times = []
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             start_times.append(time.time())
             await asyncio.sleep(0.1)  # 100ms待機
             mock_response = MagicMock()
@@ -71,7 +73,7 @@ class TestExternalServicePolicy:
         # リクエストの開始時刻を記録
         start_times = []
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             start_times.append(time.time())
             await asyncio.sleep(0.1)  # 100ms待機
             mock_response = MagicMock()
@@ -104,7 +106,7 @@ class TestExternalServicePolicy:
 
         request_times = []
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             request_times.append(time.time())
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -149,7 +151,7 @@ class TestExternalServicePolicy:
         call_count = 0
         retry_times = []
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             nonlocal call_count
             retry_times.append(time.time())
             call_count += 1
@@ -194,7 +196,7 @@ class TestExternalServicePolicy:
 
         call_count = 0
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             nonlocal call_count
             call_count += 1
 
@@ -232,7 +234,7 @@ class TestExternalServicePolicy:
 
         call_count = 0
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             nonlocal call_count
             call_count += 1
 
@@ -264,7 +266,7 @@ class TestExternalServicePolicy:
 
         call_count = 0
 
-        async def mock_request(url: str, timeout: int):
+        async def mock_request(url: str, **kwargs):
             nonlocal call_count
             call_count += 1
 
@@ -285,3 +287,110 @@ class TestExternalServicePolicy:
 
         # 初回 + 2回リトライ = 3回実行される
         assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_short_circuits_requests(self):
+        """失敗が続くとサーキットがOPENになり、以降はリクエストせず即座に失敗する."""
+        registry = CircuitBreakerRegistry(min_requests=2, cooldown_seconds=60.0)
+        policy = ExternalServicePolicy(
+            retry_delays=[0.0, 0.0, 0.0],
+            jitter_range=(0.0, 0.0),  # jitterを無効化
+            circuit_breakers=registry,
+        )
+
+        call_count = 0
+
+        async def mock_request(url: str, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            mock_response = MagicMock()
+            mock_response.status_code = 503
+            raise httpx.HTTPStatusError(
+                "Service Unavailable",
+                request=MagicMock(),
+                response=mock_response
+            )
+
+        mock_client = AsyncMock()
+        mock_client.get = mock_request
+
+        # 2回失敗した時点でOPENとなり、残りのリトライは打ち切られる
+        with pytest.raises(CircuitOpenError):
+            await policy.fetch_with_policy("https://example.com/a", mock_client)
+        assert call_count == 2
+        assert policy.is_circuit_open("https://example.com/b") is True
+
+        # OPEN中はHTTPリクエストを送信しない
+        with pytest.raises(CircuitOpenError):
+            await policy.fetch_with_policy("https://example.com/b", mock_client)
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_circuit_ignores_non_retryable_4xx(self):
+        """429以外の4xxはサービス稼働中とみなし、サーキットを開かない."""
+        registry = CircuitBreakerRegistry(min_requests=1)
+        policy = ExternalServicePolicy(
+            retry_delays=[],
+            jitter_range=(0.0, 0.0),  # jitterを無効化
+            circuit_breakers=registry,
+        )
+
+        async def mock_request(url: str, **kwargs):
+            mock_response = MagicMock()
+            mock_response.status_code = 404
+            raise httpx.HTTPStatusError(
+                "Not Found",
+                request=MagicMock(),
+                response=mock_response
+            )
+
+        mock_client = AsyncMock()
+        mock_client.get = mock_request
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await policy.fetch_with_policy("https://example.com", mock_client)
+
+        assert registry.is_open("example.com") is False
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_half_open_circuit(self):
+        """試行リクエストがキャンセルされても、次のリクエストで再び試行できる."""
+        clock = [0.0]
+        registry = CircuitBreakerRegistry(
+            min_requests=1, cooldown_seconds=60.0, clock=lambda: clock[0]
+        )
+        policy = ExternalServicePolicy(
+            retry_delays=[],
+            jitter_range=(0.0, 0.0),  # jitterを無効化
+            circuit_breakers=registry,
+        )
+        registry.get("example.com").record_failure()
+        clock[0] = 61.0
+
+        started = asyncio.Event()
+
+        async def hanging_request(url: str, **kwargs):
+            started.set()
+            await asyncio.sleep(10)
+
+        hanging_client = AsyncMock()
+        hanging_client.get = hanging_request
+        probe = asyncio.create_task(
+            policy.fetch_with_policy("https://example.com/a", hanging_client)
+        )
+        await started.wait()
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        async def ok_request(url: str, **kwargs):
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.raise_for_status = MagicMock()
+            return mock_response
+
+        ok_client = AsyncMock()
+        ok_client.get = ok_request
+        await policy.fetch_with_policy("https://example.com/b", ok_client)
+
+        assert registry.snapshot() == {"example.com": "closed"}
@@ -0,0 +1,114 @@
+"""フィードストリーミング解析のユニットテスト."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.services.feed_stream_parser import FeedStreamParser, read_feed_entries
+from src.shared.exceptions.collection_error import FeedStreamParseError
+from src.shared.utils.date_utils import struct_time_to_datetime
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Test Feed</title>
+    <item>
+      <title>Article 1</title>
+      <link>https://example.com/article1</link>
+      <guid>article-1</guid>
+      <description><![CDATA[<p>Article 1 description</p>]]></description>
+      <pubDate>Mon, 10 Feb 2025 11:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Article 2</title>
+      <link>https://example.com/article2</link>
+      <content:encoded><![CDATA[<p>Article 2 body</p>]]></content:encoded>
+      <pubDate>Mon, 10 Feb 2025 10:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Test Atom Feed</title>
+  <entry>
+    <title>Atom Article</title>
+    <link rel="self" href="https://example.com/atom1.xml"/>
+    <link rel="alternate" href="https://example.com/atom1"/>
+    <id>tag:example.com,2025:atom1</id>
+    <summary>Atom description</summary>
+    <updated>2025-02-10T10:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+async def _chunks(data: bytes, size: int = 16) -> AsyncIterator[bytes]:
+    """バイト列を小さなチャンクに分割して返す."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.mark.asyncio
+async def test_parses_rss_entries_across_chunks() -> None:
+    """チャンク境界をまたぐRSSエントリを解析できることを確認."""
+    result = await read_feed_entries(_chunks(RSS_FEED))
+
+    assert [entry.link for entry in result.entries] == [
+        "https://example.com/article1",
+        "https://example.com/article2",
+    ]
+    first, second = result.entries
+    assert first.id == "article-1"
+    assert first.summary == "<p>Article 1 description</p>"
+    assert second.content == [{"value": "<p>Article 2 body</p>"}]
+    assert first.published_parsed is not None
+    assert struct_time_to_datetime(first.published_parsed).hour == 11
+    assert result.bytes_read == len(RSS_FEED)
+    assert not result.stopped_early
+
+
+@pytest.mark.asyncio
+async def test_parses_atom_entry() -> None:
+    """Atomエントリのalternateリンク・ID・更新日時を解析できることを確認."""
+    result = await read_feed_entries(_chunks(ATOM_FEED))
+
+    entry = result.entries[0]
+    assert entry.link == "https://example.com/atom1"
+    assert entry.id == "tag:example.com,2025:atom1"
+    assert entry.summary == "Atom description"
+    assert entry.updated_parsed is not None
+
+
+@pytest.mark.asyncio
+async def test_stops_at_max_entries() -> None:
+    """max_entries件に達した時点で読み込みを打ち切ることを確認."""
+    result = await read_feed_entries(_chunks(RSS_FEED), max_entries=1)
+
+    assert [entry.title for entry in result.entries] == ["Article 1"]
+    assert result.stopped_early
+    assert result.bytes_read < len(RSS_FEED)
+
+
+@pytest.mark.asyncio
+async def test_stops_before_matching_entry() -> None:
+    """should_stopがTrueを返すエントリの手前で打ち切ることを確認."""
+    result = await read_feed_entries(
+        _chunks(RSS_FEED), should_stop=lambda entry: entry.title == "Article 2"
+    )
+
+    assert [entry.title for entry in result.entries] == ["Article 1"]
+    assert result.stopped_early
+
+
+def test_raises_on_malformed_xml() -> None:
+    """不正なXMLの場合にFeedStreamParseErrorを送出することを確認."""
+    parser = FeedStreamParser()
+    with pytest.raises(FeedStreamParseError, match="Malformed"):
+        parser.feed(b"<rss><channel><item><title>&nbsp;</title></item>")
+
+
+def test_raises_on_non_feed_document() -> None:
+    """RSS/Atom以外の文書の場合にFeedStreamParseErrorを送出することを確認."""
+    parser = FeedStreamParser()
+    with pytest.raises(FeedStreamParseError, match="Not an RSS/Atom feed"):
+        parser.feed(b"<html><body>Not found</body></html>")
@@ -0,0 +1,107 @@
+"""InterestRelevanceScorerサービスのユニットテスト."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.models.article import Article
+from src.models.interest_profile import InterestProfile
+from src.services.interest_relevance import (
+    InterestRelevanceScorer,
+    extract_topic_keywords,
+    hashed_features,
+)
+
+
+@pytest.fixture
+def scorer() -> InterestRelevanceScorer:
+    """テスト用の関連度スコア計算サービス."""
+    profile = InterestProfile(
+        summary="テスト用プロファイル",
+        max_interest=["Claude Code"],
+        high_interest=["AI/ML（大規模言語モデル、機械学習基盤）", "Kubernetes（コンテナ、オーケストレーション）"],
+        medium_interest=["PostgreSQL"],
+        low_interest=["React"],
+        ignore_interest=["Ruby"],
+        criteria={},
+    )
+    return InterestRelevanceScorer(profile)
+
+
+def _article(title: str, description: str = "") -> Article:
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    return Article(
+        url="https://example.com/article",
+        title=title,
+        description=description,
+        source_name="Test",
+        published_at=now,
+        normalized_url="https://example.com/article",
+        collected_at=now,
+    )
+
+
+def test_extract_topic_keywords() -> None:
+    """括弧外のメインキーワードと括弧内のサブキーワードを抽出する."""
+    assert extract_topic_keywords("AI/ML（大規模言語モデル、機械学習基盤）") == [
+        "AI/ML",
+        "大規模言語モデル",
+        "機械学習基盤",
+    ]
+    assert extract_topic_keywords("Kubernetes (container, orchestration)") == [
+        "Kubernetes",
+        "container",
+        "orchestration",
+    ]
+
+
+def test_hashed_features_normalizes_text() -> None:
+    """全角半角・大文字小文字・複数形の違いは同じ特徴量になる."""
+    assert hashed_features("ＬＬＭｓ") == hashed_features("llm")
+    assert hashed_features("機械学習") == hashed_features("機械学習")
+    assert len(hashed_features("機械学習")) == 3  # 文字bigram
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("kubernetesでデプロイする", 80.0),  # メインキーワード
+        ("大規模言語モデルの最新動向", 80.0),  # サブキーワード
+        ("全く無関係な内容", 15.0),
+        ("Rubyの新機能", 0.0),
+    ],
+)
+def test_full_keyword_match_scores_tier(
+    scorer: InterestRelevanceScorer, title: str, expected: float
+) -> None:
+    """キーワードをすべて含む場合は関心レベルのスコアとなる."""
+    assert scorer.score(_article(title)) == expected
+
+
+def test_does_not_match_inside_other_words(scorer: InterestRelevanceScorer) -> None:
+    """英単語の一部（"ai" を含む "email" 等）には一致しない."""
+    assert scorer.score(_article("Email tips", "Maintain your mailbox")) == 15.0
+
+
+def test_partial_match_scores_between_default_and_tier(scorer: InterestRelevanceScorer) -> None:
+    """キーワードの一部を含む場合は被覆率に応じた中間のスコアとなる."""
+    # "機械学習基盤" の bigram 5件のうち "機械学習" は3件を含む（被覆率0.6）
+    score = scorer.score(_article("機械学習の入門"))
+
+    assert score == pytest.approx(15.0 + (80.0 - 15.0) * 0.6)
+
+
+def test_multiple_matches_rank_higher(scorer: InterestRelevanceScorer) -> None:
+    """複数の関心トピックに一致する記事ほど高いスコアとなる."""
+    single = scorer.score(_article("Kubernetes運用"))
+    multiple = scorer.score(_article("Kubernetes上のPostgreSQLとReact"))
+
+    assert single == 80.0
+    assert multiple == 80.0 + InterestRelevanceScorer.MULTI_MATCH_BONUS * 2
+
+
+def test_score_batch_preserves_order(scorer: InterestRelevanceScorer) -> None:
+    """一括計算の結果は記事と同じ順序となる."""
+    articles = [_article("Claude Codeの新機能"), _article("Rubyの新機能"), _article("React 19")]
+
+    assert scorer.score_batch(articles) == [100.0, 0.0, 30.0]
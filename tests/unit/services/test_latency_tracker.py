@@ -0,0 +1,134 @@
+"""LatencyTrackerのユニットテスト."""
+
+import pytest
+
+from src.models.source_config import FeedType, Priority, SourceConfig
+from src.models.source_latency import SourceLatency
+from src.services.latency_tracker import LatencyTracker
+
+
+def _source(priority: Priority = Priority.HIGH, timeout_seconds: int = 20) -> SourceConfig:
+    """テスト用の収集元設定を返す."""
+    return SourceConfig(
+        source_id="test_source",
+        name="Test Source",
+        feed_url="https://example.com/rss",
+        feed_type=FeedType.RSS,
+        priority=priority,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def _tracker_with(samples: list[float]) -> LatencyTracker:
+    """サンプルを記録済みのLatencyTrackerを返す."""
+    tracker = LatencyTracker()
+    for sample in samples:
+        tracker.record("test_source", sample)
+    return tracker
+
+
+def test_percentiles() -> None:
+    """p50/p95がnearest-rank法で計算されることを確認."""
+    tracker = _tracker_with([float(i) for i in range(1, 21)])
+
+    latency = tracker.get_latency("test_source")
+
+    assert latency is not None
+    assert latency.p50_seconds == 10.0
+    assert latency.p95_seconds == 19.0
+    assert latency.sample_count == 20
+
+
+def test_uses_configured_timeout_without_enough_samples() -> None:
+    """サンプル不足の場合は設定値のタイムアウトを使い、ヘッジしないことを確認."""
+    tracker = _tracker_with([0.1, 0.1])
+
+    assert tracker.timeout_for(_source()) == 20.0
+    assert tracker.hedge_delay_for(_source()) is None
+
+
+@pytest.mark.parametrize(
+    ("samples", "expected"),
+    [
+        ([2.0, 2.0, 2.0], 6.0),  # p95 × 3
+        ([0.1, 0.1, 0.1], 3.0),  # 下限
+        ([10.0, 10.0, 10.0], 20.0),  # 設定値が上限
+    ],
+)
+def test_timeout_derived_from_p95(samples: list[float], expected: float) -> None:
+    """タイムアウトがp95から導出され、下限と設定値の間に収まることを確認."""
+    tracker = _tracker_with(samples)
+
+    assert tracker.timeout_for(_source()) == expected
+
+
+def test_hedges_only_high_priority_sources() -> None:
+    """高優先度ソースのみp95経過後にヘッジすることを確認."""
+    tracker = _tracker_with([1.0, 1.5, 2.0])
+
+    assert tracker.hedge_delay_for(_source(Priority.HIGH)) == 2.0
+    assert tracker.hedge_delay_for(_source(Priority.MEDIUM)) is None
+
+
+def test_window_keeps_recent_samples() -> None:
+    """保持するサンプル数がウィンドウサイズに制限されることを確認."""
+    tracker = LatencyTracker(window_size=3)
+    for sample in [9.0, 9.0, 9.0, 1.0, 1.0, 1.0]:
+        tracker.record("test_source", sample)
+
+    latency = tracker.get_latency("test_source")
+
+    assert latency is not None
+    assert latency.p95_seconds == 1.0
+
+
+def test_snapshot_includes_sources_without_enough_samples() -> None:
+    """実行をまたいで蓄積できるよう、サンプル不足のソースも統計に含めることを確認."""
+    tracker = _tracker_with([0.4])
+
+    assert tracker.get_latency("test_source") is None
+    assert tracker.snapshot() == [
+        SourceLatency(source_id="test_source", p50_seconds=0.4, p95_seconds=0.4, sample_count=1)
+    ]
+
+
+@pytest.mark.parametrize("sample_count", [1, 2, 3, 20])
+def test_seed_restores_previous_statistics(sample_count: int) -> None:
+    """前回実行の統計から、同じ p50/p95 となるサンプルが復元されることを確認."""
+    previous = SourceLatency(
+        source_id="test_source", p50_seconds=0.5, p95_seconds=2.0, sample_count=sample_count
+    )
+    tracker = LatencyTracker()
+
+    tracker.seed([previous])
+
+    (restored,) = tracker.snapshot()
+    assert restored.sample_count == sample_count
+    assert restored.p50_seconds == 0.5
+    assert restored.p95_seconds == (0.5 if sample_count == 1 else 2.0)
+
+
+def test_seeded_samples_accumulate_across_runs() -> None:
+    """1回に1サンプルの実行でも、seed を介して数回でタイムアウトを導出できることを確認."""
+    latencies: list[SourceLatency] = []
+    for _ in range(LatencyTracker.MIN_SAMPLES):
+        tracker = LatencyTracker()  # コールドスタート
+        tracker.seed(latencies)
+        tracker.record("test_source", 2.0)
+        latencies = tracker.snapshot()
+
+    assert tracker.timeout_for(_source()) == 6.0
+
+
+def test_seed_keeps_existing_samples() -> None:
+    """サンプルのあるソース（ウォーム起動）は seed で上書きしないことを確認."""
+    tracker = _tracker_with([1.0, 1.0, 1.0])
+
+    tracker.seed(
+        [SourceLatency(source_id="test_source", p50_seconds=9.0, p95_seconds=9.0, sample_count=10)]
+    )
+
+    latency = tracker.get_latency("test_source")
+    assert latency is not None
+    assert latency.p95_seconds == 1.0
+    assert latency.sample_count == 3
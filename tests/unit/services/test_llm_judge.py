@@ -1,5 +1,6 @@
 """LlmJudgeサービスのユニットテスト."""
 
+import asyncio
 import json
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
@@ -7,7 +8,8 @@ from botocore.exceptions import ClientError
 
 from src.models.article import Article
 from src.models.interest_profile import InterestProfile, JudgmentCriterion
-from src.services.llm_judge import LlmJudge
+from src.services.llm_judge import LlmJudge, judgment_cache_version
+from src.shared.exceptions.llm_error import LlmFatalError
 
 
 @pytest.fixture
@@ -131,6 +133,19 @@ def test_build_prompt_structure(
     assert "JSON形式で以下のキーを含めて出力してください:" in prompt
 
 
+def test_judgment_cache_version_changes_with_interest_profile(
+    mock_interest_profile: InterestProfile,
+) -> None:
+    """関心プロファイルが変わると判定キャッシュのバージョンが変わる."""
+    from dataclasses import replace
+
+    version = judgment_cache_version(mock_interest_profile)
+    changed = replace(mock_interest_profile, high_interest=["AI/ML"])
+
+    assert judgment_cache_version(mock_interest_profile) == version
+    assert judgment_cache_version(changed) != version
+
+
 def test_llm_judge_initialization_with_interest_profile(
     mock_interest_profile: InterestProfile,
 ) -> None:
@@ -383,7 +398,7 @@ async def test_judge_single_retries_on_service_unavailable_exception(
 async def test_judge_single_does_not_retry_on_validation_exception(
     mock_interest_profile: InterestProfile, sample_article: Article
 ) -> None:
-    """ValidationException はリトライされないことを確認."""
+    """ValidationException はリトライされず致命的エラーとなることを確認."""
     # Arrange
     mock_bedrock = MagicMock()
 
@@ -402,10 +417,11 @@ async def test_judge_single_does_not_retry_on_validation_exception(
     )
 
     # Act & Assert
-    with pytest.raises(ClientError) as exc_info:
+    with pytest.raises(LlmFatalError) as exc_info:
         await llm_judge._judge_single(sample_article)
 
-    assert exc_info.value.response['Error']['Code'] == 'ValidationException'
+    assert isinstance(exc_info.value.__cause__, ClientError)
+    assert exc_info.value.__cause__.response['Error']['Code'] == 'ValidationException'
     # リトライされないので、1回のみ実行
     assert mock_bedrock.invoke_model.call_count == 1
 
@@ -841,3 +857,573 @@ async def test_judge_batch_applies_staggered_start(
         )
 
     assert len(result.judgments) == 3
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_skips_unfinished_articles_when_budget_exceeded(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """時間予算を超えた判定はキャンセルされ、判定結果に含めずskipped_countに計上する."""
+    # Arrange
+    from dataclasses import replace
+
+    slow_article = replace(sample_article, url="https://example.com/slow")
+    llm_judge = LlmJudge(
+        bedrock_client=MagicMock(),
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        max_retries=0,
+    )
+
+    async def fake_judge_single(article: Article):
+        if article.url == slow_article.url:
+            await asyncio.sleep(10)
+        return llm_judge._create_fallback_judgment(article)
+
+    # Act
+    with patch.object(llm_judge, "_judge_single", side_effect=fake_judge_single):
+        result = await llm_judge.judge_batch([sample_article, slow_article], budget_seconds=0.2)
+
+    # Assert
+    assert [j.url for j in result.judgments] == [sample_article.url]
+    assert result.failed_count == 0
+    assert result.skipped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_judge_batch_returns_usage_ledger(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """judge_batch が課金対象の呼び出しとリトライ回数を利用量台帳に記録することを確認."""
+    # Arrange
+    def make_response(text: str, usage: dict) -> dict:
+        return {
+            "body": MagicMock(
+                read=MagicMock(
+                    return_value=json.dumps({"content": [{"text": text}], "usage": usage}).encode()
+                )
+            )
+        }
+
+    valid_text = json.dumps(
+        {"interest_label": "FYI", "confidence": 0.7, "summary": "test", "tags": []}
+    )
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.side_effect = [
+        ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+            "InvokeModel",
+        ),
+        make_response("not json", {"input_tokens": 100, "output_tokens": 10}),
+        make_response(
+            valid_text,
+            {"input_tokens": 20, "output_tokens": 30, "cache_read_input_tokens": 80},
+        ),
+    ]
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="anthropic.claude-haiku-4-5-20251001-v1:0",
+        max_retries=2,
+    )
+
+    # Act
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        result = await llm_judge.judge_batch([sample_article])
+
+    # Assert - スロットリングで失敗した呼び出しは課金されないため記録しない
+    usage = result.usage
+    assert [call.attempt for call in usage.calls] == [1, 2]
+    assert usage.retry_count == 2
+    assert usage.total_input_tokens == 120
+    assert usage.total_output_tokens == 40
+    assert usage.total_cache_read_input_tokens == 80
+    assert usage.calls[0].model_id == "anthropic.claude-haiku-4-5-20251001-v1:0"
+
+
+class _FakeEventStream:
+    """invoke_model_with_response_stream の応答ボディ（EventStream）の代替."""
+
+    def __init__(self, payloads: list[dict]) -> None:
+        self._events = [{"chunk": {"bytes": json.dumps(p).encode()}} for p in payloads]
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for event in self._events:
+            self.consumed += 1
+            yield event
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _stream_payloads(text_parts: list[str], output_tokens: int, stop_reason: str) -> list[dict]:
+    """Anthropic Messages API のストリーミングイベントを生成する."""
+    return [
+        {"type": "message_start", "message": {"usage": {"input_tokens": 900, "output_tokens": 1}}},
+        *[{"type": "content_block_delta", "delta": {"type": "text_delta", "text": t}} for t in text_parts],
+        {"type": "message_delta", "delta": {"stop_reason": stop_reason}, "usage": {"output_tokens": output_tokens}},
+        {"type": "message_stop"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_closes_stream_once_json_is_complete(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """ストリーミング判定でJSONが閉じた時点で受信を打ち切ることを確認."""
+    # Arrange
+    text_parts = ['```json\n{"interest_label": "THINK", ', '"confidence": 0.8, "summary": "a}b"', "}\n```", " trailing"]
+    stream = _FakeEventStream(_stream_payloads(text_parts, output_tokens=50, stop_reason="end_turn"))
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model_with_response_stream.return_value = {"body": stream}
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        streaming=True,
+    )
+
+    # Act
+    result = await llm_judge.judge_batch([sample_article])
+
+    # Assert - message_start + 3つ目のテキスト断片で打ち切る
+    judgment = result.judgments[0]
+    assert judgment.interest_label.value == "THINK"
+    assert judgment.summary == "a}b"
+    assert stream.closed
+    assert stream.consumed == 4
+    mock_bedrock.invoke_model.assert_not_called()
+    assert result.usage.total_input_tokens == 900
+    assert result.usage.total_output_tokens == 3  # 受信したテキスト断片数で近似
+    assert result.usage.calls[0].output_tokens_estimated
+
+
+@pytest.mark.asyncio
+async def test_streaming_early_stop_records_json_length_in_budget(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """ストリームを途中で閉じた場合、受信したJSONの長さから見積もった出力トークン数を上限の推定に記録することを確認."""
+    from src.services.output_token_budget import OutputTokenBudget
+
+    # Arrange
+    early_closed = _FakeEventStream(
+        _stream_payloads(
+            ['{"interest_label": "FYI", "confidence": 0.7, "summary": "s"}', " trailing"],
+            output_tokens=30,
+            stop_reason="end_turn",
+        )
+    )
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model_with_response_stream.return_value = {"body": early_closed}
+    budget = OutputTokenBudget()
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        streaming=True,
+        output_token_budget=budget,
+    )
+
+    # Act
+    result = await llm_judge.judge_batch([sample_article])
+
+    # Assert - 台帳には受信したテキスト断片数の近似値、上限の推定にはJSONの長さからの見積もりを記録する
+    assert result.failed_count == 0
+    assert early_closed.closed
+    assert result.usage.calls[0].output_tokens == 1
+    assert result.usage.calls[0].output_tokens_estimated
+    assert list(budget._samples) == [20]  # 60バイト / 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_retries_when_json_is_incomplete(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """ストリームがJSONの途中で終わった場合はリトライすることを確認."""
+    # Arrange
+    truncated = _FakeEventStream(
+        _stream_payloads(['{"interest_label": "FYI", "conf'], output_tokens=10, stop_reason="max_tokens")
+    )
+    complete = _FakeEventStream(
+        _stream_payloads(
+            ['{"interest_label": "FYI", "confidence": 0.7, "summary": "s"}'],
+            output_tokens=30,
+            stop_reason="end_turn",
+        )
+    )
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model_with_response_stream.side_effect = [
+        {"body": truncated},
+        {"body": complete},
+    ]
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        max_retries=1,
+        streaming=True,
+    )
+
+    # Act
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        result = await llm_judge.judge_batch([sample_article])
+
+    # Assert
+    assert result.failed_count == 0
+    assert result.judgments[0].interest_label.value == "FYI"
+    assert truncated.closed
+    assert result.usage.total_output_tokens == 11  # 打ち切られた出力(10) + 近似(1)
+
+
+@pytest.mark.asyncio
+async def test_streaming_retries_lowercase_throttling_error(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """ストリーミング応答の throttlingException もリトライ対象であることを確認."""
+    # Arrange
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model_with_response_stream.side_effect = [
+        ClientError(
+            {"Error": {"Code": "throttlingException", "Message": "Too many requests"}},
+            "InvokeModelWithResponseStream",
+        ),
+        {
+            "body": _FakeEventStream(
+                _stream_payloads(
+                    ['{"interest_label": "FYI", "confidence": 0.7, "summary": "s"}'],
+                    output_tokens=30,
+                    stop_reason="end_turn",
+                )
+            )
+        },
+    ]
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        max_retries=1,
+        streaming=True,
+    )
+
+    # Act
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        result = await llm_judge.judge_batch([sample_article])
+
+    # Assert
+    assert result.failed_count == 0
+    assert mock_bedrock.invoke_model_with_response_stream.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_output_token_budget_sets_max_tokens_and_resets_on_retry(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """推定した max_tokens で呼び出し、リトライ時は固定の上限に戻すことを確認."""
+    from src.services.output_token_budget import OutputTokenBudget
+
+    # Arrange
+    budget = OutputTokenBudget()
+    for _ in range(OutputTokenBudget.MIN_SAMPLES):
+        budget.record(200)
+
+    def make_response(text: str, stop_reason: str) -> dict:
+        body = {"content": [{"text": text}], "usage": {"output_tokens": 300}, "stop_reason": stop_reason}
+        return {"body": MagicMock(read=MagicMock(return_value=json.dumps(body).encode()))}
+
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.side_effect = [
+        make_response('{"interest_label": "FYI", "conf', "max_tokens"),
+        make_response('{"interest_label": "FYI", "confidence": 0.7, "summary": "s"}', "end_turn"),
+    ]
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        max_retries=1,
+        output_token_budget=budget,
+    )
+
+    # Act
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        await llm_judge.judge_batch([sample_article])
+
+    # Assert - 200 × 1.5 = 300 で呼び出し、リトライ時は1000に戻す
+    max_tokens = [
+        json.loads(call.kwargs["body"])["max_tokens"]
+        for call in mock_bedrock.invoke_model.call_args_list
+    ]
+    assert max_tokens == [300, 1000]
+    # 打ち切られた出力は記録せず、完了した出力（300）のみ記録する → p99 = 300 × 1.5
+    assert len(budget._samples) == OutputTokenBudget.MIN_SAMPLES + 1
+    assert budget.max_tokens() == 450
+
+
+def _invoke_response(body: dict) -> dict:
+    """invoke_model の応答を生成する."""
+    return {"body": MagicMock(read=MagicMock(return_value=json.dumps(body).encode()))}
+
+
+@pytest.mark.asyncio
+async def test_repairs_truncated_json_without_reinvocation(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """修復できる出力は再呼び出しせずに判定結果とし、修復回数を記録することを確認."""
+    # Arrange
+    text = '```json\n{"interest_label": "think", "confidence": 0.8, "summary": "途中で'
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.return_value = _invoke_response(
+        {"content": [{"type": "text", "text": text}], "usage": {"output_tokens": 10}}
+    )
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+    )
+
+    # Act
+    result = await llm_judge.judge_batch([sample_article])
+
+    # Assert
+    assert mock_bedrock.invoke_model.call_count == 1
+    assert result.judgments[0].interest_label.value == "THINK"
+    assert result.judgments[0].summary == "途中で"
+    assert result.usage.json_repair_count == 1
+    assert result.usage.json_parse_failure_count == 0
+    assert result.usage.retry_count == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_label_is_counted_as_parse_failure(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """不正なラベルは解析失敗として再呼び出しすることを確認."""
+    # Arrange
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.side_effect = [
+        _invoke_response(
+            {"content": [{"text": '{"interest_label": "MAYBE", "confidence": 0.5, "summary": "s"}'}]}
+        ),
+        _invoke_response(
+            {"content": [{"text": '{"interest_label": "FYI", "confidence": 1.5, "summary": "s"}'}]}
+        ),
+    ]
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        max_retries=1,
+    )
+
+    # Act
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        result = await llm_judge.judge_batch([sample_article])
+
+    # Assert - confidence は0.0-1.0に丸める
+    assert result.judgments[0].interest_label.value == "FYI"
+    assert result.judgments[0].confidence == 1.0
+    assert result.usage.json_parse_failure_count == 1
+    assert result.usage.retry_count == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_use_forces_schema_tool_and_reads_tool_input(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """Tool use モードで判定ツールの呼び出しを強制し、引数を判定結果とすることを確認."""
+    from src.services.llm_judge import JUDGMENT_TOOL_NAME
+
+    # Arrange
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.return_value = _invoke_response(
+        {
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": "toolu_1",
+                    "name": JUDGMENT_TOOL_NAME,
+                    "input": {
+                        "interest_label": "ACT_NOW",
+                        "confidence": 0.9,
+                        "summary": "要約",
+                        "tags": ["AWS"],
+                    },
+                }
+            ],
+            "stop_reason": "tool_use",
+            "usage": {"input_tokens": 1200, "output_tokens": 60},
+        }
+    )
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        tool_use=True,
+    )
+
+    # Act
+    result = await llm_judge.judge_batch([sample_article])
+
+    # Assert
+    body = json.loads(mock_bedrock.invoke_model.call_args.kwargs["body"])
+    assert body["tool_choice"] == {"type": "tool", "name": JUDGMENT_TOOL_NAME}
+    schema = body["tools"][0]["input_schema"]
+    assert schema["required"] == ["interest_label", "confidence", "summary"]
+    assert schema["properties"]["interest_label"]["enum"] == ["ACT_NOW", "FYI", "IGNORE", "THINK"]
+    judgment = result.judgments[0]
+    assert judgment.interest_label.value == "ACT_NOW"
+    assert judgment.tags == ["AWS"]
+
+
+@pytest.mark.asyncio
+async def test_tool_use_streaming_reads_partial_json(
+    mock_interest_profile: InterestProfile, sample_article: Article
+) -> None:
+    """Tool use のストリーミング応答（partial_json）を判定結果とすることを確認."""
+    # Arrange
+    payloads = [
+        {"type": "message_start", "message": {"usage": {"input_tokens": 900, "output_tokens": 1}}},
+        {"type": "content_block_start", "content_block": {"type": "tool_use", "input": {}}},
+        {"type": "content_block_delta", "delta": {"type": "input_json_delta", "partial_json": ""}},
+        {"type": "content_block_delta", "delta": {"type": "input_json_delta", "partial_json": '{"interest_label": "FYI", '}},
+        {"type": "content_block_delta", "delta": {"type": "input_json_delta", "partial_json": '"confidence": 0.7, "summary": "s"}'}},
+        {"type": "content_block_stop"},
+    ]
+    stream = _FakeEventStream(payloads)
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model_with_response_stream.return_value = {"body": stream}
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        streaming=True,
+        tool_use=True,
+    )
+
+    # Act
+    result = await llm_judge.judge_batch([sample_article])
+
+    # Assert
+    assert result.judgments[0].interest_label.value == "FYI"
+    assert stream.consumed == 5
+
+
+def _articles(count: int) -> list[Article]:
+    """テスト用の記事リストを生成する."""
+    from datetime import datetime, timezone
+
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    return [
+        Article(
+            url=f"https://example.com/{i}",
+            title=f"記事{i}",
+            description="",
+            source_name="テストソース",
+            published_at=now,
+            normalized_url=f"https://example.com/{i}",
+            collected_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _valid_response() -> dict:
+    return _invoke_response(
+        {"content": [{"text": '{"interest_label": "FYI", "confidence": 0.7, "summary": "s"}'}]}
+    )
+
+
+def _access_denied() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "no access"}}, "InvokeModel"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fatal_error_cancels_batch_and_raises(
+    mock_interest_profile: InterestProfile,
+) -> None:
+    """致命的エラーが発生した場合、残りの判定をキャンセルして失敗させることを確認."""
+    # Arrange
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.side_effect = _access_denied()
+
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        concurrency_limit=1,
+        request_interval=0.01,
+    )
+
+    # Act & Assert - 並列度1のため最初の1件で中断する
+    with pytest.raises(LlmFatalError):
+        await llm_judge.judge_batch(_articles(20))
+
+    assert mock_bedrock.invoke_model.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fatal_error_reroutes_remaining_articles_to_fallback(
+    mock_interest_profile: InterestProfile,
+) -> None:
+    """致命的エラー後の未判定の記事を fallback_judge に判定させることを確認."""
+    # Arrange
+    mock_bedrock = MagicMock()
+    mock_bedrock.invoke_model.side_effect = [_valid_response(), _access_denied()]
+    fallback_bedrock = MagicMock()
+    fallback_bedrock.invoke_model.side_effect = lambda **_: _valid_response()
+
+    fallback_judge = LlmJudge(
+        bedrock_client=fallback_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="fallback-model",
+    )
+    llm_judge = LlmJudge(
+        bedrock_client=mock_bedrock,
+        cache_repository=None,
+        interest_profile=mock_interest_profile,
+        model_id="test-model",
+        concurrency_limit=1,
+        request_interval=0.01,
+        fallback_judge=fallback_judge,
+    )
+    articles = _articles(5)
+
+    # Act
+    result = await llm_judge.judge_batch(articles)
+
+    # Assert - 1件目は元のモデル、失敗した2件目以降は代替モデルで判定する
+    assert mock_bedrock.invoke_model.call_count == 2
+    assert fallback_bedrock.invoke_model.call_count == 4
+    model_ids = {j.url: j.model_id for j in result.judgments}
+    assert model_ids == {
+        articles[0].url: "test-model",
+        **{article.url: "fallback-model" for article in articles[1:]},
+    }
+    assert result.failed_count == 0
+    assert len(result.usage.calls) == 5
@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
+from src.services.social_proof.circuit_breaker import CircuitBreakerRegistry
 from src.services.social_proof.multi_source_social_proof_fetcher import (
     MultiSourceSocialProofFetcher,
 )
@@ -354,3 +355,61 @@ class TestMultiSourceSocialProofFetcher:
         # score = 27.5 / 0.50 = 55.0
         assert len(result) == 1
         assert 54.5 <= result[url] <= 55.5
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_source_is_skipped(self):
+        """サーキットがOPENの情報源は呼び出さずに欠損扱いとする."""
+        registry = CircuitBreakerRegistry(min_requests=1)
+        registry.get(MultiSourceSocialProofFetcher.HATENA_DOMAIN).record_failure()
+
+        mock_yamadashy = AsyncMock()
+        mock_yamadashy.fetch_signals = AsyncMock(return_value={})
+        mock_hatena = AsyncMock()
+        mock_hatena.fetch_batch = AsyncMock(return_value={})
+        mock_zenn = AsyncMock()
+        mock_zenn.fetch_batch = AsyncMock(return_value={})
+        mock_qiita = AsyncMock()
+        mock_qiita.fetch_batch = AsyncMock(return_value={})
+
+        fetcher = MultiSourceSocialProofFetcher(
+            yamadashy_fetcher=mock_yamadashy,
+            hatena_fetcher=mock_hatena,
+            zenn_fetcher=mock_zenn,
+            qiita_fetcher=mock_qiita,
+            circuit_breakers=registry,
+        )
+
+        url = "https://example.com/article1"
+        result = await fetcher.fetch_batch([create_test_article(url)])
+
+        mock_hatena.fetch_batch.assert_not_called()
+        mock_yamadashy.fetch_signals.assert_called_once()
+        assert result[url] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open_returns_default_score(self):
+        """全情報源のサーキットがOPENの場合はリクエストせずDEFAULT_SCOREを返す."""
+        registry = CircuitBreakerRegistry(min_requests=1)
+        for domain in [
+            MultiSourceSocialProofFetcher.YAMADASHY_DOMAIN,
+            MultiSourceSocialProofFetcher.HATENA_DOMAIN,
+            MultiSourceSocialProofFetcher.ZENN_DOMAIN,
+            MultiSourceSocialProofFetcher.QIITA_DOMAIN,
+        ]:
+            registry.get(domain).record_failure()
+
+        mock_fetcher = AsyncMock()
+        fetcher = MultiSourceSocialProofFetcher(
+            yamadashy_fetcher=mock_fetcher,
+            hatena_fetcher=mock_fetcher,
+            zenn_fetcher=mock_fetcher,
+            qiita_fetcher=mock_fetcher,
+            circuit_breakers=registry,
+        )
+
+        urls = ["https://zenn.dev/a/articles/1", "https://example.com/b"]
+        result = await fetcher.fetch_batch([create_test_article(url) for url in urls])
+
+        assert result == dict.fromkeys(urls, MultiSourceSocialProofFetcher.DEFAULT_SCORE)
+        mock_fetcher.fetch_batch.assert_not_called()
+        mock_fetcher.fetch_signals.assert_not_called()
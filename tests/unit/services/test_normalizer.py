@@ -83,3 +83,16 @@ class TestNormalizer:
         result = normalizer.normalize([invalid_article])
         # 空のURLは正規化できないが、エラーハンドリングでスキップされる
         assert isinstance(result, list)
+
+    def test_normalize_updates_articles_in_place(
+        self, normalizer: Normalizer, sample_article: Article
+    ) -> None:
+        """記事をコピーせずにインプレースで正規化することを確認."""
+        result = normalizer.normalize([sample_article])
+
+        assert result[0] is sample_article
+        assert sample_article.normalized_url == "https://example.com/article"
+
+    def test_article_has_no_instance_dict(self, sample_article: Article) -> None:
+        """Articleが__slots__で定義され、インスタンス辞書を持たないことを確認."""
+        assert not hasattr(sample_article, "__dict__")
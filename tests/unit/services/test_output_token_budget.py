@@ -0,0 +1,61 @@
+"""OutputTokenBudgetサービスのユニットテスト."""
+
+from src.services.output_token_budget import OutputTokenBudget
+
+
+def test_uses_default_until_enough_samples() -> None:
+    """サンプルが不足している間は固定の上限を返すことを確認."""
+    budget = OutputTokenBudget()
+    for _ in range(OutputTokenBudget.MIN_SAMPLES - 1):
+        budget.record(100)
+
+    assert budget.max_tokens() == OutputTokenBudget.DEFAULT_MAX_TOKENS
+
+
+def test_derives_max_tokens_from_p99() -> None:
+    """p99 × P99_MULTIPLIER を max_tokens とすることを確認."""
+    budget = OutputTokenBudget()
+    for tokens in range(101, 301):
+        budget.record(tokens)
+
+    # p99 = 298 → 298 × 1.5 = 447
+    assert budget.max_tokens() == 447
+
+
+def test_max_tokens_is_clamped() -> None:
+    """max_tokens が下限・上限の間に収まることを確認."""
+    small = OutputTokenBudget()
+    large = OutputTokenBudget()
+    for _ in range(OutputTokenBudget.MIN_SAMPLES):
+        small.record(10)
+        large.record(5000)
+
+    assert small.max_tokens() == OutputTokenBudget.MIN_MAX_TOKENS
+    assert large.max_tokens() == OutputTokenBudget.DEFAULT_MAX_TOKENS
+
+
+def test_keeps_only_recent_samples() -> None:
+    """直近 window_size 件のみで推定することを確認."""
+    budget = OutputTokenBudget(window_size=OutputTokenBudget.MIN_SAMPLES)
+    for _ in range(OutputTokenBudget.MIN_SAMPLES):
+        budget.record(900)
+    for _ in range(OutputTokenBudget.MIN_SAMPLES):
+        budget.record(200)
+
+    assert budget.max_tokens() == 300
+
+
+def test_ignores_empty_outputs() -> None:
+    """出力トークン数0の呼び出しは記録しないことを確認."""
+    budget = OutputTokenBudget()
+    for _ in range(OutputTokenBudget.MIN_SAMPLES):
+        budget.record(0)
+
+    assert budget.max_tokens() == OutputTokenBudget.DEFAULT_MAX_TOKENS
+
+
+def test_estimate_output_tokens_from_utf8_length() -> None:
+    """出力テキストのUTF-8バイト長から出力トークン数を多めに見積もることを確認."""
+    assert OutputTokenBudget.estimate_output_tokens('{"a": 1}') == 3
+    assert OutputTokenBudget.estimate_output_tokens("要約") == 2
+    assert OutputTokenBudget.estimate_output_tokens("") == 0
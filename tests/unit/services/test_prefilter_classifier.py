@@ -0,0 +1,145 @@
+"""PrefilterClassifierサービスのユニットテスト."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.models.article import Article
+from src.models.buzz_score import BuzzScore
+from src.models.judgment import InterestLabel
+from src.services.prefilter_classifier import (
+    PrefilterClassifier,
+    PrefilterModel,
+    PrefilterResult,
+    tokenize,
+)
+
+# IGNORE: 求人・セール情報、非IGNORE: 技術記事
+_TRAINING_SAMPLES = [
+    ("Job opening sale discount campaign", True),
+    ("Big sale discount coupon today", True),
+    ("Hiring job opening coupon campaign", True),
+    ("Sale coupon discount hiring", True),
+    ("Python asyncio performance tuning", False),
+    ("Rust async runtime performance", False),
+    ("Python type hints and asyncio", False),
+    ("Kubernetes performance tuning guide", False),
+]
+
+
+def _article(url: str, title: str) -> Article:
+    """テスト用の記事を生成する."""
+    now = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+    return Article(
+        url=url,
+        title=title,
+        published_at=now,
+        source_name="Example",
+        description="",
+        normalized_url=url,
+        collected_at=now,
+    )
+
+
+def _score(url: str, interest_score: float) -> BuzzScore:
+    """テスト用のBuzzスコアを生成する."""
+    return BuzzScore(
+        url=url,
+        social_proof_score=0.0,
+        interest_score=interest_score,
+        authority_score=0.0,
+        social_proof_count=0,
+        total_score=0.0,
+    )
+
+
+@pytest.fixture
+def model() -> PrefilterModel:
+    """学習済みモデルのフィクスチャ."""
+    return PrefilterModel.train(_TRAINING_SAMPLES)
+
+
+def test_tokenize_splits_words_and_cjk_bigrams() -> None:
+    """英数字は単語単位、日本語は文字bigramに分割されることを確認."""
+    tokens = tokenize("Node.js と C++ 入門")
+
+    assert {"node.js", "c++"} <= tokens
+    assert "と" in tokens
+    assert "入門" in tokens
+
+
+def test_train_requires_both_classes() -> None:
+    """片方のラベルしかない場合ValueErrorが発生することを確認."""
+    with pytest.raises(ValueError, match="both IGNORE and non-IGNORE"):
+        PrefilterModel.train([("Sale discount", True), ("Sale coupon", True)])
+
+
+def test_ignore_probability_separates_classes(model: PrefilterModel) -> None:
+    """IGNOREらしい記事ほどIGNORE確率が高いことを確認."""
+    ignore_probability = model.ignore_probability("Sale discount coupon campaign")
+    keep_probability = model.ignore_probability("Python asyncio performance tuning")
+
+    assert ignore_probability > 0.9
+    assert keep_probability < 0.1
+
+
+def test_ignore_probability_of_unknown_text_is_prior(model: PrefilterModel) -> None:
+    """語彙にないテキストは事前確率になることを確認."""
+    assert model.ignore_probability("完全に未知の単語") == pytest.approx(0.5)
+
+
+def test_model_round_trip(model: PrefilterModel, tmp_path: Path) -> None:
+    """保存・読み込みでモデルが変わらないことを確認."""
+    path = tmp_path / "prefilter_model.json"
+    model.save(path)
+
+    loaded = PrefilterModel.load(path)
+
+    assert loaded == model
+    assert loaded.sample_count == len(_TRAINING_SAMPLES)
+
+
+def test_filter_ignores_confident_articles(model: PrefilterModel) -> None:
+    """IGNORE確率が閾値以上の記事のみLLM判定を省略することを確認."""
+    articles = [
+        _article("https://example.com/sale", "Sale discount coupon campaign"),
+        _article("https://example.com/python", "Python asyncio performance tuning"),
+    ]
+
+    result = PrefilterClassifier(model, threshold=0.9).filter(articles, {})
+
+    assert [a.url for a in result.llm_articles] == ["https://example.com/python"]
+    assert len(result.ignored_judgments) == 1
+    judgment = result.ignored_judgments[0]
+    assert judgment.url == "https://example.com/sale"
+    assert judgment.interest_label == InterestLabel.IGNORE
+    assert judgment.model_id == PrefilterClassifier.MODEL_ID
+    assert result.avoided_ratio == pytest.approx(0.5)
+
+
+def test_filter_sends_uncertain_articles_to_llm(model: PrefilterModel) -> None:
+    """閾値が厳しい場合はLLM判定に回すことを確認."""
+    articles = [_article("https://example.com/sale", "Sale discount coupon campaign")]
+
+    result = PrefilterClassifier(model, threshold=0.999999).filter(articles, {})
+
+    assert len(result.llm_articles) == 1
+    assert result.ignored_judgments == []
+
+
+def test_filter_never_ignores_protected_interest(model: PrefilterModel) -> None:
+    """関心スコアが高い記事はIGNORE確率に関わらずLLM判定に回すことを確認."""
+    url = "https://example.com/sale"
+    articles = [_article(url, "Sale discount coupon campaign")]
+    scores = {url: _score(url, PrefilterClassifier.PROTECTED_INTEREST_SCORE)}
+
+    result = PrefilterClassifier(model, threshold=0.5).filter(articles, scores)
+
+    assert len(result.llm_articles) == 1
+    assert result.ignored_judgments == []
+
+
+def test_avoided_ratio_of_empty_result() -> None:
+    """記事がない場合の省略率が0であることを確認."""
+    assert PrefilterResult(llm_articles=[], ignored_judgments=[]).avoided_ratio == 0.0
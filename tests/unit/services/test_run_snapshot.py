@@ -0,0 +1,250 @@
+"""実行スナップショット（記録・再生）のユニットテスト."""
+
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.models.article import Article
+from src.models.interest_profile import InterestProfile, JudgmentCriterion
+from src.services.collector import CollectionResult, Collector
+from src.services.llm_judge import LlmJudge
+from src.services.normalizer import Normalizer
+from src.services.run_snapshot import (
+    SNAPSHOT_MISS_ERROR_CODE,
+    RecordingBedrockClient,
+    RecordingCollector,
+    ReplayBedrockClient,
+    ReplayCollector,
+    ReplaySocialProofFetcher,
+    RunSnapshot,
+    llm_request_key,
+)
+
+MODEL_ID = "anthropic.claude-haiku-4-5-20251001-v1:0"
+EXECUTED_AT = datetime(2026, 2, 14, 0, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def interest_profile() -> InterestProfile:
+    """テスト用のInterestProfile."""
+    criteria = {
+        label.lower(): JudgmentCriterion(label=label, description=label, examples=[])
+        for label in ("ACT_NOW", "THINK", "FYI", "IGNORE")
+    }
+    return InterestProfile(
+        summary="テスト用プロファイル",
+        max_interest=[],
+        high_interest=["AI/ML"],
+        medium_interest=[],
+        low_interest=[],
+        ignore_interest=[],
+        criteria=criteria,
+    )
+
+
+def _article(index: int) -> Article:
+    """テスト用の記事を生成する."""
+    return Article(
+        url=f"https://example.com/{index}",
+        title=f"記事{index}",
+        description=f"概要{index}",
+        source_name="テストソース",
+        published_at=EXECUTED_AT,
+        normalized_url=f"https://example.com/{index}",
+        collected_at=EXECUTED_AT,
+    )
+
+
+def _response_body(label: str) -> bytes:
+    text = json.dumps({"interest_label": label, "confidence": 0.9, "summary": "要約"})
+    return json.dumps(
+        {
+            "content": [{"type": "text", "text": text}],
+            "usage": {"input_tokens": 900, "output_tokens": 100},
+        }
+    ).encode()
+
+
+def _request_body(prompt: str, max_tokens: int = 1024) -> str:
+    return json.dumps({"max_tokens": max_tokens, "messages": [{"role": "user", "content": prompt}]})
+
+
+def _throttling() -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "InvokeModel"
+    )
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    """保存したスナップショットを同じ内容で読み込めることを確認."""
+    snapshot = RunSnapshot(
+        run_id="run-1",
+        executed_at=EXECUTED_AT,
+        metadata={"bedrock_model_id": MODEL_ID},
+        articles=[_article(0), _article(1)],
+        social_proof_scores={"https://example.com/0": 42.5},
+        llm_responses={"key": [{"kind": "invoke", "body": "{}"}]},
+    )
+    path = tmp_path / "snapshots" / "run-1.json.gz"
+
+    snapshot.save(path)
+
+    assert RunSnapshot.load(path) == snapshot
+
+
+def test_load_rejects_unknown_format_version(tmp_path: Path) -> None:
+    """形式バージョンが異なるスナップショットはValueErrorとなることを確認."""
+    path = tmp_path / "snapshot.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"format_version": 999}, f)
+
+    with pytest.raises(ValueError, match="format version"):
+        RunSnapshot.load(path)
+
+
+def test_request_key_ignores_max_tokens() -> None:
+    """出力上限のみ異なるリクエストは同じキー、プロンプトやモデルが異なれば別キーとなることを確認."""
+    key = llm_request_key(MODEL_ID, _request_body("a", max_tokens=512))
+
+    assert key == llm_request_key(MODEL_ID, _request_body("a", max_tokens=2048))
+    assert key != llm_request_key(MODEL_ID, _request_body("b"))
+    assert key != llm_request_key("other-model", _request_body("a"))
+
+
+def test_records_and_replays_invoke_model_in_order() -> None:
+    """記録した応答・エラーを呼び出し順に再生し、記録を超えた分は最後の応答を繰り返すことを確認."""
+    snapshot = RunSnapshot(run_id="run-1", executed_at=EXECUTED_AT)
+    client = MagicMock()
+    client.invoke_model.side_effect = [
+        _throttling(),
+        {"body": io.BytesIO(_response_body("ACT_NOW"))},
+    ]
+    recording = RecordingBedrockClient(client, snapshot)
+    body = _request_body("記事0")
+
+    with pytest.raises(ClientError):
+        recording.invoke_model(modelId=MODEL_ID, body=body)
+    recorded = recording.invoke_model(modelId=MODEL_ID, body=body)
+    assert recorded["body"].read() == _response_body("ACT_NOW")
+
+    replay = ReplayBedrockClient(snapshot)
+    with pytest.raises(ClientError) as exc_info:
+        replay.invoke_model(modelId=MODEL_ID, body=body)
+    assert exc_info.value.response["Error"]["Code"] == "ThrottlingException"
+    for _ in range(2):
+        assert replay.invoke_model(modelId=MODEL_ID, body=body)["body"].read() == _response_body(
+            "ACT_NOW"
+        )
+
+
+def test_records_and_replays_stream_events() -> None:
+    """ストリーミング応答のイベントを記録・再生できることを確認."""
+    snapshot = RunSnapshot(run_id="run-1", executed_at=EXECUTED_AT)
+    events = [{"chunk": {"bytes": b'{"type":"a"}'}}, {"chunk": {"bytes": b'{"type":"b"}'}}]
+    client = MagicMock()
+    client.invoke_model_with_response_stream.return_value = {"body": iter(events)}
+    recording = RecordingBedrockClient(client, snapshot)
+    body = _request_body("記事0")
+
+    assert list(recording.invoke_model_with_response_stream(modelId=MODEL_ID, body=body)["body"]) == events
+
+    replayed = ReplayBedrockClient(snapshot).invoke_model_with_response_stream(modelId=MODEL_ID, body=body)
+    assert list(replayed["body"]) == events
+
+
+def test_replay_miss_raises_non_retryable_error() -> None:
+    """記録のないリクエストはリトライ対象外のエラーとなることを確認."""
+    replay = ReplayBedrockClient(RunSnapshot(run_id="run-1", executed_at=EXECUTED_AT))
+
+    with pytest.raises(ClientError) as exc_info:
+        replay.invoke_model(modelId=MODEL_ID, body=_request_body("記事0"))
+
+    assert exc_info.value.response["Error"]["Code"] == SNAPSHOT_MISS_ERROR_CODE
+
+
+@pytest.mark.asyncio
+async def test_replayed_judgments_match_recorded_run(interest_profile: InterestProfile) -> None:
+    """記録した判定を、Bedrockにアクセスせずに同じ結果で再実行できることを確認."""
+    labels = {"記事0": "ACT_NOW", "記事1": "IGNORE"}
+
+    def invoke_model(**kwargs: Any) -> dict[str, Any]:
+        prompt = json.loads(kwargs["body"])["messages"][0]["content"]
+        label = next(label for title, label in labels.items() if f"タイトル: {title}\n" in prompt)
+        return {"body": io.BytesIO(_response_body(label))}
+
+    client = MagicMock()
+    client.invoke_model.side_effect = invoke_model
+    snapshot = RunSnapshot(run_id="run-1", executed_at=EXECUTED_AT)
+    articles = [_article(0), _article(1)]
+
+    def judge(bedrock_client: Any) -> LlmJudge:
+        return LlmJudge(
+            bedrock_client=bedrock_client,
+            cache_repository=None,
+            interest_profile=interest_profile,
+            model_id=MODEL_ID,
+            max_retries=0,
+        )
+
+    recorded = await judge(RecordingBedrockClient(client, snapshot)).judge_batch(articles)
+    replayed = await judge(ReplayBedrockClient(snapshot)).judge_batch(articles)
+
+    assert client.invoke_model.call_count == 2
+    assert [(j.url, j.interest_label) for j in replayed.judgments] == [
+        (j.url, j.interest_label) for j in recorded.judgments
+    ]
+    assert replayed.failed_count == 0
+
+
+@pytest.mark.asyncio
+async def test_recorded_articles_are_unchanged_by_normalization() -> None:
+    """収集後の正規化（インプレース更新）が記録した記事に影響しないことを確認."""
+    collected = Article(
+        url="https://example.com/0?utm_source=feed",
+        title="  記事0  ",
+        description="概要0",
+        source_name="テストソース",
+        published_at=EXECUTED_AT,
+        normalized_url="",
+        collected_at=EXECUTED_AT,
+    )
+    snapshot = RunSnapshot(run_id="run-1", executed_at=EXECUTED_AT)
+    collector = RecordingCollector(snapshot, MagicMock())
+
+    with patch.object(
+        Collector, "collect", AsyncMock(return_value=CollectionResult(articles=[collected], errors={}))
+    ):
+        result = await collector.collect()
+    Normalizer().normalize(result.articles)
+
+    assert result.articles[0].title == "記事0"
+    assert snapshot.articles[0].title == "  記事0  "
+    assert snapshot.articles[0].normalized_url == ""
+
+
+@pytest.mark.asyncio
+async def test_replay_collector_and_social_proof_fetcher() -> None:
+    """記録した記事・SocialProofスコアを返すことを確認."""
+    snapshot = RunSnapshot(
+        run_id="run-1",
+        executed_at=EXECUTED_AT,
+        articles=[_article(0), _article(1)],
+        social_proof_scores={"https://example.com/0": 42.5},
+    )
+
+    result = await ReplayCollector(snapshot, MagicMock()).collect()
+    scores = await ReplaySocialProofFetcher(snapshot).fetch_batch(result.articles)
+
+    assert result.articles == snapshot.articles
+    # 正規化等で変更されても記録は変わらない
+    assert result.articles[0] is not snapshot.articles[0]
+    assert result.errors == {}
+    # 記録のない記事は欠損扱い
+    assert scores == {"https://example.com/0": 42.5}
@@ -5,7 +5,13 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.shared.config import AppConfig, _load_config_from_ssm, _load_config_local, load_config
+from src.shared.config import (
+    AppConfig,
+    CachedConfigLoader,
+    _load_config_from_ssm,
+    _load_config_local,
+    load_config,
+)
 
 
 def test_load_config_local_defaults() -> None:
@@ -173,6 +179,21 @@ def test_load_config_local_invalid_integer() -> None:
             _load_config_local()
 
 
+def test_load_config_local_rejects_inference_profile_arn_with_region_pool() -> None:
+    """リージョンプールとインファレンスプロファイルARNの併用でエラーが発生することを確認."""
+    env_vars = {
+        "ENVIRONMENT": "local",
+        "BEDROCK_REGION_POOL": "ap-northeast-1=apac,us-east-1=us",
+        "BEDROCK_INFERENCE_PROFILE_ARN": (
+            "arn:aws:bedrock:ap-northeast-1:123456789012:inference-profile/apac.anthropic.claude"
+        ),
+    }
+
+    with patch.dict(os.environ, env_vars, clear=False):
+        with pytest.raises(ValueError, match="BEDROCK_REGION_POOL"):
+            _load_config_local()
+
+
 def test_load_config_environment_detection() -> None:
     """環境検出が正しく動作することを確認."""
     # local 環境
@@ -277,3 +298,66 @@ FROM_EMAIL=prod-from@example.com
     with patch("src.shared.config.boto3.client", return_value=mock_ssm):
         with pytest.raises(ValueError, match="TO_EMAIL"):
             _load_config_from_ssm()
+
+
+def test_cached_config_loader_reuses_config_until_ssm_version_changes() -> None:
+    """確認間隔内はSSMを呼ばず、バージョン不変なら同一インスタンスを返すことを確認."""
+    dotenv_content = """LOG_LEVEL=INFO
+DYNAMODB_CACHE_TABLE=prod-cache
+DYNAMODB_HISTORY_TABLE=prod-history
+BEDROCK_MODEL_ID=anthropic.claude-haiku-4-5-20251001-v1:0
+BEDROCK_MAX_PARALLEL=8
+LLM_CANDIDATE_MAX=180
+FINAL_SELECT_MAX=15
+FINAL_SELECT_MAX_PER_DOMAIN=5
+SOURCES_CONFIG_PATH=config/sources.yaml
+FROM_EMAIL=prod-from@example.com
+TO_EMAIL=prod-to@example.com
+"""
+    mock_ssm = Mock()
+    mock_ssm.get_parameter.return_value = {
+        "Parameter": {"Value": dotenv_content, "Version": 3}
+    }
+    now = [0.0]
+    loader = CachedConfigLoader(check_interval_seconds=60.0, clock=lambda: now[0])
+
+    with (
+        patch("src.shared.config.boto3.client", return_value=mock_ssm),
+        patch("src.shared.config.load_dotenv"),
+        patch.dict(os.environ, {"ENVIRONMENT": "production"}, clear=False),
+    ):
+        first = loader.load()
+        now[0] = 30.0
+        within_interval = loader.load()
+        now[0] = 90.0
+        same_version = loader.load()
+
+        mock_ssm.get_parameter.return_value = {
+            "Parameter": {
+                "Value": dotenv_content.replace("LLM_CANDIDATE_MAX=180", "LLM_CANDIDATE_MAX=50"),
+                "Version": 4,
+            }
+        }
+        now[0] = 200.0
+        new_version = loader.load()
+
+    assert within_interval is first
+    assert same_version is first
+    assert mock_ssm.get_parameter.call_count == 3
+    assert new_version is not first
+    assert new_version.llm_candidate_max == 50
+
+
+def test_cached_config_loader_local_returns_same_instance_when_unchanged() -> None:
+    """ローカル環境では内容が同じ場合に同一インスタンスを返すことを確認."""
+    loader = CachedConfigLoader()
+
+    with patch.dict(os.environ, {"ENVIRONMENT": "local", "LLM_CANDIDATE_MAX": "100"}):
+        first = loader.load()
+        second = loader.load()
+    with patch.dict(os.environ, {"ENVIRONMENT": "local", "LLM_CANDIDATE_MAX": "120"}):
+        changed = loader.load()
+
+    assert second is first
+    assert changed is not first
+    assert changed.llm_candidate_max == 120
@@ -1,8 +1,16 @@
 """Bedrockコスト推定ユーティリティのテスト."""
 
+from unittest.mock import patch
+
 import pytest
 
-from src.shared.utils.bedrock_cost_estimator import estimate_bedrock_cost_usd
+from src.models.bedrock_usage import BedrockCallUsage, BedrockUsageLedger
+from src.shared.utils.bedrock_cost_estimator import (
+    DEFAULT_MODEL_PRICING,
+    calculate_bedrock_cost_usd,
+    estimate_bedrock_cost_usd,
+    get_model_pricing,
+)
 
 
 @pytest.mark.parametrize(
@@ -65,3 +73,112 @@ def test_estimate_bedrock_cost_usd_raises_for_negative_output_cost() -> None:
     """output_cost_per_millionが負の場合は ValueError になることを確認."""
     with pytest.raises(ValueError, match="output_cost_per_million"):
         estimate_bedrock_cost_usd(10, output_cost_per_million=-1.0)
+
+
+def test_calculate_bedrock_cost_usd_uses_actual_tokens_and_model_pricing() -> None:
+    """実トークン数とモデル別単価からコストを計算できることを確認."""
+    ledger = BedrockUsageLedger()
+    ledger.record(
+        BedrockCallUsage(
+            url="https://example.com/a",
+            model_id="jp.anthropic.claude-haiku-4-5-20251001-v1:0",
+            attempt=0,
+            input_tokens=1000,
+            output_tokens=200,
+            cache_read_input_tokens=5000,
+        )
+    )
+    ledger.record(
+        BedrockCallUsage(
+            url="https://example.com/b",
+            model_id="anthropic.claude-sonnet-4-5-20250929-v1:0",
+            attempt=0,
+            input_tokens=1000,
+            output_tokens=100,
+        )
+    )
+
+    cost = calculate_bedrock_cost_usd(ledger)
+
+    # Haiku 4.5: (1000*1.0 + 200*5.0 + 5000*0.1)/1M = 0.0025
+    # Sonnet 4.5: (1000*3.0 + 100*15.0)/1M = 0.0045
+    assert cost == pytest.approx(0.007, rel=1e-9)
+
+
+def test_calculate_bedrock_cost_usd_is_zero_without_calls() -> None:
+    """呼び出しがない場合（全件フォールバック等）はコスト0になることを確認."""
+    assert calculate_bedrock_cost_usd(BedrockUsageLedger()) == 0.0
+
+
+@pytest.mark.parametrize(
+    ("model_id", "expected_input_cost"),
+    [
+        ("anthropic.claude-haiku-4-5-20251001-v1:0", 1.0),
+        ("jp.anthropic.claude-haiku-4-5-20251001-v1:0", 1.0),
+        ("anthropic.claude-sonnet-4-20250514-v1:0", 3.0),
+        ("apac.anthropic.claude-3-5-haiku-20241022-v1:0", 0.8),
+        (
+            "arn:aws:bedrock:ap-northeast-1:123456789012:inference-profile/"
+            "apac.anthropic.claude-3-haiku-20240307-v1:0",
+            0.25,
+        ),
+        ("claude-haiku-4-5", 1.0),
+    ],
+)
+def test_get_model_pricing_matches_model_name(model_id: str, expected_input_cost: float) -> None:
+    """リージョン接頭辞・接尾辞を除いたモデル名で単価を引けることを確認."""
+    pricing = get_model_pricing(model_id)
+
+    assert pricing is not None
+    assert pricing.input_cost_per_million == expected_input_cost
+
+
+@pytest.mark.parametrize("model_id", ["unknown-model", "anthropic.claude-sonnet-4-6-v1:0"])
+def test_get_model_pricing_returns_none_for_unknown_model(model_id: str) -> None:
+    """単価表にないモデルは、名前の一部が一致しても単価なし（None）になることを確認."""
+    assert get_model_pricing(model_id) is None
+
+
+def test_calculate_bedrock_cost_usd_warns_for_unknown_model() -> None:
+    """単価表にないモデルはデフォルト単価で推定し、警告ログを出すことを確認."""
+    ledger = BedrockUsageLedger(
+        calls=[
+            BedrockCallUsage("u1", "unknown-model", 0, input_tokens=1000, output_tokens=200),
+            BedrockCallUsage("u2", "unknown-model", 0, input_tokens=1000, output_tokens=200),
+        ]
+    )
+
+    with patch("src.shared.utils.bedrock_cost_estimator.logger") as mock_logger:
+        cost = calculate_bedrock_cost_usd(ledger)
+
+    expected_per_call = (
+        1000 * DEFAULT_MODEL_PRICING.input_cost_per_million
+        + 200 * DEFAULT_MODEL_PRICING.output_cost_per_million
+    ) / 1_000_000
+    assert cost == pytest.approx(expected_per_call * 2, rel=1e-9)
+    mock_logger.warning.assert_called_once_with(
+        "bedrock_model_pricing_unknown", model_ids=["unknown-model"]
+    )
+
+
+def test_calculate_bedrock_cost_usd_applies_batch_inference_discount() -> None:
+    """バッチ推論経由の呼び出しに割引単価が適用されることを確認."""
+    realtime = BedrockUsageLedger(
+        calls=[BedrockCallUsage("u", "claude-haiku-4-5", 0, input_tokens=1000, output_tokens=200)]
+    )
+    batch = BedrockUsageLedger(
+        calls=[
+            BedrockCallUsage(
+                "u",
+                "claude-haiku-4-5",
+                0,
+                input_tokens=1000,
+                output_tokens=200,
+                batch_inference=True,
+            )
+        ]
+    )
+
+    assert calculate_bedrock_cost_usd(batch) == pytest.approx(
+        calculate_bedrock_cost_usd(realtime) * 0.5
+    )
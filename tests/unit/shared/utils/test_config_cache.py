@@ -0,0 +1,39 @@
+"""config_cacheのユニットテスト."""
+
+import os
+from pathlib import Path
+
+from src.shared.utils.config_cache import ConfigCache, file_version
+
+
+def test_file_version_changes_only_when_content_changes(tmp_path: Path) -> None:
+    """内容が変わった場合のみバージョンが変わることを確認."""
+    path = tmp_path / "sources.yaml"
+    path.write_text("sources: []\n", encoding="utf-8")
+    initial = file_version(path)
+
+    # touchのみ（mtime変更・内容同一）
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert file_version(path) == initial
+
+    path.write_text("sources:\n  - source_id: a\n", encoding="utf-8")
+    assert file_version(path) != initial
+
+
+def test_get_or_build_reuses_until_version_changes() -> None:
+    """同一バージョンでは再構築せず、バージョン変更時のみ再構築することを確認."""
+    cache = ConfigCache()
+    builds: list[str] = []
+
+    def build(version: str) -> object:
+        builds.append(version)
+        return object()
+
+    first = cache.get_or_build("source_master", "v1", lambda: build("v1"))
+    second = cache.get_or_build("source_master", "v1", lambda: build("v1"))
+    third = cache.get_or_build("source_master", "v2", lambda: build("v2"))
+
+    assert first is second
+    assert third is not first
+    assert builds == ["v1", "v2"]
@@ -0,0 +1,40 @@
+"""JSON修復ユーティリティのユニットテスト."""
+
+import pytest
+
+from src.shared.utils.json_repair import repair_json_object
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # オブジェクト前後の説明文・コードブロック
+        ('判定結果です:\n```json\n{"a": 1}\n```\n以上です。', {"a": 1}),
+        # 閉じ括弧直前の余分なカンマ
+        ('{"a": 1, "b": ["x", "y",],}', {"a": 1, "b": ["x", "y"]}),
+        # 文字列の途中で打ち切り
+        ('{"a": 1, "summary": "途中で切', {"a": 1, "summary": "途中で切"}),
+        # キーの途中で打ち切り（直前のカンマまでを採用）
+        ('{"a": 1, "summ', {"a": 1}),
+        # 値の直前で打ち切り
+        ('{"a": 1, "b":', {"a": 1, "b": None}),
+        # 配列の途中で打ち切り
+        ('{"a": ["x", "y"', {"a": ["x", "y"]}),
+        # エスケープ文字の直後で打ち切り
+        ('{"a": "x\\', {"a": "x"}),
+    ],
+)
+def test_repairs_common_llm_output_errors(text: str, expected: dict) -> None:
+    """LLM出力で起こりやすい崩れを修復できることを確認."""
+    assert repair_json_object(text) == expected
+
+
+def test_keeps_braces_inside_strings() -> None:
+    """文字列リテラル内の括弧・カンマを修復対象にしないことを確認."""
+    assert repair_json_object('{"a": "x,}", "b": 1,}') == {"a": "x,}", "b": 1}
+
+
+@pytest.mark.parametrize("text", ["not json", '{"a": 1]', "{: }"])
+def test_returns_none_when_unrepairable(text: str) -> None:
+    """修復できない場合Noneを返すことを確認."""
+    assert repair_json_object(text) is None
@@ -0,0 +1,51 @@
+"""JSONストリーム走査ユーティリティのユニットテスト."""
+
+import json
+
+from src.shared.utils.json_stream import JsonObjectScanner
+
+
+def test_detects_object_split_across_chunks() -> None:
+    """複数の断片にまたがるオブジェクトの終端を検出できることを確認."""
+    scanner = JsonObjectScanner()
+
+    assert scanner.feed('{"a": {"b"') is None
+    assert scanner.feed(": 1}") is None
+    assert scanner.feed(', "c": 2}') == '{"a": {"b": 1}, "c": 2}'
+
+
+def test_skips_text_around_object() -> None:
+    """オブジェクト前後のテキスト（コードブロック等）を含めないことを確認."""
+    scanner = JsonObjectScanner()
+
+    assert scanner.feed("```json\n") is None
+    assert scanner.feed('{"a": 1}\n```') == '{"a": 1}'
+
+
+def test_ignores_braces_inside_strings() -> None:
+    """文字列リテラル内の括弧・エスケープされた引用符を無視することを確認."""
+    scanner = JsonObjectScanner()
+    text = '{"summary": "a } b \\" { c", "tags": ["{x}"]}'
+
+    result = scanner.feed(text[:20])
+    assert result is None
+    result = scanner.feed(text[20:])
+
+    assert result == text
+    assert json.loads(result)["summary"] == 'a } b " { c'
+
+
+def test_returns_completed_object_after_completion() -> None:
+    """検出後に追加の断片を受け取っても結果が変わらないことを確認."""
+    scanner = JsonObjectScanner()
+    scanner.feed('{"a": 1}')
+
+    assert scanner.feed('{"b": 2}') == '{"a": 1}'
+
+
+def test_incomplete_object_returns_none() -> None:
+    """オブジェクトが閉じていない場合Noneを返すことを確認."""
+    scanner = JsonObjectScanner()
+
+    assert scanner.feed('{"a": "unterminated') is None
+    assert scanner.feed("no braces") is None
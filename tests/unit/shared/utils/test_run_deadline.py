@@ -0,0 +1,118 @@
+"""実行期限ユーティリティのユニットテスト."""
+
+import asyncio
+
+import pytest
+
+from src.shared.utils.run_deadline import RunDeadline, gather_within_budget
+
+
+class FakeClock:
+    """テスト用の手動時計."""
+
+    def __init__(self) -> None:
+        """時計を100秒で初期化する."""
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+def test_from_remaining_millis_subtracts_safety_margin() -> None:
+    """残り実行時間から安全マージンを差し引いて期限を設定する."""
+    clock = FakeClock()
+
+    deadline = RunDeadline.from_remaining_millis(
+        900_000, safety_margin_seconds=20.0, clock=clock
+    )
+
+    assert deadline.remaining_seconds() == 880.0
+    assert deadline.is_unlimited is False
+
+
+def test_remaining_seconds_never_negative() -> None:
+    """期限を過ぎても残り時間は0.0で、期限切れと判定される."""
+    clock = FakeClock()
+    deadline = RunDeadline.from_remaining_millis(10_000, safety_margin_seconds=0.0, clock=clock)
+
+    clock.now += 30.0
+
+    assert deadline.remaining_seconds() == 0.0
+    assert deadline.is_expired() is True
+
+
+def test_budget_applies_ratio_after_reserve() -> None:
+    """予約時間を差し引いた残り時間に比率を掛けた予算を返す."""
+    clock = FakeClock()
+    deadline = RunDeadline.from_remaining_millis(130_000, safety_margin_seconds=0.0, clock=clock)
+
+    assert deadline.budget(0.25, reserve_seconds=30.0) == 25.0
+    assert deadline.budget(reserve_seconds=30.0) == 100.0
+    assert deadline.budget(reserve_seconds=200.0) == 0.0
+
+
+def test_unlimited_deadline_has_no_budget() -> None:
+    """無期限の場合は予算なし（None）を返す."""
+    deadline = RunDeadline.unlimited()
+
+    assert deadline.is_unlimited is True
+    assert deadline.is_expired() is False
+    assert deadline.budget(0.5, reserve_seconds=30.0) is None
+
+
+async def _sleep_then_return(seconds: float, value: str) -> str:
+    """指定秒数待ってから値を返す."""
+    await asyncio.sleep(seconds)
+    return value
+
+
+async def _raise(error: BaseException) -> str:
+    """例外を送出する."""
+    raise error
+
+
+@pytest.mark.asyncio
+async def test_gather_within_budget_cancels_unfinished_tasks() -> None:
+    """予算切れで未完了のタスクをキャンセルし、完了済みの結果・例外はタスク順に返す."""
+    error = ValueError("failed")
+    tasks = [
+        asyncio.create_task(_sleep_then_return(0.0, "fast")),
+        asyncio.create_task(_sleep_then_return(10.0, "slow")),
+        asyncio.create_task(_raise(error)),
+    ]
+
+    gathered = await gather_within_budget(tasks, budget_seconds=0.05)
+
+    assert gathered.outcomes[0] == "fast"
+    assert isinstance(gathered.outcomes[1], asyncio.CancelledError)
+    assert gathered.outcomes[2] is error
+    assert gathered.cancelled_count == 1
+    assert gathered.stop_error is None
+    assert tasks[1].cancelled() is True
+
+
+@pytest.mark.asyncio
+async def test_gather_within_budget_stops_on_exception_type() -> None:
+    """stop_on の例外が発生した時点で待機を打ち切り、残りのタスクをキャンセルする."""
+    error = RuntimeError("fatal")
+    tasks = [
+        asyncio.create_task(_raise(error)),
+        asyncio.create_task(_sleep_then_return(10.0, "slow")),
+    ]
+
+    gathered = await gather_within_budget(tasks, budget_seconds=None, stop_on=RuntimeError)
+
+    assert gathered.outcomes[0] is error
+    assert isinstance(gathered.outcomes[1], asyncio.CancelledError)
+    assert gathered.cancelled_count == 1
+    assert gathered.stop_error is error
+
+
+@pytest.mark.asyncio
+async def test_gather_within_budget_without_tasks() -> None:
+    """タスクがない場合は空の結果を返す."""
+    gathered = await gather_within_budget([], budget_seconds=0.0)
+
+    assert gathered.outcomes == []
+    assert gathered.cancelled_count == 0
@@ -0,0 +1,72 @@
+"""stage_profilerのユニットテスト."""
+
+from unittest.mock import Mock
+
+from src.shared.utils.stage_profiler import (
+    StageProfiler,
+    record_bedrock_tokens,
+    record_http_response,
+    stage_span,
+)
+
+
+class TestStageProfiler:
+    """StageProfilerクラスのテスト."""
+
+    def test_span_records_nested_stages_in_start_order(self) -> None:
+        """ネストしたスパンは親ステップ名で修飾され、開始順に記録される."""
+        profiler = StageProfiler()
+
+        with profiler.span("step1_collect"):
+            with profiler.span("collect"):
+                pass
+            with profiler.span("normalize"):
+                pass
+        with profiler.span("step2_deduplicate"):
+            pass
+
+        assert [stage.name for stage in profiler.stages] == [
+            "step1_collect",
+            "step1_collect.collect",
+            "step1_collect.normalize",
+            "step2_deduplicate",
+        ]
+        assert all(stage.wall_seconds >= 0.0 for stage in profiler.stages)
+
+    def test_http_and_tokens_are_added_to_all_active_spans(self) -> None:
+        """HTTPレスポンスとトークン数は計測中の全スパンに加算される."""
+        profiler = StageProfiler()
+        response = Mock()
+        response.content = b"x" * 100
+
+        with profiler.span("step3_buzz_score"):
+            with stage_span("social_proof"):
+                record_http_response(response)
+                record_bedrock_tokens(10, 5)
+            record_http_response(response)
+
+        parent, child = profiler.stages
+        assert child.name == "step3_buzz_score.social_proof"
+        assert (child.http_request_count, child.http_bytes) == (1, 100)
+        assert (parent.http_request_count, parent.http_bytes) == (2, 200)
+        assert (parent.bedrock_input_tokens, parent.bedrock_output_tokens) == (10, 5)
+
+    def test_non_bytes_content_counts_request_only(self) -> None:
+        """ボディがbytesでない場合はリクエスト数のみ加算する."""
+        profiler = StageProfiler()
+
+        with profiler.span("step1_collect"):
+            record_http_response(Mock())
+
+        (stage,) = profiler.stages
+        assert stage.http_request_count == 1
+        assert stage.http_bytes == 0
+
+
+def test_helpers_are_noop_without_profiler() -> None:
+    """プロファイラ外ではサブ区間計測・記録は何もしない."""
+    with stage_span("social_proof") as metrics:
+        record_http_response(Mock(content=b"abc"))
+        record_bedrock_tokens(1, 1)
+
+    assert metrics is None
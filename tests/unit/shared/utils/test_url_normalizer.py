@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.shared.utils.url_normalizer import normalize_url
+from src.shared.utils.url_normalizer import normalize_url, normalize_urls
 
 
 class TestNormalizeUrl:
@@ -75,3 +75,48 @@ class TestNormalizeUrl:
         # しかし、コードパスをカバーするために追加
         with pytest.raises(ValueError, match="URLが空です"):
             normalize_url(None)  # type: ignore
+
+    def test_preserves_all_values_of_repeated_parameters(self) -> None:
+        """同じキーのパラメータが複数ある場合、全ての値が保持されることを確認."""
+        url = "https://example.com/search?tag=python&tag=aws&utm_source=rss"
+        result = normalize_url(url)
+        assert result == "https://example.com/search?tag=python&tag=aws"
+
+    def test_distinct_query_values_are_not_conflated(self) -> None:
+        """値のみ異なるURLが別のURLとして正規化されることを確認."""
+        first = normalize_url("https://example.com/watch?v=1&v=2")
+        second = normalize_url("https://example.com/watch?v=1&v=3")
+        assert first != second
+
+    def test_preserves_query_encoding(self) -> None:
+        """クエリ値のエンコードが保持されることを確認."""
+        url = "https://example.com/search?q=a%20b%26c"
+        result = normalize_url(url)
+        assert result == "https://example.com/search?q=a%20b%26c"
+
+    def test_removes_click_id_parameters(self) -> None:
+        """fbclid等のクリックIDパラメータが除去されることを確認."""
+        url = "https://example.com/article?fbclid=abc&id=1&gclid=def"
+        result = normalize_url(url)
+        assert result == "https://example.com/article?id=1"
+
+    def test_memoizes_results(self) -> None:
+        """同じURLの正規化結果がキャッシュされることを確認."""
+        normalize_url.cache_clear()
+        normalize_url("https://example.com/cached/")
+        normalize_url("https://example.com/cached/")
+        assert normalize_url.cache_info().hits == 1
+
+
+class TestNormalizeUrls:
+    """normalize_urls関数のテスト."""
+
+    def test_normalizes_in_input_order(self) -> None:
+        """入力と同じ順序で正規化結果を返すことを確認."""
+        urls = ["http://example.com/b/", "https://example.com/a?utm_medium=x"]
+        assert normalize_urls(urls) == ["https://example.com/b", "https://example.com/a"]
+
+    def test_raises_error_on_empty_url(self) -> None:
+        """空のURLが含まれる場合、ValueErrorを送出する."""
+        with pytest.raises(ValueError, match="URLが空です"):
+            normalize_urls(["https://example.com", ""])
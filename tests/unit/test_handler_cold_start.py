@@ -0,0 +1,80 @@
+"""Lambdaハンドラーのコールドスタート（遅延import）のテスト."""
+
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# src.handler のコールドimportに許容する累積時間（マイクロ秒）. 実測は約50ms で、共有CIでも揺れないよう余裕を持たせる
+HANDLER_IMPORT_BUDGET_US = 500_000
+
+# 初回呼び出しまで遅延importすべき重いモジュール
+LAZY_MODULES = ["boto3", "botocore", "httpx", "feedparser", "pydantic", "yaml"]
+
+
+def _is_reloaded(module: str) -> bool:
+    """コールドimportを再現するため sys.modules から取り除くモジュールか判定する."""
+    top_level = module.split(".")[0]
+    return top_level == "src" or top_level in LAZY_MODULES
+
+
+def _modules_loaded_by_handler_import() -> set[str]:
+    """src配下と重いモジュールを未importの状態で src.handler をimportし、読み込まれたモジュールを返す.
+
+    他のテストが読み込んだモジュールに影響しないよう、終了時に sys.modules を元に戻す.
+    """
+    saved_modules = dict(sys.modules)
+    for module in [module for module in sys.modules if _is_reloaded(module)]:
+        del sys.modules[module]
+    try:
+        importlib.import_module("src.handler")
+        return set(sys.modules)
+    finally:
+        sys.modules.clear()
+        sys.modules.update(saved_modules)
+
+
+def _import_handler_in_fresh_process() -> str:
+    """新しいPythonプロセスで src.handler をimportし、-X importtime の出力を返す."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.handler"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr
+
+
+def _cumulative_src_import_us(log: str) -> int:
+    """-X importtime の出力から、トップレベルでimportされた src 配下モジュールの累積時間を合計する."""
+    total_us = 0
+    for line in log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # 入れ子のimportは名前がインデントされるため、トップレベルのみ集計して二重計上を避ける
+        if name.startswith("  "):
+            continue
+        if name.strip().split(".")[0] == "src":
+            total_us += int(cumulative)
+    return total_us
+
+
+def test_handler_cold_import_within_budget() -> None:
+    """新しいプロセスでの src.handler のimport累積時間が予算内に収まることを確認."""
+    log = _import_handler_in_fresh_process()
+
+    cumulative_us = _cumulative_src_import_us(log)
+
+    assert 0 < cumulative_us <= HANDLER_IMPORT_BUDGET_US
+
+
+def test_handler_import_defers_heavy_modules() -> None:
+    """src.handler のimport時点では重いモジュールを読み込まないことを確認."""
+    loaded = _modules_loaded_by_handler_import()
+
+    assert "src.handler" in loaded
+    assert [module for module in LAZY_MODULES if module in loaded] == []